@@ -0,0 +1,127 @@
+"""@package benchmarks
+Generated project compile time comparison for the cmake build options
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# pylint: disable=wrong-import-position
+from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
+from code_tools_grocsoftware.cpp_gen.cmake_gen import GenerateCmakeFile
+from synthetic_project import build_project
+# pylint: enable=wrong-import-position
+
+## Build configurations, {name: generate_cmake keyword arguments}
+BUILD_CONFIGS = {"baseline": {},
+                 "pch": {"precompile_headers": True},
+                 "unity": {"unity_batch_size": 8},
+                 "pch+unity": {"precompile_headers": True, "unity_batch_size": 8}}
+
+## Prelude for building the generated sources on a host without the windows headers
+PRELUDE = ["#include <cstdint>\n",
+           "#include <list>\n",
+           "#include <memory>\n",
+           "#include <sstream>\n",
+           "#include <string>\n",
+           "typedef uint16_t LANGID;\n"]
+
+def generate_tree(project_file:str, out_dir:str, cmake_options:dict,
+                  generator_options:dict = None)->str:
+    """!
+    @brief Generate the project tree on disk
+    @param project_file {string} Project JSON file name
+    @param out_dir {string} Output directory
+    @param cmake_options {dictionary} generate_cmake() keyword arguments
+    @param generator_options {dictionary} ProjectFileGenerator keyword arguments
+    @return string - Library target name
+    """
+    if generator_options is None:
+        generator_options = {}
+    os.makedirs(out_dir)
+    proj_gen = ProjectFileGenerator(ProjectDescription(project_file), **generator_options)
+    proj_gen.make_dirs(out_dir)
+    proj_gen.generate_files(out_dir)
+    GenerateCmakeFile(proj_gen).generate_cmake(out_dir, True, **cmake_options)
+    return proj_gen.get_project_data().get_project_name()
+
+def time_library_build(out_dir:str, target:str, jobs:int)->float:
+    """!
+    @brief Configure the generated tree and time the library build
+    @param out_dir {string} Generated tree directory
+    @param target {string} Library target name
+    @param jobs {integer} Parallel build job count
+    @return float - Library build time in seconds
+    """
+    build_dir = os.path.join(out_dir, "build")
+    prelude = os.path.join(out_dir, "bench_prelude.h")
+    with open(prelude, mode='wt', encoding="utf-8") as prelude_file:
+        prelude_file.writelines(PRELUDE)
+
+    cxx_flags = "-include "+prelude+" -I"+os.path.join(out_dir, "inc")
+    subprocess.run(["cmake", "-S", out_dir, "-B", build_dir, "-DCMAKE_BUILD_TYPE=Release",
+                    "-DCMAKE_CXX_FLAGS="+cxx_flags],
+                   check=True, stdout=subprocess.DEVNULL)
+
+    start = time.perf_counter()
+    subprocess.run(["cmake", "--build", build_dir, "--target", target, "-j", str(jobs)],
+                   check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+def main():
+    """!
+    @brief Benchmark entry point
+    """
+    parser = argparse.ArgumentParser(description="Generated project compile time comparison")
+    parser.add_argument("--langs", type=int, default=20, help="Language count")
+    parser.add_argument("--methods", type=int, default=50, help="Translate method count")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="Parallel build jobs")
+    args = parser.parse_args()
+
+    if shutil.which("cmake") is None:
+        print("cmake is required to run this benchmark")
+        return
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        project_file = build_project(data_dir, args.langs, args.methods)
+        for name, cmake_options in BUILD_CONFIGS.items():
+            out_dir = os.path.join(data_dir, name.replace("+", "_"))
+            target = generate_tree(project_file, out_dir, cmake_options)
+            elapsed = time_library_build(out_dir, target, args.jobs)
+            print(f"{name:10s} {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
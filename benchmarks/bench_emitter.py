@@ -0,0 +1,111 @@
+"""@package benchmarks
+Compare direct backend file writes with the streaming CodeEmitter output
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# pylint: disable=wrong-import-position
+from code_tools_grocsoftware.base.output_backend import DiskOutputBackend, HashOutputBackend
+from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
+from synthetic_project import build_project
+# pylint: enable=wrong-import-position
+
+def make_generator(project_file:str, output_backend, base_dir:str,
+                   buffer_size:int)->ProjectFileGenerator:
+    """!
+    @brief Load the project and create the output directories
+    @param project_file {string} Project JSON file name
+    @param output_backend {object} Output backend
+    @param base_dir {string} Output base directory
+    @param buffer_size {integer} CodeEmitter buffer size, None writes straight to
+                                 the backend files
+    @return ProjectFileGenerator - Generator ready to run generate_files()
+    """
+    proj_gen = ProjectFileGenerator(ProjectDescription(project_file), output_backend)
+    proj_gen.emitter_buffer_size = buffer_size
+    proj_gen.class_gen.get_string_model()
+    if not output_backend.exists(base_dir):
+        output_backend.make_dir(base_dir)
+    proj_gen.make_dirs(base_dir)
+    return proj_gen
+
+def measure(name:str, project_file:str, backend_class, base_dir:str, buffer_size:int, repeat:int):
+    """!
+    @brief Measure the best generate_files() time and its peak traced memory
+    @param name {string} Run name
+    @param project_file {string} Project JSON file name
+    @param backend_class {class} Output backend class
+    @param base_dir {string} Output base directory
+    @param buffer_size {integer} CodeEmitter buffer size or None
+    @param repeat {integer} Repeat count, best time is shown
+    """
+    best = None
+    for _ in range(repeat):
+        proj_gen = make_generator(project_file, backend_class(), base_dir, buffer_size)
+        start = time.perf_counter()
+        proj_gen.generate_files(base_dir)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Measure memory in a separate run so tracing does not skew the timing
+    proj_gen = make_generator(project_file, backend_class(), base_dir, buffer_size)
+    tracemalloc.start()
+    proj_gen.generate_files(base_dir)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:14s} {best:8.3f}s  peak {peak/1048576:8.2f} MiB")
+
+def main():
+    """!
+    @brief Benchmark entry point
+    """
+    parser = argparse.ArgumentParser(description="CodeEmitter benchmark")
+    parser.add_argument("--langs", type=int, default=20, help="Language count")
+    parser.add_argument("--methods", type=int, default=500, help="Translate method count")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeat count, best time is shown")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        project_file = build_project(data_dir, args.langs, args.methods)
+        base_dir = os.path.join(data_dir, "output")
+
+        for backend_name, backend_class in [("disk", DiskOutputBackend), ("hash", HashOutputBackend)]:
+            for mode_name, buffer_size in [("direct", None), ("emitter", 65536)]:
+                measure(backend_name+" "+mode_name, project_file, backend_class, base_dir,
+                        buffer_size, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""@package benchmarks
+Project generation benchmark on the in-memory output backend
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# pylint: disable=wrong-import-position
+from code_tools_grocsoftware.base.output_backend import MemoryOutputBackend, HashOutputBackend
+from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
+from code_tools_grocsoftware.cpp_gen.cmake_gen import GenerateCmakeFile
+from synthetic_project import build_project
+# pylint: enable=wrong-import-position
+
+def run_generate(project_file:str, output_backend, base_dir:str)->dict:
+    """!
+    @brief Generate the project source and cmake files without disk output
+    @param project_file {string} Project JSON file name
+    @param output_backend {MemoryOutputBackend} Output backend
+    @param base_dir {string} Virtual output base directory
+    @return dictionary - {phase_name: elapsed seconds}
+    """
+    times = {}
+    start = time.perf_counter()
+    proj_gen = ProjectFileGenerator(ProjectDescription(project_file), output_backend)
+    times['load'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    output_backend.make_dir(base_dir)
+    proj_gen.make_dirs(base_dir)
+    proj_gen.generate_files(base_dir)
+    times['generate_files'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    GenerateCmakeFile(proj_gen).generate_cmake(base_dir, True)
+    times['generate_cmake'] = time.perf_counter() - start
+    return times
+
+def main():
+    """!
+    @brief Benchmark entry point
+    """
+    parser = argparse.ArgumentParser(description="In-memory generation benchmark")
+    parser.add_argument("--langs", type=int, default=20, help="Language count")
+    parser.add_argument("--methods", type=int, default=500, help="Translate method count")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeat count, best time is shown")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        project_file = build_project(data_dir, args.langs, args.methods)
+        base_dir = os.path.join(data_dir, "virtual_output")
+
+        for name, backend_class in [("memory", MemoryOutputBackend), ("hash", HashOutputBackend)]:
+            best = {}
+            for _ in range(args.repeat):
+                backend = backend_class()
+                times = run_generate(project_file, backend, base_dir)
+                for phase, elapsed in times.items():
+                    best[phase] = min(best.get(phase, elapsed), elapsed)
+            phase_text = "  ".join(f"{phase} {elapsed:.3f}s" for phase, elapsed in best.items())
+            print(f"{name:8s} {len(backend.get_file_names())} files  {phase_text}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""@package benchmarks
+Generation scaling benchmark suite with synthetic projects and JSON results
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+import argparse
+import itertools
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# pylint: disable=wrong-import-position
+from code_tools_grocsoftware.base.output_backend import DiskOutputBackend, MemoryOutputBackend
+from code_tools_grocsoftware.base.output_backend import HashOutputBackend, StagedOutputBackend
+from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
+from code_tools_grocsoftware.cpp_gen.cmake_gen import GenerateCmakeFile
+from synthetic_project import build_project
+# pylint: enable=wrong-import-position
+
+## Output backends by benchmark name, the factory takes the output base directory
+OUTPUT_BACKENDS = {"memory": lambda _: MemoryOutputBackend(),
+                   "hash": lambda _: HashOutputBackend(),
+                   "disk": lambda _: DiskOutputBackend(),
+                   "staged": StagedOutputBackend}
+
+## Code generator backends by benchmark name, ProjectFileGenerator keyword options
+GENERATOR_BACKENDS = {"classes": {},
+                      "string_table": {'string_table': True}}
+
+## Timed phases, summed to the total time used for the scaling exponents
+PHASES = ['load', 'init', 'generate_files', 'generate_cmake', 'commit']
+
+def parse_int_list(text:str)->list:
+    """!
+    @brief Parse a comma separated integer list argument
+    @param text {string} Comma separated integers
+    @return list - Integer list
+    """
+    return [int(value) for value in text.split(',') if value]
+
+def parse_name_list(choices:dict):
+    """!
+    @brief Make a comma separated name list argument parser
+    @param choices {dictionary} Valid names
+    @return function - Argument type function
+    """
+    def parse(text:str)->list:
+        names = [name for name in text.split(',') if name]
+        for name in names:
+            if name not in choices:
+                raise argparse.ArgumentTypeError(f"unknown name '{name}', "
+                                                 f"choose from {', '.join(choices)}")
+        return names
+    return parse
+
+def run_case(project_file:str, out_dir:str, output_name:str, generator_name:str)->dict:
+    """!
+    @brief Time one generation of the project tree
+    @param project_file {string} Project JSON file name
+    @param out_dir {string} Output base directory
+    @param output_name {string} OUTPUT_BACKENDS name
+    @param generator_name {string} GENERATOR_BACKENDS name
+    @return dictionary - {phase_name: elapsed seconds, 'files': library source and include file count}
+    """
+    times = {}
+    output_backend = OUTPUT_BACKENDS[output_name](out_dir)
+
+    start = time.perf_counter()
+    project_data = ProjectDescription(project_file)
+    times['load'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    proj_gen = ProjectFileGenerator(project_data, output_backend,
+                                    **GENERATOR_BACKENDS[generator_name])
+    times['init'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    output_backend.make_dir(out_dir)
+    proj_gen.make_dirs(out_dir)
+    if not proj_gen.generate_files(out_dir):
+        raise RuntimeError("generate_files failed for "+project_file)
+    times['generate_files'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if not GenerateCmakeFile(proj_gen).generate_cmake(out_dir, True):
+        raise RuntimeError("generate_cmake failed for "+project_file)
+    times['generate_cmake'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if isinstance(output_backend, StagedOutputBackend):
+        output_backend.commit()
+    times['commit'] = time.perf_counter() - start
+
+    times['files'] = len(proj_gen.get_source_fnames()) + len(proj_gen.get_include_fnames())
+    return times
+
+def scaling_exponents(results:list, axis:str)->list:
+    """!
+    @brief Estimate the scaling exponent of the total time along one size axis
+
+    Results that only differ in the axis value are compared in pairs of
+    consecutive sizes. An exponent near 1 is linear, well above 1 is super-linear.
+
+    @param results {list} Result dictionaries from main()
+    @param axis {string} Size axis, 'langs', 'methods' or 'params'
+    @return list - [{fixed sizes, 'axis', 'from', 'to', 'exponent'}]
+    """
+    fixed_keys = [key for key in ['output', 'generator', 'langs', 'methods', 'params'] if key != axis]
+    groups = {}
+    for result in results:
+        groups.setdefault(tuple(result[key] for key in fixed_keys), []).append(result)
+
+    exponents = []
+    for group_key, group in groups.items():
+        group.sort(key=lambda result: result[axis])
+        for low, high in zip(group, group[1:]):
+            # Parameter count 0 has no meaningful ratio
+            if (low[axis] <= 0) or (low['total'] <= 0) or (high[axis] == low[axis]):
+                continue
+            entry = dict(zip(fixed_keys, group_key))
+            entry.update({'axis': axis, 'from': low[axis], 'to': high[axis],
+                          'exponent': math.log(high['total']/low['total'])/math.log(high[axis]/low[axis])})
+            exponents.append(entry)
+    return exponents
+
+def main():
+    """!
+    @brief Benchmark entry point
+    """
+    parser = argparse.ArgumentParser(description="Generation scaling benchmark suite")
+    parser.add_argument("--langs", type=parse_int_list, default=[1, 10, 50],
+                        help="Comma separated language counts, up to 200")
+    parser.add_argument("--methods", type=parse_int_list, default=[10, 100, 1000],
+                        help="Comma separated translate method counts, up to 10000")
+    parser.add_argument("--params", type=parse_int_list, default=[2],
+                        help="Comma separated maximum parameters per method")
+    parser.add_argument("--outputs", type=parse_name_list(OUTPUT_BACKENDS),
+                        default=list(OUTPUT_BACKENDS), help="Comma separated output backends")
+    parser.add_argument("--generators", type=parse_name_list(GENERATOR_BACKENDS),
+                        default=["classes"], help="Comma separated code generator backends")
+    parser.add_argument("--repeat", type=int, default=1, help="Repeat count, best time is kept")
+    parser.add_argument("--superlinear", type=float, default=1.2,
+                        help="Report scaling exponents above this value")
+    parser.add_argument("-o", "--output", default=None, help="JSON result file, default stdout")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        for lang_count, method_count, param_count in itertools.product(args.langs, args.methods,
+                                                                       args.params):
+            case_dir = os.path.join(data_dir, f"l{lang_count}_m{method_count}_p{param_count}")
+            start = time.perf_counter()
+            project_file = build_project(case_dir, lang_count, method_count, param_count)
+            synth_time = time.perf_counter() - start
+
+            for output_name, generator_name in itertools.product(args.outputs, args.generators):
+                best = {}
+                for repeat in range(args.repeat):
+                    out_dir = os.path.join(case_dir, f"out_{output_name}_{generator_name}_{repeat}")
+                    times = run_case(project_file, out_dir, output_name, generator_name)
+                    for phase in PHASES:
+                        best[phase] = min(best.get(phase, times[phase]), times[phase])
+                    best['files'] = times['files']
+
+                result = {'output': output_name, 'generator': generator_name,
+                          'langs': lang_count, 'methods': method_count, 'params': param_count,
+                          'synthesize': synth_time}
+                result.update(best)
+                result['total'] = sum(best[phase] for phase in PHASES)
+                results.append(result)
+                print(f"{output_name:7s} {generator_name:12s} langs {lang_count:4d} "
+                      f"methods {method_count:6d} params {param_count:2d}  "
+                      f"total {result['total']:.3f}s", file=sys.stderr)
+
+    scaling = []
+    for axis in ['langs', 'methods', 'params']:
+        scaling.extend(scaling_exponents(results, axis))
+    for entry in scaling:
+        if entry['exponent'] > args.superlinear:
+            print(f"super-linear {entry['axis']} {entry['from']}->{entry['to']} "
+                  f"({entry['output']}, {entry['generator']}): exponent {entry['exponent']:.2f}",
+                  file=sys.stderr)
+
+    report = {'python': platform.python_version(),
+              'platform': platform.platform(),
+              'repeat': args.repeat,
+              'results': results,
+              'scaling': scaling}
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w', encoding='utf-8') as result_file:
+            json.dump(report, result_file, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""@package benchmarks
+Generated language selection function make_shared vs cached instance microbenchmark
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+
+import argparse
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# pylint: disable=wrong-import-position
+from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
+from bench_cmake_build import PRELUDE
+from synthetic_project import build_project, synthetic_iso_code
+# pylint: enable=wrong-import-position
+
+## Selection function instance modes, {name: ProjectFileGenerator cached_instances value}
+INSTANCE_MODES = {"make_shared": False, "cached": True}
+
+def gen_bench_driver(proj_gen:ProjectFileGenerator)->list:
+    """!
+    @brief Generate the selection function timing driver
+    @param proj_gen {ProjectFileGenerator} Project generator for the tree under test
+    @return list - Driver source string list
+    """
+    class_gen = proj_gen.class_gen
+    base_class = class_gen.base_class_name
+    select_call = base_class+"::"+class_gen.master_function_name+"()"
+    return ["#include <chrono>\n",
+            "#include <cstdio>\n",
+            "#include <cstdlib>\n",
+            "#include \""+class_gen.gen_h_fname()+"\"\n",
+            "\n",
+            "using namespace "+class_gen.namespace_name+";\n",
+            "\n",
+            "int main(int argc, char* argv[])\n",
+            "{\n",
+            "    long iterations = (argc > 1) ? std::atol(argv[1]) : 1000000;\n",
+            "    size_t check = 0;\n",
+            "    auto start = std::chrono::steady_clock::now();\n",
+            "    for (long i = 0; i < iterations; ++i)\n",
+            "    {\n",
+            "        "+class_gen.base_intf_ret_ptr_type+" local = "+select_call+";\n",
+            "        check += local->"+class_gen.json_str_data.get_iso_property_method_name()+
+            "().size();\n",
+            "    }\n",
+            "    std::chrono::duration<double, std::nano> elapsed = "
+            "std::chrono::steady_clock::now() - start;\n",
+            "    printf(\"%.1f %zu\\n\", elapsed.count()/iterations, check);\n",
+            "    return 0;\n",
+            "}\n"]
+
+def build_bench(project_file:str, out_dir:str, cached_instances:bool)->str:
+    """!
+    @brief Generate the project tree and compile the timing driver with the library sources
+    @param project_file {string} Project JSON file name
+    @param out_dir {string} Output directory
+    @param cached_instances {bool} ProjectFileGenerator cached_instances option
+    @return string - Driver executable name
+    """
+    os.makedirs(out_dir)
+    proj_gen = ProjectFileGenerator(ProjectDescription(project_file),
+                                    linux_select_regex=False,
+                                    cached_instances=cached_instances)
+    proj_gen.make_dirs(out_dir)
+    proj_gen.generate_files(out_dir)
+
+    prelude = os.path.join(out_dir, "bench_prelude.h")
+    with open(prelude, mode='wt', encoding="utf-8") as prelude_file:
+        prelude_file.writelines(PRELUDE)
+    driver = os.path.join(out_dir, "bench_select.cpp")
+    with open(driver, mode='wt', encoding="utf-8") as driver_file:
+        driver_file.writelines(gen_bench_driver(proj_gen))
+
+    exe_name = os.path.join(out_dir, "bench_select")
+    sources = sorted(glob.glob(os.path.join(out_dir, "src", "*.cpp")))
+    subprocess.run(["c++", "-O2", "-std=c++17", "-include", prelude,
+                    "-I"+os.path.join(out_dir, "inc"), "-o", exe_name, driver]+sources,
+                   check=True)
+    return exe_name
+
+def main():
+    """!
+    @brief Benchmark entry point
+    """
+    parser = argparse.ArgumentParser(description="Generated language selection function "
+                                                 "instance microbenchmark")
+    parser.add_argument("--langs", type=int, default=20, help="Language count")
+    parser.add_argument("--methods", type=int, default=10, help="Translate method count")
+    parser.add_argument("--iterations", type=int, default=1000000, help="Selection calls to time")
+    args = parser.parse_args()
+
+    if shutil.which("c++") is None:
+        print("a c++ compiler is required to run this benchmark")
+        return
+
+    # Select the last language so the selection function walks every case
+    iso_code = synthetic_iso_code(args.langs-1)
+    run_env = dict(os.environ, LANG=iso_code+"_"+iso_code.upper()+".UTF-8")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        project_file = build_project(data_dir, args.langs, args.methods)
+        for name, cached_instances in INSTANCE_MODES.items():
+            exe_name = build_bench(project_file, os.path.join(data_dir, name), cached_instances)
+            result = subprocess.run([exe_name, str(args.iterations)], check=True,
+                                    capture_output=True, text=True, env=run_env)
+            ns_per_call = float(result.stdout.split()[0])
+            print(f"{name:12s} {ns_per_call:.1f} ns/call")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""@package benchmarks
+Class per language vs string table backend library size and compile time comparison
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# pylint: disable=wrong-import-position
+from bench_cmake_build import generate_tree, time_library_build
+from synthetic_project import build_project
+# pylint: enable=wrong-import-position
+
+## Language class backends, {name: ProjectFileGenerator keyword arguments}
+BACKENDS = {"classes": {}, "table": {"string_table": True}}
+
+def object_size(out_dir:str, target:str)->tuple:
+    """!
+    @brief Sum the library object file sizes of the generated tree
+    @param out_dir {string} Generated tree directory
+    @param target {string} Library target name
+    @return tuple - (object file count, total object file bytes)
+    """
+    obj_dir = os.path.join(out_dir, "build", "CMakeFiles", target+".dir")
+    obj_list = glob.glob(os.path.join(obj_dir, "**", "*.o"), recursive=True)
+    return len(obj_list), sum(os.path.getsize(obj_name) for obj_name in obj_list)
+
+def main():
+    """!
+    @brief Benchmark entry point
+    """
+    parser = argparse.ArgumentParser(description="Class per language vs string table backend comparison")
+    parser.add_argument("--langs", type=int, default=20, help="Language count")
+    parser.add_argument("--methods", type=int, default=50, help="Translate method count")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="Parallel build jobs")
+    args = parser.parse_args()
+
+    if shutil.which("cmake") is None:
+        print("cmake is required to run this benchmark")
+        return
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        project_file = build_project(data_dir, args.langs, args.methods)
+        for name, generator_options in BACKENDS.items():
+            out_dir = os.path.join(data_dir, name)
+            target = generate_tree(project_file, out_dir, {}, generator_options)
+            elapsed = time_library_build(out_dir, target, args.jobs)
+            obj_count, obj_bytes = object_size(out_dir, target)
+            print(f"{name:8s} {elapsed:6.2f}s {obj_count:4d} objects {obj_bytes:10d} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""@package benchmarks
+Google Benchmark comparison of the stringstream and reserve and append translate method code
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+
+import argparse
+import glob
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# pylint: disable=wrong-import-position
+from code_tools_grocsoftware.base.param_return_tools import ParamRetDict
+from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
+from bench_cmake_build import PRELUDE
+from synthetic_project import build_project
+# pylint: enable=wrong-import-position
+
+## Translate method code modes, {name: ProjectFileGenerator append_translate value}
+TRANSLATE_MODES = {"stream": False, "append": True}
+
+def gen_bench_driver(proj_gen:ProjectFileGenerator)->list:
+    """!
+    @brief Generate the Google Benchmark translate method driver for the default language
+    @param proj_gen {ProjectFileGenerator} Project generator for the tree under test
+    @return list - Driver source string list
+    """
+    class_gen = proj_gen.class_gen
+    string_model = class_gen.get_string_model()
+    lang_name, _ = class_gen.json_lang_data.get_default_data()
+    class_name = string_model.get_class_name(lang_name)
+
+    driver = ["#include <benchmark/benchmark.h>\n",
+              "#include \""+class_gen.gen_h_fname(lang_name)+"\"\n",
+              "\n",
+              "using namespace "+class_gen.namespace_name+";\n",
+              "\n"]
+    for method in string_model.get_translate_methods():
+        # pylint: disable=protected-access
+        param_data = [class_gen._get_param_test_value(ParamRetDict.get_param_name(param))
+                      for param in method.params]
+        # pylint: enable=protected-access
+        driver.extend(["static void BM_"+method.name+"(benchmark::State& state)\n",
+                       "{\n",
+                       "    "+class_name+" testvar;\n",
+                       "    for (auto _ : state)\n",
+                       "    {\n",
+                       "        benchmark::DoNotOptimize(testvar."+method.name+"("+
+                       ", ".join(param_data)+"));\n",
+                       "    }\n",
+                       "}\n",
+                       "BENCHMARK(BM_"+method.name+");\n",
+                       "\n"])
+    driver.append("BENCHMARK_MAIN();\n")
+    return driver
+
+def build_bench(project_file:str, out_dir:str, append_translate:bool)->str:
+    """!
+    @brief Generate the project tree and compile the benchmark driver with the library sources
+    @param project_file {string} Project JSON file name
+    @param out_dir {string} Output directory
+    @param append_translate {bool} ProjectFileGenerator append_translate option
+    @return string - Driver executable name
+    """
+    os.makedirs(out_dir)
+    proj_gen = ProjectFileGenerator(ProjectDescription(project_file),
+                                    append_translate=append_translate)
+    proj_gen.make_dirs(out_dir)
+    proj_gen.generate_files(out_dir)
+
+    prelude = os.path.join(out_dir, "bench_prelude.h")
+    with open(prelude, mode='wt', encoding="utf-8") as prelude_file:
+        prelude_file.writelines(PRELUDE)
+    driver = os.path.join(out_dir, "bench_translate.cpp")
+    with open(driver, mode='wt', encoding="utf-8") as driver_file:
+        driver_file.writelines(gen_bench_driver(proj_gen))
+
+    exe_name = os.path.join(out_dir, "bench_translate")
+    sources = sorted(glob.glob(os.path.join(out_dir, "src", "*.cpp")))
+    subprocess.run(["c++", "-O2", "-std=c++17", "-include", prelude,
+                    "-I"+os.path.join(out_dir, "inc"), "-o", exe_name, driver]+sources+
+                   ["-lbenchmark", "-lpthread"],
+                   check=True)
+    return exe_name
+
+def run_bench(exe_name:str)->dict:
+    """!
+    @brief Run the benchmark driver
+    @param exe_name {string} Driver executable name
+    @return dictionary - {benchmark name: cpu time in nanoseconds}
+    """
+    result = subprocess.run([exe_name, "--benchmark_format=json"], check=True,
+                            capture_output=True, text=True)
+    return {bench['name']: bench['cpu_time'] for bench in json.loads(result.stdout)['benchmarks']}
+
+def main():
+    """!
+    @brief Benchmark entry point
+    """
+    parser = argparse.ArgumentParser(description="Translate method code mode Google Benchmark "
+                                                 "comparison")
+    parser.add_argument("--langs", type=int, default=4, help="Language count")
+    parser.add_argument("--methods", type=int, default=12, help="Translate method count")
+    parser.add_argument("--params", type=int, default=2, help="Maximum parameters per method")
+    args = parser.parse_args()
+
+    if shutil.which("c++") is None:
+        print("a c++ compiler is required to run this benchmark")
+        return
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        project_file = build_project(data_dir, args.langs, args.methods, args.params)
+        results = {}
+        for name, append_translate in TRANSLATE_MODES.items():
+            exe_name = build_bench(project_file, os.path.join(data_dir, name), append_translate)
+            results[name] = run_bench(exe_name)
+
+    print(f"{'benchmark':24s} "+" ".join(f"{name:>10s}" for name in TRANSLATE_MODES))
+    for bench_name in results["stream"]:
+        print(f"{bench_name:24s} "+" ".join(f"{results[name][bench_name]:8.1f}ns"
+                                             for name in TRANSLATE_MODES))
+
+    ratios = [results["stream"][bench_name]/results["append"][bench_name]
+              for bench_name in results["stream"]]
+    speedup = math.exp(sum(math.log(ratio) for ratio in ratios)/len(ratios))
+    print(f"geometric mean speedup {speedup:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""@package benchmarks
+Synthetic project, language and string class JSON data for the benchmarks
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# pylint: disable=wrong-import-position
+from code_tools_grocsoftware.base.param_return_tools import ParamRetDict
+from code_tools_grocsoftware.base.json_language_list import LanguageDescriptionList
+from code_tools_grocsoftware.base.json_string_class_description import StringClassDescription
+from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.base.translate_text_parser import TransTxtParser
+# pylint: enable=wrong-import-position
+
+def synthetic_lang_name(index:int)->str:
+    """!
+    @brief Generate a synthetic language name
+    @param index {integer} Language index
+    @return string - Language name
+    """
+    return "lang"+chr(ord('a')+(index//26)%26)+chr(ord('a')+index%26)
+
+def synthetic_iso_code(index:int)->str:
+    """!
+    @brief Generate a unique two letter synthetic ISO 639-1 code
+    @param index {integer} Language index
+    @return string - ISO code
+    """
+    return chr(ord('a')+(index//26)%26)+chr(ord('a')+index%26)
+
+def build_lang_json(filename:str, lang_count:int)->LanguageDescriptionList:
+    """!
+    @brief Write a synthetic language description JSON file
+    @param filename {string} Output JSON file name
+    @param lang_count {integer} Number of languages to generate
+    @return LanguageDescriptionList - Language list object
+    """
+    lang_list = LanguageDescriptionList(filename)
+    lang_list.clear()
+    for index in range(lang_count):
+        iso_code = synthetic_iso_code(index)
+        lang_list.add_language(synthetic_lang_name(index), iso_code,
+                               [iso_code.upper()], [index+1], [0x400+index+1],
+                               iso_code, synthetic_lang_name(index).upper()+"_ERRORS")
+    lang_list.set_default(synthetic_lang_name(0))
+    lang_list.update()
+    return lang_list
+
+def build_string_json(filename:str, lang_count:int, method_count:int,
+                      param_count:int = 2)->StringClassDescription:
+    """!
+    @brief Write a synthetic string class description JSON file
+    @param filename {string} Output JSON file name
+    @param lang_count {integer} Number of languages to generate text for
+    @param method_count {integer} Number of translate methods to generate
+    @param param_count {integer} Maximum number of parameters per translate method
+    @return StringClassDescription - String class description object
+    """
+    str_data = StringClassDescription(filename)
+    str_data.set_base_class_name("ParserStringListInterface")
+    str_data.set_namespace_name("argparser")
+
+    # Add every language property method
+    for prop in LanguageDescriptionList.get_property_list():
+        ret_type, ret_desc, is_list = LanguageDescriptionList.get_property_return_data(prop)
+        method_name = LanguageDescriptionList.get_property_method_name(prop)
+        # pylint: disable=protected-access
+        entry = str_data._define_property_function_entry(prop, "Get the "+ret_desc,
+                                                          ret_type, ret_desc, is_list)
+        # pylint: enable=protected-access
+        str_data.string_jason_data['propertyMethods'][method_name] = entry
+
+    param_types = ["string", "integer"]
+    for method in range(method_count):
+        params = []
+        for param in range(method % (param_count+1)):
+            params.append(ParamRetDict.build_param_dict("value"+str(param),
+                                                        param_types[param % 2],
+                                                        "Value "+str(param)))
+        ret = ParamRetDict.build_return_dict("string", "Message text")
+        text = "Message "+str(method)+" text"
+        for param in params:
+            text += " @"+ParamRetDict.get_param_name(param)+"@"
+
+        method_name = "getMessage"+str(method)
+        str_data.add_translate_method_entry(method_name, "Message "+str(method),
+                                            params, ret, "en", text, True)
+        for index in range(lang_count):
+            iso_code = synthetic_iso_code(index)
+            str_data.add_manual_translation(method_name, iso_code,
+                                            TransTxtParser.parse_translate_string(iso_code+" "+text))
+
+    for param in range(param_count):
+        str_data.add_test_param_value("value"+str(param), str(param), bool(param % 2 == 0))
+    str_data.update()
+    return str_data
+
+def build_project(base_dir:str, lang_count:int, method_count:int,
+                  param_count:int = 2)->str:
+    """!
+    @brief Write a complete synthetic project
+    @param base_dir {string} Directory to write the JSON files to
+    @param lang_count {integer} Number of languages to generate
+    @param method_count {integer} Number of translate methods to generate
+    @param param_count {integer} Maximum number of parameters per translate method
+    @return string - Project JSON file name
+    """
+    os.makedirs(base_dir, exist_ok=True)
+    lang_filename = os.path.join(base_dir, "synthetic_lang.json")
+    str_filename = os.path.join(base_dir, "synthetic_strings.json")
+    proj_filename = os.path.join(base_dir, "synthetic_project.json")
+
+    build_lang_json(lang_filename, lang_count)
+    build_string_json(str_filename, lang_count, method_count, param_count)
+
+    project = ProjectDescription(proj_filename)
+    project.clear()
+    project.filename = proj_filename
+    project.set_lang_data_name(lang_filename)
+    project.set_string_data_name(str_filename)
+    project.set_project_name("ParserStringListInterface")
+    project.set_creation_year(2025)
+    project.set_owner("Benchmark")
+    project.set_inc_subdir("inc")
+    project.set_src_subdir("src")
+    project.set_test_subdir("test")
+    project.set_mock_subdir("mock")
+    project.set_group_name("LocalLanguageSelection")
+    project.set_group_desc("Local language selection")
+    project.add_include_using("parserstr", "std::string", "Standard parser string definition")
+    project.add_lang_src_using("parser_str_stream", "std::stringstream",
+                               "Standard string stream definition")
+    project.update()
+    return proj_filename
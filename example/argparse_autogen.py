@@ -36,10 +36,14 @@ from argparse_json_data import create_argparse_project_file
 
 # Json tools import
 from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.base.output_backend import HashOutputBackend
+from code_tools_grocsoftware.base.output_backend import StagedOutputBackend
+from code_tools_grocsoftware.base.profiler import profiler
 
 # File generator tools import
 from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
 from code_tools_grocsoftware.cpp_gen.cmake_gen import GenerateCmakeFile
+from code_tools_grocsoftware.cpp_gen.build_cli import positive_int
 
 ##################################
 ##################################
@@ -89,6 +93,12 @@ def command_main():
     parser.add_argument('-j','--json', dest='json_proj_name', required=False,
                         type=pathlib.Path, default='../data/argparse_project.json',
                         help='Project json file name, default = ../data/argparse_project.json')
+    parser.add_argument('--profile', dest='profile', choices=['table', 'trace'], default=None,
+                        help='Report the generation phase timing as a table or a Chrome trace')
+    parser.add_argument('--profile-file', dest='profile_file', default=None,
+                        help='Profile report file, default = table to stderr, trace to code_tools_trace.json')
+    parser.add_argument('--profile-memory', dest='profile_memory', action='store_true', default=False,
+                        help='Add the tracemalloc span peak memory and top allocation sites to the profile')
 
     subcommands= parser.add_subparsers(title='subcommand', dest='subcommand',
                                        help='Options: build, langjson, classjson, projjson')
@@ -98,6 +108,38 @@ def command_main():
                               required=True, type=pathlib.Path,
                               default='../output',
                               help='Existing destination directory for source and data files')
+    build_parser.add_argument('--dry-run', dest='dry_run', action='store_true',
+                              help='Report the files that would change without writing them')
+    build_parser.add_argument('--reuse-objects', dest='reuse_objects', action='store_true',
+                              help='Link the unit tests against the library objects')
+    build_parser.add_argument('--combined-unittest', dest='combined_unittest', action='store_true',
+                              help='Build all of the language unit tests into one executable')
+    build_parser.add_argument('--typed-unittest', dest='typed_unittest', action='store_true',
+                              help='Generate one typed unit test for all of the languages')
+    build_parser.add_argument('--no-regex-select', dest='linux_select_regex', action='store_false',
+                              help='Parse the linux LANG value without std::regex')
+    build_parser.add_argument('--cached-instances', dest='cached_instances', action='store_true',
+                              help='Return cached language class instances from the selection functions')
+    build_parser.add_argument('--string-view-constants', dest='string_view_constants', action='store_true',
+                              help='Return std::string_view static text from the parameterless translate methods')
+    build_parser.add_argument('--append-translate', dest='append_translate', action='store_true',
+                              help='Build the translate method strings with reserve and append')
+    build_parser.add_argument('--string-table', dest='string_table', action='store_true',
+                              help='Generate one constexpr string table class for all of the languages')
+    build_parser.add_argument('--langid-table', dest='windows_langid_table', action='store_true',
+                              help='Look up the full windows LANGID before the primary language switch')
+    build_parser.add_argument('--constexpr-properties', dest='constexpr_properties', action='store_true',
+                              help='Return the list property values as a std::span of constexpr data, needs C++20')
+    build_parser.add_argument('--shard-methods', dest='shard_method_count', type=positive_int, default=None,
+                              help='Split each language source file into shards of this many methods')
+    build_parser.add_argument('--shard-bytes', dest='shard_byte_size', type=positive_int, default=None,
+                              help='Split each language source file into shards of about this many bytes')
+    build_parser.add_argument('--languages', dest='language_subset', default=None,
+                              help='Comma separated language names or compile switches to build')
+    build_parser.add_argument('--pch', dest='precompile_headers', action='store_true',
+                              help='Precompile the base interface header')
+    build_parser.add_argument('--unity-batch', dest='unity_batch_size', type=positive_int, default=None,
+                              help='Unity build the library sources in batches of this size')
 
     lang_json_parser = subcommands.add_parser('langjson', help='Language JSON File Commands Help')
     lang_json_parser.add_argument('langcommand', choices=['createdefault', 'add'])
@@ -113,6 +155,8 @@ def command_main():
     proj_json_parser.add_argument('projcommand', choices=['createdefault'])
 
     args = parser.parse_args()
+    if args.profile is not None:
+        profiler.enable(memory=args.profile_memory)
 
     # Open the data files
     data_file = os.path.abspath(args.json_proj_name)
@@ -121,11 +165,28 @@ def command_main():
     # Process the subcommand
     if args.subcommand == 'build':
         # Open the project description file
-        proj_gen = ProjectFileGenerator(proj_json_data)
+        output_base = os.path.abspath(args.gen_file_path)
+        if args.dry_run:
+            output_backend = HashOutputBackend()
+        else:
+            output_backend = StagedOutputBackend(output_base)
+        if args.language_subset is not None:
+            proj_json_data.set_language_subset(args.language_subset.split(','))
+        proj_gen = ProjectFileGenerator(proj_json_data, output_backend,
+                                        combined_unittest=args.combined_unittest,
+                                        typed_unittest=args.typed_unittest,
+                                        linux_select_regex=args.linux_select_regex,
+                                        cached_instances=args.cached_instances,
+                                        string_view_constants=args.string_view_constants,
+                                        append_translate=args.append_translate,
+                                        string_table=args.string_table,
+                                        windows_langid_table=args.windows_langid_table,
+                                        constexpr_properties=args.constexpr_properties,
+                                        shard_method_count=args.shard_method_count,
+                                        shard_byte_size=args.shard_byte_size)
 
         # Generate the source and cmake files
         print ("Building directory structure")
-        output_base = os.path.abspath(args.gen_file_path)
         build_status = proj_gen.make_dirs(output_base)
         if build_status:
             print ("Building source and cmake files")
@@ -133,11 +194,27 @@ def command_main():
 
         if build_status:
             cmake_generator = GenerateCmakeFile(proj_gen)
-            build_status = cmake_generator.generate_cmake(output_base, True)
+            build_status = cmake_generator.generate_cmake(output_base, True,
+                                                          reuse_objects=args.reuse_objects,
+                                                          precompile_headers=args.precompile_headers,
+                                                          unity_batch_size=args.unity_batch_size)
+
+        if args.dry_run:
+            if build_status:
+                changed_files = output_backend.get_changed_files()
+                for file_name, status in changed_files:
+                    print (f"{status:8s} {file_name}")
+                print (f"{len(changed_files)} of {len(output_backend.get_file_names())} "
+                       "files would change")
+        elif build_status:
+            # Publish the complete tree in one step
+            build_status = output_backend.commit()
+        else:
+            output_backend.abort()
 
     elif args.subcommand == 'classjson':
         class_data = proj_json_data.get_string_data()
-        lang_data = proj_json_data.get_lang_data()
+        lang_data = proj_json_data.get_lang_data(apply_subset=False)
 
         if args.stringscommand == 'createdefault':
             # Build the default methods definitions file
@@ -167,7 +244,7 @@ def command_main():
             raise ValueError("Error: Unknown JSON string file command: "+args.stringscommand)
 
     elif args.subcommand == 'langjson':
-        lang_data = proj_json_data.get_lang_data()
+        lang_data = proj_json_data.get_lang_data(apply_subset=False)
         if args.langcommand == 'createdefault':
             # Build the default language list definitions file
             print ("Updating Language JSON file")
@@ -194,6 +271,9 @@ def command_main():
     else:
         raise ValueError("Error: Unknown subcommand: "+args.subcommand)
 
+    if args.profile is not None:
+        profiler.write_report(args.profile, args.profile_file)
+
 
 if __name__ == '__main__':
     command_main()
@@ -24,25 +24,35 @@ Utilities to get the creation and last modification years of a file
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #==========================================================================
 
+import importlib
+
 __version__ = '0.8.3'
 
 __all__ = ["commit_check", "text_format", "copyright_generator", "eula",
            "comment_gen_tools", "doxygen_gen_tools", "param_return_tools",
            "json_language_list", "json_string_class_description",
-           "project_json", "insert_new_copyright_block"]
-
-from . import commit_check
-from . import text_format
-
-from . import copyright_generator
-from . import eula
-
-from . import comment_gen_tools
-from . import doxygen_gen_tools
-
-from . import param_return_tools
-
-from . import json_language_list
-from . import json_string_class_description
-from . import insert_new_copyright_block
-from . import project_json
+           "string_class_model", "code_emitter", "project_json",
+           "insert_new_copyright_block", "profiler"]
+
+def __getattr__(name:str):
+    """!
+    @brief Import a package submodule on first access (PEP 562)
+
+    The submodules are not imported with the package, a tool only pays the
+    import time of the submodules it uses.
+
+    @param name {string} Submodule name
+    @return module - The imported submodule
+    """
+    if name in __all__:
+        module = importlib.import_module("."+name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__()->list:
+    """!
+    @brief List the package attributes including the submodules not imported yet
+    @return list - Attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,191 @@
+"""@package langstringautogen
+Streaming code emitter and buffered output sinks
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+
+import hashlib
+
+class HashSink():
+    """!
+    @brief Output sink that only keeps a running hash and size of the text
+
+    Used when the generated text is only needed for comparison, i.e. to
+    detect changed files, without holding the text in memory.
+    """
+    def __init__(self, encoding:str = "utf-8"):
+        """!
+        @brief HashSink constructor
+        @param encoding {string} Text encoding used to hash the output
+        """
+        ## Text encoding
+        self.encoding = encoding
+        ## Running sha256 hash of the encoded text
+        self.hasher = hashlib.sha256()
+        ## Encoded byte count
+        self.size = 0
+
+    def write(self, text:str)->int:
+        """!
+        @brief Add the text to the hash
+        @param text {string} Text to add
+        @return integer - Number of characters written
+        """
+        data = text.encode(self.encoding)
+        self.hasher.update(data)
+        self.size += len(data)
+        return len(text)
+
+    def writelines(self, lines:list):
+        """!
+        @brief Add the text lines to the hash
+        @param lines {list of strings} Text lines to add
+        """
+        self.write("".join(lines))
+
+    def close(self):
+        """!
+        @brief File interface, nothing to release
+        """
+
+    def hexdigest(self)->str:
+        """!
+        @brief Get the current hash value
+        @return string - sha256 hex digest of the text written so far
+        """
+        return self.hasher.hexdigest()
+
+class LineSink():
+    """!
+    @brief Output sink that keeps every written string as a list entry
+
+    Backs the list returning generator methods, the text is written by the
+    same emit code that streams into a CodeEmitter.
+    """
+    def __init__(self):
+        """!
+        @brief LineSink constructor
+        """
+        ## Written strings
+        self.lines = []
+
+    def write(self, text:str)->int:
+        """!
+        @brief Add the text as a list entry
+        @param text {string} Text to add
+        @return integer - Number of characters written
+        """
+        self.lines.append(text)
+        return len(text)
+
+    def writelines(self, lines:list):
+        """!
+        @brief Add the text lines as list entries
+        @param lines {list of strings} Text lines to add
+        """
+        self.lines.extend(lines)
+
+class CodeEmitter():
+    """!
+    @brief Streaming code emitter
+
+    File like writer that collects generated text into a bounded buffer and
+    streams it to the output sink (open file, StringIO, HashSink, ...) in large
+    chunks. The generators render pre-indented text, the emitter only buffers it.
+    """
+    def __init__(self, sink, buffer_size:int = 65536, owns_sink:bool = False):
+        """!
+        @brief CodeEmitter constructor
+        @param sink {object} Output sink, any object with a write(string) method
+        @param buffer_size {integer} Buffered character count that triggers a sink write
+        @param owns_sink {boolean} True to close the sink on close(), False to leave it open
+        """
+        ## Output sink
+        self.sink = sink
+        ## True if close() also closes the sink
+        self.owns_sink = owns_sink
+        ## Buffered character count that triggers a sink write
+        self.buffer_size = buffer_size
+        ## Pending text buffer
+        self.buffer = []
+        ## Pending text buffer character count
+        self.buffer_count = 0
+
+    def write(self, text:str)->int:
+        """!
+        @brief Write raw text, file interface
+        @param text {string} Text to write
+        @return integer - Number of characters written
+        """
+        self.buffer.append(text)
+        self.buffer_count += len(text)
+        if self.buffer_count >= self.buffer_size:
+            self.flush()
+        return len(text)
+
+    def writelines(self, lines:list):
+        """!
+        @brief Write pre-formatted text lines, file interface
+        @param lines {list of strings} Text lines to write, any iterable of strings
+        """
+        if not isinstance(lines, (list, tuple)):
+            # Read a generator or iterator input once for both the buffer and the count
+            lines = list(lines)
+        self.buffer.extend(lines)
+        self.buffer_count += sum(map(len, lines))
+        if self.buffer_count >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """!
+        @brief Write the pending text buffer to the sink
+        """
+        if self.buffer:
+            self.sink.write("".join(self.buffer))
+            self.buffer = []
+            self.buffer_count = 0
+
+    def close(self):
+        """!
+        @brief Flush the pending text, close the sink if it is owned by the emitter
+        """
+        self.flush()
+        if self.owns_sink:
+            self.sink.close()
+
+    def __enter__(self):
+        """!
+        @brief Context manager entry
+        @return CodeEmitter - self
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """!
+        @brief Context manager exit, flush the pending text
+        @return boolean - False, exceptions are not suppressed
+        """
+        self.flush()
+        return False
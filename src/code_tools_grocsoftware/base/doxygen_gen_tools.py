@@ -27,6 +27,7 @@ for a language string generation library
 
 from code_tools_grocsoftware.base.param_return_tools import ParamRetDict
 from code_tools_grocsoftware.base.text_format import mult_line_format
+from code_tools_grocsoftware.base.profiler import profile_span
 
 #============================================================================
 #============================================================================
@@ -225,6 +226,7 @@ class DoxyCommentGenerator():
         # return the final formated data string list
         return ret_list
 
+    @profile_span("DoxyCommentGenerator.method_comment")
     def gen_doxy_method_comment(self, brief_desc:str, param_dict_list:list,
                                 ret_dict:dict = None, long_desc:str = None,
                                 block_indent:int = 0)->list:
@@ -29,11 +29,13 @@ import json
 
 from code_tools_grocsoftware.base.commit_check import get_commit_flag
 from code_tools_grocsoftware.base.commit_check import new_entry_correct
+from code_tools_grocsoftware.base.profiler import profile_span
 
 class LanguageDescriptionList():
     """!
     Language description list data
     """
+    @profile_span("LanguageDescriptionList.load")
     def __init__(self, lang_list_file_name = None):
         """!
         @brief LanguageDescriptionList constructor
@@ -133,6 +135,50 @@ class LanguageDescriptionList():
         """
         return list(self.lang_json_data['languages'].keys())
 
+    def select_languages(self, selection:list)->bool:
+        """!
+        @brief Restrict the language list to a build subset
+
+        Each selection entry can be a language name or a language compile switch.
+        If the default language is not selected the first selected language
+        becomes the default so the selection fallback stays in the subset.
+
+        @param selection {list of strings} Language names or compile switches to keep
+        @return boolean - True if the list was restricted, False if the selection is invalid
+        """
+        switch_names = {}
+        for lang_name, lang_entry in self.lang_json_data['languages'].items():
+            switch_names[lang_entry['compileSwitch']] = lang_name
+
+        selected_names = []
+        for entry in selection:
+            if entry.lower() in self.lang_json_data['languages'].keys():
+                lang_name = entry.lower()
+            elif entry in switch_names:
+                lang_name = switch_names[entry]
+            else:
+                self._print_error("Unknown language subset entry: "+entry)
+                return False
+
+            if lang_name not in selected_names:
+                selected_names.append(lang_name)
+
+        if not selected_names:
+            self._print_error("The language subset must select at least one language.")
+            return False
+
+        # Keep the language file order so the generated output is stable
+        subset = {}
+        for lang_name, lang_entry in self.lang_json_data['languages'].items():
+            if lang_name in selected_names:
+                subset[lang_name] = lang_entry
+        self.lang_json_data['languages'] = subset
+
+        default_name, _ = self.get_default_data()
+        if default_name not in subset:
+            self.set_default(list(subset.keys())[0])
+        return True
+
     def get_property_data(self, language_name:str, property_name:str):
         """!
         @brief Get a list of the current defined languages
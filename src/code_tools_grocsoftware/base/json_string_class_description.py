@@ -36,12 +36,14 @@ from code_tools_grocsoftware.base.translate import Translator
 from code_tools_grocsoftware.base.commit_check import get_commit_over_write_flag
 from code_tools_grocsoftware.base.commit_check import get_commit_flag
 from code_tools_grocsoftware.base.commit_check import new_entry_correct
+from code_tools_grocsoftware.base.profiler import profile_span
 
 class StringClassDescription():
     """!
     String object class definitions
     """
 
+    @profile_span("StringClassDescription.load")
     def __init__(self, string_def_file_name:str = None):
         """!
         @brief StringClassDescription constructor
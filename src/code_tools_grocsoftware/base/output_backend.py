@@ -0,0 +1,438 @@
+"""@package langstringautogen
+Pluggable output backends for the generated files, disk, in-memory and hash only
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+
+import filecmp
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+
+from code_tools_grocsoftware.base.code_emitter import HashSink
+from code_tools_grocsoftware.base.profiler import profile_span
+
+class DiskOutputBackend():
+    """!
+    @brief Output backend that writes the generated files to the file system
+    """
+    def exists(self, path:str)->bool:
+        """!
+        @brief Check if the path exists
+        @param path {string} File or directory path
+        @return boolean - True if the path exists, else False
+        """
+        return os.path.exists(path)
+
+    def make_dir(self, path:str):
+        """!
+        @brief Create a directory
+        @param path {string} Directory path
+        @exception OSError Directory could not be created
+        """
+        os.mkdir(path)
+
+    def open_file(self, path:str):
+        """!
+        @brief Open a file for writing
+        @param path {string} File path
+        @return file - Open text file
+        @exception OSError File could not be opened
+        """
+        return open(path, mode='wt', encoding="utf-8") # pylint: disable=consider-using-with
+
+class MemoryFile(io.StringIO):
+    """!
+    @brief In-memory output file that keeps its text after close()
+    """
+    def __init__(self):
+        """!
+        @brief MemoryFile constructor
+        """
+        super().__init__()
+        ## File text saved on close
+        self.text = None
+
+    def close(self):
+        """!
+        @brief Save the text and close the file
+        """
+        if not self.closed:
+            self.text = self.getvalue()
+        super().close()
+
+    def get_text(self)->str:
+        """!
+        @brief Get the file text
+        @return string - Current file text
+        """
+        if self.closed:
+            return self.text
+        return self.getvalue()
+
+    def hexdigest(self)->str:
+        """!
+        @brief Get the sha256 digest of the file text, same interface as HashSink
+        @return string - Hex digest of the utf-8 encoded text
+        """
+        return hashlib.sha256(self.get_text().encode("utf-8")).hexdigest()
+
+class VirtualOutputBackend():
+    """!
+    @brief Common base of the output backends that do not write to the file system
+
+    Directories and files only exist in memory. Existing file system
+    directories are reported as existing so an existing output directory
+    can be used as the base directory. Each output file object provides a
+    hexdigest() of its utf-8 encoded text.
+    """
+    def __init__(self):
+        """!
+        @brief VirtualOutputBackend constructor
+        """
+        ## Created directory set
+        self.dirs = set()
+        ## Output files, {path: file object}
+        self.files = {}
+
+    def exists(self, path:str)->bool:
+        """!
+        @brief Check if the path exists in memory or on the file system
+        @param path {string} File or directory path
+        @return boolean - True if the path exists, else False
+        """
+        return (path in self.dirs) or (path in self.files) or os.path.exists(path)
+
+    def make_dir(self, path:str):
+        """!
+        @brief Create an in-memory directory
+        @param path {string} Directory path
+        """
+        self.dirs.add(path)
+
+    def get_file_names(self)->list:
+        """!
+        @brief Get the sorted output file path list
+        @return list of strings - Output file paths
+        """
+        return sorted(self.files.keys())
+
+    def get_digest(self, path:str)->str:
+        """!
+        @brief Get the sha256 digest of the generated file text
+        @param path {string} File path
+        @return string - Hex digest of the utf-8 encoded text
+        """
+        return self.files[path].hexdigest()
+
+    def get_changed_files(self)->list:
+        """!
+        @brief Compare the generated files with the files on the file system
+
+        The raw file bytes are compared with the utf-8 encoded generated text,
+        line ending or encoding differences are reported as changed.
+
+        @return list of tuples - (path, status) for each generated file that differs,
+                                 status is "new" or "changed"
+        """
+        changed = []
+        for path in self.get_file_names():
+            if not os.path.isfile(path):
+                changed.append((path, "new"))
+            else:
+                with open(path, mode='rb') as disk_file:
+                    disk_digest = hashlib.sha256(disk_file.read()).hexdigest()
+                if disk_digest != self.get_digest(path):
+                    changed.append((path, "changed"))
+        return changed
+
+class MemoryOutputBackend(VirtualOutputBackend):
+    """!
+    @brief Output backend that keeps the generated files in a dictionary
+    """
+    def open_file(self, path:str):
+        """!
+        @brief Open an in-memory file for writing
+        @param path {string} File path
+        @return MemoryFile - Open file
+        """
+        outfile = MemoryFile()
+        self.files[path] = outfile
+        return outfile
+
+    def get_text(self, path:str)->str:
+        """!
+        @brief Get the generated text for the path
+        @param path {string} File path
+        @return string - Generated file text
+        """
+        return self.files[path].get_text()
+
+class HashOutputBackend(VirtualOutputBackend):
+    """!
+    @brief Output backend that only keeps a hash of each generated file, the
+           generated text is not available
+    """
+    def open_file(self, path:str):
+        """!
+        @brief Open a hash only file for writing
+        @param path {string} File path
+        @return HashSink - Open hash sink
+        """
+        outfile = HashSink()
+        self.files[path] = outfile
+        return outfile
+
+class StagedOutputBackend(DiskOutputBackend):
+    """!
+    @brief Output backend that builds the new output tree beside the old one and swaps it in
+
+    Files are written to a staging directory next to the output base directory,
+    so the final renames stay on the same file system, and new directories are
+    only recorded. Nothing in the output tree changes before commit().
+
+    commit() builds the complete new tree in the staging directory. The existing
+    output tree is hard linked into it, or copied where links are not supported,
+    the new directories are created and the staged files are moved over their
+    targets. The new tree is flushed to storage and swapped in by renaming the
+    old tree into the staging directory and the new tree to the base directory.
+    Readers see either the old or the new tree, never a mix of both, only
+    between the two renames the base directory is briefly missing. The old tree
+    is kept as the rollback copy until the swap succeeded, if the commit fails
+    the old tree is left or put back in place. If the generation fails, abort()
+    removes the staging directory without touching the output tree.
+
+    An incremental commit only replaces the files whose text changed, the
+    unchanged files keep their time stamps and the build tools do not
+    rebuild them.
+    """
+    def __init__(self, base_dir:str, incremental:bool = False):
+        """!
+        @brief StagedOutputBackend constructor
+        @param base_dir {string} Existing output base directory, the staging directory is
+                                 created in its parent directory
+        @param incremental {boolean} True to leave the existing files with unchanged text in place
+        """
+        ## Output base directory
+        self.base_dir = base_dir
+        ## True if commit() skips the files with unchanged text
+        self.incremental = incremental
+        ## Final paths of the files the last incremental commit left in place
+        self.unchanged = []
+        ## Staging directory path or None if nothing has been staged
+        self.stage_dir = None
+        ## Staged files, {target path: (staged path, file object)}
+        self.staged = {}
+        ## Staged new directory paths in creation order
+        self.staged_dirs = []
+        ## Staged file name counter
+        self.stage_count = 0
+
+    def _get_tree_path(self, tree_dir:str, path:str)->str:
+        """!
+        @brief Get the path of an output file or directory inside a copy of the output tree
+        @param tree_dir {string} Output tree copy directory
+        @param path {string} Output file or directory path
+        @return string - Path inside tree_dir
+        @exception OSError The path is outside the output base directory
+        """
+        rel_path = os.path.relpath(path, self.base_dir)
+        if (rel_path == os.pardir) or rel_path.startswith(os.pardir+os.sep):
+            raise OSError(f"'{path}' is outside the output directory '{self.base_dir}'")
+        return os.path.normpath(os.path.join(tree_dir, rel_path))
+
+    def _get_stage_dir(self)->str:
+        """!
+        @brief Get the staging directory, create it next to the output base directory if needed
+        @return string - Staging directory path
+        """
+        if self.stage_dir is None:
+            parent_dir, base_name = os.path.split(os.path.abspath(self.base_dir))
+            self.stage_dir = tempfile.mkdtemp(prefix="."+base_name+".staging-", dir=parent_dir)
+        return self.stage_dir
+
+    def exists(self, path:str)->bool:
+        """!
+        @brief Check if the path exists on the file system or is a staged directory
+        @param path {string} File or directory path
+        @return boolean - True if the path exists, else False
+        """
+        return (path in self.staged_dirs) or os.path.exists(path)
+
+    def make_dir(self, path:str):
+        """!
+        @brief Stage a new directory, it is created by commit()
+        @param path {string} Directory path
+        @exception FileExistsError The path already exists
+        @exception FileNotFoundError The parent directory does not exist
+        @exception OSError The path is outside the output base directory
+        """
+        if self.exists(path):
+            raise FileExistsError(f"'{path}' already exists")
+        if not self.exists(os.path.dirname(path)):
+            raise FileNotFoundError(f"'{os.path.dirname(path)}' does not exist")
+        self._get_tree_path(self.base_dir, path)
+        self.staged_dirs.append(path)
+
+    def open_file(self, path:str):
+        """!
+        @brief Open a staged file for writing
+        @param path {string} Final file path
+        @return file - Open text file in the staging directory
+        @exception OSError File could not be opened or is outside the output base directory
+        """
+        self._get_tree_path(self.base_dir, path)
+        stage_dir = self._get_stage_dir()
+
+        if path in self.staged:
+            # Reopened, the earlier staged copy is discarded
+            self.staged[path][1].close()
+
+        # The staging directory is private, a simple counter is a unique name
+        stage_path = os.path.join(stage_dir, str(self.stage_count))
+        self.stage_count += 1
+        outfile = open(stage_path, mode='xt', encoding="utf-8") # pylint: disable=consider-using-with
+        self.staged[path] = (stage_path, outfile)
+        return outfile
+
+    def get_file_names(self)->list:
+        """!
+        @brief Get the sorted staged file path list
+        @return list of strings - Final output file paths
+        """
+        return sorted(self.staged.keys())
+
+    def _sync_files(self):
+        """!
+        @brief Close the staged files and flush their data to storage
+        """
+        for stage_path, outfile in self.staged.values():
+            if not outfile.closed:
+                outfile.close()
+            with open(stage_path, mode='rb') as stage_file:
+                os.fsync(stage_file.fileno())
+
+    @staticmethod
+    def _sync_dir(path:str):
+        """!
+        @brief Flush the directory entries to storage
+        @param path {string} Directory path
+        """
+        if not hasattr(os, "O_DIRECTORY"):
+            # Directory handles can not be synced on this platform
+            return
+        dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    @staticmethod
+    def _link_file(src:str, dst:str):
+        """!
+        @brief Hard link an existing output file into the new tree, copy it if links fail
+        @param src {string} Existing output file path
+        @param dst {string} New tree file path
+        """
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    def _build_tree(self, tree_dir:str):
+        """!
+        @brief Build the new output tree from the existing tree and the staged data
+        @param tree_dir {string} New tree directory path, it must not exist
+        """
+        shutil.copytree(self.base_dir, tree_dir, symlinks=True, copy_function=self._link_file)
+        for path in self.staged_dirs:
+            os.makedirs(self._get_tree_path(tree_dir, path), exist_ok=True)
+
+        for path, (stage_path, _) in self.staged.items():
+            tree_path = self._get_tree_path(tree_dir, path)
+            if self.incremental and os.path.isfile(tree_path) and \
+               filecmp.cmp(stage_path, tree_path, shallow=False):
+                # Keep the existing file link and its time stamp
+                self.unchanged.append(path)
+            else:
+                os.replace(stage_path, tree_path)
+
+        for dir_path, _, _ in os.walk(tree_dir):
+            self._sync_dir(dir_path)
+
+    def _swap_tree(self, tree_dir:str, old_dir:str):
+        """!
+        @brief Move the old output tree aside and rename the new tree to the base directory
+        @param tree_dir {string} New tree directory path
+        @param old_dir {string} Directory path the old tree is moved to
+        """
+        base_path = os.path.abspath(self.base_dir)
+        os.rename(base_path, old_dir)
+        try:
+            os.rename(tree_dir, base_path)
+        except OSError:
+            # Put the old tree back
+            os.rename(old_dir, base_path)
+            raise
+        self._sync_dir(os.path.dirname(base_path))
+
+    @profile_span()
+    def commit(self)->bool:
+        """!
+        @brief Build the new output tree and swap it in for the old tree
+        @return boolean - True if the new tree was published, else False and the old
+                          tree is left in place
+        """
+        return_val = True
+        self.unchanged = []
+        if self.staged or self.staged_dirs:
+            stage_dir = self._get_stage_dir()
+            try:
+                self._sync_files()
+                self._build_tree(os.path.join(stage_dir, "tree"))
+                self._swap_tree(os.path.join(stage_dir, "tree"), os.path.join(stage_dir, "old"))
+            except OSError as error:
+                return_val = False
+                self.unchanged = []
+                print(f"Failed to commit the staged output files: {error}")
+
+        self.abort()
+        return return_val
+
+    def abort(self):
+        """!
+        @brief Discard any remaining staged files and directories and the old output tree
+        """
+        for _, outfile in self.staged.values():
+            if not outfile.closed:
+                outfile.close()
+        self.staged = {}
+        self.staged_dirs = []
+
+        if self.stage_dir is not None:
+            shutil.rmtree(self.stage_dir, ignore_errors=True)
+            self.stage_dir = None
@@ -0,0 +1,376 @@
+"""@package langstringautogen
+Generation pipeline span timers, counters and timing reports
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+
+class _NullSpan():
+    """!
+    @brief Span context used when the profiler is disabled, does nothing
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+class _Span():
+    """!
+    @brief Span context that times the enclosed block
+    """
+    def __init__(self, profiler, name:str):
+        """!
+        @brief _Span constructor
+        @param profiler {PhaseProfiler} Profiler to record the span in
+        @param name {string} Span name
+        """
+        ## Profiler to record the span in
+        self.profiler = profiler
+        ## Span name
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.begin(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.end()
+        return False
+
+## Shared do nothing span returned by span() when the profiler is disabled
+_NULL_SPAN = _NullSpan()
+
+class PhaseProfiler():
+    """!
+    @brief Span timer and counter collection for the generation pipeline
+
+    Spans nest, each span records its inclusive time and its self time, the
+    time not spent in child spans. When the profiler is disabled span() returns
+    a shared do nothing context and count() returns at once.
+
+    In memory mode tracemalloc traces the allocations, each span also records its
+    peak traced memory and the outermost spans record their top allocation sites.
+    """
+    def __init__(self, enabled:bool = False, clock = time.perf_counter):
+        """!
+        @brief PhaseProfiler constructor
+        @param enabled {boolean} True to start recording at once
+        @param clock {function} Time source in seconds
+        """
+        ## True if spans and counters are recorded
+        self.enabled = enabled
+        ## Time source in seconds
+        self.clock = clock
+        ## Time origin of the trace events
+        self.origin = clock()
+        ## Completed span list [(name, start seconds, duration seconds, depth)]
+        self.events = []
+        ## Span statistics {name: [calls, inclusive seconds, self seconds, max seconds]}
+        self.stats = {}
+        ## Counter values {name: value}
+        self.counters = {}
+        ## Open span stack [[name, start seconds, child seconds, start bytes, peak bytes]]
+        self.stack = []
+        ## True if the span peak memory and allocation sites are recorded
+        self.memory = False
+        ## True if enable() started tracemalloc and stops it again
+        self.started_tracemalloc = False
+        ## Number of allocation sites kept for each outermost span
+        self.site_count = 10
+        ## Span memory statistics {name: [peak bytes, peak bytes above the span start]}
+        self.memory_stats = {}
+        ## Outermost span allocation sites {name: [(file:line, bytes, allocation count)]}
+        self.memory_sites = {}
+        ## Traced memory samples at each span end [(seconds, current bytes, span peak bytes)]
+        self.memory_events = []
+
+    def enable(self, enabled:bool = True, memory:bool = False):
+        """!
+        @brief Start or stop recording
+        @param enabled {boolean} True to record spans and counters
+        @param memory {boolean} True to also record the span peak memory and the
+                                top allocation sites with tracemalloc
+        """
+        self.enabled = enabled
+        self.memory = enabled and memory
+        if not (self.memory or self.started_tracemalloc):
+            return
+        # Only memory mode pays the tracemalloc import time
+        import tracemalloc   # pylint: disable=import-outside-toplevel
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracemalloc = True
+        elif (not self.memory) and self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
+
+    def reset(self):
+        """!
+        @brief Clear all recorded spans and counters
+        """
+        self.origin = self.clock()
+        self.events = []
+        self.stats = {}
+        self.counters = {}
+        self.stack = []
+        self.memory_stats = {}
+        self.memory_sites = {}
+        self.memory_events = []
+
+    def begin(self, name:str):
+        """!
+        @brief Open a span
+        @param name {string} Span name
+        """
+        if self.memory:
+            import tracemalloc   # pylint: disable=import-outside-toplevel
+            # Keep the enclosing span peak, the tracemalloc peak is reset for this span
+            current, peak = self._get_traced_memory()
+            if self.stack:
+                self.stack[-1][4] = max(self.stack[-1][4], peak)
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            self.stack.append([name, self.clock(), 0.0, current, current])
+        else:
+            self.stack.append([name, self.clock(), 0.0, 0, 0])
+
+    def end(self):
+        """!
+        @brief Close the innermost open span and record it
+        """
+        name, start, child_time, start_bytes, peak_bytes = self.stack.pop()
+        duration = self.clock() - start
+        if self.memory:
+            self._end_memory(name, start_bytes, peak_bytes)
+        self.events.append((name, start - self.origin, duration, len(self.stack)))
+
+        stat = self.stats.get(name)
+        if stat is None:
+            self.stats[name] = [1, duration, duration - child_time, duration]
+        else:
+            stat[0] += 1
+            stat[1] += duration
+            stat[2] += duration - child_time
+            stat[3] = max(stat[3], duration)
+
+        if self.stack:
+            self.stack[-1][2] += duration
+
+    @staticmethod
+    def _get_traced_memory()->tuple:
+        """!
+        @brief Get the traced memory and the peak since the last span boundary
+
+        Python 3.8 tracemalloc has no reset_peak(), its peak covers the whole
+        trace. There the peak is tracked by hand from the traced memory at
+        each span start and end, so it misses short lived allocations.
+
+        @return tuple - (current bytes, peak bytes)
+        """
+        import tracemalloc   # pylint: disable=import-outside-toplevel
+        current, peak = tracemalloc.get_traced_memory()
+        if not hasattr(tracemalloc, "reset_peak"):
+            peak = current
+        return current, peak
+
+    def _end_memory(self, name:str, start_bytes:int, peak_bytes:int):
+        """!
+        @brief Record the peak memory of a closed span
+        @param name {string} Span name
+        @param start_bytes {number} Traced memory at the span start
+        @param peak_bytes {number} Peak traced memory of the span child spans
+        """
+        import tracemalloc   # pylint: disable=import-outside-toplevel
+        current, peak = self._get_traced_memory()
+        peak = max(peak, peak_bytes)
+        self.memory_events.append((self.clock() - self.origin, current, peak))
+
+        stat = self.memory_stats.get(name)
+        if stat is None:
+            self.memory_stats[name] = [peak, peak - start_bytes]
+        else:
+            stat[0] = max(stat[0], peak)
+            stat[1] = max(stat[1], peak - start_bytes)
+
+        if self.stack:
+            self.stack[-1][4] = max(self.stack[-1][4], peak)
+        else:
+            # Outermost span, keep the largest live allocation sites outside the profiler
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__)])
+            sites = []
+            for stat_line in snapshot.statistics('lineno')[:self.site_count]:
+                frame = stat_line.traceback[0]
+                sites.append((f"{frame.filename}:{frame.lineno}", stat_line.size, stat_line.count))
+            self.memory_sites[name] = sites
+
+    def span(self, name:str):
+        """!
+        @brief Get a span context for a with block
+        @param name {string} Span name
+        @return context - Timing span, or a do nothing span if the profiler is disabled
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def count(self, name:str, value:int = 1):
+        """!
+        @brief Add to a counter
+        @param name {string} Counter name
+        @param value {number} Value to add
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def get_table(self)->list:
+        """!
+        @brief Format the span statistics and counters as a flat table
+        @return list of strings - Table lines, spans sorted by self time
+        """
+        name_width = max([len(name) for name in self.stats] + [len(name) for name in self.counters] + [4])
+        lines = [f"{'Span':{name_width}s} {'Calls':>8s} {'Total ms':>10s} {'Self ms':>10s} "
+                 f"{'Mean ms':>10s} {'Max ms':>10s}\n"]
+        ordered = sorted(self.stats.items(), key=lambda item: item[1][2], reverse=True)
+        for name, (calls, total, self_time, max_time) in ordered:
+            lines.append(f"{name:{name_width}s} {calls:8d} {total*1000:10.3f} {self_time*1000:10.3f} "
+                         f"{total*1000/calls:10.3f} {max_time*1000:10.3f}\n")
+
+        if self.memory_stats:
+            lines.append("\n")
+            lines.append(f"{'Span':{name_width}s} {'Peak KiB':>12s} {'Growth KiB':>12s}\n")
+            ordered = sorted(self.memory_stats.items(), key=lambda item: item[1][1], reverse=True)
+            for name, (peak, growth) in ordered:
+                lines.append(f"{name:{name_width}s} {peak/1024:12.1f} {growth/1024:12.1f}\n")
+
+        for name, sites in self.memory_sites.items():
+            lines.append("\n")
+            lines.append(f"Top allocation sites after {name}\n")
+            for site, size, count in sites:
+                lines.append(f"  {size/1024:10.1f} KiB {count:8d} blocks  {site}\n")
+
+        if self.counters:
+            lines.append("\n")
+            lines.append(f"{'Counter':{name_width}s} {'Value':>8s}\n")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:{name_width}s} {value:8d}\n")
+        return lines
+
+    def get_chrome_trace(self)->dict:
+        """!
+        @brief Format the recorded spans and counters as Chrome trace event data
+        @return dictionary - Trace event JSON data for chrome://tracing or Perfetto
+        """
+        pid = os.getpid()
+        trace_events = []
+        for name, start, duration, depth in self.events:
+            trace_events.append({'name': name, 'cat': name.split('.')[0], 'ph': 'X',
+                                 'ts': start*1000000, 'dur': duration*1000000,
+                                 'pid': pid, 'tid': 0, 'args': {'depth': depth}})
+        end_time = (self.clock() - self.origin)*1000000
+        for event_time, current, peak in self.memory_events:
+            trace_events.append({'name': "traced memory", 'ph': 'C', 'ts': event_time*1000000,
+                                 'pid': pid, 'tid': 0, 'args': {'current': current, 'peak': peak}})
+        for name, value in sorted(self.counters.items()):
+            trace_events.append({'name': name, 'ph': 'C', 'ts': end_time,
+                                 'pid': pid, 'tid': 0, 'args': {'value': value}})
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def write_report(self, report_format:str = "table", filename:str = None):
+        """!
+        @brief Write the timing table or the Chrome trace
+        @param report_format {string} 'table' or 'trace'
+        @param filename {string} Output file name, None = table to stderr,
+                                 trace to code_tools_trace.json
+        """
+        if report_format == "trace":
+            if filename is None:
+                filename = "code_tools_trace.json"
+            with open(filename, 'w', encoding='utf-8') as trace_file:
+                json.dump(self.get_chrome_trace(), trace_file)
+        elif filename is None:
+            sys.stderr.writelines(self.get_table())
+        else:
+            with open(filename, 'w', encoding='utf-8') as table_file:
+                table_file.writelines(self.get_table())
+
+## Shared generation pipeline profiler
+profiler = PhaseProfiler()
+
+def profile_span(name:str = None):
+    """!
+    @brief Decorator that times each call of the function as a profiler span
+
+    When the profiler is disabled the wrapper only checks the enabled flag.
+
+    @param name {string} Span name, None = function qualified name
+    @return function - Function decorator
+    """
+    def decorator(func):
+        span_name = name if name is not None else func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            profiler.begin(span_name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.end()
+        return wrapper
+    return decorator
+
+def configure_from_env(environ:dict = None)->bool:
+    """!
+    @brief Enable the shared profiler from the environment
+
+    CODE_TOOLS_PROFILE=table prints the timing table to stderr at exit,
+    CODE_TOOLS_PROFILE=trace writes the Chrome trace at exit.
+    CODE_TOOLS_PROFILE_FILE sets the report file name and
+    CODE_TOOLS_PROFILE_MEMORY=1 adds the tracemalloc peak memory report.
+
+    @param environ {dictionary} Environment variables, None = os.environ
+    @return boolean - True if profiling was enabled
+    """
+    if environ is None:
+        environ = os.environ
+
+    report_format = environ.get("CODE_TOOLS_PROFILE", "")
+    if report_format not in ["table", "trace"]:
+        return False
+
+    profiler.enable(memory=environ.get("CODE_TOOLS_PROFILE_MEMORY", "0") not in ["", "0"])
+    atexit.register(profiler.write_report, report_format, environ.get("CODE_TOOLS_PROFILE_FILE", None))
+    return True
+
+configure_from_env()
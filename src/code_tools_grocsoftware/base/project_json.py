@@ -25,16 +25,20 @@ Utility to create a json language description list
 #==========================================================================
 
 import json
+import os
 from datetime import date
 
 from code_tools_grocsoftware.base.eula import EulaText
 from code_tools_grocsoftware.base.json_language_list import LanguageDescriptionList
 from code_tools_grocsoftware.base.json_string_class_description import StringClassDescription
+from code_tools_grocsoftware.base.string_class_model import StringClassModel
+from code_tools_grocsoftware.base.profiler import profile_span
 
 class ProjectDescription():
     """!
     Language description list data
     """
+    @profile_span("ProjectDescription.load")
     def __init__(self, project_data_file_name:str = None):
         """!
         @brief LanguageDescriptionList constructor
@@ -48,6 +52,9 @@ class ProjectDescription():
         ## JSON language description data from the file
         self.project_json_data = {}
 
+        ## Loaded data objects {(data type, file name, ...): object}, None to load them on every get
+        self.data_cache = None
+
         if project_data_file_name is not None:
             self.filename = project_data_file_name
             try:
@@ -80,6 +87,43 @@ class ProjectDescription():
                                              'minor':1,
                                              'patch':0}}
 
+    def enable_data_cache(self, enabled:bool = True, shared_cache:dict = None):
+        """!
+        @brief Share one loaded language list and string description between all callers
+
+        The generators only read the language and string data, with the cache
+        enabled the data files are parsed once instead of once per generator.
+        The cache entries are keyed by the data file names, project descriptions
+        given the same shared_cache dictionary share the data files they have
+        in common.
+
+        @param enabled (boolean) - True to cache the loaded data, False to load
+                                   the data files on every get
+        @param shared_cache (dictionary) - Cache shared with other project descriptions,
+                                           None for a cache private to this project
+        """
+        if not enabled:
+            self.data_cache = None
+        elif shared_cache is not None:
+            self.data_cache = shared_cache
+        else:
+            self.data_cache = {}
+
+    def _get_data_key(self, data_type:str, apply_subset:bool = True)->tuple:
+        """!
+        @brief Get the data cache key of a data file
+        @param data_type (string) - 'langDataFile' or 'stringDataFile'
+        @param apply_subset (boolean) - True to include the language subset in the key
+        @return (tuple) - Cache key
+        """
+        file_name = self.project_json_data[data_type]
+        if file_name is not None:
+            file_name = os.path.abspath(file_name)
+        subset = self.get_language_subset()
+        if apply_subset and subset is not None:
+            return (data_type, file_name, tuple(subset))
+        return (data_type, file_name)
+
     def update(self):
         """!
         @brief Update the JSON file with the current contents of self.project_json_data
@@ -118,12 +162,26 @@ class ProjectDescription():
             raise TypeError("EULA text must be a list of strings")
         self.project_json_data['custom_text'] = eula_text
 
-    def get_lang_data(self)->LanguageDescriptionList:
+    def get_lang_data(self, apply_subset:bool = True)->LanguageDescriptionList:
         """!
         @brief Get the language data file name from the JSON data
+        @param apply_subset (boolean) - True restrict the list to the language subset,
+                                        False return every language in the file
         @return (LanguageDescriptionList) - Language data
         """
-        return LanguageDescriptionList(self.project_json_data['langDataFile'])
+        cache_key = self._get_data_key('langDataFile', apply_subset)
+        if (self.data_cache is not None) and (cache_key in self.data_cache):
+            return self.data_cache[cache_key]
+
+        lang_data = LanguageDescriptionList(self.project_json_data['langDataFile'])
+        subset = self.get_language_subset()
+        if apply_subset and subset is not None:
+            if not lang_data.select_languages(subset):
+                raise ValueError("Invalid language subset: "+", ".join(subset))
+
+        if self.data_cache is not None:
+            self.data_cache[cache_key] = lang_data
+        return lang_data
 
     def set_lang_data_name(self, lang_data_name:str = None):
         """!
@@ -133,12 +191,73 @@ class ProjectDescription():
         """
         self.project_json_data['langDataFile'] = lang_data_name
 
+    def get_language_subset(self)->list:
+        """!
+        @brief Get the build language subset from the JSON data
+        @return (list) - Language names or compile switches to build, None to build every language
+        """
+        return self.project_json_data.get('languageSubset', None)
+
+    def set_language_subset(self, subset:list = None):
+        """!
+        @brief Set the build language subset in the JSON data
+
+        @param subset (list) - Language names or compile switches to build,
+                               None to build every language
+        """
+        self.project_json_data['languageSubset'] = subset
+
     def get_string_data(self)->StringClassDescription:
         """!
         @brief Get the string data file name from the JSON data
         @return (StringClassDescription) - String data
         """
-        return StringClassDescription(self.project_json_data['stringDataFile'])
+        cache_key = self._get_data_key('stringDataFile')
+        if (self.data_cache is not None) and (cache_key in self.data_cache):
+            return self.data_cache[cache_key]
+
+        string_data = StringClassDescription(self.project_json_data['stringDataFile'])
+        if self.data_cache is not None:
+            self.data_cache[cache_key] = string_data
+        return string_data
+
+    def get_string_model(self, lang_data:LanguageDescriptionList,
+                         string_data:StringClassDescription)->StringClassModel:
+        """!
+        @brief Get the string class model of the language and string data
+
+        With the data cache enabled the model, and the translation text it
+        parses, is shared by every generator using the same data objects.
+
+        @param lang_data (LanguageDescriptionList) - Language data
+        @param string_data (StringClassDescription) - String data
+        @return (StringClassModel) - String class model
+        """
+        if self.data_cache is None:
+            return StringClassModel(lang_data, string_data)
+
+        # The entry keeps the data objects, their ids can not be reused
+        cache_key = ('stringModel', id(lang_data), id(string_data))
+        cache_entry = self.data_cache.get(cache_key)
+        if (cache_entry is None) or (cache_entry[0] is not lang_data) or \
+           (cache_entry[1] is not string_data):
+            cache_entry = (lang_data, string_data, StringClassModel(lang_data, string_data))
+            self.data_cache[cache_key] = cache_entry
+        return cache_entry[2]
+
+    def get_header_cache(self)->dict:
+        """!
+        @brief Get the rendered file header cache
+
+        With the data cache enabled the rendered copyright and EULA file headers
+        are kept in the data cache, shared by the projects using the same cache
+        and released with it.
+
+        @return (dictionary) - Header cache, None if the data cache is disabled
+        """
+        if self.data_cache is None:
+            return None
+        return self.data_cache.setdefault(('fileHeaders',), {})
 
     def set_string_data_name(self, string_data_name:str = None):
         """!
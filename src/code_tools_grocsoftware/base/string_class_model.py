@@ -0,0 +1,261 @@
+"""@package langstringautogen
+Language neutral string class model shared by the code generators
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+
+from code_tools_grocsoftware.base.param_return_tools import ParamRetDict
+from code_tools_grocsoftware.base.json_language_list import LanguageDescriptionList
+from code_tools_grocsoftware.base.json_string_class_description import StringClassDescription
+from code_tools_grocsoftware.base.translate_text_parser import TransTxtParser
+
+class StringMethodModel():
+    """!
+    @brief String class method model entry
+    """
+    def __init__(self, name:str, desc:str, params:list, ret:dict, property_name:str = None):
+        """!
+        @brief StringMethodModel constructor
+
+        @param name {string} Method name
+        @param desc {string} Brief method description
+        @param params {list of dictionaries} Method input parameter definitions(s)
+        @param ret {dictionary} Return data definition
+        @param property_name {string} Language property name for property methods,
+                                      None for translate methods
+        """
+        ## Method name
+        self.name = name
+        ## Brief method description
+        self.desc = desc
+        ## Method input parameter list
+        self.params = params
+        ## Method return dictionary
+        self.ret = ret
+        ## Language property name or None if this is a translate method
+        self.property_name = property_name
+
+        ## Method input parameter name list
+        self.param_names = [ParamRetDict.get_param_name(param) for param in params]
+        ## True if the method returns a list
+        self.is_list = ParamRetDict.is_return_list(ret)
+        ## True if the property value is text, always False for translate methods
+        self.is_text = (property_name is not None) and LanguageDescriptionList.is_property_text(property_name)
+
+    def is_property(self)->bool:
+        """!
+        @brief Check if this is a property method
+        @return boolean - True if this is a property method, else False
+        """
+        return self.property_name is not None
+
+class LanguageClassModel():
+    """!
+    @brief Language specific string class model
+
+    Language property values and parsed translation text are resolved from the
+    JSON data on first use and kept for every following backend.
+    """
+    def __init__(self, lang_name:str, lang_data:LanguageDescriptionList,
+                 str_data:StringClassDescription):
+        """!
+        @brief LanguageClassModel constructor
+
+        @param lang_name {string} Language name
+        @param lang_data {LanguageDescriptionList} Language description data
+        @param str_data {StringClassDescription} String class description data
+        """
+        ## Language name
+        self.lang_name = lang_name
+        ## Language class name
+        self.class_name = str_data.get_language_class_name(lang_name)
+        ## Language ISO 639-1 code
+        self.iso_code = lang_data.get_iso_code_data(lang_name)
+
+        ## Language description data
+        self.lang_data = lang_data
+        ## String class description data
+        self.str_data = str_data
+
+        ## Resolved property values, {property_name: value}
+        self.property_values = {}
+        ## Resolved translation text, {method_name: parsed text tuple list}
+        self.translate_text = {}
+        ## Assembled unittest expected strings, {(method_name, test values): string}
+        self.test_strings = {}
+
+    def get_property_value(self, property_name:str):
+        """!
+        @brief Get the language property value
+        @param property_name {string} Language property name
+        @return any - Property value
+        """
+        if property_name not in self.property_values:
+            self.property_values[property_name] = self.lang_data.get_property_data(self.lang_name,
+                                                                                   property_name)
+        return self.property_values[property_name]
+
+    def get_translate_text(self, method_name:str)->list:
+        """!
+        @brief Get the parsed translation text for the translate method
+        @param method_name {string} Translate method name
+        @return list of tuples - Parsed text tuple list
+        """
+        if method_name not in self.translate_text:
+            self.translate_text[method_name] = self.str_data.get_tranlate_method_text_data(method_name,
+                                                                                           self.iso_code)
+        return self.translate_text[method_name]
+
+    def get_property_items(self, method:StringMethodModel)->list:
+        """!
+        @brief Get the property method body data as an item list
+        @param method {StringMethodModel} Property method model
+        @return list - Property value list, single values are returned as a one item list
+        """
+        value = self.get_property_value(method.property_name)
+        if method.is_list:
+            return list(value)
+        return [value]
+
+    def get_test_expected(self, method:StringMethodModel, test_values:dict):
+        """!
+        @brief Get the unittest expected data for the method
+        @param method {StringMethodModel} Property or translate method model
+        @param test_values {dictionary} Test parameter values, {param_name: (value, is_text)}
+        @return list or string - Expected property item list or expected translate string
+        """
+        if method.is_property():
+            return self.get_property_items(method)
+
+        key = (method.name, tuple((name, tuple(value)) for name, value in sorted(test_values.items())))
+        if key not in self.test_strings:
+            self.test_strings[key] = TransTxtParser.assemble_test_return_string(self.get_translate_text(method.name),
+                                                                                test_values)
+        return self.test_strings[key]
+
+class StringClassModel():
+    """!
+    @brief Language neutral string class model
+
+    Method and language data are resolved from the JSON data once, on first
+    use, so the C++, python and typescript generators can all render from the
+    same model.
+    """
+    def __init__(self, lang_data:LanguageDescriptionList, str_data:StringClassDescription):
+        """!
+        @brief StringClassModel constructor
+
+        @param lang_data {LanguageDescriptionList} Language description data
+        @param str_data {StringClassDescription} String class description data
+        """
+        ## Language description data
+        self.lang_data = lang_data
+        ## String class description data
+        self.str_data = str_data
+
+        ## Base class name
+        self.base_class_name = str_data.get_language_class_name()
+        ## Namespace name
+        self.namespace_name = str_data.get_namespace_name()
+
+        ## Property method name list
+        self.property_method_names = str_data.get_property_method_list()
+        ## Translate method name list
+        self.translate_method_names = str_data.get_tranlate_method_list()
+
+        ## Resolved property methods, {method_name: StringMethodModel}
+        self.property_methods = {}
+        ## Resolved translate methods, {method_name: StringMethodModel}
+        self.translate_methods = {}
+        ## Language class models, {lang_name: LanguageClassModel}
+        self.languages = {}
+
+    def get_property_method(self, method_name:str)->StringMethodModel:
+        """!
+        @brief Get the property method model, resolve it if needed
+        @param method_name {string} Property method name
+        @return StringMethodModel - Method model
+        """
+        if method_name not in self.property_methods:
+            prop_name, desc, params, ret = self.str_data.get_property_method_data(method_name)
+            self.property_methods[method_name] = StringMethodModel(method_name, desc, params,
+                                                                   ret, prop_name)
+        return self.property_methods[method_name]
+
+    def get_translate_method(self, method_name:str)->StringMethodModel:
+        """!
+        @brief Get the translate method model, resolve it if needed
+        @param method_name {string} Translate method name
+        @return StringMethodModel - Method model
+        """
+        if method_name not in self.translate_methods:
+            desc, params, ret = self.str_data.get_tranlate_method_function_data(method_name)
+            self.translate_methods[method_name] = StringMethodModel(method_name, desc, params, ret)
+        return self.translate_methods[method_name]
+
+    def get_property_methods(self)->list:
+        """!
+        @brief Get the property method models in declaration order
+        @return list of StringMethodModel - Property method models
+        """
+        return [self.get_property_method(name) for name in self.property_method_names]
+
+    def get_translate_methods(self)->list:
+        """!
+        @brief Get the translate method models in declaration order
+        @return list of StringMethodModel - Translate method models
+        """
+        return [self.get_translate_method(name) for name in self.translate_method_names]
+
+    @staticmethod
+    def get_test_args(method:StringMethodModel, test_values:dict)->list:
+        """!
+        @brief Get the unittest call arguments for the method
+        @param method {StringMethodModel} Property or translate method model
+        @param test_values {dictionary} Test parameter values, {param_name: (value, is_text)}
+        @return list of tuples - (value, is_text) for each method parameter, parameters
+                                 without a test value default to ("42", False)
+        """
+        return [test_values.get(name, ("42", False)) for name in method.param_names]
+
+    def get_language(self, lang_name:str)->LanguageClassModel:
+        """!
+        @brief Get the language class model, resolve it if needed
+        @param lang_name {string} Language name
+        @return LanguageClassModel - Language class model
+        """
+        if lang_name not in self.languages:
+            self.languages[lang_name] = LanguageClassModel(lang_name, self.lang_data, self.str_data)
+        return self.languages[lang_name]
+
+    def get_class_name(self, lang_name:str = None)->str:
+        """!
+        @brief Get the class name
+        @param lang_name {string} Language name or None for the base class
+        @return string - Class name
+        """
+        if lang_name is None:
+            return self.base_class_name
+        return self.get_language(lang_name).class_name
@@ -25,18 +25,30 @@ for a language string generation library
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #==========================================================================
 
+import importlib
+
 __version__ = '0.8.3'
 
 __all__ = ["file_gen_base", "string_class_tools", "linux_lang_select",
            "windows_lang_select", "static_lang_select", "master_lang_select",
-           "class_file_gen", "project_file_gen", "cmake_gen"]
+           "file_skeleton", "class_file_gen", "project_file_gen", "cmake_gen",
+           "build_cli"]
+
+def __getattr__(name:str):
+    """!
+    @brief Import a generator submodule on first access (PEP 562)
+    @param name {string} Submodule name
+    @return module - The imported submodule
+    """
+    if name in __all__:
+        module = importlib.import_module("."+name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from . import file_gen_base
-from . import string_class_tools
-from . import linux_lang_select
-from . import windows_lang_select
-from . import static_lang_select
-from . import master_lang_select
-from . import class_file_gen
-from . import project_file_gen
-from . import cmake_gen
+def __dir__()->list:
+    """!
+    @brief List the package attributes including the submodules not imported yet
+    @return list - Attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
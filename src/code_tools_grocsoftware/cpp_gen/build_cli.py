@@ -0,0 +1,284 @@
+"""@package langstringautogen
+Command line build of a language string library project
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+import argparse
+import os
+import time
+
+from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.base.output_backend import HashOutputBackend, StagedOutputBackend
+from code_tools_grocsoftware.base.profiler import profiler
+from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
+from code_tools_grocsoftware.cpp_gen.cmake_gen import GenerateCmakeFile
+
+def positive_int(value:str)->int:
+    """!
+    @brief Command line argument type for the count and size options
+    @param value {string} Argument text
+    @return integer - Argument value
+    @exception argparse.ArgumentTypeError The value is not an integer of at least 1,
+                                          the parser reports it through parser.error()
+    """
+    try:
+        int_value = int(value)
+    except ValueError:
+        int_value = 0
+    if int_value < 1:
+        raise argparse.ArgumentTypeError(f"invalid positive integer value: '{value}'")
+    return int_value
+
+def make_arg_parser()->argparse.ArgumentParser:
+    """!
+    @brief Make the build command line parser
+    @return argparse.ArgumentParser - Command line parser
+    """
+    parser = argparse.ArgumentParser(prog="code-tools-build",
+                                     description="Generate the language string library source, "
+                                                 "unittest and cmake files of a project")
+    parser.add_argument('project', nargs='+',
+                        help='Project JSON file names, a batch of projects is built in one process '
+                             'with one output subdirectory per project file name')
+    parser.add_argument('-o', '--outpath', dest='gen_file_path', required=True,
+                        help='Existing destination directory for the generated files')
+    parser.add_argument('--jobs', dest='jobs', type=positive_int, default=1,
+                        help='Language file generation worker processes, default = 1')
+    parser.add_argument('--incremental', dest='incremental', action='store_true',
+                        help='Only replace the generated files whose text changed')
+    parser.add_argument('--dry-run', dest='dry_run', action='store_true',
+                        help='Report the files that would change without writing them')
+    parser.add_argument('--profile', dest='profile', choices=['table', 'trace'], default=None,
+                        help='Report the generation phase timing as a table or a Chrome trace')
+    parser.add_argument('--profile-file', dest='profile_file', default=None,
+                        help='Profile report file, default = table to stderr, trace to code_tools_trace.json')
+    parser.add_argument('--profile-memory', dest='profile_memory', action='store_true',
+                        help='Add the tracemalloc span peak memory and top allocation sites to the profile')
+    parser.add_argument('--languages', dest='language_subset', default=None,
+                        help='Comma separated language names or compile switches to build')
+
+    generator_group = parser.add_argument_group('generator options')
+    generator_group.add_argument('--combined-unittest', dest='combined_unittest', action='store_true',
+                                 help='Build all of the language unit tests into one executable')
+    generator_group.add_argument('--typed-unittest', dest='typed_unittest', action='store_true',
+                                 help='Generate one typed unit test for all of the languages')
+    generator_group.add_argument('--no-regex-select', dest='linux_select_regex', action='store_false',
+                                 help='Parse the linux LANG value without std::regex')
+    generator_group.add_argument('--cached-instances', dest='cached_instances', action='store_true',
+                                 help='Return cached language class instances from the selection functions')
+    generator_group.add_argument('--string-view-constants', dest='string_view_constants', action='store_true',
+                                 help='Return std::string_view static text from the parameterless '
+                                      'translate methods')
+    generator_group.add_argument('--append-translate', dest='append_translate', action='store_true',
+                                 help='Build the translate method strings with reserve and append')
+    generator_group.add_argument('--string-table', dest='string_table', action='store_true',
+                                 help='Generate one constexpr string table class for all of the languages')
+    generator_group.add_argument('--langid-table', dest='windows_langid_table', action='store_true',
+                                 help='Look up the full windows LANGID before the primary language switch')
+    generator_group.add_argument('--constexpr-properties', dest='constexpr_properties', action='store_true',
+                                 help='Return the list property values as a std::span of constexpr data, '
+                                      'needs C++20')
+    generator_group.add_argument('--shard-methods', dest='shard_method_count', type=positive_int, default=None,
+                                 help='Split each language source file into shards of this many methods')
+    generator_group.add_argument('--shard-bytes', dest='shard_byte_size', type=positive_int, default=None,
+                                 help='Split each language source file into shards of about this many bytes')
+
+    cmake_group = parser.add_argument_group('cmake options')
+    cmake_group.add_argument('--reuse-objects', dest='reuse_objects', action='store_true',
+                             help='Link the unit tests against the library objects')
+    cmake_group.add_argument('--pch', dest='precompile_headers', action='store_true',
+                             help='Precompile the base interface header')
+    cmake_group.add_argument('--unity-batch', dest='unity_batch_size', type=positive_int, default=None,
+                             help='Unity build the library sources in batches of this size')
+    return parser
+
+def build_project(project_data:ProjectDescription, output_base:str, args:argparse.Namespace)->bool:
+    """!
+    @brief Generate, check and publish the project files
+    @param project_data {ProjectDescription} Loaded project data, shared by all of the generators
+    @param output_base {string} Existing output base directory
+    @param args {argparse.Namespace} Parsed make_arg_parser() options
+    @return boolean - True for pass else False for failure
+    """
+    if args.dry_run:
+        output_backend = HashOutputBackend()
+        if not output_backend.exists(output_base):
+            output_backend.make_dir(output_base)
+    elif not os.path.isdir(output_base):
+        print(f"Error: Output directory '{output_base}' does not exist")
+        return False
+    else:
+        output_backend = StagedOutputBackend(output_base, args.incremental)
+
+    try:
+        proj_gen = ProjectFileGenerator(project_data, output_backend,
+                                        combined_unittest=args.combined_unittest,
+                                        typed_unittest=args.typed_unittest,
+                                        linux_select_regex=args.linux_select_regex,
+                                        cached_instances=args.cached_instances,
+                                        string_view_constants=args.string_view_constants,
+                                        append_translate=args.append_translate,
+                                        string_table=args.string_table,
+                                        windows_langid_table=args.windows_langid_table,
+                                        constexpr_properties=args.constexpr_properties,
+                                        shard_method_count=args.shard_method_count,
+                                        shard_byte_size=args.shard_byte_size)
+    except ValueError as error:
+        print(f"Error: {error}")
+        return False
+
+    build_status = proj_gen.make_dirs(output_base)
+    if build_status:
+        build_status = proj_gen.generate_files(output_base, args.jobs)
+    if build_status:
+        cmake_generator = GenerateCmakeFile(proj_gen)
+        build_status = cmake_generator.generate_cmake(output_base, True,
+                                                      reuse_objects=args.reuse_objects,
+                                                      precompile_headers=args.precompile_headers,
+                                                      unity_batch_size=args.unity_batch_size)
+
+    if args.dry_run:
+        if build_status:
+            changed_files = output_backend.get_changed_files()
+            for file_name, status in changed_files:
+                print (f"{status:8s} {file_name}")
+            print (f"{len(changed_files)} of {len(output_backend.get_file_names())} "
+                   "files would change")
+    elif build_status:
+        file_count = len(output_backend.get_file_names())
+        build_status = output_backend.commit()
+        if build_status and args.incremental:
+            print (f"{file_count - len(output_backend.unchanged)} of {file_count} files changed")
+    else:
+        output_backend.abort()
+
+    return build_status
+
+def get_project_name(project_file:str)->str:
+    """!
+    @brief Get the batch project name
+    @param project_file {string} Project JSON file name
+    @return string - Project file name without the directory and extension
+    """
+    return os.path.splitext(os.path.basename(project_file))[0]
+
+def build_batch(project_files:list, output_base:str, args:argparse.Namespace)->list:
+    """!
+    @brief Build a batch of projects in this process
+
+    The projects share one data cache, a language list or string description
+    used by several projects is parsed once and its string model, with the
+    parsed translation text, is resolved once. The rendered copyright and
+    EULA file headers are kept in the same cache, it is released when the
+    batch ends.
+
+    @param project_files {list} Project JSON file names
+    @param output_base {string} Existing output base directory, a batch of more than
+                                one project builds each project in a subdirectory
+                                named after the project file
+    @param args {argparse.Namespace} Parsed make_arg_parser() options
+    @return list of tuples - [(project name, load seconds, build seconds, status)]
+    """
+    shared_cache = {}
+    results = []
+    for project_file in project_files:
+        project_name = get_project_name(project_file)
+        if len(project_files) > 1:
+            print (f"Building {project_name}")
+
+        if not os.path.isfile(project_file):
+            print(f"Error: Project file '{project_file}' does not exist")
+            results.append((project_name, 0.0, 0.0, False))
+            continue
+
+        project_base = output_base
+        if len(project_files) > 1:
+            project_base = os.path.join(output_base, project_name)
+            if (not args.dry_run) and (not os.path.isdir(project_base)):
+                os.mkdir(project_base)
+
+        start = time.perf_counter()
+        project_data = ProjectDescription(os.path.abspath(project_file))
+        project_data.enable_data_cache(shared_cache=shared_cache)
+        if args.language_subset is not None:
+            project_data.set_language_subset(args.language_subset.split(','))
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        status = build_project(project_data, project_base, args)
+        results.append((project_name, load_time, time.perf_counter() - start, status))
+    return results
+
+def get_batch_summary(results:list)->list:
+    """!
+    @brief Format the batch timing summary
+    @param results {list} build_batch() results
+    @return list of strings - Summary table lines
+    """
+    name_width = max([len("Project")] + [len(result[0]) for result in results])
+    lines = [f"{'Project':{name_width}s} {'Load ms':>10s} {'Build ms':>10s} {'Total ms':>10s} Status\n"]
+    total_load = 0.0
+    total_build = 0.0
+    for project_name, load_time, build_time, status in results:
+        total_load += load_time
+        total_build += build_time
+        lines.append(f"{project_name:{name_width}s} {load_time*1000:10.3f} {build_time*1000:10.3f} "
+                     f"{(load_time+build_time)*1000:10.3f} {'pass' if status else 'FAIL'}\n")
+    failures = len([result for result in results if not result[3]])
+    lines.append(f"{'Total':{name_width}s} {total_load*1000:10.3f} {total_build*1000:10.3f} "
+                 f"{(total_load+total_build)*1000:10.3f} {failures} failed\n")
+    return lines
+
+def command_main(argv:list = None)->int:
+    """!
+    @brief Build command entry point
+    @param argv {list} Command line arguments, None = sys.argv
+    @return integer - Process exit status, 0 for pass else 1
+    """
+    args = make_arg_parser().parse_args(argv)
+
+    output_base = os.path.abspath(args.gen_file_path)
+    if len(args.project) > 1:
+        project_names = [get_project_name(project_file) for project_file in args.project]
+        if len(set(project_names)) != len(project_names):
+            print("Error: The batch project file names must be unique")
+            return 1
+        if not os.path.isdir(output_base):
+            print(f"Error: Output directory '{output_base}' does not exist")
+            return 1
+
+    if args.profile is not None:
+        profiler.enable(memory=args.profile_memory)
+
+    # One project description per project, the generators share its loaded data
+    results = build_batch(args.project, output_base, args)
+    build_status = all(result[3] for result in results)
+    if len(results) > 1:
+        print ("".join(get_batch_summary(results)), end="")
+
+    if args.profile is not None:
+        profiler.write_report(args.profile, args.profile_file)
+        profiler.enable(False)
+    return 0 if build_status else 1
@@ -31,8 +31,12 @@ from code_tools_grocsoftware.base.project_json import ProjectDescription
 from code_tools_grocsoftware.base.json_language_list import LanguageDescriptionList
 from code_tools_grocsoftware.base.json_string_class_description import StringClassDescription
 from code_tools_grocsoftware.base.translate_text_parser import TransTxtParser
+from code_tools_grocsoftware.base.string_class_model import StringClassModel
+from code_tools_grocsoftware.base.code_emitter import LineSink
+from code_tools_grocsoftware.base.profiler import profile_span, profiler
 
 from code_tools_grocsoftware.cpp_gen.string_class_tools import BaseCppStringClassGenerator
+from code_tools_grocsoftware.cpp_gen.file_skeleton import FileSkeleton
 
 from code_tools_grocsoftware.cpp_gen.master_lang_select import MasterSelectFunctionGenerator
 from code_tools_grocsoftware.cpp_gen.linux_lang_select import LinuxLangSelectFunctionGenerator
@@ -45,11 +49,37 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
     data and generates the base and language specific source, include, mock and unittest
     files.
     """
-    def __init__(self, project_data:ProjectDescription):
+    @profile_span()
+    def __init__(self, project_data:ProjectDescription, linux_select_regex:bool = True,
+                 cached_instances:bool = False, string_view_constants:bool = False,
+                 append_translate:bool = False, string_table:bool = False,
+                 windows_langid_table:bool = False, constexpr_properties:bool = False,
+                 shard_method_count:int = None, shard_byte_size:int = None):
         """!
         @brief GenerateBaseLangFile constructor
 
         @param project_data {ProjectDescription} JSON project data object
+        @param linux_select_regex {bool} True to match the linux LANG value with std::regex,
+                                         False to parse it by hand
+        @param cached_instances {bool} True to return cached language class instances from
+                                       the selection functions, False to make a new
+                                       instance on every call
+        @param string_view_constants {bool} True to return std::string_view static text from
+                                            the parameterless translate methods, False to
+                                            return a new string
+        @param append_translate {bool} True to build the translate method strings with
+                                       reserve and append, False to use a string stream
+        @param string_table {bool} True to generate one string table class for all of the
+                                   languages, False to generate a class per language
+        @param windows_langid_table {bool} True to look up the full windows LANGID in a sorted
+                                           table before the primary language switch
+        @param constexpr_properties {bool} True to return the list property values as a
+                                           std::span of static constexpr std::array data,
+                                           False to build a new std::list on every call
+        @param shard_method_count {int} Maximum translate methods per language source file,
+                                        None = no method count limit
+        @param shard_byte_size {int} Maximum translate method definition bytes per language
+                                     source file, None = no byte size limit
         """
         ## Json project data object
         self.project_data = project_data
@@ -63,8 +93,10 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
                          self.project_data.get_version())
 
         ## OS specific language selection function generator list
-        self.os_lang_sel_list = [LinuxLangSelectFunctionGenerator(self.project_data),
-                                 WindowsLangSelectFunctionGenerator(self.project_data)
+        self.os_lang_sel_list = [LinuxLangSelectFunctionGenerator(self.project_data,
+                                                                  linux_select_regex),
+                                 WindowsLangSelectFunctionGenerator(self.project_data,
+                                                                    windows_langid_table)
                                  # Add additional OS lang select classes here
                                  ]
 
@@ -76,6 +108,36 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         self.master_func_gen = MasterSelectFunctionGenerator(self.project_data,
                                                              self.master_function_name)
 
+        ## True to return std::string_view static text from the parameterless translate methods
+        self.string_view_constants = string_view_constants
+        ## True to build the translate method strings with reserve and append
+        self.append_translate = append_translate
+        ## True to return the list property values as a std::span of static constexpr data
+        self.constexpr_properties = constexpr_properties
+        ## Maximum translate methods per language source file shard, None = no limit
+        self.shard_method_count = shard_method_count
+        ## Maximum translate method definition bytes per language source file shard, None = no limit
+        self.shard_byte_size = shard_byte_size
+        ## Parameter types appended as text by the reserve and append translate code
+        self.append_text_types = ['string', 'text']
+        ## Parameter types appended as a single character by the reserve and append translate code
+        self.append_char_types = ['char']
+        ## Parameter types appended with std::to_string() by the reserve and append
+        #  translate code, {type: reserved characters}
+        self.append_number_types = {'integer': 11, 'unsigned': 10, 'size': 20, 'LANGID': 5}
+
+        # Set the selection function instance mode
+        self.cached_instances = cached_instances
+        self.master_func_gen.cached_instances = cached_instances
+        for os_sel_gen in self.os_lang_sel_list:
+            os_sel_gen.cached_instances = cached_instances
+
+        # Set the string table mode
+        self.string_table = string_table
+        self.master_func_gen.string_table = string_table
+        for os_sel_gen in self.os_lang_sel_list:
+            os_sel_gen.string_table = string_table
+
         ## Parameter test value dictionary
         #  {param_name: (value, is_text)}
         #  is_text is True if the value is a text string and should be quoted
@@ -91,8 +153,34 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         if project_data.get_lang_src_using() is not None:
             uselist.extend(project_data.get_lang_src_using())
 
-        for entry in uselist:
-            self.update_xlate_name(entry['stdName'], entry['localName'])
+        self.update_xlate_names([(entry['stdName'], entry['localName']) for entry in uselist])
+
+        # Share the rendered file headers through the project data cache,
+        # without it the headers are only shared by this generator's files
+        self.header_cache = project_data.get_header_cache()
+        if self.header_cache is None:
+            self.header_cache = {}
+
+        ## Language neutral string class model, resolved on first use
+        self.string_model = None
+        ## Language include file skeleton, rendered on first use
+        self.lang_inc_skeleton = None
+        ## Language source file skeleton, rendered on first use
+        self.lang_src_skeleton = None
+        ## True to add a main function to each language unittest file, False if the
+        #  language unittests are linked with the shared write_unittest_main_file() main
+        self.lang_unittest_main = True
+
+    def get_string_model(self)->StringClassModel:
+        """!
+        @brief Get the string class model, resolve it from the JSON data if needed
+        @return StringClassModel - String class model
+        """
+        if self.string_model is None:
+            with profiler.span("StringClassModel.resolve"):
+                self.string_model = self.project_data.get_string_model(self.json_lang_data,
+                                                                       self.json_str_data)
+        return self.string_model
 
     def get_os_lang_sel_list(self)->list:
         """!
@@ -101,21 +189,34 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         """
         return self.os_lang_sel_list
 
+    @staticmethod
+    def _format_test_value(value:str, is_text:bool)->str:
+        """!
+        @brief Format a parameter test value as a C++ argument
+        @param value {string} Test value
+        @param is_text {boolean} True if the value is text, else False
+        @return string - Test value, quoted if it is text
+        """
+        if is_text:
+            return "\""+value+"\""
+        return value
+
     def _get_param_test_value(self, param_name:str)->str:
         """!
         @brief Return the parameter test value
         @param param_name (string) Name fot the value
         @return string - Test value
         """
-        if param_name in self.test_param_values:
-            value, is_text = self.test_param_values[param_name]
-            if is_text:
-                retstr = "\""+value+"\""
-            else:
-                retstr = value
-        else:
-            retstr = "42"
-        return retstr
+        return self._format_test_value(*self.test_param_values.get(param_name, ("42", False)))
+
+    def _get_test_arg_list(self, method_model)->list:
+        """!
+        @brief Return the unittest call argument list for the method
+        @param method_model {StringMethodModel} Method model
+        @return list of strings - Formatted test values
+        """
+        return [self._format_test_value(value, is_text)
+                for value, is_text in StringClassModel.get_test_args(method_model, self.test_param_values)]
 
     def _gen_property_code(self, lang_name:str, property_name:str, property_return:dict)->list:
         """!
@@ -126,12 +227,25 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         @return list of strings - Inline code
         """
         is_text = LanguageDescriptionList.is_property_text(property_name)
+        lang_model = self.get_string_model().get_language(lang_name)
         code_text = []
 
-        if ParamRetDict.is_return_list(property_return):
+        if ParamRetDict.is_return_list(property_return) and self.constexpr_properties:
+            # Constexpr list case
+            data_list = lang_model.get_property_value(property_name)
+            if is_text:
+                item_type = self.declare_type('stringview')
+                items = ["\""+str(data_item)+"\"" for data_item in data_list]
+            else:
+                item_type = self.declare_type(ParamRetDict.get_return_type(property_return))
+                items = [str(data_item) for data_item in data_list]
+            code_text.append("static constexpr std::array<"+item_type+", "+str(len(items))+
+                             "> values = {"+", ".join(items)+"};")
+            code_text.append("return values;")
+        elif ParamRetDict.is_return_list(property_return):
             # List case
             code_text.append(self.gen_function_ret_type(property_return)+"returnData;")
-            data_list = self.json_lang_data.get_property_data(lang_name, property_name)
+            data_list = lang_model.get_property_value(property_name)
 
             # Determine data type
             for data_item in data_list:
@@ -139,7 +253,7 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             code_text.append("return returnData;")
         else:
             # Single item case
-            data_item = self.json_lang_data.get_property_data(lang_name, property_name)
+            data_item = lang_model.get_property_value(property_name)
             code_text.append(self.gen_return_statment(str(data_item), is_text))
 
         return code_text
@@ -162,21 +276,80 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             prefix = None
             skipdox = True
 
-        method_list = self.json_str_data.get_property_method_list()
-        for method_name in method_list:
-            _, desc, params, ret = self.json_str_data.get_property_method_data(method_name)
-
+        for method in self.get_string_model().get_property_methods():
             # Output final declaration
-            hfile.writelines(self.write_method(method_name,
-                                               desc,
-                                               params,
-                                               ret,
+            hfile.writelines(self.write_method(method.name,
+                                               method.desc,
+                                               method.params,
+                                               self._get_property_ret(method),
                                                prefix,
                                                base_postfix,
                                                skipdox))
             if not skipdox:
                 hfile.writelines(["\n"]) # whitespace for readability
 
+    def _get_property_ret(self, method_model)->dict:
+        """!
+        @brief Get the property method return dictionary
+        @param method_model {StringMethodModel} Property method model
+        @return dictionary - std::span return dictionary for the constexpr list properties,
+                             else the method return dictionary
+        """
+        if self.constexpr_properties and ParamRetDict.is_return_list(method_model.ret):
+            is_text = LanguageDescriptionList.is_property_text(method_model.property_name)
+            return self.gen_span_ret_dict(method_model.ret, is_text)
+        return method_model.ret
+
+    def _gen_src_property_def(self, class_name:str, method:str)->list:
+        """!
+        @brief Generate the property method source definition start
+
+        @param class_name {string} Language class name
+        @param method {string} Property method name
+        @return list of strings - Method definition start
+        """
+        method_model = self.get_string_model().get_property_method(method)
+
+        # Translate the return type
+        if len(method_model.params) == 0:
+            postfix = "const"
+        else:
+            postfix = None
+
+        # Output final declaration
+        return self.define_function_with_decorations(class_name+"::"+method,
+                                                     method_model.desc,
+                                                     method_model.params,
+                                                     self._get_property_ret(method_model),
+                                                     True,
+                                                     None,
+                                                     postfix)
+
+    @profile_span("GenerateLangFiles.property_body")
+    def _gen_src_property_body(self, lang_name:str, method:str)->list:
+        """!
+        @brief Generate the property method source code body
+
+        @param lang_name {string} Language name
+        @param method {string} Property method name
+        @return list of string lists - Code body, one string list per file write
+        """
+        method_model = self.get_string_model().get_property_method(method)
+
+        # Get the language data replacements
+        code_text = self._gen_property_code(lang_name, method_model.property_name, method_model.ret)
+
+        # Output code body
+        if len(code_text) == 1:
+            body = [["{"+code_text[0]+"}\n"]]
+        else:
+            body_indent = "".rjust(self.level_tab_size, ' ')
+            body = [["{\n"]]
+            for line in code_text:
+                body.append([body_indent+line+"\n"])
+            body.append(["}\n"])
+        return body
+
     def _write_src_property_methods(self, cppfile, lang_name:str):
         """!
         @brief Write the property method sourc file definitios
@@ -185,40 +358,13 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         @param lang_name {string} Language name or None this is for the base file
         """
         if lang_name is not None:
-            class_name = self.json_str_data.get_language_class_name(lang_name)
-
-            method_list = self.json_str_data.get_property_method_list()
-            for method in method_list:
-                name, desc, params, ret = self.json_str_data.get_property_method_data(method)
+            string_model = self.get_string_model()
+            class_name = string_model.get_class_name(lang_name)
 
-                # Translate the return type
-                if len(params) == 0:
-                    postfix = "const"
-                else:
-                    postfix = None
-
-                # Output final declaration
-                method_def = self.define_function_with_decorations(class_name+"::"+method,
-                                                                   desc,
-                                                                   params,
-                                                                   ret,
-                                                                   True,
-                                                                   None,
-                                                                   postfix)
-                cppfile.writelines(method_def)
-
-                # Get the language data replacements
-                code_text = self._gen_property_code(lang_name, name, ret)
-
-                # Output code body
-                if len(code_text) == 1:
-                    cppfile.writelines(["{"+code_text[0]+"}\n"])
-                else:
-                    body_indent = "".rjust(self.level_tab_size, ' ')
-                    cppfile.writelines(["{\n"])
-                    for line in code_text:
-                        cppfile.writelines([body_indent+line+"\n"])
-                    cppfile.writelines(["}\n"])
+            for method in string_model.get_property_methods():
+                cppfile.writelines(self._gen_src_property_def(class_name, method.name))
+                for code_text in self._gen_src_property_body(lang_name, method.name):
+                    cppfile.writelines(code_text)
 
     def _gen_stream_code(self, stream_data:list)->str:
         """!
@@ -233,6 +379,98 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         stream_str += "; return "+stream_name+".str();"
         return stream_str
 
+    def _is_static_text_translate(self, method_model)->bool:
+        """!
+        @brief Check if the translate method returns static text
+        @param method_model {StringMethodModel} Translate method model
+        @return boolean - True if string_view_constants is set and the method has no
+                          parameters and a single string return, else False
+        """
+        if (not self.string_view_constants) or (len(method_model.params) != 0):
+            return False
+        return (ParamRetDict.get_return_type(method_model.ret) == 'string') and \
+               (ParamRetDict.get_return_type_mod(method_model.ret) == 0)
+
+    def _get_translate_ret(self, method_model)->dict:
+        """!
+        @brief Get the translate method return dictionary
+        @param method_model {StringMethodModel} Translate method model
+        @return dictionary - std::string_view return dictionary for static text methods,
+                             else the method return dictionary
+        """
+        if self._is_static_text_translate(method_model):
+            return ParamRetDict.build_return_dict_with_mod('stringview',
+                                                           ParamRetDict.get_return_desc(method_model.ret))
+        return method_model.ret
+
+    def _gen_static_text_code(self, stream_data:list)->str:
+        """!
+        @brief Generate the static text return code
+        @param stream_data {tuple list} Parameterless stream output tuple list
+        @return string - Inline code
+        """
+        # Without a stream operator the text assembles into a single string literal
+        text_literal = TransTxtParser.assemble_stream(stream_data, "").strip()
+        if not text_literal:
+            text_literal = "\"\""
+        return "return "+text_literal+";"
+
+    def _gen_append_code(self, stream_data:list, params:list)->str:
+        """!
+        @brief Generate the reserve and append string output code
+        @param stream_data {tuple list} Stream output tuple list
+        @param params {list of dictionaries} Translate method parameter definitions
+        @return string - Inline code or None if a parameter type can not be appended
+        """
+        param_types = {}
+        for param in params:
+            if ParamRetDict.get_param_type_mod(param) != 0:
+                return None
+            param_types[ParamRetDict.get_param_name(param)] = ParamRetDict.get_param_type(param)
+
+        str_name = "retstr"
+        reserve_size = 0
+        reserve_str = ""
+        append_str = ""
+        literal = ""
+        for desc_type, desc_data in stream_data:
+            if TransTxtParser.parsed_type_text == desc_type:
+                literal += desc_data
+                reserve_size += len(desc_data.encode("utf-8"))
+            elif TransTxtParser.parsed_type_special == desc_type:
+                literal += "\\"+desc_data
+                reserve_size += 1
+            elif TransTxtParser.parsed_type_param == desc_type:
+                # Flush the literal text before the parameter
+                if literal:
+                    append_str += " "+str_name+".append(\""+literal+"\");"
+                    literal = ""
+
+                param_type = param_types.get(desc_data)
+                if param_type in self.append_text_types:
+                    append_str += " "+str_name+".append("+desc_data+");"
+                    reserve_str += "+"+desc_data+".size()"
+                elif param_type in self.append_char_types:
+                    append_str += " "+str_name+".push_back("+desc_data+");"
+                    reserve_size += 1
+                elif param_type in self.append_number_types:
+                    append_str += " "+str_name+".append(std::to_string("+desc_data+"));"
+                    reserve_size += self.append_number_types[param_type]
+                else:
+                    return None
+            else:
+                raise TypeError("Unknown string description tuple type: "+desc_type)
+
+        # Flush the trailing literal text
+        if literal:
+            append_str += " "+str_name+".append(\""+literal+"\");"
+
+        append_code = self._get_string_type()+" "+str_name+"; "
+        append_code += str_name+".reserve("+str(reserve_size)+reserve_str+");"
+        append_code += append_str
+        append_code += " return "+str_name+";"
+        return append_code
+
     def _write_inc_translate_methods(self, hfile, base:bool=False):
         """!
         @brief Write the property method definitions
@@ -251,20 +489,66 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             postfix = "final"
             skipdox = True
 
-        method_list = self.json_str_data.get_tranlate_method_list()
-        for method_name in method_list:
-            desc, params, ret = self.json_str_data.get_tranlate_method_function_data(method_name)
-
-            hfile.writelines(self.write_method(method_name,
-                                               desc,
-                                               params,
-                                               ret,
+        for method in self.get_string_model().get_translate_methods():
+            hfile.writelines(self.write_method(method.name,
+                                               method.desc,
+                                               method.params,
+                                               self._get_translate_ret(method),
                                                prefix,
                                                postfix,
                                                skipdox))
             if not skipdox:
                 hfile.writelines(["\n"]) # whitespace for readability
 
+    def _gen_src_translate_def(self, class_name:str, name:str, skipdox:bool)->list:
+        """!
+        @brief Generate the translate method source definition start
+
+        @param class_name {string} Language class name
+        @param name {string} Translate method name
+        @param skipdox {boolean} True skip the doxygen comment block
+        @return list of strings - Method definition start
+        """
+        method_model = self.get_string_model().get_translate_method(name)
+
+        # Translate the return type
+        if len(method_model.params) == 0:
+            postfix = "const"
+        else:
+            postfix = None
+
+        # Output final declaration
+        return self.define_function_with_decorations(class_name+"::"+name,
+                                                     method_model.desc,
+                                                     method_model.params,
+                                                     self._get_translate_ret(method_model),
+                                                     skipdox,
+                                                     None,
+                                                     postfix,
+                                                     None)
+
+    @profile_span("GenerateLangFiles.translate_body")
+    def _gen_src_translate_body(self, lang_name:str, name:str)->list:
+        """!
+        @brief Generate the translate method source code body
+
+        @param lang_name {string} Language name
+        @param name {string} Translate method name
+        @return list of string lists - Code body, one string list per file write
+        """
+        # Get the language data replacements
+        stream_data = self.get_string_model().get_language(lang_name).get_translate_text(name)
+        method_model = self.get_string_model().get_translate_method(name)
+        code_text = None
+        if self._is_static_text_translate(method_model):
+            code_text = self._gen_static_text_code(stream_data)
+        elif self.append_translate:
+            code_text = self._gen_append_code(stream_data, method_model.params)
+
+        if code_text is None:
+            code_text = self._gen_stream_code(stream_data)
+        return [["{"+code_text+"}\n"]]
+
     def _write_src_translate_methods(self, cppfile, lang_name:str = None):
         """!
         @brief Write the property method definitions
@@ -273,39 +557,100 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         @param lang_name {string} Language name or None this is for the base file
         """
         skipdox = bool(lang_name is None)
-        class_name = self.json_str_data.get_language_class_name(lang_name)
+        string_model = self.get_string_model()
+        class_name = string_model.get_class_name(lang_name)
 
-        methods = self.json_str_data.get_tranlate_method_list()
-        for name in methods:
-            desc, params, ret = self.json_str_data.get_tranlate_method_function_data(name)
+        for method in string_model.get_translate_methods():
+            cppfile.writelines(self._gen_src_translate_def(class_name, method.name, skipdox))
+            for code_text in self._gen_src_translate_body(lang_name, method.name):
+                cppfile.writelines(code_text)
 
-            # Translate the return type
-            if len(params) == 0:
-                postfix = "const"
-            else:
-                postfix = None
+    def _get_lang_inc_skeleton(self)->FileSkeleton:
+        """!
+        @brief Get the language include file skeleton, render it if needed
 
-            # Output final declaration
-            method_def = self.define_function_with_decorations(class_name+"::"+name,
-                                                               desc,
-                                                               params,
-                                                               ret,
-                                                               skipdox,
-                                                               None,
-                                                               postfix,
-                                                               None)
-            cppfile.writelines(method_def)
-
-            # Get the language generation string if needed
-            target_lang = self.json_lang_data.get_iso_code_data(lang_name)
-
-            # Get the language data replacements
-            stream_data = self.json_str_data.get_tranlate_method_text_data(name, target_lang)
-            code_text = self._gen_stream_code(stream_data)
+        The file header, includes, namespace and the method declarations are the
+        same for every language class so they are rendered once. The class name
+        dependent blocks are left as slots.
+
+        @return FileSkeleton - Language include file skeleton
+        """
+        if self.lang_inc_skeleton is None:
+            skeleton = FileSkeleton()
+
+            # Write the common header
+            skeleton.writelines(self._generate_file_header(self.project_data.get_eula(),
+                                                           self.project_data.get_owner(),
+                                                           self.project_data.get_creation_year()))
+            skeleton.writelines(["\n"]) # whitespace for readability
+
+            # Write the include block
+            skeleton.writelines(self.gen_include_block([self.gen_h_fname()]))
+            skeleton.writelines(["\n"]) # whitespace for readability
+
+            if self.project_data.get_group_name() is not None:
+                skeleton.add_slot("defgroup")
+                skeleton.writelines(["\n"]) # whitespace for readability
+
+            # Class definition
+            skeleton.writelines(["#pragma once\n"])
+            skeleton.writelines(self.gen_namespace_open(self.namespace_name))
+            skeleton.writelines(["\n"]) # whitespace for readability
 
-            # Output code body
-            cppfile.writelines(["{"+code_text+"}\n"])
+            # Start class definition
+            skeleton.add_slot("class_open")
+            indent = "".rjust(self.level_tab_size, " ")
+            skeleton.writelines([indent+"public:\n"])
+            skeleton.add_slot("constructors")
+
+            # Add the property fetch and string generation methods
+            self._write_inc_property_methods(skeleton, False)
+            skeleton.writelines(["\n"]) # whitespace for readability
+            self._write_inc_translate_methods(skeleton, False)
+
+            # Close the class and namespace
+            skeleton.add_slot("class_close")
+            skeleton.writelines(["\n"]) # whitespace for readability
+            skeleton.writelines(self.gen_namespace_close(self.namespace_name))
+
+            if self.project_data.get_group_name() is not None:
+                skeleton.add_slot("group_end")
+
+            self.lang_inc_skeleton = skeleton
+
+        return self.lang_inc_skeleton
+
+    def _gen_lang_inc_slots(self, lang_name:str)->dict:
+        """!
+        @brief Generate the language specific include file skeleton slot data
+
+        @param lang_name {string} - Language name
+        @return dictionary - {slot_name: slot data}
+        """
+        class_name = self.get_string_model().get_class_name(lang_name)
+        class_desc = "Language specific parser error/help string generation interface"
+        decl_indent = self.level_tab_size*2
 
+        slot_data = {}
+        group_name = self.project_data.get_group_name()
+        if group_name is not None:
+            slot_data["defgroup"] = [self.doxy_comment_gen.gen_doxy_defgroup(self.gen_h_fname(lang_name),
+                                                                             group_name,
+                                                                             self.project_data.get_group_desc())]
+            slot_data["group_end"] = [self.doxy_comment_gen.gen_doxy_group_end()]
+
+        slot_data["class_open"] = [self.gen_class_open(class_name, class_desc,
+                                                       "public "+self.base_class_name,
+                                                       "final")]
+        slot_data["constructors"] = [self.gen_class_default_constructor_destructor(class_name,
+                                                                                   decl_indent,
+                                                                                   False,
+                                                                                   False,
+                                                                                   False)]
+        slot_data["class_close"] = [self.gen_class_close(class_name)]
+        return slot_data
+
+    @profile_span()
     def write_inc_file(self, hfile, lang_name:str = None):
         """!
         @brief Write the language specific include file
@@ -313,25 +658,23 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         @param hfile {File} File to write the data to
         @param lang_name {string} - Language name
         """
+        if lang_name is not None:
+            self._get_lang_inc_skeleton().stamp(hfile, self._gen_lang_inc_slots(lang_name))
+        else:
+            self._write_base_inc_file(hfile)
+
+    def _write_base_inc_file(self, hfile):
+        """!
+        @brief Write the base class include file
+
+        @param hfile {File} File to write the data to
+        """
         # Set the class name and description
         decl_indent = self.level_tab_size*2
-        class_name = self.json_str_data.get_language_class_name(lang_name)
+        class_name = self.get_string_model().get_class_name()
         group_name = self.project_data.get_group_name()
         group_desc = self.project_data.get_group_desc()
-
-        if lang_name is None:
-            class_desc = "Parser error/help string generation interface"
-            inheritence = None
-            class_decoration = None
-            skipdoxy = False
-            virtual_destructor = True
-
-        else:
-            class_desc = "Language specific parser error/help string generation interface"
-            inheritence = "public "+self.base_class_name
-            class_decoration = "final"
-            skipdoxy = True
-            virtual_destructor = False
+        class_desc = "Parser error/help string generation interface"
 
         # Write the common header
         hfile.writelines(self._generate_file_header(self.project_data.get_eula(),
@@ -340,20 +683,16 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         hfile.writelines(["\n"]) # whitespace for readability
 
         # Write the include block
-        if lang_name is None:
-            # Base includes
-            include_list = ["<cstddef>", "<cstdlib>", "<memory>", "<string>"]
-            filename = self.gen_h_fname()
-        else:
-            # Language specific includes
-            include_list = [self.gen_h_fname()]
-            filename = self.gen_h_fname(lang_name)
-
+        include_list = ["<cstddef>", "<cstdlib>", "<memory>", "<string>"]
+        if self.constexpr_properties:
+            include_list.extend(["<array>", "<span>"])
+        if self.string_view_constants or self.constexpr_properties:
+            include_list.append("<string_view>")
         hfile.writelines(self.gen_include_block(include_list))
         hfile.writelines(["\n"]) # whitespace for readability
 
         if group_name is not None:
-            hfile.writelines(self.doxy_comment_gen.gen_doxy_defgroup(filename,
+            hfile.writelines(self.doxy_comment_gen.gen_doxy_defgroup(self.gen_h_fname(),
                                                                      group_name,
                                                                      group_desc))
             hfile.writelines(["\n"]) # whitespace for readability
@@ -364,47 +703,45 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         hfile.writelines(["\n"]) # whitespace for readability
 
         # Add using statements
-        if lang_name is None:
-            using_list = self.project_data.get_include_using()
-            if using_list is not None:
-                using_code = []
-                for using in using_list:
-                    using_code.append(self.gen_using_statement(using['localName'],
-                                                               using['stdName'],
-                                                               using['desc']))
-                hfile.writelines(using_code)
-                hfile.writelines(["\n"]) # whitespace for readability
+        using_list = self.project_data.get_include_using()
+        if using_list is not None:
+            using_code = []
+            for using in using_list:
+                using_code.append(self.gen_using_statement(using['localName'],
+                                                           using['stdName'],
+                                                           using['desc']))
+            hfile.writelines(using_code)
+            hfile.writelines(["\n"]) # whitespace for readability
 
         # Start class definition
-        hfile.writelines(self.gen_class_open(class_name, class_desc, inheritence, class_decoration))
+        hfile.writelines(self.gen_class_open(class_name, class_desc, None, None))
         indent = "".rjust(self.level_tab_size, " ")
         hfile.writelines([indent+"public:\n"])
 
         # Add default Constructor/destructor definitions
         hfile.writelines(self.gen_class_default_constructor_destructor(class_name,
                                                                        decl_indent,
-                                                                       virtual_destructor,
-                                                                       not skipdoxy,
+                                                                       True,
+                                                                       True,
                                                                        False))
 
         # Add the property fetch methods
-        self._write_inc_property_methods(hfile, bool(lang_name is None))
+        self._write_inc_property_methods(hfile, True)
         hfile.writelines(["\n"]) # whitespace for readability
 
         # Add the string generation methods
-        self._write_inc_translate_methods(hfile, bool(lang_name is None))
-
-        if lang_name is None:
-            # Add the static generation function declaration
-            sname, sdesc, sret, sparams = self.master_func_gen.get_function_desc()
-            sfunc = self.declare_function_with_decorations(sname,
-                                                           sdesc,
-                                                           sparams,
-                                                           sret,
-                                                           decl_indent,
-                                                           False,
-                                                           "static")
-            hfile.writelines(sfunc)
+        self._write_inc_translate_methods(hfile, True)
+
+        # Add the static generation function declaration
+        sname, sdesc, sret, sparams = self.master_func_gen.get_function_desc()
+        sfunc = self.declare_function_with_decorations(sname,
+                                                       sdesc,
+                                                       sparams,
+                                                       sret,
+                                                       decl_indent,
+                                                       False,
+                                                       "static")
+        hfile.writelines(sfunc)
 
         # Close the class
         hfile.writelines(self.gen_class_close(class_name))
@@ -417,6 +754,7 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             # Complete the doxygen group
             hfile.writelines(self.doxy_comment_gen.gen_doxy_group_end())
 
+    @profile_span()
     def write_base_src_file(self, srcfile):
         """!
         @brief Write the language specific source file
@@ -435,9 +773,7 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
 
         # Write the include block
         include_list = [self.gen_h_fname()]
-        lang_list = self.json_lang_data.get_language_list()
-        for lang in lang_list:
-            include_list.append(self.gen_h_fname(lang))
+        include_list.extend(self._gen_lang_include_list())
 
         srcfile.writelines(self.gen_include_block(include_list))
         srcfile.writelines(["\n"]) # whitespace for readability
@@ -464,6 +800,11 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             srcfile.writelines(using_code)
             srcfile.writelines(["\n"]) # whitespace for readability
 
+        if self.cached_instances:
+            # Add the cached instance function used by the selection functions
+            srcfile.writelines(self.gen_cached_instance_function())
+            srcfile.writelines(["\n"]) # whitespace for readability
+
         for os_sel_gen in self.os_lang_sel_list:
             # Add the OS specific delection functions
             srcfile.writelines(os_sel_gen.gen_function())
@@ -477,6 +818,121 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             # Complete the doxygen group
             srcfile.writelines(self.doxy_comment_gen.gen_doxy_group_end())
 
+    def _get_lang_src_skeleton(self)->FileSkeleton:
+        """!
+        @brief Get the language source file skeleton, render it if needed
+
+        The file header, using statements and the method doxygen comments and
+        signatures are rendered once with a class name marker. The include block
+        and the method bodies are left as slots. The property methods are the
+        "properties" group and each translate method is a "translate:"+name
+        group so the source shard files can be stamped from the same skeleton.
+
+        @return FileSkeleton - Language source file skeleton
+        """
+        if self.lang_src_skeleton is None:
+            skeleton = FileSkeleton()
+            class_marker = FileSkeleton.slot_marker("class_name")
+
+            # Write the common header
+            skeleton.writelines(self._generate_file_header(self.project_data.get_eula(),
+                                                           self.project_data.get_owner(),
+                                                           self.project_data.get_creation_year()))
+            skeleton.writelines(["\n"]) # whitespace for readability
+
+            # Write the include block
+            skeleton.add_slot("include")
+            skeleton.writelines(["\n"]) # whitespace for readability
+
+            if self.project_data.get_group_name() is not None:
+                skeleton.add_slot("defgroup")
+                skeleton.writelines(["\n"]) # whitespace for readability
+
+            # Set namespace
+            skeleton.writelines(self.gen_using_namespace(self.namespace_name))
+            skeleton.writelines(["\n"]) # whitespace for readability
+
+            # Add using statements
+            using_list = self.project_data.get_lang_src_using()
+            if using_list is not None:
+                using_code = []
+                for using in using_list:
+                    using_code.append(self.gen_using_statement(using['localName'],
+                                                               using['stdName'],
+                                                               using['desc']))
+                skeleton.writelines(using_code)
+                skeleton.writelines(["\n"]) # whitespace for readability
+
+            # Add the property fetch methods
+            string_model = self.get_string_model()
+            skeleton.begin_group("properties")
+            for method in string_model.get_property_methods():
+                skeleton.add_stamped_text(self._gen_src_property_def(class_marker, method.name),
+                                          "class_name")
+                skeleton.add_slot("property:"+method.name)
+            skeleton.writelines(["\n"]) # whitespace for readability
+            skeleton.end_group("properties")
+
+            # Add the string generation methods
+            for method in string_model.get_translate_methods():
+                skeleton.begin_group("translate:"+method.name)
+                skeleton.add_stamped_text(self._gen_src_translate_def(class_marker, method.name, False),
+                                          "class_name")
+                skeleton.add_slot("translate:"+method.name)
+                skeleton.end_group("translate:"+method.name)
+            skeleton.writelines(["\n"]) # whitespace for readability
+
+            if self.project_data.get_group_name() is not None:
+                skeleton.add_slot("group_end")
+
+            self.lang_src_skeleton = skeleton
+
+        return self.lang_src_skeleton
+
+    def _gen_lang_src_common_slots(self, lang_name:str, src_fname:str)->dict:
+        """!
+        @brief Generate the language source file skeleton slot data shared by every shard
+
+        @param lang_name {string} - Language name
+        @param src_fname {string} - Source file name for the doxygen group definition
+        @return dictionary - {slot_name: slot data}
+        """
+        slot_data = {"class_name": self.get_string_model().get_class_name(lang_name),
+                     "include": [self.gen_include_block(["<sstream>",
+                                                         self.gen_h_fname(lang_name)])]}
+
+        group_name = self.project_data.get_group_name()
+        if group_name is not None:
+            slot_data["defgroup"] = [self.doxy_comment_gen.gen_doxy_defgroup(src_fname,
+                                                                             group_name,
+                                                                             self.project_data.get_group_desc())]
+            slot_data["group_end"] = [self.doxy_comment_gen.gen_doxy_group_end()]
+        return slot_data
+
+    def _gen_lang_src_property_slots(self, lang_name:str)->dict:
+        """!
+        @brief Generate the language source file property method body slot data
+
+        @param lang_name {string} - Language name
+        @return dictionary - {slot_name: slot data}
+        """
+        return {"property:"+method.name: self._gen_src_property_body(lang_name, method.name)
+                for method in self.get_string_model().get_property_methods()}
+
+    def _gen_lang_src_slots(self, lang_name:str)->dict:
+        """!
+        @brief Generate the language specific source file skeleton slot data
+
+        @param lang_name {string} - Language name
+        @return dictionary - {slot_name: slot data}
+        """
+        slot_data = self._gen_lang_src_common_slots(lang_name, self.gen_cpp_fname(lang_name))
+        slot_data.update(self._gen_lang_src_property_slots(lang_name))
+        for method in self.get_string_model().get_translate_methods():
+            slot_data["translate:"+method.name] = self._gen_src_translate_body(lang_name, method.name)
+        return slot_data
+
+    @profile_span()
     def write_lang_src_file(self, srcfile, lang_name:str):
         """!
         @brief Write the language specific source file
@@ -484,9 +940,402 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         @param hfile {File} File to write the data to
         @param lang_name {string} - Language name
         """
-        # Set the class name and description
+        self._get_lang_src_skeleton().stamp(srcfile, self._gen_lang_src_slots(lang_name))
+
+    def is_sharded(self)->bool:
+        """!
+        @brief Check if the language source files are split into shards
+        @return boolean - True if a shard method count or byte size limit is set
+        """
+        return (self.shard_method_count is not None) or (self.shard_byte_size is not None)
+
+    def gen_shard_cpp_fname(self, lang_name:str, shard_index:int)->str:
+        """!
+        @brief Generate the language source shard file name
+        @param lang_name {string} Language name
+        @param shard_index {number} Shard index, shard 0 uses the language source file name
+        @return string - source shard file name
+        """
+        if shard_index == 0:
+            return self.gen_cpp_fname(lang_name)
+        return self.base_class_name+lang_name.capitalize()+"_"+str(shard_index)+".cpp"
+
+    @profile_span()
+    def gen_lang_src_shards(self, lang_name:str)->list:
+        """!
+        @brief Render the language translate method bodies and split them into shards
+
+        A new shard is started when adding the next method would go over the
+        shard method count or byte size limit. Every shard holds at least one method.
+        The method size is the size of its stamped language source skeleton group.
+
+        @param lang_name {string} Language name
+        @return list - One {"translate:"+method name: method body} slot dictionary per shard
+        """
+        skeleton = self._get_lang_src_skeleton()
+        class_slot = {"class_name": self.get_string_model().get_class_name(lang_name)}
+
+        shards = [{}]
+        shard_bytes = 0
+        for method in self.get_string_model().get_translate_methods():
+            slot_name = "translate:"+method.name
+            class_slot[slot_name] = self._gen_src_translate_body(lang_name, method.name)
+            method_text = LineSink()
+            skeleton.stamp_group(method_text, slot_name, class_slot)
+            method_bytes = sum(len(line.encode("utf-8")) for line in method_text.lines)
+
+            current = shards[-1]
+            if current:
+                count_full = (self.shard_method_count is not None) and \
+                             (len(current) >= self.shard_method_count)
+                bytes_full = (self.shard_byte_size is not None) and \
+                             (shard_bytes + method_bytes > self.shard_byte_size)
+                if count_full or bytes_full:
+                    shards.append({})
+                    shard_bytes = 0
+
+            shards[-1][slot_name] = class_slot.pop(slot_name)
+            shard_bytes += method_bytes
+        return shards
+
+    @profile_span()
+    def write_lang_src_shard_file(self, srcfile, lang_name:str, shard_index:int, shard_slots:dict):
+        """!
+        @brief Write one language source shard file
+
+        The shard is stamped from the language source file skeleton leaving out
+        the translate methods of the other shards. Shard 0 also holds the
+        property method definitions.
+
+        @param srcfile {File} File to write the data to
+        @param lang_name {string} Language name
+        @param shard_index {number} Shard index
+        @param shard_slots {dictionary} Shard method slot data from gen_lang_src_shards()
+        """
+        slot_data = self._gen_lang_src_common_slots(lang_name, self.gen_shard_cpp_fname(lang_name, shard_index))
+        skip_groups = ["translate:"+method.name for method in self.get_string_model().get_translate_methods()
+                       if "translate:"+method.name not in shard_slots]
+        if shard_index == 0:
+            slot_data.update(self._gen_lang_src_property_slots(lang_name))
+        else:
+            skip_groups.append("properties")
+        slot_data.update(shard_slots)
+
+        self._get_lang_src_skeleton().stamp(srcfile, slot_data, skip_groups)
+
+    def _gen_lang_include_list(self)->list:
+        """!
+        @brief Generate the include list of the language class headers
+        @return list - string table header or the language class header names
+        """
+        if self.string_table:
+            return [self.gen_table_h_fname()]
+        return [self.gen_h_fname(lang) for lang in self.json_lang_data.get_language_list()]
+
+    def _gen_table_segments(self, lang_name:str)->tuple:
+        """!
+        @brief Generate the text pool and the translate method segment table of one language
+
+        Adjacent text and special characters are merged into one text segment, each
+        parameter is a parameter slot segment that holds the parameter index.
+
+        @param lang_name {string} Language name
+        @return tuple - ([(pool literal text, method name)], [(offset or parameter index, length)],
+                         first segment index of each method plus the end index)
+        """
+        string_model = self.get_string_model()
+        lang_model = string_model.get_language(lang_name)
+        pool_entries = []
+        segments = []
+        method_start = []
+        pool_size = 0
+
+        for method in string_model.get_translate_methods():
+            method_start.append(len(segments))
+            param_names = [ParamRetDict.get_param_name(param) for param in method.params]
+            method_literal = ""
+            literal = ""
+            literal_size = 0
+            for desc_type, desc_data in lang_model.get_translate_text(method.name) + [(None, None)]:
+                if TransTxtParser.parsed_type_text == desc_type:
+                    literal += desc_data
+                    literal_size += len(desc_data.encode("utf-8"))
+                    continue
+                if TransTxtParser.parsed_type_special == desc_type:
+                    literal += "\\"+desc_data
+                    literal_size += 1
+                    continue
+
+                # Close the text segment
+                if literal_size != 0:
+                    segments.append((pool_size, literal_size))
+                    pool_size += literal_size
+                    method_literal += literal
+                    literal = ""
+                    literal_size = 0
+
+                if TransTxtParser.parsed_type_param == desc_type:
+                    segments.append((param_names.index(desc_data), 0))
+                elif desc_type is not None:
+                    raise TypeError("Unknown string description tuple type: "+desc_type)
+
+            if method_literal:
+                pool_entries.append((method_literal, method.name))
+
+        method_start.append(len(segments))
+        return pool_entries, segments, method_start
+
+    def _gen_table_data(self)->list:
+        """!
+        @brief Generate the string table segment structures and the language tables
+        @return list of strings - Table code to output
+        """
+        body_indent = "".rjust(self.level_tab_size, " ")
+        code_txt = []
+        code_txt.extend(self.doxy_comment_gen.gen_doxy_class_comment("String table text segment, text "
+                                                                     "in the language text pool or "
+                                                                     "a parameter slot"))
+        code_txt.extend(["struct TableSegment\n",
+                         "{\n",
+                         body_indent+"uint32_t offset;    //!< Text pool offset or the parameter index "
+                         "of a parameter slot\n",
+                         body_indent+"uint32_t length;    //!< Text length, 0 for a parameter slot\n",
+                         "};\n",
+                         "\n"])
+        code_txt.extend(self.doxy_comment_gen.gen_doxy_class_comment("Language string table"))
+        code_txt.extend(["struct LanguageTable\n",
+                         "{\n",
+                         body_indent+"const char* pool;               //!< Language text pool\n",
+                         body_indent+"const TableSegment* segments;   //!< Translate method text segments\n",
+                         body_indent+"const uint32_t* methodStart;    //!< First segment of each translate "
+                         "method and the end segment\n",
+                         "};\n",
+                         "\n"])
+
+        table_list = []
+        for lang in self.json_lang_data.get_language_list():
+            pool_entries, segments, method_start = self._gen_table_segments(lang)
+            lang_suffix = lang.capitalize()
+            code_txt.append("// "+lang+" string table\n")
+            if pool_entries:
+                code_txt.append("constexpr char pool"+lang_suffix+"[] =\n")
+                for index, (literal, method_name) in enumerate(pool_entries, 1):
+                    # The last literal closes the declaration
+                    terminator = ";" if index == len(pool_entries) else ""
+                    code_txt.append(body_indent+"\""+literal+"\""+terminator+" // "+method_name+"\n")
+            else:
+                code_txt.append("constexpr char pool"+lang_suffix+"[] = \"\";\n")
+
+            # Zero length arrays are not allowed, keep one unused segment
+            if not segments:
+                segments = [(0, 0)]
+            code_txt.append("constexpr TableSegment segments"+lang_suffix+"[] = {\n")
+            code_txt.append(body_indent+", ".join("{"+str(offset)+", "+str(length)+"}"
+                                                  for offset, length in segments)+"\n")
+            code_txt.append("};\n")
+            code_txt.append("constexpr uint32_t methodStart"+lang_suffix+"[] = {"+
+                            ", ".join(str(start) for start in method_start)+"};\n")
+            code_txt.append("\n")
+            table_list.append(body_indent+"{pool"+lang_suffix+", segments"+lang_suffix+
+                              ", methodStart"+lang_suffix+"}")
+
+        code_txt.append("constexpr LanguageTable languageTables[] = {\n")
+        code_txt.append(",\n".join(table_list)+"\n")
+        code_txt.append("};\n")
+        return code_txt
+
+    def _gen_table_property_body(self, method)->list:
+        """!
+        @brief Generate the string table class property method body
+        @param method {StringMethodModel} Property method model
+        @return list of strings - Method body code
+        """
+        body_indent = "".rjust(self.level_tab_size, " ")
+        is_text = LanguageDescriptionList.is_property_text(method.property_name)
+        is_span = self.is_span_return(self._get_property_ret(method))
+        if is_text and is_span:
+            item_type = self.declare_type('stringview')
+        elif is_text:
+            item_type = "const char*"
+        else:
+            item_type = self.declare_type(ParamRetDict.get_return_type(method.ret))
+
+        string_model = self.get_string_model()
+        values = []
+        value_start = [0]
+        for lang in self.json_lang_data.get_language_list():
+            lang_values = string_model.get_language(lang).get_property_value(method.property_name)
+            if not ParamRetDict.is_return_list(method.ret):
+                lang_values = [lang_values]
+            for value in lang_values:
+                if is_text:
+                    values.append("\""+str(value)+"\"")
+                else:
+                    values.append(str(value))
+            value_start.append(len(values))
+
+        ret_type = self.gen_function_ret_type(self._get_property_ret(method)).strip()
+        code_txt = ["{\n"]
+        if not values:
+            code_txt.append(body_indent+"return "+ret_type+"();\n")
+        elif ParamRetDict.is_return_list(method.ret):
+            code_txt.append(body_indent+"static constexpr "+item_type+" values[] = {"+", ".join(values)+"};\n")
+            code_txt.append(body_indent+"static constexpr uint32_t valueStart[] = {"+
+                            ", ".join(str(start) for start in value_start)+"};\n")
+            if is_span:
+                code_txt.append(body_indent+"return "+ret_type+"(values+valueStart[langIndex], "
+                                "valueStart[langIndex+1]-valueStart[langIndex]);\n")
+            else:
+                code_txt.append(body_indent+"return "+ret_type+"(values+valueStart[langIndex], "
+                                "values+valueStart[langIndex+1]);\n")
+        else:
+            code_txt.append(body_indent+"static constexpr "+item_type+" values[] = {"+", ".join(values)+"};\n")
+            code_txt.append(body_indent+"return values[langIndex];\n")
+        code_txt.append("}\n")
+        return code_txt
+
+    def _gen_table_translate_body(self, method, method_index:int)->list:
+        """!
+        @brief Generate the string table class translate method body
+        @param method {StringMethodModel} Translate method model
+        @param method_index {number} Translate method table index
+        @return list of strings - Method body code
+        """
+        body_indent = "".rjust(self.level_tab_size, " ")
+        code_txt = ["{\n"]
+        if self._is_static_text_translate(method):
+            code_txt.append(body_indent+"return textView("+str(method_index)+");\n")
+        elif not method.params:
+            code_txt.append(body_indent+"return formatText("+str(method_index)+", nullptr);\n")
+        else:
+            args = []
+            for param in method.params:
+                param_name = ParamRetDict.get_param_name(param)
+                param_type = ParamRetDict.get_param_type(param)
+                text_name = param_name+"Text"
+                if ParamRetDict.get_param_type_mod(param) != 0:
+                    param_type = None
+
+                if param_type in self.append_text_types:
+                    args.append(param_name)
+                elif param_type in self.append_char_types:
+                    args.append("std::string_view(&"+param_name+", 1)")
+                elif param_type in self.append_number_types:
+                    code_txt.append(body_indent+"const "+self._get_string_type()+" "+text_name+
+                                    " = std::to_string("+param_name+");\n")
+                    args.append(text_name)
+                else:
+                    stream_name = param_name+"Stream"
+                    code_txt.append(body_indent+self._get_str_stream_type()+" "+stream_name+";\n")
+                    code_txt.append(body_indent+stream_name+" << "+param_name+";\n")
+                    code_txt.append(body_indent+"const "+self._get_string_type()+" "+text_name+
+                                    " = "+stream_name+".str();\n")
+                    args.append(text_name)
+
+            code_txt.append(body_indent+"const std::string_view args[] = {"+", ".join(args)+"};\n")
+            code_txt.append(body_indent+"return formatText("+str(method_index)+", args);\n")
+        code_txt.append("}\n")
+        return code_txt
+
+    @profile_span()
+    def write_table_inc_file(self, hfile):
+        """!
+        @brief Write the string table class include file
+        @param hfile {File} File to write the data to
+        """
+        class_name = self.gen_table_class_name()
         group_name = self.project_data.get_group_name()
-        group_desc = self.project_data.get_group_desc()
+        decl_indent = "".rjust(self.level_tab_size*2, " ")
+        lang_list = self.json_lang_data.get_language_list()
+
+        # Write the common header
+        hfile.writelines(self._generate_file_header(self.project_data.get_eula(),
+                                                    self.project_data.get_owner(),
+                                                    self.project_data.get_creation_year()))
+        hfile.writelines(["\n"]) # whitespace for readability
+
+        # Write the include block
+        hfile.writelines(self.gen_include_block(["<cstddef>", "<string_view>", self.gen_h_fname()]))
+        hfile.writelines(["\n"]) # whitespace for readability
+
+        if group_name is not None:
+            hfile.writelines(self.doxy_comment_gen.gen_doxy_defgroup(self.gen_table_h_fname(),
+                                                                     group_name,
+                                                                     self.project_data.get_group_desc()))
+            hfile.writelines(["\n"]) # whitespace for readability
+
+        # Class definition
+        hfile.writelines(["#pragma once\n"])
+        hfile.writelines(self.gen_namespace_open(self.namespace_name))
+        hfile.writelines(["\n"]) # whitespace for readability
+
+        class_desc = "String table based parser error/help string generation interface for " \
+                     "all of the languages"
+        hfile.writelines(self.gen_class_open(class_name, class_desc,
+                                             "public "+self.base_class_name))
+        hfile.writelines(["".rjust(self.level_tab_size, " ")+"public:\n"])
+
+        # Add the language table indexes
+        for index, lang in enumerate(lang_list):
+            hfile.writelines([decl_indent+"static constexpr size_t "+self.gen_table_index_name(lang)+
+                              " = "+str(index)+";   //!< "+lang+" string table index\n"])
+        hfile.writelines([decl_indent+"static constexpr size_t languageCount = "+str(len(lang_list))+
+                          ";   //!< Number of string table languages\n"])
+        hfile.writelines(["\n"]) # whitespace for readability
+
+        # Add the constructor
+        index_param = ParamRetDict.build_param_dict("index", "size", "Language string table index")
+        hfile.writelines(self.doxy_comment_gen.gen_doxy_method_comment("Construct a new "+class_name+
+                                                                       " object",
+                                                                       self.xlate_params([index_param]),
+                                                                       None, None,
+                                                                       self.level_tab_size*2))
+        hfile.writelines([decl_indent+"explicit "+class_name+"(size_t index) : langIndex(index) {}\n"])
+        hfile.writelines(["\n"]) # whitespace for readability
+
+        # Add the property fetch and string generation methods
+        self._write_inc_property_methods(hfile, False)
+        hfile.writelines(["\n"]) # whitespace for readability
+        self._write_inc_translate_methods(hfile, False)
+        hfile.writelines(["\n"]) # whitespace for readability
+
+        # Add the table interpreter methods
+        hfile.writelines(["".rjust(self.level_tab_size, " ")+"private:\n"])
+        hfile.writelines(self.doxy_comment_gen.gen_doxy_method_comment("Format the translate method text "
+                                                                       "from the language string table",
+                                                                       [], None, None,
+                                                                       self.level_tab_size*2))
+        hfile.writelines([decl_indent+self._get_string_type()+" formatText(size_t methodIndex, "
+                          "const std::string_view* args) const;\n"])
+        if self.string_view_constants:
+            hfile.writelines(["\n"]) # whitespace for readability
+            hfile.writelines(self.doxy_comment_gen.gen_doxy_method_comment("Return the parameterless "
+                                                                           "translate method text from "
+                                                                           "the language text pool",
+                                                                           [], None, None,
+                                                                           self.level_tab_size*2))
+            hfile.writelines([decl_indent+"std::string_view textView(size_t methodIndex) const;\n"])
+        hfile.writelines(["\n"]) # whitespace for readability
+        hfile.writelines([decl_indent+"size_t langIndex;   //!< Language string table index\n"])
+
+        # Close the class and namespace
+        hfile.writelines(self.gen_class_close(class_name))
+        hfile.writelines(["\n"]) # whitespace for readability
+        hfile.writelines(self.gen_namespace_close(self.namespace_name))
+
+        if group_name is not None:
+            hfile.writelines(self.doxy_comment_gen.gen_doxy_group_end())
+
+    @profile_span()
+    def write_table_src_file(self, srcfile):
+        """!
+        @brief Write the string table class source file
+        @param srcfile {File} File to write the data to
+        """
+        class_name = self.gen_table_class_name()
+        group_name = self.project_data.get_group_name()
+        body_indent = "".rjust(self.level_tab_size, " ")
+        string_model = self.get_string_model()
 
         # Write the common header
         srcfile.writelines(self._generate_file_header(self.project_data.get_eula(),
@@ -495,17 +1344,13 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         srcfile.writelines(["\n"]) # whitespace for readability
 
         # Write the include block
-        include_list = ["<sstream>",
-                        self.gen_h_fname(lang_name)]
-
-        srcfile.writelines(self.gen_include_block(include_list))
+        srcfile.writelines(self.gen_include_block(["<cstdint>", "<sstream>", self.gen_table_h_fname()]))
         srcfile.writelines(["\n"]) # whitespace for readability
 
         if group_name is not None:
-            filename = self.gen_cpp_fname(lang_name)
-            srcfile.writelines(self.doxy_comment_gen.gen_doxy_defgroup(filename,
+            srcfile.writelines(self.doxy_comment_gen.gen_doxy_defgroup(self.gen_table_cpp_fname(),
                                                                        group_name,
-                                                                       group_desc))
+                                                                       self.project_data.get_group_desc()))
             srcfile.writelines(["\n"]) # whitespace for readability
 
         # Set namespace
@@ -523,18 +1368,92 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             srcfile.writelines(using_code)
             srcfile.writelines(["\n"]) # whitespace for readability
 
+        # Add the string tables
+        srcfile.writelines(["namespace {\n", "\n"])
+        srcfile.writelines(self._gen_table_data())
+        srcfile.writelines(["\n", "} // end of anonymous namespace\n", "\n"])
+
+        # Add the table interpreter
+        segment_loop = body_indent+"for (uint32_t index = table.methodStart[methodIndex]; " \
+                       "index < table.methodStart[methodIndex+1]; ++index)\n"
+        srcfile.writelines([self._get_string_type()+" "+class_name+
+                            "::formatText(size_t methodIndex, const std::string_view* args) const\n",
+                            "{\n",
+                            body_indent+"const LanguageTable& table = languageTables[langIndex];\n",
+                            body_indent+"size_t length = 0;\n",
+                            segment_loop,
+                            body_indent+"{\n",
+                            body_indent*2+"const TableSegment& segment = table.segments[index];\n",
+                            body_indent*2+"length += (segment.length != 0) ? segment.length : "
+                            "args[segment.offset].size();\n",
+                            body_indent+"}\n",
+                            "\n",
+                            body_indent+self._get_string_type()+" text;\n",
+                            body_indent+"text.reserve(length);\n",
+                            segment_loop,
+                            body_indent+"{\n",
+                            body_indent*2+"const TableSegment& segment = table.segments[index];\n",
+                            body_indent*2+"if (segment.length != 0)\n",
+                            body_indent*2+"{\n",
+                            body_indent*3+"text.append(table.pool+segment.offset, segment.length);\n",
+                            body_indent*2+"}\n",
+                            body_indent*2+"else\n",
+                            body_indent*2+"{\n",
+                            body_indent*3+"text.append(args[segment.offset]);\n",
+                            body_indent*2+"}\n",
+                            body_indent+"}\n",
+                            body_indent+"return text;\n",
+                            "}\n",
+                            "\n"])
+        if self.string_view_constants:
+            srcfile.writelines(["std::string_view "+class_name+"::textView(size_t methodIndex) const\n",
+                                "{\n",
+                                body_indent+"const LanguageTable& table = languageTables[langIndex];\n",
+                                body_indent+"const uint32_t index = table.methodStart[methodIndex];\n",
+                                body_indent+"if (index == table.methodStart[methodIndex+1])\n",
+                                body_indent+"{\n",
+                                body_indent*2+"return std::string_view();\n",
+                                body_indent+"}\n",
+                                body_indent+"return std::string_view(table.pool+table.segments[index].offset, "
+                                "table.segments[index].length);\n",
+                                "}\n",
+                                "\n"])
+
         # Add the property fetch methods
-        self._write_src_property_methods(srcfile, lang_name)
+        for method in string_model.get_property_methods():
+            srcfile.writelines(self._gen_src_property_def(class_name, method.name))
+            srcfile.writelines(self._gen_table_property_body(method))
         srcfile.writelines(["\n"]) # whitespace for readability
 
         # Add the string generation methods
-        self._write_src_translate_methods(srcfile, lang_name)
+        for method_index, method in enumerate(string_model.get_translate_methods()):
+            srcfile.writelines(self._gen_src_translate_def(class_name, method.name, True))
+            srcfile.writelines(self._gen_table_translate_body(method, method_index))
         srcfile.writelines(["\n"]) # whitespace for readability
 
         if group_name is not None:
-            # Complete the doxygen group
             srcfile.writelines(self.doxy_comment_gen.gen_doxy_group_end())
 
+    def _gen_table_test_classes(self)->list:
+        """!
+        @brief Generate the default constructable language test classes of the string table
+        @return list of strings - Test class code to output
+        """
+        table_class = self.gen_table_class_name()
+        body_indent = "".rjust(self.level_tab_size, " ")
+        code_txt = ["// Language test classes for the string table\n"]
+        for lang in self.json_lang_data.get_language_list():
+            class_name = self.get_string_model().get_class_name(lang)
+            code_txt.extend(["class "+class_name+" : public "+table_class+"\n",
+                             "{\n",
+                             "public:\n",
+                             body_indent+class_name+"() : "+table_class+"("+table_class+"::"+
+                             self.gen_table_index_name(lang)+") {}\n",
+                             "};\n",
+                             "\n"])
+        return code_txt
+
+    @profile_span()
     def write_base_unittest_file(self, utfile):
         """!
         @brief Write the OS language selection CPP file
@@ -591,6 +1510,7 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             utfile.writelines(["\n"]) # whitespace for readability
             utfile.writelines(self.doxy_comment_gen.gen_doxy_group_end())
 
+    @profile_span()
     def write_selection_unittest_file(self, utfile, os_sel_gen):
         """!
         @brief Write the OS specific language selection CPP file
@@ -655,25 +1575,25 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         @param langname {string} Language name
         @return list of strings - Test code to output
         """
-        pname, _, pparams, pret = self.json_str_data.get_property_method_data(method)
-        ut_section = self.json_str_data.get_language_class_name(langname)
+        sink = LineSink()
+        self._emit_property_unittest(sink, method, langname)
+        return sink.lines
 
-        param_data = []
-        for param in pparams:
-            param_data.append(self._get_param_test_value(ParamRetDict.get_param_name(param)))
-
-        # Build the test assertion expected data
-        is_list = ParamRetDict.is_mod_list(ParamRetDict.get_return_type_mod(pret))
-        if is_list:
-            expected = []
-            for item in self.json_lang_data.get_property_data(langname, pname):
-                expected.append(item)
-        else:
-            expected = [self.json_lang_data.get_property_data(langname, pname)]
+    def _emit_property_unittest(self, outfile, method:str, langname:str):
+        """!
+        @brief Write the unit test for the input property method
+        @param outfile {File} File, CodeEmitter or LineSink to write the data to
+        @param method {string} Property function name
+        @param langname {string} Language name
+        """
+        method_model = self.get_string_model().get_property_method(method)
+        lang_model = self.get_string_model().get_language(langname)
+        pret = self._get_property_ret(method_model)
+        expected = lang_model.get_test_expected(method_model, self.test_param_values)
 
-        return self.generate_property_unittest(method, ut_section, pret,
-                                               expected, param_data,
-                                               LanguageDescriptionList.is_property_text(pname))
+        self.emit_property_unittest(outfile, method, lang_model.class_name, pret,
+                                    expected, self._get_test_arg_list(method_model),
+                                    method_model.is_text)
 
     def _generate_translate_unittest(self, method:str, langname:str)->list:
         """!
@@ -682,21 +1602,26 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
         @param langname {string} Language name
         @return list of strings - Test code to output
         """
-        ut_section = self.json_str_data.get_language_class_name(langname)
-        _, tparams, tret = self.json_str_data.get_tranlate_method_function_data(method)
-        param_data = []
-        for param in tparams:
-            param_data.append(self._get_param_test_value(ParamRetDict.get_param_name(param)))
+        sink = LineSink()
+        self._emit_translate_unittest(sink, method, langname)
+        return sink.lines
 
-        # Build the expected string
-        target_lang = self.json_lang_data.get_iso_code_data(langname)
-        str_data = self.json_str_data.get_tranlate_method_text_data(method, target_lang)
-        expected = TransTxtParser.assemble_test_return_string(str_data,
-                                                              self.test_param_values)
+    def _emit_translate_unittest(self, outfile, method:str, langname:str):
+        """!
+        @brief Write the unit test for the input translate method
+        @param outfile {File} File, CodeEmitter or LineSink to write the data to
+        @param method {string} Translate function name
+        @param langname {string} Language name
+        """
+        method_model = self.get_string_model().get_translate_method(method)
+        lang_model = self.get_string_model().get_language(langname)
+        tret = self._get_translate_ret(method_model)
+        expected = lang_model.get_test_expected(method_model, self.test_param_values)
 
-        return self.generate_translate_unittest(method, ut_section, tret,
-                                                expected, param_data)
+        self.emit_translate_unittest(outfile, method, lang_model.class_name, tret,
+                                     expected, self._get_test_arg_list(method_model))
 
+    @profile_span()
     def write_lang_unittest_file(self, utfile, lang:str):
         """!
         @brief Write the OS specific language selection CPP file
@@ -743,15 +1668,204 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             utfile.writelines(["\n"]) # whitespace for readability
 
         # Add the property unittest methods
-        method_list = self.json_str_data.get_property_method_list()
-        for method_name in method_list:
-            utfile.writelines(self._generate_property_unittest(method_name, lang))
+        string_model = self.get_string_model()
+        for method in string_model.get_property_methods():
+            self._emit_property_unittest(utfile, method.name, lang)
+            utfile.write("\n") # whitespace for readability
+
+        # Add the string generation methods
+        for method in string_model.get_translate_methods():
+            self._emit_translate_unittest(utfile, method.name, lang)
+            utfile.write("\n") # whitespace for readability
+
+        # Add the test main
+        if self.lang_unittest_main:
+            utfile.writelines(self.gen_unittest_main())
+
+        # Complete the doxygen group
+        if group_name is not None:
+            utfile.writelines(["\n"]) # whitespace for readability
+            utfile.writelines(self.doxy_comment_gen.gen_doxy_group_end())
+
+    @profile_span()
+    def write_unittest_main_file(self, utfile):
+        """!
+        @brief Write the shared main file for the combined language unittest
+        @param utfile {File} File to write the data to
+        """
+        # Write the common header data
+        utfile.writelines(self._generate_file_header(self.project_data.get_eula(),
+                                                     self.project_data.get_owner(),
+                                                     self.project_data.get_creation_year()))
+        utfile.writelines(["\n"]) # whitespace for readability
+
+        # Add the common includes
+        utfile.writelines(self.gen_include_block(["<gtest/gtest.h>"]))
+        utfile.writelines(["\n"]) # whitespace for readability
+
+        # Add the test main
+        utfile.writelines(self.gen_unittest_main())
+
+    def _get_typed_unittest_names(self)->tuple:
+        """!
+        @brief Get the typed unittest C++ names
+        @return tuple - typed test suite name, expected value table template name,
+                        language type list name, test name generator class name
+        """
+        return (self.base_class_name+"TypedTest",
+                self.base_class_name+"Expected",
+                self.base_class_name+"Types",
+                self.base_class_name+"TypeNames")
+
+    def _generate_typed_unittest_table(self, table_name:str, lang:str)->list:
+        """!
+        @brief Generate the expected value table of one language for the typed unittest
+        @param table_name {string} Expected value table template name
+        @param lang {string} Language name
+        @return list of strings - Table code to output
+        """
+        body_indent = "".rjust(self.level_tab_size, " ")
+        string_model = self.get_string_model()
+        lang_model = string_model.get_language(lang)
+
+        code_txt = ["template <> struct "+table_name+"<"+lang_model.class_name+">\n"]
+        code_txt.append("{\n")
+        code_txt.append(body_indent+"static constexpr const char* type_name = \""+lang.capitalize()+"\";\n")
+
+        # Add the property values
+        for method in string_model.get_property_methods():
+            is_text = method.is_text
+            if is_text:
+                item_type = "const char*"
+            else:
+                item_type = self.declare_type(ParamRetDict.get_return_type(method.ret))
+
+            values = lang_model.get_property_value(method.property_name)
+            if ParamRetDict.is_mod_list(ParamRetDict.get_return_type_mod(method.ret)):
+                if is_text:
+                    items = ["\""+item+"\"" for item in values]
+                else:
+                    items = [str(item) for item in values]
+                code_txt.append(body_indent+"static constexpr std::array<"+item_type+", "+
+                                str(len(items))+"> "+method.name+" = {"+", ".join(items)+"};\n")
+            elif is_text:
+                code_txt.append(body_indent+"static constexpr "+item_type+" "+method.name+
+                                " = \""+values+"\";\n")
+            else:
+                code_txt.append(body_indent+"static constexpr "+item_type+" "+method.name+
+                                " = "+str(values)+";\n")
+
+        # Add the translated strings
+        for method in string_model.get_translate_methods():
+            expected = lang_model.get_test_expected(method, self.test_param_values)
+            code_txt.append(body_indent+"static constexpr const char* "+method.name+
+                            " = \""+expected+"\";\n")
+
+        code_txt.append("};\n")
+        return code_txt
+
+    @profile_span()
+    def write_typed_unittest_file(self, utfile):
+        """!
+        @brief Write one typed unittest file for all of the language classes
+        @param utfile {File} File to write the data to
+        """
+        # Set the class name and description
+        group_name = self.project_data.get_group_name()
+        group_desc = self.project_data.get_group_desc()
+        fname = self.gen_typed_unittest_fname()
+        suite_name, table_name, types_name, names_name = self._get_typed_unittest_names()
+        lang_list = self.json_lang_data.get_language_list()
+        string_model = self.get_string_model()
+        body_indent = "".rjust(self.level_tab_size, " ")
+
+        # Write the common header data
+        utfile.writelines(self._generate_file_header(self.project_data.get_eula(),
+                                                     self.project_data.get_owner(),
+                                                     self.project_data.get_creation_year()))
+        utfile.writelines(["\n"]) # whitespace for readability
+
+        # Add the common includes
+        include_list = ["<array>", "<string>", "<gtest/gtest.h>", self.gen_h_fname()]
+        include_list.extend(self._gen_lang_include_list())
+        utfile.writelines(self.gen_include_block(include_list))
+        utfile.writelines(["\n"]) # whitespace for readability
+
+        # Add doxygen group start
+        if group_name is not None:
+            utfile.writelines(self.doxy_comment_gen.gen_doxy_defgroup(fname,
+                                                                      group_name+'unittest',
+                                                                      group_desc+'unit test'))
+
+            utfile.writelines(["\n"]) # whitespace for readability
+
+        # Add using namespace
+        utfile.writelines(self.gen_using_namespace(self.namespace_name))
+
+        # Add using statements
+        using_list = self.project_data.get_base_src_using()
+        if using_list is not None:
+            using_code = []
+            for using in using_list:
+                using_code.append(self.gen_using_statement(using['localName'],
+                                                           using['stdName'],
+                                                           using['desc']))
+            utfile.writelines(using_code)
+        utfile.writelines(["\n"]) # whitespace for readability
+
+        if self.string_table:
+            # Add the language classes under test
+            utfile.writelines(self._gen_table_test_classes())
+
+        # Add the expected value tables
+        utfile.writelines(["// Expected values for each language class\n",
+                           "template <typename T> struct "+table_name+";\n",
+                           "\n"])
+        for lang in lang_list:
+            utfile.writelines(self._generate_typed_unittest_table(table_name, lang))
+            utfile.writelines(["\n"]) # whitespace for readability
+
+        # Add the typed test suite
+        class_list = [string_model.get_class_name(lang) for lang in lang_list]
+        utfile.writelines(["template <typename T>\n",
+                           "class "+suite_name+" : public ::testing::Test\n",
+                           "{\n",
+                           "};\n",
+                           "\n",
+                           "class "+names_name+"\n",
+                           "{\n",
+                           "public:\n",
+                           body_indent+"template <typename T>\n",
+                           body_indent+"static std::string GetName(int)\n",
+                           body_indent+"{\n",
+                           body_indent+body_indent+"return "+table_name+"<T>::type_name;\n",
+                           body_indent+"}\n",
+                           "};\n",
+                           "\n",
+                           "using "+types_name+" = ::testing::Types<"+
+                           (",\n"+body_indent).join(class_list)+">;\n",
+                           "TYPED_TEST_SUITE("+suite_name+", "+types_name+", "+names_name+");\n",
+                           "\n"])
+
+        # Add the property unittest methods
+        for method in string_model.get_property_methods():
+            param_data = [self._get_param_test_value(ParamRetDict.get_param_name(param))
+                          for param in method.params]
+            is_text = LanguageDescriptionList.is_property_text(method.property_name)
+            utfile.writelines(self.generate_typed_property_unittest(method.name, suite_name,
+                                                                    table_name,
+                                                                    self._get_property_ret(method),
+                                                                    param_data, is_text))
             utfile.writelines(["\n"]) # whitespace for readability
 
         # Add the string generation methods
-        method_list = self.json_str_data.get_tranlate_method_list()
-        for method_name in method_list:
-            utfile.writelines(self._generate_translate_unittest(method_name, lang))
+        for method in string_model.get_translate_methods():
+            param_data = [self._get_param_test_value(ParamRetDict.get_param_name(param))
+                          for param in method.params]
+            utfile.writelines(self.generate_typed_translate_unittest(method.name, suite_name,
+                                                                     table_name,
+                                                                     self._get_translate_ret(method),
+                                                                     param_data))
             utfile.writelines(["\n"]) # whitespace for readability
 
         # Add the test main
@@ -762,6 +1876,7 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             utfile.writelines(["\n"]) # whitespace for readability
             utfile.writelines(self.doxy_comment_gen.gen_doxy_group_end())
 
+    @profile_span()
     def write_mock_inc_file(self, mockfile):
         """!
         @brief Write the language specific include file
@@ -816,18 +1931,15 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
                                                                        False))
 
         # Add the property unittest methods
-        method_list = self.json_str_data.get_property_method_list()
-        for method_name in method_list:
-            _, _, params, ret = self.json_str_data.get_property_method_data(method_name)
-            mockfile.writelines(self.write_mock_method(method_name, params,
-                                                       ret, "final"))
+        string_model = self.get_string_model()
+        for method in string_model.get_property_methods():
+            mockfile.writelines(self.write_mock_method(method.name, method.params,
+                                                       self._get_property_ret(method), "final"))
 
         # Add the string generation methods
-        method_list = self.json_str_data.get_tranlate_method_list()
-        for method_name in method_list:
-            _, params, ret = self.json_str_data.get_tranlate_method_function_data(method_name)
-            mockfile.writelines(self.write_mock_method(method_name, params,
-                                                       ret, "final"))
+        for method in string_model.get_translate_methods():
+            mockfile.writelines(self.write_mock_method(method.name, method.params,
+                                                       self._get_translate_ret(method), "final"))
         # Close the class
         mockfile.writelines(self.gen_class_close(class_name))
 
@@ -839,6 +1951,7 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
             # Complete the doxygen group
             mockfile.writelines(self.doxy_comment_gen.gen_doxy_group_end())
 
+    @profile_span()
     def write_mock_src_file(self, srcfile):
         """!
         @brief Write the mock source file
@@ -858,9 +1971,7 @@ class GenerateLangFiles(BaseCppStringClassGenerator):
 
         # Write the include block
         include_list = [self.gen_mock_h_fname()]
-        lang_list = self.json_lang_data.get_language_list()
-        for lang in lang_list:
-            include_list.append(self.gen_h_fname(lang))
+        include_list.extend(self._gen_lang_include_list())
 
         srcfile.writelines(self.gen_include_block(include_list))
         srcfile.writelines(["\n"]) # whitespace for readability
@@ -29,6 +29,7 @@ import os
 
 from code_tools_grocsoftware.base.project_json import ProjectDescription
 from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
+from code_tools_grocsoftware.base.profiler import profile_span
 
 class GenerateCmakeFile():
     """!
@@ -55,8 +56,8 @@ class GenerateCmakeFile():
         """
         retfile = None
         open_name = os.path.join(base_dir, 'CMakeLists.txt')
-        try: # pylint: disable=consider-using-with
-            retfile = open(open_name, mode='wt', encoding="utf-8")
+        try:
+            retfile = self.file_gen.open_emitter(open_name)
             return retfile
         except OSError:
             print (f"Failed to open cmake file '{base_dir}/CMakeLists.txt' for writing")
@@ -74,17 +75,20 @@ class GenerateCmakeFile():
         return cmake_txt
 
     def gen_header(self, project_name:str, project_ver:str,
-                   description:str=None, url:str=None)->list:
+                   description:str=None, url:str=None,
+                   min_version:str="3.14", cxx_standard:int = 17)->list:
         """!
         @brief Generate the include directories cmake code
         @param project_name {str} Project name
         @param project_ver {str} Project version
         @param description {str} Project description
         @param url {str} Project url
+        @param min_version {str} Minimum cmake version
+        @param cxx_standard {int} Required C++ standard version
         @return {list} cmake include directory list name
         """
         cmake_txt = []
-        cmake_txt.append("cmake_minimum_required(VERSION 3.14)\n")
+        cmake_txt.append("cmake_minimum_required(VERSION "+min_version+")\n")
         project_line = f"project({project_name} VERSION {project_ver} LANGUAGES C CXX"
         if description is not None:
             project_line += f' DESCRIPTION "{description}"'
@@ -93,7 +97,7 @@ class GenerateCmakeFile():
         project_line += ")\n\n"
 
         cmake_txt.append(project_line)
-        cmake_txt.append("set(CMAKE_CXX_STANDARD 17)\n")
+        cmake_txt.append("set(CMAKE_CXX_STANDARD "+str(cxx_standard)+")\n")
         cmake_txt.append("set(CMAKE_CXX_STANDARD_REQUIRED True)\n")
 
         return cmake_txt
@@ -144,12 +148,18 @@ class GenerateCmakeFile():
 
     def gen_lib_target(self, project_name:str,
                      srclst_name:str = None,
-                     inclst_name:str = None)->list:
+                     inclst_name:str = None,
+                     reuse_objects:bool = False,
+                     enable_googletest:bool = False)->list:
         """!
         @brief Generate the cmake build file
         @param project_name {str} Project name
         @param srclst_name {str} Source file list
         @param inclst_name {str} Include directory list
+        @param reuse_objects {bool} True if the unit tests link the object library objects,
+                                    the objects are built with the unit test include
+                                    directories, compile definitions and Debug coverage options
+        @param enable_googletest {bool} True if googletest is enabled, False otherwise
         @return {list} cmake library make code
         """
         cmake_txt = []
@@ -157,12 +167,47 @@ class GenerateCmakeFile():
             # Add the library
             cmake_txt.extend(self._gen_comment_block(project_name+" library"))
             cmake_txt.append("add_library(${PROJECT_NAME} OBJECT ${"+srclst_name+"})\n")
+            if reuse_objects:
+                inc_scope = " PUBLIC "
+            else:
+                inc_scope = " PRIVATE "
             if inclst_name is not None:
-                cmake_txt.append("target_include_directories(${PROJECT_NAME} PRIVATE ${"+inclst_name+"})\n")
+                cmake_txt.append("target_include_directories(${PROJECT_NAME}"+inc_scope+"${"+inclst_name+"})\n")
             cmake_txt.append("set_target_properties(${PROJECT_NAME} " \
                             "PROPERTIES VERSION ${PROJECT_VERSION})\n")
+            if reuse_objects:
+                if enable_googletest:
+                    cmake_txt.append("target_compile_options(${PROJECT_NAME} PUBLIC " \
+                                     "-DGTEST_LINKED_AS_SHARED_LIBRARY=1)\n")
+                cmake_txt.extend(self._gen_coverage_options("${PROJECT_NAME}", False))
+        return cmake_txt
+
+    def gen_lib_build_options(self, precompile_headers:bool = False,
+                              unity_batch_size:int = None)->list:
+        """!
+        @brief Generate the library compile time reduction options
+        @param precompile_headers {bool} True to precompile the base interface header
+        @param unity_batch_size {int} Unity build source file batch size,
+                                      0 = all sources in one batch, None = no unity build
+        @return {list} cmake library build option make code
+        """
+        cmake_txt = []
+        base_inc = self.file_gen.get_base_include_fname()
+        if precompile_headers and base_inc is not None:
+            cmake_txt.append("target_precompile_headers(${PROJECT_NAME} PRIVATE " \
+                             "${CMAKE_CURRENT_LIST_DIR}/"+base_inc+" <sstream>)\n")
+        if unity_batch_size is not None:
+            cmake_txt.append("set_target_properties(${PROJECT_NAME} PROPERTIES " \
+                             "UNITY_BUILD ON UNITY_BUILD_BATCH_SIZE "+str(unity_batch_size)+")\n")
         return cmake_txt
 
+    def gen_object_source(self)->str:
+        """!
+        @brief Generate the object library source reference
+        @return {str} cmake generator expression for the project object library objects
+        """
+        return "$<TARGET_OBJECTS:${PROJECT_NAME}>"
+
     def gen_enable_unittest(self, enable_googletest:bool = False)->list:
         """!
         @brief Generate unittest enable code
@@ -180,17 +225,16 @@ class GenerateCmakeFile():
         return cmake_txt
 
 
-    def gen_unittest_target(self, target_name:str,
-                            srclst:list = None,
+    def _gen_unittest_build(self, target_name:str, srclst:list,
                             inclst_name:str = None,
                             enable_googletest:bool = False)->list:
         """!
-        @brief Generate the cmake build file
-        @param target_name {str} Project name
-        @param srclst_name {str} Source file list
+        @brief Generate the unittest executable build code
+        @param target_name {str} Unittest target name
+        @param srclst {list} Source file list
         @param inclst_name {str} Include directory list
         @param enable_googletest {bool} True to enable googletest, False otherwise
-        @return {list} cmake unittest make code
+        @return {list} cmake unittest executable make code
         """
         if enable_googletest:
             if inclst_name is not None:
@@ -208,45 +252,132 @@ class GenerateCmakeFile():
             test_lib = None
             extra_link = None
 
+        cmake_txt = []
+        exe_line = "add_executable("+target_name
+        for srcfile in srclst:
+            exe_line += " "+srcfile
+        exe_line += ")\n"
+        cmake_txt.append(exe_line)
+        if test_inc is not None:
+            cmake_txt.append("target_include_directories("+target_name+" PUBLIC "+test_inc+")\n")
+        if test_lib is not None:
+            # If we have a test library, link it
+            cmake_txt.append("target_link_libraries("+target_name+" PRIVATE "+test_lib+")\n")
+        if extra_link is not None:
+            # If we have extra link options, add them
+            cmake_txt.append("target_compile_options("+target_name+" PUBLIC "+extra_link+")\n")
+
+        cmake_txt.extend(self._gen_coverage_options(target_name))
+        return cmake_txt
+
+    def _gen_coverage_options(self, target_name:str, link_options:bool = True)->list:
+        """!
+        @brief Generate the linux Debug build coverage options
+        @param target_name {str} Target name
+        @param link_options {bool} True to add the coverage link option, False for
+                                   targets that are not linked, i.e. object libraries
+        @return {list} cmake coverage option make code
+        """
+        cmake_txt = []
+        cmake_txt.append("if((${CMAKE_SYSTEM_NAME} MATCHES \"Linux\") AND " \
+                            "(CMAKE_BUILD_TYPE MATCHES \"^[Dd]ebug\"))\n")
+        cmake_txt.append("    target_compile_options("+target_name+" PRIVATE --coverage)\n")
+        if link_options:
+            cmake_txt.append("    target_link_options("+target_name+" PRIVATE --coverage)\n")
+        cmake_txt.append("endif()\n\n")
+        return cmake_txt
+
+    def _gen_test_path(self, test_list_name:str)->list:
+        """!
+        @brief Generate the windows test environment path code
+        @param test_list_name {str} Test list name
+        @return {list} cmake test environment make code
+        """
+        cmake_txt = []
+        cmake_txt.append("if(${CMAKE_SYSTEM_NAME} MATCHES \"Windows\")\n")
+        cmake_txt.append("    set_tests_properties("+test_list_name+" " \
+                            "PROPERTIES ENVIRONMENT \"PATH=$<SHELL_PATH:$<TARGET_FILE_DIR" \
+                            ":gtest>>$<SEMICOLON>$ENV{PATH}\")\n")
+        cmake_txt.append("endif()\n")
+        return cmake_txt
+
+    def gen_unittest_target(self, target_name:str,
+                            srclst:list = None,
+                            inclst_name:str = None,
+                            enable_googletest:bool = False,
+                            test_src:str = None)->list:
+        """!
+        @brief Generate the cmake build file
+        @param target_name {str} Project name
+        @param srclst_name {str} Source file list
+        @param inclst_name {str} Include directory list
+        @param enable_googletest {bool} True to enable googletest, False otherwise
+        @param test_src {str} Test source file to scan for the tests,
+                              None to scan all of the target sources
+        @return {list} cmake unittest make code
+        """
         cmake_txt = []
         if srclst is not None:
             # Add the library
             cmake_txt.extend(self._gen_comment_block(target_name+" unit test build"))
-            exe_line = "add_executable("+target_name
-            for srcfile in srclst:
-                exe_line += " "+srcfile
-            exe_line += ")\n"
-            cmake_txt.append(exe_line)
-            if test_inc is not None:
-                cmake_txt.append("target_include_directories("+target_name+" PUBLIC "+test_inc+")\n")
-            if test_lib is not None:
-                # If we have a test library, link it
-                cmake_txt.append("target_link_libraries("+target_name+" PRIVATE "+test_lib+")\n")
-            if extra_link is not None:
-                # If we have extra link options, add them
-                cmake_txt.append("target_compile_options("+target_name+" PUBLIC "+extra_link+")\n")
-
-            cmake_txt.append("if((${CMAKE_SYSTEM_NAME} MATCHES \"Linux\") AND " \
-                                "(CMAKE_BUILD_TYPE MATCHES \"^[Dd]ebug\"))\n")
-            cmake_txt.append("    target_compile_options("+target_name+" PRIVATE --coverage)\n")
-            cmake_txt.append("    target_link_options("+target_name+" PRIVATE --coverage)\n")
-            cmake_txt.append("endif()\n\n")
+            cmake_txt.extend(self._gen_unittest_build(target_name, srclst,
+                                                      inclst_name, enable_googletest))
 
-            cmake_txt.append("gtest_add_tests (TARGET "+target_name+" TEST_LIST "+target_name+"AllTests)\n\n")
+            if test_src is not None:
+                cmake_txt.append("gtest_add_tests (TARGET "+target_name+" SOURCES "+test_src+
+                                 " TEST_LIST "+target_name+"AllTests)\n\n")
+            else:
+                cmake_txt.append("gtest_add_tests (TARGET "+target_name+" TEST_LIST "+target_name+"AllTests)\n\n")
+            cmake_txt.extend(self._gen_test_path(target_name+"AllTests"))
 
-            cmake_txt.append("if(${CMAKE_SYSTEM_NAME} MATCHES \"Windows\")\n")
-            cmake_txt.append("    set_tests_properties("+target_name+"AllTests " \
-                                "PROPERTIES ENVIRONMENT \"PATH=$<SHELL_PATH:$<TARGET_FILE_DIR" \
-                                ":gtest>>$<SEMICOLON>$ENV{PATH}\")\n")
-            cmake_txt.append("endif()\n")
+        return cmake_txt
+
+    def gen_combined_unittest_target(self, target_name:str,
+                                     srclst:list,
+                                     test_sets:list,
+                                     inclst_name:str = None,
+                                     enable_googletest:bool = False)->list:
+        """!
+        @brief Generate one unittest executable for all of the language unittests
+        @param target_name {str} Combined unittest target name
+        @param srclst {list} Source file list, including the unittest main file
+        @param test_sets {list} (unittest file, language unittest target name) list
+        @param inclst_name {str} Include directory list
+        @param enable_googletest {bool} True to enable googletest, False otherwise
+        @return {list} cmake combined unittest make code
+        """
+        cmake_txt = []
+        cmake_txt.extend(self._gen_comment_block(target_name+" unit test build"))
+        exe_srclst = list(srclst)
+        exe_srclst.extend([tstfile for tstfile, _ in test_sets])
+        cmake_txt.extend(self._gen_unittest_build(target_name, exe_srclst,
+                                                  inclst_name, enable_googletest))
+
+        # Keep the language test lists so each language can still be selected
+        for tstfile, lang_target in test_sets:
+            cmake_txt.append("gtest_add_tests (TARGET "+target_name+" SOURCES "+tstfile+
+                             " TEST_LIST "+lang_target+"AllTests)\n")
+            cmake_txt.extend(self._gen_test_path(lang_target+"AllTests"))
+        cmake_txt.append("\n")
 
         return cmake_txt
 
-    def generate_cmake(self, base_dir:str, enable_googletest:bool = False)->bool:
+    @profile_span()
+    def generate_cmake(self, base_dir:str, enable_googletest:bool = False,
+                       reuse_objects:bool = False,
+                       precompile_headers:bool = False,
+                       unity_batch_size:int = None)->bool:
         """!
         @brief Generate the cmake build file
         @param base_dir {str} Base directory name to create the file in
         @param enable_googletest {bool} True to enable googletest, False otherwise
+        @param reuse_objects {bool} True to link the unit tests against the project
+                                    object library objects instead of compiling the
+                                    sources again for each test, False otherwise
+        @param precompile_headers {bool} True to precompile the base interface header
+                                         for the library sources, False otherwise
+        @param unity_batch_size {int} Unity build the library sources in batches of
+                                      this size, 0 = one batch, None = no unity build
         @return {bool} True if successful, False if not
         """
         cmake_file = self._open_file(base_dir)
@@ -258,8 +389,13 @@ class GenerateCmakeFile():
         description = self.proj_data.get_description()
         url = self.proj_data.get_url()
 
-        # Generate the header
-        cmake_txt = self.gen_header(project_name, project_ver, description, url)
+        # Generate the header, precompiled headers and unity builds need cmake 3.16
+        if precompile_headers or (unity_batch_size is not None):
+            min_version = "3.16"
+        else:
+            min_version = "3.14"
+        cmake_txt = self.gen_header(project_name, project_ver, description, url, min_version,
+                                    self.file_gen.get_cxx_standard())
         cmake_file.writelines(cmake_txt)
         cmake_file.write("\n")  # whitespace for readability
 
@@ -276,7 +412,11 @@ class GenerateCmakeFile():
         # Add the library
         cmake_txt = self.gen_lib_target(project_name,
                                         srclst_name=srclst_name,
-                                        inclst_name=inclst_name)
+                                        inclst_name=inclst_name,
+                                        reuse_objects=reuse_objects,
+                                        enable_googletest=enable_googletest)
+        if srclst_name is not None:
+            cmake_txt.extend(self.gen_lib_build_options(precompile_headers, unity_batch_size))
         cmake_file.writelines(cmake_txt)
         cmake_file.write("\n")  # whitespace for readability
 
@@ -285,24 +425,66 @@ class GenerateCmakeFile():
         cmake_file.writelines(cmake_txt)
         cmake_file.write("\n")  # whitespace for readability
 
+        # Select the unit test library sources, gtest_add_tests can not scan
+        # the object library generator expression for tests
+        if reuse_objects:
+            lib_sources = self.gen_object_source()
+        else:
+            lib_sources = "${"+srclst_name+"}"
+
         # Add the language unit tests
         unttest_list = self.file_gen.get_lang_unittest_set_names()
-        for srcfile, tstfile, target in unttest_list:
+        combined_set = self.file_gen.get_combined_unittest_set_names()
+        typed_set = self.file_gen.get_typed_unittest_set_names()
+        if typed_set is not None:
+            tstfile, target = typed_set
             cmake_txt = self.gen_unittest_target(target,
-                                                 srclst=[srcfile, tstfile],
+                                                 srclst=[lib_sources, tstfile],
                                                  inclst_name=inclst_name,
-                                                 enable_googletest=enable_googletest)
+                                                 enable_googletest=enable_googletest,
+                                                 test_src=tstfile)
 
             cmake_file.writelines(cmake_txt)
             cmake_file.write("\n")  # whitespace for readability
+        elif combined_set is not None:
+            mainfile, target = combined_set
+            if reuse_objects:
+                srclst = [lib_sources, mainfile]
+            else:
+                srclst = []
+                for srcfile, _, _ in unttest_list:
+                    srclst.extend(self.file_gen.get_source_shard_fnames(srcfile))
+                srclst.append(mainfile)
+            test_sets = [(tstfile, lang_target) for _, tstfile, lang_target in unttest_list]
+            cmake_txt = self.gen_combined_unittest_target(target, srclst, test_sets,
+                                                          inclst_name=inclst_name,
+                                                          enable_googletest=enable_googletest)
+
+            cmake_file.writelines(cmake_txt)
+            cmake_file.write("\n")  # whitespace for readability
+        else:
+            for srcfile, tstfile, target in unttest_list:
+                if reuse_objects:
+                    srclst = [lib_sources]
+                else:
+                    srclst = self.file_gen.get_source_shard_fnames(srcfile)
+                cmake_txt = self.gen_unittest_target(target,
+                                                     srclst=srclst+[tstfile],
+                                                     inclst_name=inclst_name,
+                                                     enable_googletest=enable_googletest,
+                                                     test_src=tstfile if reuse_objects else None)
+
+                cmake_file.writelines(cmake_txt)
+                cmake_file.write("\n")  # whitespace for readability
 
         # Add the OS selection unit tests
         unttest_list = self.file_gen.get_select_unittest_set_names()
         for tstfile, target in unttest_list:
             cmake_txt = self.gen_unittest_target(target,
-                                                 srclst=["${"+srclst_name+"}", tstfile],
+                                                 srclst=[lib_sources, tstfile],
                                                  inclst_name=inclst_name,
-                                                 enable_googletest=enable_googletest)
+                                                 enable_googletest=enable_googletest,
+                                                 test_src=tstfile if reuse_objects else None)
 
             cmake_file.writelines(cmake_txt)
             cmake_file.write("\n")  # whitespace for readability
@@ -310,11 +492,13 @@ class GenerateCmakeFile():
         # Add the base file unit tests
         tstfile, target = self.file_gen.get_base_unittest_set_names()
         cmake_txt = self.gen_unittest_target(target,
-                                            srclst=["${"+srclst_name+"}", tstfile],
+                                            srclst=[lib_sources, tstfile],
                                             inclst_name=inclst_name,
-                                            enable_googletest=enable_googletest)
+                                            enable_googletest=enable_googletest,
+                                            test_src=tstfile if reuse_objects else None)
 
         cmake_file.writelines(cmake_txt)
         cmake_file.write("\n")  # whitespace for readability
+        cmake_file.close()
 
         return True
@@ -29,6 +29,7 @@ from datetime import datetime
 
 from code_tools_grocsoftware.base.copyright_generator import CopyrightGenerator
 from code_tools_grocsoftware.base.eula import EulaText
+from code_tools_grocsoftware.base.code_emitter import LineSink
 
 from code_tools_grocsoftware.base.comment_gen_tools import CCommentGenerator
 from code_tools_grocsoftware.base.doxygen_gen_tools import CDoxyCommentGenerator
@@ -56,6 +57,9 @@ class GenerateCppFileHelper():
 
         ## Copyright string generator for the file header generation
         self.copyright_generator = CopyrightGenerator()
+        ## Rendered file header cache, None renders every header
+        #  {(eula name, eula text, owner, first year, last year, tool name): header lines}
+        self.header_cache = None
         self.level_tab_size = 4
 
         ## C/CPP Doxygen comment generator for generating doxygen comment blocks
@@ -71,15 +75,47 @@ class GenerateCppFileHelper():
                                   'unsigned':"unsigned",
                                   'char':"char"}
 
+        ## Reverse translation index, {cpp type name: [generic type keys]}
+        self.xlate_reverse_index = {}
+        for key, xlate_name in self.type_xlation_dict.items():
+            self.xlate_reverse_index.setdefault(xlate_name, []).append(key)
+
+    def add_xlate_type(self, base_type:str, xlate_name:str):
+        """!
+        @brief Add or replace a generic to CPP type translation entry
+        @param base_type {string} Generic type name
+        @param xlate_name {string} CPP type name
+        """
+        old_name = self.type_xlation_dict.get(base_type, None)
+        if old_name is not None:
+            self.xlate_reverse_index[old_name].remove(base_type)
+            if not self.xlate_reverse_index[old_name]:
+                del self.xlate_reverse_index[old_name]
+
+        self.type_xlation_dict[base_type] = xlate_name
+        self.xlate_reverse_index.setdefault(xlate_name, []).append(base_type)
+
     def update_xlate_name(self, std_name:str, new_name:str):
         """!
         @brief Update the translation matrix with a new type name
         @param std_name {string} Old translation name
         @param new_name {string} New name
         """
-        for key, xlate_name in self.type_xlation_dict.items():
-            if xlate_name == std_name:
-                self.type_xlation_dict[key] = new_name
+        if (std_name == new_name) or (std_name not in self.xlate_reverse_index):
+            return
+
+        key_list = self.xlate_reverse_index.pop(std_name)
+        for key in key_list:
+            self.type_xlation_dict[key] = new_name
+        self.xlate_reverse_index.setdefault(new_name, []).extend(key_list)
+
+    def update_xlate_names(self, name_pairs:list):
+        """!
+        @brief Update the translation matrix with a list of new type names
+        @param name_pairs {list of tuples} (std_name, new_name) pairs, applied in order
+        """
+        for std_name, new_name in name_pairs:
+            self.update_xlate_name(std_name, new_name)
 
 
     def declare_type(self, base_type:str, type_mod:int=0)->str:
@@ -214,17 +250,46 @@ class GenerateCppFileHelper():
 
         @return string list - Function doxygen comment block and declaration
         """
-        func_declare_text = []
+        sink = LineSink()
+        self.emit_function_declaration(sink, name, briefdesc, param_dict_list, ret_dict,
+                                       indent, no_doxygen, prefix_decaration,
+                                       postfix_decaration, inlinecode, long_desc)
+        return sink.lines
+
+    def emit_function_declaration(self, outfile, name:str, briefdesc:str,
+                                  param_dict_list:list, ret_dict:dict = None,
+                                  indent:int = 0, no_doxygen:bool = False,
+                                  prefix_decaration:str = None,
+                                  postfix_decaration:str = None,
+                                  inlinecode:list = None,
+                                  long_desc:str = None):
+        """!
+        @brief Write a function declatation text block with doxygen comment
 
+        @param outfile {File} File, CodeEmitter or LineSink to write the data to
+        @param name {string} Function name
+        @param briefdesc {string} Function description
+        @param param_dict_list {list of dictionaries} - Return parameter data
+        @param ret_dict {dictionary or None} - Return parameter data or None
+        @param indent {integer} Comment and function declaration indentation
+        @param no_doxygen {boolean} True skip doxygen comment generation, False generate
+                                    doxygen comment block
+        @param prefix_decaration {string} Valid C/C++ declaration prefix decoration, i.e "virtual"
+        @param postfix_decaration {string} Valid C/C++ declaration postfix decoration,
+                                           i.e "const" | "override" ...
+        @param inlinecode {sting list or None} Inline code for the declaration or None id
+                                               there is no inline definition
+        @param long_desc {string or None} Long description of the function
+        """
         # Add doxygen comment block
         if not no_doxygen:
             xlated_params = self.xlate_params(param_dict_list)
             xlated_ret = self.xlate_return_dict(ret_dict)
-            func_declare_text.extend(self.doxy_comment_gen.gen_doxy_method_comment(briefdesc,
-                                                                                   xlated_params,
-                                                                                   xlated_ret,
-                                                                                   long_desc,
-                                                                                   indent))
+            outfile.writelines(self.doxy_comment_gen.gen_doxy_method_comment(briefdesc,
+                                                                             xlated_params,
+                                                                             xlated_ret,
+                                                                             long_desc,
+                                                                             indent))
 
         # Create function declaration line
         func_line = "".rjust(indent, ' ')
@@ -248,24 +313,19 @@ class GenerateCppFileHelper():
 
         # Add inline code if defined
         if inlinecode is None:
-            func_line += ";\n"
-            func_declare_text.append(func_line)
+            outfile.write(func_line+";\n")
         else:
-            func_line += "\n"
-            func_declare_text.append(func_line)
+            outfile.write(func_line+"\n")
             inline_indent = "".rjust(indent, ' ')
             inline_start = inline_indent+"{"
             if len(inlinecode) == 1:
-                func_declare_text.append(inline_start+inlinecode[0]+"}\n")
+                outfile.write(inline_start+inlinecode[0]+"}\n")
             else:
-                func_declare_text.append(inline_start+"\n")
+                outfile.write(inline_start+"\n")
                 inline_body_indent = "".rjust(indent+self.level_tab_size, ' ')
                 for code_line in inlinecode:
-                    code_line += "\n"
-                    func_declare_text.append(inline_body_indent+code_line)
-                func_declare_text.append(inline_indent+"}\n")
-
-        return func_declare_text
+                    outfile.write(inline_body_indent+code_line+"\n")
+                outfile.write(inline_indent+"}\n")
 
     def define_function_with_decorations(self, name:str, briefdesc:str,
                                          param_dict_list:list, ret_dict:dict,
@@ -290,17 +350,44 @@ class GenerateCppFileHelper():
 
         @return string list - Function doxygen comment block and declaration start
         """
-        func_define_text = []
+        sink = LineSink()
+        self.emit_function_definition(sink, name, briefdesc, param_dict_list, ret_dict,
+                                      no_doxygen, prefix_decaration, postfix_decaration,
+                                      long_desc)
+        return sink.lines
+
+    def emit_function_definition(self, outfile, name:str, briefdesc:str,
+                                 param_dict_list:list, ret_dict:dict,
+                                 no_doxygen:bool = False,
+                                 prefix_decaration:str = None,
+                                 postfix_decaration:str = None,
+                                 long_desc:list = None):
+        """!
+        @brief Write a function definition start with doxygen comment
+
+        @param outfile {File} File, CodeEmitter or LineSink to write the data to
+        @param name {string} Function name
+        @param briefdesc {string} Function description
+        @param param_dict_list {list of dictionaries} - Return parameter data
+        @param ret_dict {dictionary} - Return parameter data
+        @param no_doxygen {boolean} True skip doxygen comment generation, False generate
+                                    doxygen comment block
+        @param prefix_decaration {string or None} Valid C/C++ method declaration prefix
+                                                  decoration, i.e "virtual"
+        @param postfix_decaration {string or None} Valid C/C++ declaration postfix decoration,
+                                                   i.e "const" | "override" ...
+        @param long_desc {string or None} Long description of the function
+        """
         func_line = ""
 
         # Add doxygen comment block
         if not no_doxygen:
             xlated_param_list = self.xlate_params(param_dict_list)
             xlated_ret = self.xlate_return_dict(ret_dict)
-            func_define_text.extend(self.doxy_comment_gen.gen_doxy_method_comment(briefdesc,
-                                                                                  xlated_param_list,
-                                                                                  xlated_ret,
-                                                                                  long_desc))
+            outfile.writelines(self.doxy_comment_gen.gen_doxy_method_comment(briefdesc,
+                                                                             xlated_param_list,
+                                                                             xlated_ret,
+                                                                             long_desc))
 
         # Add function prefix definitions if defined
         if prefix_decaration is not None:
@@ -316,9 +403,7 @@ class GenerateCppFileHelper():
         if postfix_decaration is not None:
             func_line += " "
             func_line += postfix_decaration
-        func_define_text.append(func_line+"\n")
-
-        return func_define_text
+        outfile.write(func_line+"\n")
 
     def end_function(self, name:str)->str:
         """!
@@ -339,13 +424,27 @@ class GenerateCppFileHelper():
         @param autotoolname {string} Auto generation tool name for comments
         @return list of strings - Code to output
         """
+        current_year = datetime.now().year
+        if start_year is None:
+            start_year = current_year
+
+        if owner is None:
+            cache_key = (None, None, None, None, None, autotoolname)
+        elif isinstance(eula, EulaText):
+            cache_key = (eula.eula_name, tuple(eula.raw_eula_text), owner,
+                         start_year, current_year, autotoolname)
+        else:
+            # Only the EulaText raw text is known to fix the formatted text
+            cache_key = None
+        if self.header_cache is None:
+            cache_key = None
+        elif cache_key in self.header_cache:
+            return list(self.header_cache[cache_key])
+
         comment_text = []
         copyright_eula_text = []
         if owner is not None:
             # Generate copyright and EULA text
-            current_year = datetime.now().year
-            if start_year is None:
-                start_year = current_year
 
             copyright_eula_text.append(self.copyright_generator.create_new_copyright(owner,
                                                                                      start_year,
@@ -371,7 +470,10 @@ class GenerateCppFileHelper():
         # Generate comment footer
         for line in self.header_comment_gen.build_comment_block_footer():
             comment_text.append(line+"\n")
-        return comment_text
+
+        if cache_key is not None:
+            self.header_cache[cache_key] = comment_text
+        return list(comment_text)
 
     def gen_include(self, include_name:str)->str:
         """!
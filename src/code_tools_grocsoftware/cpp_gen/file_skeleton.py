@@ -0,0 +1,144 @@
+"""@package langstringautogen
+Pre-rendered file skeleton with per-language slot stamping
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+
+class FileSkeleton():
+    """!
+    @brief Pre-rendered file template with named slots
+
+    The language invariant file text is rendered once into an ordered list of
+    segments. Each segment maps to a single writelines() call when the skeleton
+    is stamped. Language specific text is supplied at stamp time through named
+    slots, either as whole blocks or as markers embedded in a rendered line.
+    Runs of segments can be named as groups so a file variant can leave them
+    out, or so a single group can be stamped on its own.
+    """
+    def __init__(self):
+        """!
+        @brief FileSkeleton constructor
+        """
+        ## Ordered segment list, each entry is a (slot_name, data) tuple
+        #  - slot_name None: data is a list of pre-rendered strings
+        #  - data None: block slot, stamp value is a list of string lists
+        #  - otherwise: data is a list of line fragment tuples joined by the stamp value
+        self.segments = []
+        ## Named segment groups, {group_name: (first segment index, end segment index)}
+        self.groups = {}
+        ## Open group start segment indexes, {group_name: first segment index}
+        self.open_groups = {}
+
+    @staticmethod
+    def slot_marker(slot_name:str)->str:
+        """!
+        @brief Get the inline marker text for a slot
+        @param slot_name {string} Slot name
+        @return string - Marker to embed in rendered text
+        """
+        return "@"+slot_name+"@"
+
+    def writelines(self, text_list:list):
+        """!
+        @brief Append a pre-rendered text segment, file like interface so the
+               existing file generators can render directly into the skeleton
+        @param text_list {list of strings} Rendered text
+        """
+        self.segments.append((None, list(text_list)))
+
+    def add_slot(self, slot_name:str):
+        """!
+        @brief Append a block slot segment
+        @param slot_name {string} Slot name
+        """
+        self.segments.append((slot_name, None))
+
+    def add_stamped_text(self, text_list:list, slot_name:str):
+        """!
+        @brief Append a rendered text segment containing inline slot markers
+        @param text_list {list of strings} Rendered text with slot_marker(slot_name) markers
+        @param slot_name {string} Slot name
+        """
+        marker = self.slot_marker(slot_name)
+        self.segments.append((slot_name, [tuple(line.split(marker)) for line in text_list]))
+
+    def begin_group(self, group_name:str):
+        """!
+        @brief Start a named segment group, the following segments belong to the group
+        @param group_name {string} Group name
+        """
+        self.open_groups[group_name] = len(self.segments)
+
+    def end_group(self, group_name:str):
+        """!
+        @brief Close a named segment group
+        @param group_name {string} Group name
+        """
+        self.groups[group_name] = (self.open_groups.pop(group_name), len(self.segments))
+
+    @staticmethod
+    def _stamp_segment(outfile, slot_name, data, slot_data:dict):
+        """!
+        @brief Write one skeleton segment to the output file
+        @param outfile {File} File to write the data to
+        @param slot_name {string} Segment slot name, None for static text
+        @param data {list} Segment data, None for a block slot
+        @param slot_data {dictionary} {slot_name: value} slot values
+        """
+        if slot_name is None:
+            outfile.writelines(data)
+        elif data is None:
+            for text_list in slot_data[slot_name]:
+                outfile.writelines(text_list)
+        else:
+            value = slot_data[slot_name]
+            outfile.writelines([value.join(fragments) for fragments in data])
+
+    def stamp(self, outfile, slot_data:dict, skip_groups:list = None):
+        """!
+        @brief Write the skeleton to the output file filling in the slot values
+        @param outfile {File} File to write the data to
+        @param slot_data {dictionary} {slot_name: value} where block slot values are
+                                      lists of string lists and inline slot values
+                                      are strings
+        @param skip_groups {list} Names of the segment groups to leave out
+        """
+        skipped = set()
+        for group_name in skip_groups or []:
+            skipped.update(range(*self.groups[group_name]))
+
+        for index, (slot_name, data) in enumerate(self.segments):
+            if index not in skipped:
+                self._stamp_segment(outfile, slot_name, data, slot_data)
+
+    def stamp_group(self, outfile, group_name:str, slot_data:dict):
+        """!
+        @brief Write only the segments of one named group to the output file
+        @param outfile {File} File to write the data to
+        @param group_name {string} Group name
+        @param slot_data {dictionary} {slot_name: value} slot values, see stamp()
+        """
+        start, end = self.groups[group_name]
+        for slot_name, data in self.segments[start:end]:
+            self._stamp_segment(outfile, slot_name, data, slot_data)
@@ -36,10 +36,12 @@ class LinuxLangSelectFunctionGenerator(BaseCppStringClassGenerator):
     """!
     Methods for Linux language select function generation
     """
-    def __init__(self, json_project_data:ProjectDescription):
+    def __init__(self, json_project_data:ProjectDescription, use_regex:bool = True):
         """!
         @brief LinuxLangSelectFunctionGenerator constructor
         @param json_project_data {ProjectDescription} JSON project description data
+        @param use_regex {bool} True to match the LANG value with std::regex, False to
+                                parse it by hand and switch on the packed language code
         """
         jsonstringdesc:StringClassDescription = json_project_data.get_string_data()
         base_class_name = jsonstringdesc.get_base_class_name()
@@ -67,6 +69,9 @@ class LinuxLangSelectFunctionGenerator(BaseCppStringClassGenerator):
         ## CPP Doxygen comment generator
         self.doxy_comment_gen = CDoxyCommentGenerator()
 
+        ## True to generate the std::regex LANG parser, False for the hand parser
+        self.use_regex = use_regex
+
     def get_function_name(self)->str:
         """!
         @brief Return the selection function name
@@ -110,7 +115,10 @@ class LinuxLangSelectFunctionGenerator(BaseCppStringClassGenerator):
         function_body = []
         function_body.append("#if "+self.def_os_str+"\n")
         function_body.append(self.gen_include("<cstdlib>"))
-        function_body.append(self.gen_include("<regex>"))
+        if self.use_regex:
+            function_body.append(self.gen_include("<regex>"))
+        else:
+            function_body.append(self.gen_include("<cstdint>"))
         function_body.append("\n")  # whitespace for readability
         function_body.append("// NOLINTBEGIN\n\n")
 
@@ -124,16 +132,47 @@ class LinuxLangSelectFunctionGenerator(BaseCppStringClassGenerator):
         function_body.append(body_indent+"if (nullptr != "+param_name+")\n")
         function_body.append(body_indent+"{\n")
 
+        # Generate the language selection
+        if self.use_regex:
+            function_body.extend(self._gen_regex_select(param_name))
+        else:
+            function_body.extend(self._gen_parse_select(param_name))
+
+        default_lang, _ = self.lang_json_data.get_default_data()
+        if1_indent = body_indent+"".rjust(self.level_tab_size, " ")
+
+        # Add the else if nullptr case
+        function_body.append(body_indent+"}\n")
+        function_body.append(body_indent+"else // null pointer input, use default language\n")
+        function_body.append(body_indent+"{\n")
+        function_body.append(if1_indent+self._gen_make_ptr_return_statement(default_lang))
+        function_body.append(body_indent+"} // end of if(nullptr != "+param_name+")\n")
+
+        # Complete the function
+        function_body.append(self.gen_function_end())
+        function_body.append("// NOLINTEND\n")
+        function_body.append("#endif // "+self.def_os_str+"\n")
+        return function_body
+
+    def _gen_regex_select(self, param_name:str)->list:
+        """!
+        @brief Generate the std::regex LANG value match and if/else if language selection
+        @param param_name {string} LANG value parameter name
+        @return list - Selection code string list
+        """
+        select_body = []
+        body_indent = "".rjust(self.level_tab_size, " ")
+
         # Generate if/else if chain for each language in the dictionary
         if1_indent = body_indent+"".rjust(self.level_tab_size, " ")
-        function_body.append(if1_indent+"// Break the string into its components\n")
-        function_body.append(if1_indent+"std::cmatch search_match;\n")
+        select_body.append(if1_indent+"// Break the string into its components\n")
+        select_body.append(if1_indent+"std::cmatch search_match;\n")
         regexstr = "\"^([a-z]{2})_([A-Z]{2})\\\\.(UTF-[0-9]{1,2})\""
-        function_body.append(if1_indent+"std::regex search_regex("+regexstr+");\n")
+        select_body.append(if1_indent+"std::regex search_regex("+regexstr+");\n")
         paramstr = param_name+", search_match, search_regex"
-        function_body.append(if1_indent+"bool matched = std::regex_match("+paramstr+");\n")
-        function_body.append("\n")  # whitespace for readability
-        function_body.append(if1_indent+"// Determine the language\n")
+        select_body.append(if1_indent+"bool matched = std::regex_match("+paramstr+");\n")
+        select_body.append("\n")  # whitespace for readability
+        select_body.append(if1_indent+"// Determine the language\n")
 
         if2_indent = if1_indent+"".rjust(self.level_tab_size, " ")
         first_check = True
@@ -150,30 +189,91 @@ class LinuxLangSelectFunctionGenerator(BaseCppStringClassGenerator):
             ifline += lang_code
             ifline += "\"))\n"
 
-            function_body.append(if1_indent+ifline)
-            function_body.append(if1_indent+"{\n")
-            function_body.append(if2_indent+self._gen_make_ptr_return_statement(lang_name))
-            function_body.append(if1_indent+"}\n")
+            select_body.append(if1_indent+ifline)
+            select_body.append(if1_indent+"{\n")
+            select_body.append(if2_indent+self._gen_make_ptr_return_statement(lang_name))
+            select_body.append(if1_indent+"}\n")
 
         # Add the final else (unknown language) case
         default_lang, _ = self.lang_json_data.get_default_data()
-        function_body.append(if1_indent+"else //unknown language code, use default language\n")
-        function_body.append(if1_indent+"{\n")
-        function_body.append(if2_indent+self._gen_make_ptr_return_statement(default_lang))
-        function_body.append(if1_indent+"}\n")
-
-        # Add the else if nullptr case
-        function_body.append(body_indent+"}\n")
-        function_body.append(body_indent+"else // null pointer input, use default language\n")
-        function_body.append(body_indent+"{\n")
-        function_body.append(if1_indent+self._gen_make_ptr_return_statement(default_lang))
-        function_body.append(body_indent+"} // end of if(nullptr != "+param_name+")\n")
+        select_body.append(if1_indent+"else //unknown language code, use default language\n")
+        select_body.append(if1_indent+"{\n")
+        select_body.append(if2_indent+self._gen_make_ptr_return_statement(default_lang))
+        select_body.append(if1_indent+"}\n")
+        return select_body
+
+    @staticmethod
+    def _gen_packed_code(lang_code:str)->str:
+        """!
+        @brief Pack a two character language code into a switch case value
+        @param lang_code {string} Two character language code
+        @return string - Hexadecimal C++ constant
+        """
+        return "0x"+format((ord(lang_code[0]) << 8) | ord(lang_code[1]), "04x")
 
-        # Complete the function
-        function_body.append(self.gen_function_end())
-        function_body.append("// NOLINTEND\n")
-        function_body.append("#endif // "+self.def_os_str+"\n")
-        return function_body
+    def _gen_parse_select(self, param_name:str)->list:
+        """!
+        @brief Generate the hand parsed ll_CC.UTF-x LANG value check and the packed
+               language code switch selection
+        @param param_name {string} LANG value parameter name
+        @return list - Selection code string list
+        """
+        select_body = []
+        body_indent = "".rjust(self.level_tab_size, " ")
+        if1_indent = body_indent+"".rjust(self.level_tab_size, " ")
+        if2_indent = if1_indent+"".rjust(self.level_tab_size, " ")
+        if3_indent = if2_indent+"".rjust(self.level_tab_size, " ")
+        cont_indent = if1_indent+"".rjust(len("bool matched = "), " ")
+
+        # Check the ll_CC.UTF-x form, each test stops at the string terminator
+        # before the next character is read
+        lang = param_name
+        select_body.append(if1_indent+"// Check the ll_CC.UTF-x form without a regular expression\n")
+        select_body.append(if1_indent+"bool matched = ("+lang+"[0] >= 'a') && ("+lang+"[0] <= 'z') &&\n")
+        select_body.append(cont_indent+"("+lang+"[1] >= 'a') && ("+lang+"[1] <= 'z') &&\n")
+        select_body.append(cont_indent+"("+lang+"[2] == '_') &&\n")
+        select_body.append(cont_indent+"("+lang+"[3] >= 'A') && ("+lang+"[3] <= 'Z') &&\n")
+        select_body.append(cont_indent+"("+lang+"[4] >= 'A') && ("+lang+"[4] <= 'Z') &&\n")
+        select_body.append(cont_indent+"("+lang+"[5] == '.') && ("+lang+"[6] == 'U') && ("+
+                           lang+"[7] == 'T') &&\n")
+        select_body.append(cont_indent+"("+lang+"[8] == 'F') && ("+lang+"[9] == '-') &&\n")
+        select_body.append(cont_indent+"("+lang+"[10] >= '0') && ("+lang+"[10] <= '9') &&\n")
+        select_body.append(cont_indent+"(('\\0' == "+lang+"[11]) ||\n")
+        select_body.append(cont_indent+" (("+lang+"[11] >= '0') && ("+lang+"[11] <= '9') && ('\\0' == "+
+                           lang+"[12])));\n")
+        select_body.append("\n")  # whitespace for readability
+
+        # Switch on the packed language code, first language wins duplicate codes
+        select_body.append(if1_indent+"// Determine the language from the packed language code\n")
+        select_body.append(if1_indent+"if (matched)\n")
+        select_body.append(if1_indent+"{\n")
+        select_body.append(if2_indent+"switch ((static_cast<uint16_t>("+lang+"[0]) << 8) | "
+                           "static_cast<uint16_t>("+lang+"[1]))\n")
+        select_body.append(if2_indent+"{\n")
+
+        case_codes = []
+        for lang_name in self.lang_json_data.get_language_list():
+            lang_code, _ = self.lang_json_data.get_language_data(lang_name)
+            if (len(lang_code) != 2) or (not lang_code.isascii()) or (not lang_code.isalpha()) or \
+               (not lang_code.islower()) or (lang_code in case_codes):
+                # The LANG check can never match this code or an earlier language
+                # already selects it
+                continue
+            case_codes.append(lang_code)
+            select_body.append(if3_indent+"case "+self._gen_packed_code(lang_code)+": // "+lang_code+"\n")
+            select_body.append(if3_indent+body_indent+self._gen_make_ptr_return_statement(lang_name))
+
+        select_body.append(if3_indent+"default: // unknown language code, use default language\n")
+        select_body.append(if3_indent+body_indent+"break;\n")
+        select_body.append(if2_indent+"}\n")
+        select_body.append(if1_indent+"}\n")
+        select_body.append("\n")  # whitespace for readability
+
+        # Unknown language or invalid LANG value
+        default_lang, _ = self.lang_json_data.get_default_data()
+        select_body.append(if1_indent+"// unknown language code, use default language\n")
+        select_body.append(if1_indent+self._gen_make_ptr_return_statement(default_lang))
+        return select_body
 
     def gen_return_function_call(self, indent:int = 4)->list:
         """!
@@ -292,6 +392,17 @@ class LinuxLangSelectFunctionGenerator(BaseCppStringClassGenerator):
                                                 get_iso_method)
         unittest_block.extend(unknown_lang_body)
 
+        # Generate the malformed LANG value tests for the hand parser
+        if not self.use_regex:
+            for test_name, linux_env_string in [("NoCodesetDefaultSelection", "xx_XX"),
+                                                ("ShortLanguageDefaultSelection", "x"),
+                                                ("LongCodesetDefaultSelection", "xx_XX.UTF-123")]:
+                unittest_block.append("\n") # whitespace for readability
+                unittest_block.extend(self._gen_unittest_test(test_name,
+                                                              linux_env_string,
+                                                              default_iso_code,
+                                                              get_iso_method))
+
         # Generate block end code
         unittest_block.append("#endif // "+self.def_os_str+"\n")
         return unittest_block
@@ -186,4 +186,28 @@ class MasterSelectFunctionGenerator(BaseCppStringClassGenerator):
         test_body.append(body_indent+test_var_decl+" = "+self.select_function_name+"();\n")
         test_body.append(body_indent+"EXPECT_STREQ("+get_expected_val+", "+expected_val+");\n")
         test_body.append(self.gen_function_end())
+
+        if self.cached_instances:
+            test_body.append("\n") # whitespace for readability
+            test_body.extend(self.gen_cached_unit_test(test_block_name))
+        return test_body
+
+    def gen_cached_unit_test(self, test_block_name:str = "SelectFunction")->list:
+        """!
+        @brief Generate the cached instance unit test for the selection function
+
+        @param test_block_name {string} Test suite name
+        @return list - Unittest text list
+        """
+        body_indent = "".rjust(4, " ")
+        breif_desc = "Test "+self.select_function_name+" returns the cached instance"
+        test_body = self.doxy_comment_gen.gen_doxy_method_comment(breif_desc, [])
+        test_body.append("TEST("+test_block_name+", TestLocalSelectCachedInstance)\n")
+        test_body.append("{\n")
+        test_body.append(body_indent+"// Select the language string object twice\n")
+        for var_name in ["first_var", "second_var"]:
+            test_body.append(body_indent+self.base_intf_ret_ptr_type+" "+var_name+" = "+
+                             self.select_function_name+"();\n")
+        test_body.append(body_indent+"EXPECT_EQ(first_var.get(), second_var.get());\n")
+        test_body.append(self.gen_function_end())
         return test_body
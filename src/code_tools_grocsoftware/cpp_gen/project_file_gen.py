@@ -25,32 +25,113 @@ for a language string generation library
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #==========================================================================
 
+import multiprocessing
 import os
 
 from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.base.output_backend import DiskOutputBackend, MemoryOutputBackend
+from code_tools_grocsoftware.base.code_emitter import CodeEmitter
+from code_tools_grocsoftware.base.profiler import profile_span, profiler
 
 from code_tools_grocsoftware.base.json_language_list import LanguageDescriptionList
 from code_tools_grocsoftware.cpp_gen.class_file_gen import GenerateLangFiles
 
 # Add additional OS lang select classes here
 
+## Generator inherited by the forked language generation worker processes
+_worker_generator = None
+
+def _generate_lang_worker(lang:str)->tuple:
+    """!
+    @brief Generate the language files in a worker process
+    @param lang {str} Language name
+    @return tuple - (status, language file name dictionary,
+                     [(subdirectory/file name, text)] in generation order)
+    """
+    proj_gen = _worker_generator
+    output_backend = MemoryOutputBackend()
+    proj_gen.output_backend = output_backend
+    proj_gen.fnames = {}
+    # An empty base directory keeps the file names relative to the output base
+    status = proj_gen.generate_lang_files("", lang)
+    file_text = [(fname, outfile.get_text()) for fname, outfile in output_backend.files.items()]
+    return status, proj_gen.fnames.get(lang, {}), file_text
+
 class ProjectFileGenerator():
     """!
     Class takes the LanguageDescriptionList JSON data and StringClassDescription JSON
     data and generates the base and language specific source, include, mock and unittest
     files.
     """
-    def __init__(self, project_data:ProjectDescription):
+    @profile_span()
+    def __init__(self, project_data:ProjectDescription, output_backend = None,
+                 combined_unittest:bool = False, typed_unittest:bool = False,
+                 linux_select_regex:bool = True, cached_instances:bool = False,
+                 string_view_constants:bool = False, append_translate:bool = False,
+                 string_table:bool = False, windows_langid_table:bool = False,
+                 constexpr_properties:bool = False, shard_method_count:int = None,
+                 shard_byte_size:int = None):
         """!
         @brief GenerateBaseLangFile constructor
 
         @param project_data {ProjectDescription} JSON project data object
+        @param output_backend {DiskOutputBackend|MemoryOutputBackend|HashOutputBackend}
+                              Generated file output backend, None = DiskOutputBackend
+        @param combined_unittest {bool} True to build all of the language unittests into
+                                        one test executable with a shared main, False
+                                        to build one test executable per language
+        @param typed_unittest {bool} True to generate one typed unittest file with expected
+                                     value tables for all of the languages instead of
+                                     one unittest file per language
+        @param linux_select_regex {bool} True to match the linux LANG value with std::regex,
+                                         False to parse it by hand
+        @param cached_instances {bool} True to return cached language class instances from
+                                       the selection functions, False to make a new
+                                       instance on every call
+        @param string_view_constants {bool} True to return std::string_view static text from
+                                            the parameterless translate methods, False to
+                                            return a new string
+        @param append_translate {bool} True to build the translate method strings with
+                                       reserve and append, False to use a string stream
+        @param string_table {bool} True to generate one string table class for all of the
+                                   languages instead of one class per language, the
+                                   language tests use the typed unittest file
+        @param windows_langid_table {bool} True to look up the full windows LANGID in a sorted
+                                           table before the primary language switch
+        @param constexpr_properties {bool} True to return the list property values as a
+                                           std::span of static constexpr std::array data,
+                                           the project requires C++20
+        @param shard_method_count {int} Split each language source file into shards of at
+                                        most this many translate methods, None = no limit
+        @param shard_byte_size {int} Split each language source file into shards of at
+                                     most this many translate method definition bytes,
+                                     None = no limit
         """
         ## Json project data object
         self.project_data = project_data
 
+        ## Generated file output backend
+        if output_backend is None:
+            self.output_backend = DiskOutputBackend()
+        else:
+            self.output_backend = output_backend
+        ## CodeEmitter buffer size for the generated files, None writes straight to the
+        #  output backend files
+        self.emitter_buffer_size = 65536
+
         ## Class generator
-        self.class_gen = GenerateLangFiles(project_data)
+        self.class_gen = GenerateLangFiles(project_data, linux_select_regex, cached_instances,
+                                           string_view_constants, append_translate, string_table,
+                                           windows_langid_table, constexpr_properties,
+                                           shard_method_count, shard_byte_size)
+
+        ## True if the language unittests share one test executable
+        self.combined_unittest = combined_unittest
+        self.class_gen.lang_unittest_main = not combined_unittest
+        ## True if the languages share one string table class
+        self.string_table = string_table
+        ## True if the languages share one typed unittest file
+        self.typed_unittest = typed_unittest or string_table
 
         ## Json language data list object
         self.json_lang_data:LanguageDescriptionList = project_data.get_lang_data()
@@ -58,6 +139,7 @@ class ProjectFileGenerator():
         ## File name dictionary
         #  {language_name: {'include': include_fname,
         #                   'source': source_fname,
+        #                   'sourceShards': [source_shard_fname, ...],
         #                   'mockInclude': mock_include_fname,
         #                   'mockSource': mock_source_fname,
         #                   'unittest': unittest_fname}}
@@ -74,6 +156,15 @@ class ProjectFileGenerator():
         """
         return self.project_data
 
+    def get_cxx_standard(self)->int:
+        """!
+        @brief Get the C++ standard version the generated files require
+        @return int - 20 if the constexpr list properties return std::span, else 17
+        """
+        if self.class_gen.constexpr_properties:
+            return 20
+        return 17
+
     def add_include_dir(self, subdir_name:str):
         """!
         @brief Add subdir name to the include dir list
@@ -93,19 +184,23 @@ class ProjectFileGenerator():
         """!
         @brief Add File to the list of files
         @param file_type {string} Type 'include' | 'source' | 'mockInclude'
-                                       | 'mockSource | 'unittest'
+                                       | 'mockSource | 'unittest' | 'unittestMain'
+                                       | 'typedUnittest' | 'sourceShards'
         @param file_name {string} File name to add
         @param language_name {string} Language name or None for base files
         @note If language_name is None, then the file is a base file
         @note If language_name is not None, then the file is a language specific file
+        @note 'sourceShards' file names are appended to the language shard list
         """
         if language_name is None:
             language_name = 'base'
 
-        if language_name in self.fnames:
-            self.fnames[language_name][file_type] = file_name
-        else:
+        if language_name not in self.fnames:
             self.fnames[language_name] = {}
+
+        if file_type == 'sourceShards':
+            self.fnames[language_name].setdefault(file_type, []).append(file_name)
+        else:
             self.fnames[language_name][file_type] = file_name
 
     def _add_select_file(self, file_name:str, target_name:str):
@@ -134,6 +229,13 @@ class ProjectFileGenerator():
                 file_list.append(lang_files['include'])
         return file_list
 
+    def get_base_include_fname(self)->str:
+        """!
+        @brief Get the base interface include file name
+        @return str - base include file name or None if it was not generated
+        """
+        return self.fnames.get('base', {}).get('include')
+
     def get_mock_include_fnames(self)->list:
         """!
         @brief Generate a list of include file names
@@ -154,8 +256,20 @@ class ProjectFileGenerator():
         for _, lang_files in self.fnames.items():
             if 'source' in lang_files:
                 file_list.append(lang_files['source'])
+            file_list.extend(lang_files.get('sourceShards', []))
         return file_list
 
+    def get_source_shard_fnames(self, source_fname:str)->list:
+        """!
+        @brief Get the source file name and the other shard file names of the same language
+        @param source_fname {string} Source file name from get_lang_unittest_set_names()
+        @return list - source file name followed by the other shard file names
+        """
+        for _, lang_files in self.fnames.items():
+            if lang_files.get('source') == source_fname:
+                return [source_fname] + lang_files.get('sourceShards', [])
+        return [source_fname]
+
     def get_lang_unittest_set_names(self)->list:
         """!
         @brief Generate a list of source file names
@@ -177,6 +291,28 @@ class ProjectFileGenerator():
 
         return unittest_sets
 
+    def get_combined_unittest_set_names(self)->tuple:
+        """!
+        @brief Get the combined language unittest data
+        @return tuple - unittest main file name, combined target name or
+                        None if the language unittests are built individually
+        """
+        if not self.combined_unittest:
+            return None
+        return (self.fnames['base']['unittestMain'],
+                self.class_gen.gen_combined_unittest_target_name())
+
+    def get_typed_unittest_set_names(self)->tuple:
+        """!
+        @brief Get the typed language unittest data
+        @return tuple - typed unittest file name, typed unittest target name or
+                        None if the language unittests are not typed
+        """
+        if not self.typed_unittest:
+            return None
+        return (self.fnames['base']['typedUnittest'],
+                self.class_gen.gen_typed_unittest_target_name())
+
     def get_base_unittest_set_names(self)->tuple:
         """!
         @brief Generate a list of source file names
@@ -191,9 +327,9 @@ class ProjectFileGenerator():
         @return bool - True, directory created, False if an error occurred
         """
         return_val = True
-        if not os.path.exists(subdir):
+        if not self.output_backend.exists(subdir):
             try:
-                os.mkdir(subdir)
+                self.output_backend.make_dir(subdir)
             except PermissionError:
                 return_val = False
                 print(f"Permission denied: Unable to create '{subdir}'.")
@@ -202,6 +338,7 @@ class ProjectFileGenerator():
                 print(f"OS Error occurred creating: {subdir}.")
         return return_val
 
+    @profile_span()
     def make_dirs(self, base_dir:str)->bool:
         """!
         @brief Make the subdirectories
@@ -210,7 +347,7 @@ class ProjectFileGenerator():
         """
         return_val = True
 
-        if not os.path.exists(base_dir):
+        if not self.output_backend.exists(base_dir):
             return_val = False
             raise NameError(f"ERROR: base directory '{base_dir}' does not exist")
 
@@ -225,6 +362,7 @@ class ProjectFileGenerator():
 
         return return_val
 
+    @profile_span()
     def open_file(self, base_dir:str, fname:str):
         """!
         @brief Open file
@@ -234,13 +372,28 @@ class ProjectFileGenerator():
         """
         retfile = None
         open_name = os.path.join(base_dir, fname)
-        try: # pylint: disable=consider-using-with
-            retfile = open(open_name, mode='wt', encoding="utf-8")
+        profiler.count("ProjectFileGenerator.files")
+        try:
+            retfile = self.open_emitter(open_name)
             return retfile
         except OSError:
             print (f"Failed to open '{open_name}' for writing")
             return None
 
+    def open_emitter(self, path:str):
+        """!
+        @brief Open an output backend file and wrap it in a CodeEmitter
+        @param path {str} File path
+        @return CodeEmitter - emitter that closes the backend file on close(), or the
+                              backend file if emitter_buffer_size is None
+        @exception OSError File could not be opened
+        """
+        outfile = self.output_backend.open_file(path)
+        if self.emitter_buffer_size is None:
+            return outfile
+        return CodeEmitter(outfile, self.emitter_buffer_size, owns_sink=True)
+
+    @profile_span()
     def generate_lang_files(self, base_dir:str, lang:str = None)->bool:
         """!
         @brief Generate the inc, source and unittest files
@@ -256,20 +409,29 @@ class ProjectFileGenerator():
         if baseinc is not None:
             self._add_file('include', incname, lang)
             self.class_gen.write_inc_file(baseinc, lang)
+            baseinc.close()
         else:
             return_val = False
 
-        srcname = os.path.join(self.project_data.get_src_subdir(),
-                               self.class_gen.gen_cpp_fname(lang))
-        basesrc = self.open_file(base_dir, srcname)
-        if basesrc is not None:
-            self._add_file('source', srcname, lang)
-            if lang is None:
-                self.class_gen.write_base_src_file(basesrc)
-            else:
-                self.class_gen.write_lang_src_file(basesrc, lang)
+        if (lang is not None) and self.class_gen.is_sharded():
+            return_val &= self.generate_lang_src_shard_files(base_dir, lang)
         else:
-            return_val = False
+            srcname = os.path.join(self.project_data.get_src_subdir(),
+                                   self.class_gen.gen_cpp_fname(lang))
+            basesrc = self.open_file(base_dir, srcname)
+            if basesrc is not None:
+                self._add_file('source', srcname, lang)
+                if lang is None:
+                    self.class_gen.write_base_src_file(basesrc)
+                else:
+                    self.class_gen.write_lang_src_file(basesrc, lang)
+                basesrc.close()
+            else:
+                return_val = False
+
+        if self.typed_unittest and (lang is not None):
+            # The language tests are in the typed unittest file
+            return return_val
 
         tstname = os.path.join(self.project_data.get_test_subdir(),
                                self.class_gen.gen_unittest_fname(lang))
@@ -280,11 +442,69 @@ class ProjectFileGenerator():
                 self.class_gen.write_base_unittest_file(utsrc)
             else:
                 self.class_gen.write_lang_unittest_file(utsrc, lang)
+            utsrc.close()
         else:
             return_val = False
 
         return return_val
 
+    @profile_span()
+    def generate_lang_src_shard_files(self, base_dir:str, lang:str)->bool:
+        """!
+        @brief Generate the language source shard files
+        @param base_dir {str} Base directory name
+        @param lang {str} Language name
+        @return bool - True if all files were created else False
+        """
+        return_val = True
+        for shard_index, shard_slots in enumerate(self.class_gen.gen_lang_src_shards(lang)):
+            srcname = os.path.join(self.project_data.get_src_subdir(),
+                                   self.class_gen.gen_shard_cpp_fname(lang, shard_index))
+            shardsrc = self.open_file(base_dir, srcname)
+            if shardsrc is not None:
+                if shard_index == 0:
+                    self._add_file('source', srcname, lang)
+                else:
+                    self._add_file('sourceShards', srcname, lang)
+                self.class_gen.write_lang_src_shard_file(shardsrc, lang, shard_index, shard_slots)
+                shardsrc.close()
+            else:
+                return_val = False
+
+        return return_val
+
+    @profile_span()
+    def generate_table_files(self, base_dir:str)->bool:
+        """!
+        @brief Generate the string table class inc and source files
+        @param base_dir {str} Base directory name
+        @return bool - True if all files were created else False
+        """
+        return_val = True
+
+        incname = os.path.join(self.project_data.get_inc_subdir(),
+                               self.class_gen.gen_table_h_fname())
+        tableinc = self.open_file(base_dir, incname)
+        if tableinc is not None:
+            self._add_file('include', incname, 'stringTable')
+            self.class_gen.write_table_inc_file(tableinc)
+            tableinc.close()
+        else:
+            return_val = False
+
+        srcname = os.path.join(self.project_data.get_src_subdir(),
+                               self.class_gen.gen_table_cpp_fname())
+        tablesrc = self.open_file(base_dir, srcname)
+        if tablesrc is not None:
+            self._add_file('source', srcname, 'stringTable')
+            self.class_gen.write_table_src_file(tablesrc)
+            tablesrc.close()
+        else:
+            return_val = False
+
+        return return_val
+
+    @profile_span()
     def generate_mock_files(self, base_dir:str)->bool:
         """!
         @brief Generate the mock files
@@ -298,6 +518,7 @@ class ProjectFileGenerator():
         if mock_h is not None:
             self._add_file('mockInclude', mockhname)
             self.class_gen.write_mock_inc_file(mock_h)
+            mock_h.close()
         else:
             return_val = False
 
@@ -307,11 +528,49 @@ class ProjectFileGenerator():
         if mock_cpp is not None:
             self._add_file('mockSource', mocksrcname)
             self.class_gen.write_mock_src_file(mock_cpp)
+            mock_cpp.close()
         else:
             return_val = False
 
         return return_val
 
+    @profile_span()
+    def generate_unittest_main_file(self, base_dir:str)->bool:
+        """!
+        @brief Generate the shared main file of the combined language unittest
+        @param base_dir {str} Base directory name
+        @return bool - True if the file was created else False
+        """
+        mainname = os.path.join(self.project_data.get_test_subdir(),
+                                self.class_gen.gen_unittest_main_fname())
+        main_src = self.open_file(base_dir, mainname)
+        if main_src is None:
+            return False
+
+        self._add_file('unittestMain', mainname)
+        self.class_gen.write_unittest_main_file(main_src)
+        main_src.close()
+        return True
+
+    @profile_span()
+    def generate_typed_unittest_file(self, base_dir:str)->bool:
+        """!
+        @brief Generate the typed unittest file for all of the languages
+        @param base_dir {str} Base directory name
+        @return bool - True if the file was created else False
+        """
+        typedname = os.path.join(self.project_data.get_test_subdir(),
+                                 self.class_gen.gen_typed_unittest_fname())
+        typed_src = self.open_file(base_dir, typedname)
+        if typed_src is None:
+            return False
+
+        self._add_file('typedUnittest', typedname)
+        self.class_gen.write_typed_unittest_file(typed_src)
+        typed_src.close()
+        return True
+
+    @profile_span()
     def generate_select_files(self, base_dir:str)->bool:
         """!
         @brief Generate the output files
@@ -326,14 +585,62 @@ class ProjectFileGenerator():
             if select_ut is not None:
                 self._add_select_file(selname, target_name)
                 self.class_gen.write_selection_unittest_file(select_ut, os_sel)
+                select_ut.close()
             else:
                 return_val = False
         return return_val
 
-    def generate_files(self, base_dir:str)->bool:
+    @profile_span()
+    def generate_lang_files_parallel(self, base_dir:str, lang_list:list, jobs:int)->bool:
+        """!
+        @brief Generate the language specific files in worker processes
+
+        The forked workers inherit this generator and its loaded project data,
+        each worker renders the files of one language in memory. The files are
+        written through the output backend in language order, the output is
+        the same as the serial generate_lang_files() calls.
+
+        @param base_dir {str} Base directory name
+        @param lang_list {list} Language names
+        @param jobs {int} Worker process count
+        @return bool - True if all files were created else False
+        """
+        global _worker_generator # pylint: disable=global-statement
+        return_val = True
+
+        _worker_generator = self
+        try:
+            with multiprocessing.get_context("fork").Pool(min(jobs, len(lang_list))) as pool:
+                results = pool.map(_generate_lang_worker, lang_list)
+        finally:
+            _worker_generator = None
+
+        for lang, (status, lang_fnames, file_text) in zip(lang_list, results):
+            return_val &= status
+            for file_type, file_name in lang_fnames.items():
+                if file_type == 'sourceShards':
+                    for shard_name in file_name:
+                        self._add_file(file_type, shard_name, lang)
+                else:
+                    self._add_file(file_type, file_name, lang)
+
+            for fname, text in file_text:
+                outfile = self.open_file(base_dir, fname)
+                if outfile is not None:
+                    outfile.write(text)
+                    outfile.close()
+                else:
+                    return_val = False
+
+        return return_val
+
+    @profile_span()
+    def generate_files(self, base_dir:str, jobs:int = 1)->bool:
         """!
         @brief Generate the output files
         @param base_dir {str} Base directory name
+        @param jobs {int} Language file generation worker process count, 1 = generate
+                          in this process, more workers need the fork start method
         @return bool - True if all files were created else False
         """
         return_val = True
@@ -343,10 +650,23 @@ class ProjectFileGenerator():
         # Generate the base files
         return_val &= self.generate_lang_files(base_dir)
 
-        # Generate the language specific files
-        lang_list = self.json_lang_data.get_language_list()
-        for lang in lang_list:
-            return_val &= self.generate_lang_files(base_dir, lang)
+        # Generate the language specific files or the shared string table
+        if self.string_table:
+            return_val &= self.generate_table_files(base_dir)
+        else:
+            lang_list = self.json_lang_data.get_language_list()
+            if (jobs > 1) and (len(lang_list) > 1) and \
+               ("fork" in multiprocessing.get_all_start_methods()):
+                return_val &= self.generate_lang_files_parallel(base_dir, lang_list, jobs)
+            else:
+                for lang in lang_list:
+                    return_val &= self.generate_lang_files(base_dir, lang)
+
+        # Generate the typed language unittest or the combined language unittest main
+        if self.typed_unittest:
+            return_val &= self.generate_typed_unittest_file(base_dir)
+        elif self.combined_unittest:
+            return_val &= self.generate_unittest_main_file(base_dir)
 
         # Generate the mock files
         return_val &= self.generate_mock_files(base_dir)
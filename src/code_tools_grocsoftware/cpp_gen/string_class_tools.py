@@ -28,6 +28,8 @@ for a language string generation library
 from code_tools_grocsoftware.base.param_return_tools import ParamRetDict
 from code_tools_grocsoftware.cpp_gen.file_gen_base import GenerateCppFileHelper
 from code_tools_grocsoftware.base.eula import EulaText
+from code_tools_grocsoftware.base.code_emitter import LineSink
+from code_tools_grocsoftware.base.profiler import profile_span
 
 class BaseCppStringClassGenerator(GenerateCppFileHelper):
     """!
@@ -61,9 +63,10 @@ class BaseCppStringClassGenerator(GenerateCppFileHelper):
         self.base_intf_ret_ptr_dict = ParamRetDict.build_return_dict('sharedptr', retdesc)
 
         # Add the specialty types
-        self.type_xlation_dict['LANGID'] = "LANGID"
-        self.type_xlation_dict['sharedptr'] = self.base_intf_ret_ptr_type
-        self.type_xlation_dict['strstream'] = "std::stringstream"
+        self.add_xlate_type('LANGID', "LANGID")
+        self.add_xlate_type('sharedptr', self.base_intf_ret_ptr_type)
+        self.add_xlate_type('strstream', "std::stringstream")
+        self.add_xlate_type('stringview', "std::string_view")
 
         ## Autogeneration tool name
         self.auto_tool_name = str(self.__class__.__name__)+version
@@ -80,6 +83,20 @@ class BaseCppStringClassGenerator(GenerateCppFileHelper):
         ## Default method/function body indentation
         self.function_indent = 4
 
+        ## True to return a cached function local static instance from the language
+        #  selection functions, False to make a new instance on every call
+        self.cached_instances = False
+
+        ## Cached language class instance template function name
+        self.cached_instance_function = "getCached"+self.base_class_name+"Instance"
+
+        ## True if the language selection functions return the string table class
+        #  instead of the language classes
+        self.string_table = False
+
+        ## Constexpr list property return type prefix
+        self.span_type_prefix = "std::span<const "
+
     def _get_string_type(self)->str:
         """!
         @brief Return the string type
@@ -107,16 +124,53 @@ class BaseCppStringClassGenerator(GenerateCppFileHelper):
         @param class_mod {string} Language name of the final parser string object
         @return string cpp code
         """
+        if (class_mod is not None) and self.string_table:
+            lang_index = self.gen_table_class_name()+"::"+self.gen_table_index_name(class_mod)
+            if self.cached_instances:
+                return "return "+self.cached_instance_function+"<"+lang_index+">();\n"
+            return "return std::make_shared<"+self.gen_table_class_name()+">("+lang_index+");\n"
+
         if class_mod is not None:
             ptr_name = self.base_class_name+class_mod.capitalize()
         else:
             ptr_name = self.base_class_name
 
-        ret_line = "return std::make_shared<"
-        ret_line += ptr_name
-        ret_line += ">();\n"
+        if self.cached_instances:
+            ret_line = "return "+self.cached_instance_function+"<"
+            ret_line += ptr_name
+            ret_line += ">();\n"
+        else:
+            ret_line = "return std::make_shared<"
+            ret_line += ptr_name
+            ret_line += ">();\n"
         return ret_line
 
+    def gen_cached_instance_function(self)->list:
+        """!
+        @brief Generate the cached language class instance template function used by
+               the language select return statements when cached_instances is set
+        @return list - Template function string list
+        """
+        brief = "Return the single, thread safe, function local static instance of the " \
+                "language class"
+        code_list = self.doxy_comment_gen.gen_doxy_method_comment(brief, [],
+                                                                  self.base_intf_ret_ptr_dict)
+        body_indent = "".rjust(self.function_indent, " ")
+        if self.string_table:
+            code_list.append("template <size_t LangIndex>\n")
+            make_instance = "std::make_shared<"+self.gen_table_class_name()+">(LangIndex)"
+        else:
+            code_list.append("template <class LangClass>\n")
+            make_instance = "std::make_shared<LangClass>()"
+        code_list.append("static "+self.base_intf_ret_ptr_type+" "+self.cached_instance_function+"()\n")
+        code_list.append("{\n")
+        code_list.append(body_indent+"static const "+self.base_intf_ret_ptr_type+
+                         " instance = "+make_instance+";\n")
+        code_list.append(body_indent+"return instance;\n")
+        code_list.append("}\n")
+        return code_list
+
+    @profile_span("BaseCppStringClassGenerator.file_header")
     def _generate_file_header(self, eula:EulaText, owner:str='Unknown',
                               create_date:int=None)->list:
         """!
@@ -170,6 +224,63 @@ class BaseCppStringClassGenerator(GenerateCppFileHelper):
             retstr = self.base_class_name+"_test"
         return retstr
 
+    def gen_unittest_main_fname(self)->str:
+        """!
+        @brief Generate the combined language unittest main source file name
+        @return string - unittest main source file name
+        """
+        return self.base_class_name+"Languages_test_main.cpp"
+
+    def gen_combined_unittest_target_name(self)->str:
+        """!
+        @brief Generate the combined language unittest target name
+        @return string - combined language unittest target name
+        """
+        return self.base_class_name+"Languages_test"
+
+    def gen_typed_unittest_fname(self)->str:
+        """!
+        @brief Generate the typed language unittest source file name
+        @return string - typed unittest source file name
+        """
+        return self.base_class_name+"Languages_typed_test.cpp"
+
+    def gen_typed_unittest_target_name(self)->str:
+        """!
+        @brief Generate the typed language unittest target name
+        @return string - typed language unittest target name
+        """
+        return self.base_class_name+"Languages_typed_test"
+
+    def gen_table_class_name(self)->str:
+        """!
+        @brief Generate the string table class name
+        @return string - string table class name
+        """
+        return self.base_class_name+"Table"
+
+    def gen_table_index_name(self, lang_name:str)->str:
+        """!
+        @brief Generate the string table language index constant name
+        @param lang_name {string} Language name
+        @return string - string table language index constant name
+        """
+        return "index"+lang_name.capitalize()
+
+    def gen_table_h_fname(self)->str:
+        """!
+        @brief Generate the string table include file name
+        @return string - string table include file name
+        """
+        return self.gen_table_class_name()+".h"
+
+    def gen_table_cpp_fname(self)->str:
+        """!
+        @brief Generate the string table source file name
+        @return string - string table source file name
+        """
+        return self.gen_table_class_name()+".cpp"
+
     def gen_mock_h_fname(self, lang_name:str = None)->str:
         """!
         @brief Generate the mock include file name based on the class and language names
@@ -274,6 +385,48 @@ class BaseCppStringClassGenerator(GenerateCppFileHelper):
         decl_text += ");\n"
         return [decl_text]
 
+    def gen_span_ret_dict(self, ret_dict:dict, is_text:bool)->dict:
+        """!
+        @brief Generate the constexpr list property return dictionary
+        @param ret_dict {dictionary} List property return dictionary
+        @param is_text {boolean} True if the list items are text
+        @return dictionary - std::span<const item> return dictionary
+        """
+        if is_text:
+            item_type = self.declare_type('stringview')
+        else:
+            item_type = self.declare_type(ParamRetDict.get_return_type(ret_dict))
+        return ParamRetDict.build_return_dict_with_mod(self.span_type_prefix+item_type+">",
+                                                       ParamRetDict.get_return_desc(ret_dict))
+
+    def is_span_return(self, ret_dict:dict)->bool:
+        """!
+        @brief Check for a constexpr list property return dictionary
+        @param ret_dict {dictionary} Return dictionary to check
+        @return boolean - True if the return is a std::span, else False
+        """
+        return ParamRetDict.get_return_type(ret_dict).startswith(self.span_type_prefix)
+
+    def _gen_unittest_fetch(self, method:str, ret_dict:dict, param_data:list)->str:
+        """!
+        @brief Generate the unit test method call statement
+        @param method {string} Method name
+        @param ret_dict {dictionary} Method return dictionary definition
+        @param param_data {list} Method parameter test value list
+        @return string - Method call statement
+        """
+        fetch_code = self.gen_function_ret_type(ret_dict)
+        fetch_code += "output = testvar."
+        fetch_code += method
+        fetch_code += "("
+        param_prefix = ""
+        for test_value in param_data:
+            fetch_code += param_prefix
+            fetch_code += test_value
+            param_prefix = ", "
+        fetch_code += ");\n"
+        return fetch_code
+
     def generate_property_unittest(self, method:str, ut_section:str,
                                    ret_dict:dict, expected:list,
                                    param_data,
@@ -287,29 +440,45 @@ class BaseCppStringClassGenerator(GenerateCppFileHelper):
         @param param_data {list} Property parameter test value list
         @return list of strings - Test code to output
         """
-        code_txt = []
+        sink = LineSink()
+        self.emit_property_unittest(sink, method, ut_section, ret_dict, expected, param_data, is_text)
+        return sink.lines
+
+    def emit_property_unittest(self, outfile, method:str, ut_section:str,
+                               ret_dict:dict, expected:list,
+                               param_data,
+                               is_text:bool = False):
+        """!
+        @brief Write the unit test for the input property method
+        @param outfile {File} File, CodeEmitter or LineSink to write the data to
+        @param propertyMethod {string} Property function name
+        @param ut_section {string} Unittest section name
+        @param ret_dict {dictionary} Method return dictionary definition
+        @param expected {list} Expected data
+        @param param_data {list} Property parameter test value list
+        """
         body_indent = "".rjust(4, ' ')
 
         # Translate the return type
-        code_txt.append("TEST("+ut_section+", fetch"+method+")\n")
-        code_txt.append("{\n")
-        vardecl = body_indent+ut_section+" testvar;\n"
-        code_txt.append(vardecl)
+        outfile.write("TEST("+ut_section+", fetch"+method+")\n")
+        outfile.write("{\n")
+        outfile.write(body_indent+ut_section+" testvar;\n")
 
         # Build the property function call
-        fetch_code = self.gen_function_ret_type(ret_dict)
-        fetch_code += "output = testvar."
-        fetch_code += method
-        fetch_code += "("
-        param_prefix = ""
-        for test_value in param_data:
-            fetch_code += param_prefix
-            fetch_code += test_value
-            param_prefix = ", "
-        fetch_code += ");\n"
-        code_txt.append(body_indent+fetch_code)
+        outfile.write(body_indent+self._gen_unittest_fetch(method, ret_dict, param_data))
 
         # Build the test assertion
+        if self.is_span_return(ret_dict):
+            outfile.write(body_indent+"ASSERT_EQ("+str(len(expected))+"u, output.size());\n")
+            for index, item in enumerate(expected):
+                if is_text:
+                    expected_item = "std::string_view(\""+item+"\")"
+                else:
+                    expected_item = str(item)
+                outfile.write(body_indent+"EXPECT_EQ("+expected_item+", output["+str(index)+"]);\n")
+            outfile.write("}\n")
+            return
+
         is_list = ParamRetDict.is_mod_list(ParamRetDict.get_return_type_mod(ret_dict))
         assert_pop = ""
         if is_list:
@@ -325,10 +494,9 @@ class BaseCppStringClassGenerator(GenerateCppFileHelper):
                 assert_start = "EXPECT_EQ("+str(item)
                 assert_end = ");\n"
 
-            code_txt.append(body_indent+assert_start+assert_pop+assert_end)
+            outfile.write(body_indent+assert_start+assert_pop+assert_end)
 
-        code_txt.append("}\n")
-        return code_txt
+        outfile.write("}\n")
 
     def generate_translate_unittest(self, method:str, ut_section:str,
                                     ret_dict:dict, expected:str,
@@ -343,29 +511,113 @@ class BaseCppStringClassGenerator(GenerateCppFileHelper):
                                  test value list
         @return list of strings - Test code to output
         """
-        code_txt = []
+        sink = LineSink()
+        self.emit_translate_unittest(sink, method, ut_section, ret_dict, expected, param_data)
+        return sink.lines
+
+    def emit_translate_unittest(self, outfile, method:str, ut_section:str,
+                                ret_dict:dict, expected:str,
+                                param_data:list):
+        """!
+        @brief Write the unit test for the input property method
+        @param outfile {File} File, CodeEmitter or LineSink to write the data to
+        @param method {string} Tranlated string generation function name
+        @param ut_section {string} Unittest section name
+        @param ret_dict {dictionary} Method return dictionary definition
+        @param expected {string} Expected response data
+        @param param_data {list} Tranlated string generation function parameter
+                                 test value list
+        """
         body_indent = "".rjust(4, ' ')
 
         # Translate the return type
-        code_txt.append("TEST("+ut_section+", print"+method+")\n")
-        code_txt.append("{\n")
-        code_txt.append(body_indent+ut_section+" testvar;\n")
+        outfile.write("TEST("+ut_section+", print"+method+")\n")
+        outfile.write("{\n")
+        outfile.write(body_indent+ut_section+" testvar;\n")
 
         # Build the property function call
-        fetch_code = self.gen_function_ret_type(ret_dict)
-        fetch_code += "output = testvar."
-        fetch_code += method
-        fetch_code += "("
-        param_prefix = ""
-        for param_value in param_data:
-            fetch_code += param_prefix
-            fetch_code += param_value
-            param_prefix = ", "
-        fetch_code += ");\n"
-        code_txt.append(body_indent+fetch_code)
+        outfile.write(body_indent+self._gen_unittest_fetch(method, ret_dict, param_data))
 
         # Build the assertion test
-        assert_txt = "EXPECT_STREQ(\""+expected+"\", output.c_str());\n"
-        code_txt.append(body_indent+assert_txt)
+        if ParamRetDict.get_return_type(ret_dict) == 'stringview':
+            assert_txt = "EXPECT_EQ(std::string_view(\""+expected+"\"), output);\n"
+        else:
+            assert_txt = "EXPECT_STREQ(\""+expected+"\", output.c_str());\n"
+        outfile.write(body_indent+assert_txt)
+        outfile.write("}\n")
+
+    def generate_typed_property_unittest(self, method:str, suite_name:str,
+                                         table_name:str, ret_dict:dict,
+                                         param_data:list, is_text:bool = False)->list:
+        """!
+        @brief Generate the typed unit test for the input property method
+        @param method {string} Property function name
+        @param suite_name {string} Typed test suite name
+        @param table_name {string} Expected value table template name
+        @param ret_dict {dictionary} Method return dictionary definition
+        @param param_data {list} Property parameter test value list
+        @param is_text {boolean} True if the property value is text
+        @return list of strings - Test code to output
+        """
+        code_txt = []
+        body_indent = "".rjust(4, ' ')
+        expected = table_name+"<TypeParam>::"+method
+
+        code_txt.append("TYPED_TEST("+suite_name+", fetch"+method+")\n")
+        code_txt.append("{\n")
+        code_txt.append(body_indent+"TypeParam testvar;\n")
+        code_txt.append(body_indent+self._gen_unittest_fetch(method, ret_dict, param_data))
+
+        # Build the test assertion from the expected value table
+        is_span = self.is_span_return(ret_dict)
+        if is_span or ParamRetDict.is_mod_list(ParamRetDict.get_return_type_mod(ret_dict)):
+            if is_text and is_span:
+                item_assert = "EXPECT_EQ(std::string_view(*expected_item), item);\n"
+            elif is_text:
+                item_assert = "EXPECT_STREQ(*expected_item, item.c_str());\n"
+            else:
+                item_assert = "EXPECT_EQ(*expected_item, item);\n"
+
+            code_txt.append(body_indent+"const auto& expected = "+expected+";\n")
+            code_txt.append(body_indent+"ASSERT_EQ(expected.size(), output.size());\n")
+            code_txt.append(body_indent+"auto expected_item = expected.begin();\n")
+            code_txt.append(body_indent+"for (const auto& item : output)\n")
+            code_txt.append(body_indent+"{\n")
+            code_txt.append(body_indent+body_indent+item_assert)
+            code_txt.append(body_indent+body_indent+"++expected_item;\n")
+            code_txt.append(body_indent+"}\n")
+        elif is_text:
+            code_txt.append(body_indent+"EXPECT_STREQ("+expected+", output.c_str());\n")
+        else:
+            code_txt.append(body_indent+"EXPECT_EQ("+expected+", output);\n")
+
+        code_txt.append("}\n")
+        return code_txt
+
+    def generate_typed_translate_unittest(self, method:str, suite_name:str,
+                                          table_name:str, ret_dict:dict,
+                                          param_data:list)->list:
+        """!
+        @brief Generate the typed unit test for the input translate method
+        @param method {string} Tranlated string generation function name
+        @param suite_name {string} Typed test suite name
+        @param table_name {string} Expected value table template name
+        @param ret_dict {dictionary} Method return dictionary definition
+        @param param_data {list} Tranlated string generation function parameter
+                                 test value list
+        @return list of strings - Test code to output
+        """
+        code_txt = []
+        body_indent = "".rjust(4, ' ')
+
+        code_txt.append("TYPED_TEST("+suite_name+", print"+method+")\n")
+        code_txt.append("{\n")
+        code_txt.append(body_indent+"TypeParam testvar;\n")
+        code_txt.append(body_indent+self._gen_unittest_fetch(method, ret_dict, param_data))
+        expected = table_name+"<TypeParam>::"+method
+        if ParamRetDict.get_return_type(ret_dict) == 'stringview':
+            code_txt.append(body_indent+"EXPECT_EQ(std::string_view("+expected+"), output);\n")
+        else:
+            code_txt.append(body_indent+"EXPECT_STREQ("+expected+", output.c_str());\n")
         code_txt.append("}\n")
         return code_txt
@@ -36,10 +36,13 @@ class WindowsLangSelectFunctionGenerator(BaseCppStringClassGenerator):
     """!
     Methods for Windows language select function generation
     """
-    def __init__(self, json_project_data:ProjectDescription):
+    def __init__(self, json_project_data:ProjectDescription, langid_table:bool = False):
         """!
         @brief WindowsLangSelectFunctionGenerator constructor
         @param json_project_data {ProjectDescription} JSON project description data
+        @param langid_table {bool} True to look up the full LANGID in a sorted table before
+                                   the primary language switch, False for the primary
+                                   language switch only
         """
         jsonstringdesc:StringClassDescription = json_project_data.get_string_data()
         base_class_name = jsonstringdesc.get_base_class_name()
@@ -58,6 +61,8 @@ class WindowsLangSelectFunctionGenerator(BaseCppStringClassGenerator):
         self.def_os_str = "(defined(_WIN64) || defined(_WIN32))"
         self.lang_json_data = json_project_data.get_lang_data()
         self.doxy_comment_gen = CDoxyCommentGenerator()
+        ## True to look up the full LANGID in a sorted table before the primary language switch
+        self.langid_table = langid_table
 
     def get_function_name(self)->str:
         """!
@@ -96,6 +101,63 @@ class WindowsLangSelectFunctionGenerator(BaseCppStringClassGenerator):
         """
         return self.end_function(self.select_function_name)
 
+    def _get_langid_owners(self)->tuple:
+        """!
+        @brief Get the language selected by each full and primary LANGID
+        @return tuple - ({full LANGID: language name}, {primary LANGID: language name}),
+                        the first language listing a LANGID owns it
+        """
+        region_owners = {}
+        primary_owners = {}
+        for lang_name in self.lang_json_data.get_language_list():
+            lang_codes, region_list = self.lang_json_data.get_langid_data(lang_name)
+            for lang_id in region_list:
+                region_owners.setdefault(lang_id, lang_name)
+            for lang_code in lang_codes:
+                primary_owners.setdefault(lang_code, lang_name)
+        return region_owners, primary_owners
+
+    def _gen_langid_table_lookup(self, param_name:str, body_indent:str)->list:
+        """!
+        @brief Generate the full LANGID table binary search code
+        @param param_name {string} LANGID parameter name
+        @param body_indent {string} Function body indentation
+        @return list - Lookup code string list, empty if there are no full LANGID values
+        """
+        region_owners, _ = self._get_langid_owners()
+        if not region_owners:
+            return []
+
+        lang_list = self.lang_json_data.get_language_list()
+        langid_list = sorted(region_owners)
+        index_list = [lang_list.index(region_owners[lang_id]) for lang_id in langid_list]
+
+        case_indent = body_indent+"".rjust(8, " ")
+        case_body_indent = case_indent+"".rjust(4, " ")
+        lookup_body = [body_indent+"// Full LANGID lookup, the table is sorted for the binary search\n",
+                       body_indent+"static constexpr LANGID langIdTable[] = {"+
+                       ", ".join(hex(lang_id) for lang_id in langid_list)+"};\n",
+                       body_indent+"static constexpr uint16_t langIndexTable[] = {"+
+                       ", ".join(str(index) for index in index_list)+"};\n",
+                       body_indent+"const LANGID* found = std::lower_bound(std::begin(langIdTable), "
+                       "std::end(langIdTable), "+param_name+");\n",
+                       body_indent+"if ((found != std::end(langIdTable)) && (*found == "+param_name+"))\n",
+                       body_indent+"{\n",
+                       body_indent+"    switch(langIndexTable[found - std::begin(langIdTable)])\n",
+                       body_indent+"    {\n"]
+        for index, lang_name in enumerate(lang_list):
+            if index not in index_list:
+                continue
+            lookup_body.append(case_indent+"case "+str(index)+": // "+lang_name+"\n")
+            lookup_body.append(case_body_indent+self._gen_make_ptr_return_statement(lang_name))
+            lookup_body.append(case_body_indent+"break;\n")
+        lookup_body.append(case_indent+"default:\n")
+        lookup_body.append(case_body_indent+"break;\n")
+        lookup_body.append(body_indent+"    }\n")
+        lookup_body.append(body_indent+"}\n")
+        lookup_body.append("\n")  # whitespace for readability
+        return lookup_body
+
     def gen_function(self)->list:
         """!
         @brief Generate the function body text
@@ -106,6 +168,10 @@ class WindowsLangSelectFunctionGenerator(BaseCppStringClassGenerator):
         function_body = []
         function_body.append("#if "+self.def_os_str+"\n")
         function_body.append(self.gen_include("<windows.h>"))
+        if self.langid_table:
+            function_body.append(self.gen_include("<algorithm>"))
+            function_body.append(self.gen_include("<cstdint>"))
+            function_body.append(self.gen_include("<iterator>"))
         function_body.append("\n")  # whitespace for readability
 
         # Generate function doxygen comment and start
@@ -113,14 +179,22 @@ class WindowsLangSelectFunctionGenerator(BaseCppStringClassGenerator):
 
         # Start function body generation
         body_indent = "    "
+        if self.langid_table:
+            function_body.extend(self._gen_langid_table_lookup(param_name, body_indent))
         function_body.append(body_indent+"switch("+param_name+" & 0x0FF)\n")
         function_body.append(body_indent+"{\n")
 
         # Generate case if chain for each language in the dictionary
         case_indent = body_indent+"".rjust(4, " ")
         case_body_indent = case_indent+"".rjust(4, " ")
+        _, primary_owners = self._get_langid_owners()
         for lang_name in self.lang_json_data.get_language_list():
             lang_codes, _ = self.lang_json_data.get_langid_data(lang_name)
+            if self.langid_table:
+                # Only the owning language gets the primary case
+                lang_codes = [langid for langid in lang_codes if primary_owners[langid] == lang_name]
+                if not lang_codes:
+                    continue
             for langid in lang_codes:
                 caseline =  case_indent+"case "
                 caseline += hex(langid)
@@ -211,6 +285,18 @@ class WindowsLangSelectFunctionGenerator(BaseCppStringClassGenerator):
         extern_def += ");\n"
         return extern_def
 
+    def _get_expected_iso(self, lang_name:str, owner_name:str)->str:
+        """!
+        @brief Get the expected ISO code of a selection unit test
+        @param lang_name {string} Language name the LANGID is listed under
+        @param owner_name {string} Language name that owns the LANGID in the lookup table
+        @return string - Owner ISO code if the full LANGID table is used, else the
+                         lang_name ISO code
+        """
+        if self.langid_table and (owner_name is not None):
+            return self.lang_json_data.get_iso_code_data(owner_name)
+        return self.lang_json_data.get_iso_code_data(lang_name)
+
     def gen_unit_test(self, get_iso_method:str)->list:
         """!
         @brief Generate all unit tests for the selection function
@@ -226,12 +312,13 @@ class WindowsLangSelectFunctionGenerator(BaseCppStringClassGenerator):
         unittest_text.append("\n") # white space for readability
 
         # Generate the tests
+        region_owners, primary_owners = self._get_langid_owners()
         for lang_name in self.lang_json_data.get_language_list():
             lang_codes, region_list = self.lang_json_data.get_langid_data(lang_name)
             for lang_id in region_list:
                 # Generate test for each region of known language
                 test_name = lang_name.capitalize()+"_"+str(lang_id)+"_Selection"
-                lang_iso = self.lang_json_data.get_iso_code_data(lang_name)
+                lang_iso = self._get_expected_iso(lang_name, region_owners.get(lang_id))
                 test_body = self._gen_unittest_test(test_name,
                                                     lang_id,
                                                     lang_iso,
@@ -241,7 +328,7 @@ class WindowsLangSelectFunctionGenerator(BaseCppStringClassGenerator):
 
             # Generate test for unknown region of known language(s)
             for lang_code in lang_codes:
-                lang_iso = self.lang_json_data.get_iso_code_data(lang_name)
+                lang_iso = self._get_expected_iso(lang_name, primary_owners.get(lang_code))
                 unkn_region_tstname = lang_name.capitalize()
                 unkn_region_tstname += "_unknown_region_00"
                 unkn_region_tstname += str(lang_code)
@@ -255,7 +342,7 @@ class WindowsLangSelectFunctionGenerator(BaseCppStringClassGenerator):
 
             # Generate test for unknown region of known language(s)
             for lang_code in lang_codes:
-                region_iso = self.lang_json_data.get_iso_code_data(lang_name)
+                region_iso = self._get_expected_iso(lang_name, primary_owners.get(lang_code))
                 unkn_region_tstname = lang_name.capitalize()
                 unkn_region_tstname += "_unknown_region_FF"
                 unkn_region_tstname += str(lang_code)
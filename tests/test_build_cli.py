@@ -0,0 +1,297 @@
+"""@package test_programmer_tools
+Unittest for the code-tools-build command
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+import argparse
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+from code_tools_grocsoftware.base.profiler import profiler
+from code_tools_grocsoftware.cpp_gen.build_cli import command_main, get_batch_summary, positive_int
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+from synthetic_project import build_project # pylint: disable=wrong-import-position
+
+@pytest.fixture(name="project_file")
+def fixture_project_file(tmp_path)->str:
+    """!
+    @brief Synthetic three language project
+    @return string - Project JSON file name
+    """
+    data_dir = os.path.join(tmp_path, "data")
+    os.mkdir(data_dir)
+    return build_project(data_dir, 3, 4)
+
+def get_tree_text(base_dir:str)->dict:
+    """!
+    @brief Read the generated tree
+    @param base_dir {string} Output base directory
+    @return dictionary - {relative file name: file text}
+    """
+    tree_text = {}
+    for dir_path, _, file_names in os.walk(base_dir):
+        for file_name in file_names:
+            path = os.path.join(dir_path, file_name)
+            with open(path, 'rt', encoding="utf-8") as tree_file:
+                tree_text[os.path.relpath(path, base_dir)] = tree_file.read()
+    return tree_text
+
+def test001_build(tmp_path, project_file):
+    """!
+    @brief Test the command generates the project tree
+    """
+    out_dir = os.path.join(tmp_path, "out")
+    os.mkdir(out_dir)
+    assert command_main([project_file, '-o', out_dir, '--typed-unittest']) == 0
+
+    tree_text = get_tree_text(out_dir)
+    assert "CMakeLists.txt" in tree_text
+    assert os.path.join("inc", "ParserStringListInterfaceLangab.h") in tree_text
+    assert os.path.join("src", "ParserStringListInterfaceLangac.cpp") in tree_text
+    assert not [name for name in os.listdir(tmp_path) if ".staging" in name]
+
+def test002_incremental(tmp_path, project_file, capsys):
+    """!
+    @brief Test the incremental build leaves the unchanged files in place
+    """
+    out_dir = os.path.join(tmp_path, "out")
+    os.mkdir(out_dir)
+    assert command_main([project_file, '-o', out_dir]) == 0
+    file_count = len(get_tree_text(out_dir))
+    cmake_name = os.path.join(out_dir, "CMakeLists.txt")
+    os.utime(cmake_name, (1000000, 1000000))
+    capsys.readouterr()
+
+    assert command_main([project_file, '-o', out_dir, '--incremental']) == 0
+    assert capsys.readouterr().out == f"0 of {file_count} files changed\n"
+    assert os.stat(cmake_name).st_mtime == 1000000
+
+    assert command_main([project_file, '-o', out_dir, '--incremental', '--typed-unittest']) == 0
+    assert os.stat(cmake_name).st_mtime != 1000000
+
+def test003_dry_run(tmp_path, project_file, capsys):
+    """!
+    @brief Test the dry run reports the changes without writing them
+    """
+    out_dir = os.path.join(tmp_path, "out")
+    os.mkdir(out_dir)
+    assert command_main([project_file, '-o', out_dir, '--dry-run']) == 0
+    output = capsys.readouterr().out.splitlines()
+    assert output[0].split() == ["new", os.path.join(out_dir, "CMakeLists.txt")]
+    assert output[-1] == f"{len(output)-1} of {len(output)-1} files would change"
+    assert not os.listdir(out_dir)
+
+@pytest.mark.skipif(os.name != 'posix', reason="parallel generation needs the fork start method")
+def test004_jobs(tmp_path, project_file):
+    """!
+    @brief Test the worker process build matches the serial build
+    """
+    serial_dir = os.path.join(tmp_path, "serial")
+    parallel_dir = os.path.join(tmp_path, "parallel")
+    os.mkdir(serial_dir)
+    os.mkdir(parallel_dir)
+    assert command_main([project_file, '-o', serial_dir, '--shard-methods', '2']) == 0
+    assert command_main([project_file, '-o', parallel_dir, '--shard-methods', '2', '--jobs', '3']) == 0
+
+    serial_text = get_tree_text(serial_dir)
+    parallel_text = get_tree_text(parallel_dir)
+    cmake_name = "CMakeLists.txt"
+    assert parallel_text.pop(cmake_name) == serial_text.pop(cmake_name).replace(serial_dir, parallel_dir)
+    assert parallel_text == serial_text
+
+def test005_languages(tmp_path, project_file, capsys):
+    """!
+    @brief Test the language subset option
+    """
+    out_dir = os.path.join(tmp_path, "out")
+    os.mkdir(out_dir)
+    assert command_main([project_file, '-o', out_dir, '--languages', 'langab,LANGAC_ERRORS']) == 0
+    source_names = os.listdir(os.path.join(out_dir, "src"))
+    assert "ParserStringListInterfaceLangab.cpp" in source_names
+    assert "ParserStringListInterfaceLangac.cpp" in source_names
+    assert "ParserStringListInterfaceLangaa.cpp" not in source_names
+
+    capsys.readouterr()
+    assert command_main([project_file, '-o', out_dir, '--languages', 'klingon']) == 1
+    assert capsys.readouterr().out.splitlines()[-1] == "Error: Invalid language subset: klingon"
+
+def test006_errors(tmp_path, project_file, capsys):
+    """!
+    @brief Test the command line error exits
+    """
+    missing_dir = os.path.join(tmp_path, "missing")
+    assert command_main([project_file, '-o', missing_dir]) == 1
+    assert capsys.readouterr().out == f"Error: Output directory '{missing_dir}' does not exist\n"
+
+    with pytest.raises(SystemExit) as exit_info:
+        command_main([project_file, '-o', str(tmp_path), '--jobs', '0'])
+    assert exit_info.value.code == 2
+    assert "argument --jobs: invalid positive integer value: '0'" in capsys.readouterr().err
+
+def test007_profile(tmp_path, project_file):
+    """!
+    @brief Test the profile report option
+    """
+    out_dir = os.path.join(tmp_path, "out")
+    trace_name = os.path.join(tmp_path, "trace.json")
+    os.mkdir(out_dir)
+    profiler.reset()
+    try:
+        assert command_main([project_file, '-o', out_dir, '--profile', 'trace',
+                             '--profile-file', trace_name]) == 0
+        assert not profiler.enabled
+        assert profiler.stats['LanguageDescriptionList.load'][0] == 1
+        assert profiler.stats['StringClassDescription.load'][0] == 1
+    finally:
+        profiler.enable(False)
+        profiler.reset()
+
+    with open(trace_name, 'r', encoding='utf-8') as trace_file:
+        span_names = [event['name'] for event in json.load(trace_file)['traceEvents']]
+    assert "ProjectFileGenerator.generate_files" in span_names
+
+def make_batch(project_file:str, names:list)->list:
+    """!
+    @brief Copy the project file to a batch of project files sharing its data files
+    @param project_file {string} Project JSON file name
+    @param names {list} Batch project names
+    @return list - Batch project JSON file names
+    """
+    batch_files = []
+    for name in names:
+        batch_file = os.path.join(os.path.dirname(project_file), name+".json")
+        shutil.copy(project_file, batch_file)
+        batch_files.append(batch_file)
+    return batch_files
+
+def test008_batch(tmp_path, project_file, capsys):
+    """!
+    @brief Test a batch build shares the loaded data and reports the project timing
+    """
+    out_dir = os.path.join(tmp_path, "out")
+    os.mkdir(out_dir)
+    batch_files = make_batch(project_file, ["first", "second"])
+    profiler.reset()
+    try:
+        assert command_main(batch_files + ['-o', out_dir, '--profile', 'table',
+                                           '--profile-file', os.path.join(tmp_path, "table.txt")]) == 0
+        assert profiler.stats['ProjectDescription.load'][0] == 2
+        assert profiler.stats['LanguageDescriptionList.load'][0] == 1
+        assert profiler.stats['StringClassDescription.load'][0] == 1
+        assert profiler.stats['StringClassModel.resolve'][0] == 2
+    finally:
+        profiler.enable(False)
+        profiler.reset()
+
+    first_text = get_tree_text(os.path.join(out_dir, "first"))
+    second_text = get_tree_text(os.path.join(out_dir, "second"))
+    cmake_name = "CMakeLists.txt"
+    assert second_text.pop(cmake_name) == first_text.pop(cmake_name).replace(os.path.join(out_dir, "first"),
+                                                                             os.path.join(out_dir, "second"))
+    assert first_text == second_text
+
+    output = capsys.readouterr().out.splitlines()
+    assert output[0] == "Building first"
+    assert output[1] == "Building second"
+    assert output[2].split() == ['Project', 'Load', 'ms', 'Build', 'ms', 'Total', 'ms', 'Status']
+    assert output[3].split()[0] == "first"
+    assert output[3].split()[-1] == "pass"
+    assert output[4].split()[0] == "second"
+    assert output[5].split()[-2:] == ['0', 'failed']
+
+def test009_batch_dry_run(tmp_path, project_file, capsys):
+    """!
+    @brief Test a batch dry run does not create the project directories
+    """
+    out_dir = os.path.join(tmp_path, "out")
+    os.mkdir(out_dir)
+    batch_files = make_batch(project_file, ["first", "second"])
+    assert command_main(batch_files + ['-o', out_dir, '--dry-run']) == 0
+    assert not os.listdir(out_dir)
+    output = capsys.readouterr().out.splitlines()
+    assert output[1].split()[0] == "new"
+    assert output[-3].split()[0] == "first"
+
+def test010_batch_errors(tmp_path, project_file, capsys):
+    """!
+    @brief Test the batch error exits
+    """
+    out_dir = os.path.join(tmp_path, "out")
+    missing_file = os.path.join(tmp_path, "missing.json")
+    batch_files = make_batch(project_file, ["first"])
+    assert command_main(batch_files + [missing_file, '-o', out_dir]) == 1
+    assert capsys.readouterr().out == f"Error: Output directory '{out_dir}' does not exist\n"
+
+    os.mkdir(out_dir)
+    assert command_main([project_file, os.path.join(tmp_path, os.path.basename(project_file)),
+                         '-o', out_dir]) == 1
+    assert capsys.readouterr().out == "Error: The batch project file names must be unique\n"
+
+    assert command_main(batch_files + [missing_file, '-o', out_dir]) == 1
+    output = capsys.readouterr().out.splitlines()
+    assert f"Error: Project file '{missing_file}' does not exist" in output
+    assert output[-3].split()[-1] == "pass"
+    assert output[-2].split()[0] == "missing"
+    assert output[-2].split()[-1] == "FAIL"
+    assert output[-1].split()[-2:] == ['1', 'failed']
+    assert os.path.isfile(os.path.join(out_dir, "first", "CMakeLists.txt"))
+    # A missing project file leaves no output directory behind
+    assert sorted(os.listdir(out_dir)) == ["first"]
+
+def test011_batch_summary():
+    """!
+    @brief Test the batch timing summary table
+    """
+    lines = get_batch_summary([("alpha", 0.001, 0.010, True), ("a_long_name", 0.002, 0.020, False)])
+    assert lines[0] == "Project        Load ms   Build ms   Total ms Status\n"
+    assert lines[1] == "alpha            1.000     10.000     11.000 pass\n"
+    assert lines[2] == "a_long_name      2.000     20.000     22.000 FAIL\n"
+    assert lines[3] == "Total            3.000     30.000     33.000 1 failed\n"
+
+def test012_positive_int():
+    """!
+    @brief Test the positive integer argument type
+    """
+    assert positive_int("1") == 1
+    assert positive_int("250") == 250
+    for value in ["0", "-3", "two", ""]:
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+
+@pytest.mark.parametrize("option", ['--jobs', '--shard-methods', '--shard-bytes', '--unity-batch'])
+@pytest.mark.parametrize("value", ['0', '-1', 'x'])
+def test013_count_option_errors(tmp_path, project_file, capsys, option, value):
+    """!
+    @brief Test the count and size options reject values less than 1
+    """
+    with pytest.raises(SystemExit) as exit_info:
+        command_main([project_file, '-o', str(tmp_path), option, value])
+    assert exit_info.value.code == 2
+    assert f"argument {option}: invalid positive integer value: '{value}'" in capsys.readouterr().err
+    assert os.listdir(tmp_path) == ["data"]
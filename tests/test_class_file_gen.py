@@ -25,8 +25,11 @@ Unittest for programmer base tools utility
 #==========================================================================
 
 import os
+import sys
 from unittest.mock import patch
 
+import pytest
+
 from code_tools_grocsoftware.base.param_return_tools import ParamRetDict
 from code_tools_grocsoftware.base.translate_text_parser import TransTxtParser
 from code_tools_grocsoftware.base.eula import EulaText
@@ -35,11 +38,15 @@ from code_tools_grocsoftware.cpp_gen.string_class_tools import BaseCppStringClas
 from code_tools_grocsoftware.base.json_language_list import LanguageDescriptionList
 from code_tools_grocsoftware.base.json_string_class_description import StringClassDescription
 from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.base.string_class_model import StringMethodModel
 from code_tools_grocsoftware.cpp_gen.class_file_gen import GenerateLangFiles
 from code_tools_grocsoftware.cpp_gen.master_lang_select import MasterSelectFunctionGenerator
 
 from tests.dir_init import TESTFILEPATH
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+from synthetic_project import build_project # pylint: disable=wrong-import-position
+
 langfilename = os.path.join(TESTFILEPATH, "teststringlanglist.json")
 strclass_filename = os.path.join(TESTFILEPATH, "teststrdesc.json")
 
@@ -59,6 +66,13 @@ class MockFile:
         self.mock_calls.append(('writelines', ""))
         self.writedata.extend(lines)
 
+    def write(self, text):
+        """!
+        @brief Mock write method
+        """
+        self.mock_calls.append(('write', ""))
+        self.writedata.append(text)
+
 class MockEulaText():
     """!
     @brief Mock EulaText for testing
@@ -643,4 +657,319 @@ def test024_write_src_translate_methods_with_params():
                 for i, line in enumerate(expected):
                     assert mock_file.writedata[i] == line
 
+def test025_gen_static_text_code():
+    """!
+    @brief Test _gen_static_text_code method
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_view_constants=True)
+    stream_data = TransTxtParser().parse_translate_string("Test \"string\"")
+    assert class_gen._gen_static_text_code(stream_data) == 'return "Test \\"string\\"";'
+    assert class_gen._gen_static_text_code([]) == 'return "";'
+
+def test026_get_translate_ret():
+    """!
+    @brief Test _get_translate_ret and _is_static_text_translate
+    """
+    retdict = ParamRetDict.build_return_dict("string", "trans ret desc")
+    listdict = ParamRetDict.build_return_dict("string", "trans ret desc", True)
+    param = ParamRetDict.build_param_dict('foo', 'integer', 'foo desc')
+    no_param_method = StringMethodModel("getMessage", "brief func desc", [], retdict)
+    param_method = StringMethodModel("getMessage", "brief func desc", [param], retdict)
+    list_method = StringMethodModel("getMessage", "brief func desc", [], listdict)
+
+    class_gen = GenerateLangFiles(MockProjectDescription())
+    assert not class_gen._is_static_text_translate(no_param_method)
+    assert class_gen._get_translate_ret(no_param_method) is retdict
+
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_view_constants=True)
+    assert class_gen._is_static_text_translate(no_param_method)
+    assert not class_gen._is_static_text_translate(param_method)
+    assert not class_gen._is_static_text_translate(list_method)
+    assert class_gen._get_translate_ret(no_param_method) == \
+           ParamRetDict.build_return_dict_with_mod("stringview", "trans ret desc")
+    assert class_gen._get_translate_ret(param_method) is retdict
+
+def test027_write_src_translate_methods_string_view():
+    """!
+    @brief Test write_src_translate_methods method no param, string_view_constants
+    """
+    mock_file = MockFile()
+    str_data = StringClassDescription(strclass_filename)
+    class_name = str_data.get_language_class_name("english")
+
+    retdict = ParamRetDict.build_return_dict("string", "trans ret desc")
+    viewdict = ParamRetDict.build_return_dict("stringview", "trans ret desc")
+
+    mock_trans_list = 'code_tools_grocsoftware.base.' \
+                      'json_string_class_description.StringClassDescription' \
+                      '.get_tranlate_method_list'
+    mock_get_trans = 'code_tools_grocsoftware.base.' \
+                     'json_string_class_description.StringClassDescription' \
+                     '.get_tranlate_method_function_data'
+    mock_get_text = 'code_tools_grocsoftware.base.' \
+                     'json_string_class_description.StringClassDescription' \
+                     '.get_tranlate_method_text_data'
+
+    base = BaseCppStringClassGenerator()
+    expected = []
+    expected.extend(base.define_function_with_decorations(class_name+"::getMessage",
+                                      "brief func desc",
+                                      [],
+                                      viewdict,
+                                      False,
+                                      None,
+                                      "const"))
+    expected.append("{return \"test text\";}\n")
+
+    with patch(mock_trans_list) as mock_method_list:
+        mock_method_list.return_value = ["getMessage"]
+        with patch(mock_get_trans) as mock_trans_data:
+            mock_trans_data.return_value = ("brief func desc", [], retdict)
+            with patch(mock_get_text) as mock_trans_text:
+                mock_trans_text.return_value = [["text", "test text"]]
+
+                # Mock the project description to return the expected data
+                class_gen = GenerateLangFiles(MockProjectDescription(), string_view_constants=True)
+                class_gen._write_src_translate_methods(mock_file, "english")
+
+                assert mock_file.writedata == expected
+                assert "std::string_view "+class_name+"::getMessage() const\n" in expected
+
+def test028_gen_append_code():
+    """!
+    @brief Test _gen_append_code method
+    """
+    params = [ParamRetDict.build_param_dict('name', 'string', 'name desc'),
+              ParamRetDict.build_param_dict('count', 'integer', 'count desc'),
+              ParamRetDict.build_param_dict('sep', 'char', 'sep desc')]
+    stream_data = TransTxtParser().parse_translate_string('Name "@name@" count @count@@sep@')
+    class_gen = GenerateLangFiles(MockProjectDescription(), append_translate=True)
+
+    expected = class_gen.type_xlation_dict['string']+" retstr; "
+    expected += "retstr.reserve(26+name.size());"
+    expected += ' retstr.append("Name \\"");'
+    expected += " retstr.append(name);"
+    expected += ' retstr.append("\\" count ");'
+    expected += " retstr.append(std::to_string(count));"
+    expected += " retstr.push_back(sep);"
+    expected += " return retstr;"
+    assert class_gen._gen_append_code(stream_data, params) == expected
+
+    stream_data = TransTxtParser().parse_translate_string("Text only")
+    expected = class_gen.type_xlation_dict['string']+" retstr; "
+    expected += 'retstr.reserve(9); retstr.append("Text only"); return retstr;'
+    assert class_gen._gen_append_code(stream_data, []) == expected
+
+def test029_gen_append_code_fallback():
+    """!
+    @brief Test _gen_append_code method with parameters that can not be appended
+    """
+    stream_data = TransTxtParser().parse_translate_string("Value @value@")
+    class_gen = GenerateLangFiles(MockProjectDescription(), append_translate=True)
+
+    params = [ParamRetDict.build_param_dict('value', 'float', 'value desc')]
+    assert class_gen._gen_append_code(stream_data, params) is None
+    params = [ParamRetDict.build_param_dict('value', 'string', 'value desc', True)]
+    assert class_gen._gen_append_code(stream_data, params) is None
+    with pytest.raises(TypeError):
+        class_gen._gen_append_code([("bogus", "text")], [])
+
+def test030_gen_src_translate_body_append():
+    """!
+    @brief Test _gen_src_translate_body method with append_translate
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription(), append_translate=True)
+    class_gen.test_param_values['nargs']= ("3", False)
+    method_model = class_gen.get_string_model().get_translate_method("getNotListTypeMessage")
+    stream_data = class_gen.get_string_model().get_language("english").get_translate_text("getNotListTypeMessage")
+    expected = class_gen._gen_append_code(stream_data, method_model.params)
+    assert class_gen._gen_src_translate_body("english", "getNotListTypeMessage") == [["{"+expected+"}\n"]]
+    assert "std::to_string(nargs)" in expected
+
+    class_gen = GenerateLangFiles(MockProjectDescription())
+    expected = class_gen._gen_stream_code(stream_data)
+    assert class_gen._gen_src_translate_body("english", "getNotListTypeMessage") == [["{"+expected+"}\n"]]
+
+def test031_gen_table_segments():
+    """!
+    @brief Test _gen_table_segments method
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True)
+    pool_entries, segments, method_start = class_gen._gen_table_segments("english")
+
+    assert pool_entries == [("Only list type arguments can have an argument count of ", "getNotListTypeMessage")]
+    assert segments == [(0, 55), (0, 0)]
+    assert method_start == [0, 2]
+
+def test032_gen_table_property_body():
+    """!
+    @brief Test _gen_table_property_body method
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True)
+    with patch.object(LanguageDescriptionList, 'get_iso_code_data') as lang_iso:
+        lang_iso.return_value = "en"
+        method_model = class_gen.get_string_model().get_property_method("getLangIsoCode")
+        code_txt = class_gen._gen_table_property_body(method_model)
+
+    assert code_txt == ['{\n',
+                        '    static constexpr const char* values[] = {"en", "es"};\n',
+                        '    return values[langIndex];\n',
+                        '}\n']
+
+def test033_gen_table_translate_body():
+    """!
+    @brief Test _gen_table_translate_body method
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True)
+    method_model = class_gen.get_string_model().get_translate_method("getNotListTypeMessage")
+    code_txt = class_gen._gen_table_translate_body(method_model, 3)
+
+    assert code_txt == ['{\n',
+                        '    const std::string nargsText = std::to_string(nargs);\n',
+                        '    const std::string_view args[] = {nargsText};\n',
+                        '    return formatText(3, args);\n',
+                        '}\n']
+
+def test034_gen_table_translate_body_no_params():
+    """!
+    @brief Test _gen_table_translate_body method, parameterless methods
+    """
+    method_model = StringMethodModel("getStatic", "Static text", [],
+                                     ParamRetDict.build_return_dict("string", "Static text"))
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True)
+    assert class_gen._gen_table_translate_body(method_model, 1) == ['{\n',
+                                                                    '    return formatText(1, nullptr);\n',
+                                                                    '}\n']
+
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True, string_view_constants=True)
+    assert class_gen._gen_table_translate_body(method_model, 1) == ['{\n',
+                                                                    '    return textView(1);\n',
+                                                                    '}\n']
+
+def test035_gen_property_code_constexpr_list():
+    """!
+    @brief Test _gen_property_code method, constexpr list properties
+    """
+    prop_type, peop_desc, islist = LanguageDescriptionList.get_property_return_data('LANGID')
+    property_ret = ParamRetDict.build_return_dict(prop_type, peop_desc, islist)
+
+    lang_data = LanguageDescriptionList(langfilename)
+    id_list = lang_data.get_property_data("english", "LANGID")
+
+    class_gen = GenerateLangFiles(MockProjectDescription(), constexpr_properties=True)
+    code_text = class_gen._gen_property_code("english", "LANGID", property_ret)
+    assert code_text == ["static constexpr std::array<LANGID, "+str(len(id_list))+"> values = {"+
+                         ", ".join(str(item) for item in id_list)+"};",
+                         "return values;"]
+
+    prop_type, peop_desc, islist = LanguageDescriptionList.get_property_return_data('LANG_regions')
+    property_ret = ParamRetDict.build_return_dict(prop_type, peop_desc, islist)
+    region_list = lang_data.get_property_data("english", "LANG_regions")
+    code_text = class_gen._gen_property_code("english", "LANG_regions", property_ret)
+    assert code_text[0] == "static constexpr std::array<std::string_view, "+str(len(region_list))+ \
+                           "> values = {"+", ".join('"'+item+'"' for item in region_list)+"};"
+
+def test036_get_property_ret():
+    """!
+    @brief Test _get_property_ret method
+    """
+    prop_type, peop_desc, islist = LanguageDescriptionList.get_property_return_data('LANGID')
+    list_ret = ParamRetDict.build_return_dict(prop_type, peop_desc, islist)
+    list_method = StringMethodModel("getLANGIDList", "LANGID list", [], list_ret, "LANGID")
+    scalar_ret = ParamRetDict.build_return_dict("string", "ISO code")
+    scalar_method = StringMethodModel("getLangIsoCode", "ISO code", [], scalar_ret, "isoCode")
+
+    class_gen = GenerateLangFiles(MockProjectDescription())
+    assert class_gen._get_property_ret(list_method) is list_ret
+
+    class_gen = GenerateLangFiles(MockProjectDescription(), constexpr_properties=True)
+    assert class_gen._get_property_ret(list_method) == \
+           ParamRetDict.build_return_dict_with_mod("std::span<const LANGID>", peop_desc)
+    assert class_gen._get_property_ret(scalar_method) is scalar_ret
+
+def test037_gen_shard_cpp_fname():
+    """!
+    @brief Test is_sharded and gen_shard_cpp_fname methods
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription())
+    assert not class_gen.is_sharded()
+    assert class_gen.gen_shard_cpp_fname("english", 0) == class_gen.gen_cpp_fname("english")
+    assert class_gen.gen_shard_cpp_fname("english", 2) == "ParserStringListInterfaceEnglish_2.cpp"
+
+    assert GenerateLangFiles(MockProjectDescription(), shard_method_count=2).is_sharded()
+    assert GenerateLangFiles(MockProjectDescription(), shard_byte_size=1000).is_sharded()
+
+def test038_gen_lang_src_shards_method_count(tmp_path):
+    """!
+    @brief Test gen_lang_src_shards method, method count limit
+    """
+    project_file = build_project(os.path.join(tmp_path, "data"), 2, 5)
+    class_gen = GenerateLangFiles(ProjectDescription(project_file), shard_method_count=2)
+    shards = class_gen.gen_lang_src_shards("langaa")
+
+    assert [list(shard) for shard in shards] == [["translate:getMessage0", "translate:getMessage1"],
+                                                 ["translate:getMessage2", "translate:getMessage3"],
+                                                 ["translate:getMessage4"]]
+    assert shards[2]["translate:getMessage4"] == class_gen._gen_src_translate_body("langaa", "getMessage4")
+
+def test039_gen_lang_src_shards_byte_size(tmp_path):
+    """!
+    @brief Test gen_lang_src_shards method, byte size limit
+    """
+    project_file = build_project(os.path.join(tmp_path, "data"), 2, 4)
+    class_gen = GenerateLangFiles(ProjectDescription(project_file))
+    class_name = class_gen.get_string_model().get_class_name("langaa")
+
+    method_bytes = []
+    for index in range(4):
+        method_code = [class_gen._gen_src_translate_def(class_name, "getMessage"+str(index), False)]
+        method_code.extend(class_gen._gen_src_translate_body("langaa", "getMessage"+str(index)))
+        method_bytes.append(sum(len(line.encode("utf-8")) for code in method_code for line in code))
+
+    # Unlimited is one shard
+    assert [len(shard) for shard in class_gen.gen_lang_src_shards("langaa")] == [4]
+
+    class_gen.shard_byte_size = method_bytes[0] + method_bytes[1]
+    assert [len(shard) for shard in class_gen.gen_lang_src_shards("langaa")][0] == 2
+    class_gen.shard_byte_size = method_bytes[0] + method_bytes[1] - 1
+    assert [len(shard) for shard in class_gen.gen_lang_src_shards("langaa")][0] == 1
+
+    # A method larger than the limit still gets a shard
+    class_gen.shard_byte_size = 1
+    assert [len(shard) for shard in class_gen.gen_lang_src_shards("langaa")] == [1, 1, 1, 1]
+
+def test040_header_cache():
+    """!
+    @brief Test the rendered file header cache comes from the project data cache
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription())
+    assert class_gen.header_cache == {}
+    assert GenerateLangFiles(MockProjectDescription()).header_cache is not class_gen.header_cache
+
+    shared_cache = {}
+    project_list = []
+    for _ in range(2):
+        project_data = MockProjectDescription()
+        project_data.enable_data_cache(shared_cache=shared_cache)
+        project_list.append(project_data)
+    first_gen = GenerateLangFiles(project_list[0])
+    assert first_gen.header_cache is project_list[0].get_header_cache()
+    assert GenerateLangFiles(project_list[1]).header_cache is first_gen.header_cache
+
+    first_gen._generate_file_header(EulaText("MIT_open"), "Me", 2025)
+    assert len(shared_cache[('fileHeaders',)]) == 1
+
+def test041_gen_table_data_terminator():
+    """!
+    @brief Test _gen_table_data closes the pool after the last literal, not inside text holding a quote and //
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True)
+    with patch.object(class_gen, '_gen_table_segments') as table_segments:
+        table_segments.return_value = ([('say \\" // hi', "getFirst"), ('a \\" // b', "getSecond")],
+                                       [(0, 11), (11, 9)], [0, 1, 2])
+        code_txt = class_gen._gen_table_data()
+
+    assert '    "say \\" // hi" // getFirst\n' in code_txt
+    assert '    "a \\" // b"; // getSecond\n' in code_txt
+
 # pylint: enable=protected-access
@@ -27,6 +27,7 @@ Unittest for programmer base tools utility
 #==========================================================================
 
 import os
+import sys
 from unittest.mock import patch
 
 from code_tools_grocsoftware.base.eula import EulaText
@@ -36,10 +37,14 @@ from code_tools_grocsoftware.base.translate_text_parser import TransTxtParser
 from code_tools_grocsoftware.base.json_language_list import LanguageDescriptionList
 from code_tools_grocsoftware.base.json_string_class_description import StringClassDescription
 from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.base.string_class_model import StringClassModel, StringMethodModel
 from code_tools_grocsoftware.cpp_gen.class_file_gen import GenerateLangFiles
 
 from tests.dir_init import TESTFILEPATH
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+from synthetic_project import build_project # pylint: disable=wrong-import-position
+
 langfilename = os.path.join(TESTFILEPATH, "teststringlanglist.json")
 strclass_filename = os.path.join(TESTFILEPATH, "teststrdesc.json")
 
@@ -116,6 +121,13 @@ class MockFile:
         self.mock_calls.append(('writelines', ""))
         self.writedata.extend(lines)
 
+    def write(self, text):
+        """!
+        @brief Mock write method
+        """
+        self.mock_calls.append(('write', ""))
+        self.writedata.append(text)
+
 # pylint: enable=too-few-public-methods
 
 def test001_write_inc_file():
@@ -221,6 +233,60 @@ def test013_write_base_src_file_with_using():
         assert len(mock_file.mock_calls) == 14
         assert len(mock_file.writedata) == 112
 
+def test014_write_base_src_file_cached():
+    """!
+    @brief Test write_base_src_file, cached selection function instances
+    """
+    mock_file = MockFile()
+    class_gen = GenerateLangFiles(MockProjectDescription(), cached_instances=True)
+    class_gen.write_base_src_file(mock_file)
+
+    assert class_gen.master_func_gen.cached_instances
+    assert all(os_sel_gen.cached_instances for os_sel_gen in class_gen.os_lang_sel_list)
+    cached_func = class_gen.gen_cached_instance_function()
+    index = mock_file.writedata.index(cached_func[0])
+    assert mock_file.writedata[index:index+len(cached_func)] == cached_func
+    assert not [line for line in mock_file.writedata if "std::make_shared<ParserStringListInterface" in line]
+    assert "            return getCachedParserStringListInterfaceInstance<ParserStringListInterfaceEnglish>();\n" \
+           in mock_file.writedata
+
+def test015_write_base_inc_file_string_view():
+    """!
+    @brief Test write_inc_file for the base class, string_view_constants
+    """
+    mock_file = MockFile()
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_view_constants=True)
+    class_gen.write_inc_file(mock_file)
+
+    assert '#include <string_view>\n' in mock_file.writedata
+
+def test016_write_base_src_file_string_table():
+    """!
+    @brief Test write_base_src_file, string table selection functions
+    """
+    mock_file = MockFile()
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True)
+    class_gen.write_base_src_file(mock_file)
+
+    assert class_gen.master_func_gen.string_table
+    assert all(os_sel_gen.string_table for os_sel_gen in class_gen.os_lang_sel_list)
+    assert '#include "ParserStringListInterfaceTable.h"\n' in mock_file.writedata
+    assert '#include "ParserStringListInterfaceEnglish.h"\n' not in mock_file.writedata
+    assert "            return std::make_shared<ParserStringListInterfaceTable>" \
+           "(ParserStringListInterfaceTable::indexEnglish);\n" in mock_file.writedata
+
+def test017_write_base_inc_file_constexpr_properties():
+    """!
+    @brief Test write_inc_file for the base class, constexpr_properties
+    """
+    mock_file = MockFile()
+    class_gen = GenerateLangFiles(MockProjectDescription(), constexpr_properties=True)
+    class_gen.write_inc_file(mock_file)
+
+    assert '#include <array>\n' in mock_file.writedata
+    assert '#include <span>\n' in mock_file.writedata
+    assert '#include <string_view>\n' in mock_file.writedata
+
 def test021_write_lang_src_file():
     """!
     @brief Test write_lang_src_file, no group, no using
@@ -267,6 +333,100 @@ def test023_write_lang_src_file_with_using():
         assert len(mock_file.mock_calls) == 14
         assert len(mock_file.writedata) == 32
 
+def test024_write_lang_src_file_skeleton_reuse():
+    """!
+    @brief Test write_lang_src_file, second language reuses the rendered skeleton
+    """
+    mock_gname = 'code_tools_grocsoftware.base.project_json.ProjectDescription.get_group_name'
+    mock_gdesc = 'code_tools_grocsoftware.base.project_json.ProjectDescription.get_group_desc'
+    mock_iso = 'code_tools_grocsoftware.base.json_language_list.LanguageDescriptionList.get_iso_code_data'
+
+    with patch (mock_gname) as mock_group_name, patch (mock_gdesc) as mock_group_desc:
+        mock_group_name.return_value = "TestGroup"
+        mock_group_desc.return_value = "Group desc"
+        with patch (mock_iso) as mock_iso_code:
+            # Test string data only has english text
+            mock_iso_code.return_value = "en"
+
+            class_gen = GenerateLangFiles(MockProjectDescription())
+            class_gen.write_lang_src_file(MockFile(), "english")
+            skeleton = class_gen.lang_src_skeleton
+
+            mock_file = MockFile()
+            class_gen.write_lang_src_file(mock_file, "spanish")
+            assert class_gen.lang_src_skeleton is skeleton
+
+            expected_file = MockFile()
+            GenerateLangFiles(MockProjectDescription()).write_lang_src_file(expected_file,
+                                                                            "spanish")
+            assert mock_file.writedata == expected_file.writedata
+            assert len(mock_file.mock_calls) == len(expected_file.mock_calls)
+            assert class_gen.doxy_comment_gen.group_counter == 0
+
+def test025_write_lang_inc_file_skeleton_reuse():
+    """!
+    @brief Test write_inc_file, second language reuses the rendered skeleton
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription())
+    english_file = MockFile()
+    class_gen.write_inc_file(english_file, "english")
+    skeleton = class_gen.lang_inc_skeleton
+
+    mock_file = MockFile()
+    class_gen.write_inc_file(mock_file, "spanish")
+    assert class_gen.lang_inc_skeleton is skeleton
+    assert "class ParserStringListInterfaceSpanish" in "".join(mock_file.writedata)
+    assert "English" not in "".join(mock_file.writedata)
+
+    expected_file = MockFile()
+    GenerateLangFiles(MockProjectDescription()).write_inc_file(expected_file, "spanish")
+    assert mock_file.writedata == expected_file.writedata
+
+def test026_write_table_inc_file():
+    """!
+    @brief Test write_table_inc_file
+    """
+    mock_file = MockFile()
+    class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True)
+    class_gen.write_table_inc_file(mock_file)
+
+    assert len(mock_file.mock_calls) == 28
+    assert len(mock_file.writedata) == 52
+    assert "class ParserStringListInterfaceTable : public ParserStringListInterface\n" in mock_file.writedata
+    assert "        static constexpr size_t indexSpanish = 1;   //!< spanish string table index\n" \
+           in mock_file.writedata
+    assert "        static constexpr size_t languageCount = 2;   //!< Number of string table languages\n" \
+           in mock_file.writedata
+    assert "        explicit ParserStringListInterfaceTable(size_t index) : langIndex(index) {}\n" \
+           in mock_file.writedata
+    assert "        std::string formatText(size_t methodIndex, const std::string_view* args) const;\n" \
+           in mock_file.writedata
+    assert not [line for line in mock_file.writedata if "textView" in line]
+
+def test027_write_table_src_file():
+    """!
+    @brief Test write_table_src_file
+    """
+    mock_file = MockFile()
+    with patch.object(LanguageDescriptionList, 'get_iso_code_data') as lang_iso:
+        lang_iso.return_value = "en"
+        class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True, string_view_constants=True)
+        class_gen.write_table_src_file(mock_file)
+
+    assert '#include "ParserStringListInterfaceTable.h"\n' in mock_file.writedata
+    assert "constexpr char poolSpanish[] =\n" in mock_file.writedata
+    assert '    "Only list type arguments can have an argument count of "; // getNotListTypeMessage\n' \
+           in mock_file.writedata
+    assert "    {0, 55}, {0, 0}\n" in mock_file.writedata
+    assert "constexpr uint32_t methodStartEnglish[] = {0, 2};\n" in mock_file.writedata
+    assert "    {poolEnglish, segmentsEnglish, methodStartEnglish},\n" \
+           "    {poolSpanish, segmentsSpanish, methodStartSpanish}\n" in mock_file.writedata
+    assert "std::string ParserStringListInterfaceTable::formatText(size_t methodIndex, " \
+           "const std::string_view* args) const\n" in mock_file.writedata
+    assert "std::string_view ParserStringListInterfaceTable::textView(size_t methodIndex) const\n" \
+           in mock_file.writedata
+    assert "    return formatText(0, args);\n" in mock_file.writedata
+
 def test030_write_lang_src_file():
     """!
     @brief Test write_lang_src_file, no group, no using
@@ -368,7 +528,7 @@ def test050_write_lang_unittest_file():
     class_gen.test_param_values['nargs']= ("3", False)
     class_gen.write_lang_unittest_file(mock_file, "english")
 
-    assert len(mock_file.mock_calls) == 10
+    assert len(mock_file.mock_calls) == 20
     assert len(mock_file.writedata) == 37
 
 def test051_write_lang_unittest_file_with_group():
@@ -388,7 +548,7 @@ def test051_write_lang_unittest_file_with_group():
             class_gen.test_param_values['nargs']= ("3", False)
             class_gen.write_lang_unittest_file(mock_file, "english")
 
-            assert len(mock_file.mock_calls) == 14
+            assert len(mock_file.mock_calls) == 24
             assert len(mock_file.writedata) == 54
 
 def test052_write_lang_unittest_file_with_using():
@@ -405,9 +565,93 @@ def test052_write_lang_unittest_file_with_using():
         class_gen.test_param_values['nargs']= ("3", False)
         class_gen.write_lang_unittest_file(mock_file, "english")
 
-        assert len(mock_file.mock_calls) == 12
+        assert len(mock_file.mock_calls) == 22
         assert len(mock_file.writedata) == 39
 
+def test053_write_lang_unittest_file_no_main():
+    """!
+    @brief Test write_lang_unittest_file, shared unittest main
+    """
+    mock_file = MockFile()
+    class_gen = GenerateLangFiles(MockProjectDescription())
+    class_gen.test_param_values['nargs']= ("3", False)
+    class_gen.lang_unittest_main = False
+    class_gen.write_lang_unittest_file(mock_file, "english")
+
+    assert len(mock_file.mock_calls) == 19
+    assert len(mock_file.writedata) == 31
+    assert "int main(int argc, char **argv)\n" not in mock_file.writedata
+
+def test054_write_unittest_main_file():
+    """!
+    @brief Test write_unittest_main_file
+    """
+    mock_file = MockFile()
+    class_gen = GenerateLangFiles(MockProjectDescription())
+    class_gen.write_unittest_main_file(mock_file)
+
+    assert len(mock_file.mock_calls) == 5
+    assert "#include <gtest/gtest.h>\n" in mock_file.writedata
+    assert mock_file.writedata[-6:] == class_gen.gen_unittest_main()
+
+def test055_generate_typed_unittest_table():
+    """!
+    @brief Test _generate_typed_unittest_table
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription())
+    class_gen.test_param_values['nargs']= ("3", False)
+    code_txt = class_gen._generate_typed_unittest_table("TestExpected", "english")
+
+    assert len(code_txt) == 6
+    assert code_txt[0] == "template <> struct TestExpected<ParserStringListInterfaceEnglish>\n"
+    assert code_txt[1] == "{\n"
+    assert code_txt[2] == '    static constexpr const char* type_name = "English";\n'
+    assert code_txt[3] == '    static constexpr const char* getLangIsoCode = "en";\n'
+    assert code_txt[4].startswith('    static constexpr const char* getNotListTypeMessage = "')
+    assert code_txt[5] == "};\n"
+
+def test056_write_typed_unittest_file():
+    """!
+    @brief Test write_typed_unittest_file
+    """
+    mock_file = MockFile()
+    with patch.object(LanguageDescriptionList, 'get_iso_code_data') as lang_iso:
+        lang_iso.return_value = "en"
+        class_gen = GenerateLangFiles(MockProjectDescription())
+        class_gen.test_param_values['nargs']= ("3", False)
+        class_gen.write_typed_unittest_file(mock_file)
+
+    assert '#include "ParserStringListInterfaceSpanish.h"\n' in mock_file.writedata
+    assert "template <> struct ParserStringListInterfaceExpected<ParserStringListInterfaceSpanish>\n" \
+           in mock_file.writedata
+    assert "using ParserStringListInterfaceTypes = ::testing::Types<ParserStringListInterfaceEnglish,\n" \
+           "    ParserStringListInterfaceSpanish>;\n" in mock_file.writedata
+    assert "TYPED_TEST_SUITE(ParserStringListInterfaceTypedTest, ParserStringListInterfaceTypes, " \
+           "ParserStringListInterfaceTypeNames);\n" in mock_file.writedata
+    assert "TYPED_TEST(ParserStringListInterfaceTypedTest, fetchgetLangIsoCode)\n" in mock_file.writedata
+    assert "TYPED_TEST(ParserStringListInterfaceTypedTest, printgetNotListTypeMessage)\n" in mock_file.writedata
+    assert mock_file.writedata[-6:] == class_gen.gen_unittest_main()
+
+def test057_write_typed_unittest_file_string_table():
+    """!
+    @brief Test write_typed_unittest_file, string table language test classes
+    """
+    mock_file = MockFile()
+    with patch.object(LanguageDescriptionList, 'get_iso_code_data') as lang_iso:
+        lang_iso.return_value = "en"
+        class_gen = GenerateLangFiles(MockProjectDescription(), string_table=True)
+        class_gen.test_param_values['nargs']= ("3", False)
+        class_gen.write_typed_unittest_file(mock_file)
+
+    assert '#include "ParserStringListInterfaceTable.h"\n' in mock_file.writedata
+    assert '#include "ParserStringListInterfaceSpanish.h"\n' not in mock_file.writedata
+    assert "class ParserStringListInterfaceSpanish : public ParserStringListInterfaceTable\n" \
+           in mock_file.writedata
+    assert "    ParserStringListInterfaceSpanish() : ParserStringListInterfaceTable(" \
+           "ParserStringListInterfaceTable::indexSpanish) {}\n" in mock_file.writedata
+    assert "template <> struct ParserStringListInterfaceExpected<ParserStringListInterfaceSpanish>\n" \
+           in mock_file.writedata
+
 def test060_generate_property_unittest():
     """!
     @brief Test _generate_property_unittest, no params, single return, non-text
@@ -745,6 +989,22 @@ def test082_write_mock_inc_file_with_group():
             assert len(mock_file.mock_calls) == 18
             assert len(mock_file.writedata) == 52
 
+def test083_write_mock_inc_file_constexpr_properties():
+    """!
+    @brief Test write_mock_inc_file, constexpr list properties
+    """
+    list_ret = ParamRetDict.build_return_dict("LANGID", "LANGID list", True)
+    list_method = StringMethodModel("getLANGIDList", "LANGID list", [], list_ret, "LANGID")
+
+    mock_file = MockFile()
+    class_gen = GenerateLangFiles(MockProjectDescription(), constexpr_properties=True)
+    with patch.object(StringClassModel, 'get_property_methods') as get_methods:
+        get_methods.return_value = [list_method]
+        class_gen.write_mock_inc_file(mock_file)
+
+    assert "        MOCK_METHOD(std::span<const LANGID>, getLANGIDList, (), (const, final));\n" \
+           in mock_file.writedata
+
 def test091_write_mock_src_file():
     """!
     @brief Test write_mock_src_file, no group, no using, no extra
@@ -811,4 +1071,70 @@ def test094_write_mock_src_file_with_extra():
         assert len(mock_file.mock_calls) == 16
         assert len(mock_file.writedata) == 41
 
+def test028_write_lang_src_shard_file():
+    """!
+    @brief Test write_lang_src_shard_file, one shard matches write_lang_src_file
+    """
+    mock_gname = 'code_tools_grocsoftware.base.project_json.ProjectDescription.get_group_name'
+    mock_gdesc = 'code_tools_grocsoftware.base.project_json.ProjectDescription.get_group_desc'
+
+    with patch (mock_gname) as mock_group_name, patch (mock_gdesc) as mock_group_desc:
+        mock_group_name.return_value = "TestGroup"
+        mock_group_desc.return_value = "Group desc"
+
+        class_gen = GenerateLangFiles(MockProjectDescription(), shard_method_count=10)
+        mock_file = MockFile()
+        class_gen.write_lang_src_file(mock_file, "english")
+
+        shard_file = MockFile()
+        shards = class_gen.gen_lang_src_shards("english")
+        assert len(shards) == 1
+        class_gen.write_lang_src_shard_file(shard_file, "english", 0, shards[0])
+
+    assert "".join(shard_file.writedata) == "".join(mock_file.writedata)
+
+def test029_write_lang_src_shard_file_extra_shard():
+    """!
+    @brief Test write_lang_src_shard_file, shards after the first skip the property methods
+    """
+    class_gen = GenerateLangFiles(MockProjectDescription(), shard_method_count=1)
+    shards = class_gen.gen_lang_src_shards("english")
+
+    mock_file = MockFile()
+    class_gen.write_lang_src_shard_file(mock_file, "english", 1, shards[0])
+    file_text = "".join(mock_file.writedata)
+
+    assert '#include "ParserStringListInterfaceEnglish.h"\n' in mock_file.writedata
+    assert "::getLangIsoCode()" not in file_text
+    assert "::getNotListTypeMessage(" in file_text
+
+def test030_write_lang_src_shard_file_multi_shard(tmp_path):
+    """!
+    @brief Test write_lang_src_shard_file, the shards hold the language source file methods
+    """
+    project_file = build_project(os.path.join(tmp_path, "data"), 2, 5)
+    class_gen = GenerateLangFiles(ProjectDescription(project_file), shard_method_count=2)
+    mock_file = MockFile()
+    class_gen.write_lang_src_file(mock_file, "langaa")
+    src_text = "".join(mock_file.writedata)
+
+    shard_text = []
+    for shard_index, shard_slots in enumerate(class_gen.gen_lang_src_shards("langaa")):
+        shard_file = MockFile()
+        class_gen.write_lang_src_shard_file(shard_file, "langaa", shard_index, shard_slots)
+        shard_text.append("".join(shard_file.writedata))
+
+    assert len(shard_text) == 3
+    assert "@file ParserStringListInterfaceLangaa_2.cpp" in shard_text[2]
+    assert "::getMessage4(" in shard_text[2]
+    assert "::getMessage3(" not in shard_text[2]
+
+    # Each method definition is written once, in the same text as the language source file
+    for index in range(5):
+        method_start = "::getMessage"+str(index)+"("
+        assert sum(text.count(method_start) for text in shard_text) == src_text.count(method_start)
+        owner = [text for text in shard_text if method_start in text][0]
+        method_text = owner[owner.index(method_start):owner.index("}\n", owner.index(method_start))]
+        assert method_text in src_text
+
 # pylint: enable=protected-access
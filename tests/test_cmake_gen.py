@@ -93,6 +93,7 @@ class MockFile:
     def __init__(self):
         self.mock_calls = []
         self.writedata = []
+        self.closed = False
 
     def writelines(self, lines):
         """!
@@ -108,6 +109,12 @@ class MockFile:
         self.mock_calls.append(('write', ""))
         self.writedata.append(data)
 
+    def close(self):
+        """!
+        @brief Mock close method
+        """
+        self.closed = True
+
 # pylint: disable=protected-access
 
 def test001_constructor():
@@ -193,6 +200,12 @@ def test004_gen_header():
     assert code_txt[2] == "set(CMAKE_CXX_STANDARD 17)\n"
     assert code_txt[3] == "set(CMAKE_CXX_STANDARD_REQUIRED True)\n"
 
+    code_txt = proj_gen.gen_header("TestProj4", "1.1.1.1", min_version="3.16")
+    assert code_txt[0] == "cmake_minimum_required(VERSION 3.16)\n"
+
+    code_txt = proj_gen.gen_header("TestProj5", "1.1.1.1", cxx_standard=20)
+    assert code_txt[2] == "set(CMAKE_CXX_STANDARD 20)\n"
+
 def test005_gen_include_dirs_list():
     """!
     Test gen_include_dirs_list
@@ -476,6 +489,7 @@ def test020_generate_cmake():
     @brief Test generate_cmake
     """
     gen = ProjectFileGenerator(MockProjectDescription())
+    gen.emitter_buffer_size = None
     gen.add_include_dir('inc')
     gen._add_file('source', 'src/some.cpp')
     gen._add_file('source', 'src/some_english.cpp', 'english')
@@ -494,6 +508,7 @@ def test020_generate_cmake():
                                           encoding="utf-8")
 
         assert len(mockfile.mock_calls) == 16
+        assert mockfile.closed
 
 def test021_generate_cmake_open_error(capsys):
     """!
@@ -517,4 +532,219 @@ def test021_generate_cmake_open_error(capsys):
                                             encoding="utf-8")
         assert capsys.readouterr().out == "Failed to open cmake file 'baseDir/CMakeLists.txt' for writing\n"
 
+def test022_gen_object_source():
+    """!
+    @brief Test gen_object_source
+    """
+    proj_gen = GenerateCmakeFile(ProjectFileGenerator(MockProjectDescription()))
+    assert proj_gen.gen_object_source() == "$<TARGET_OBJECTS:${PROJECT_NAME}>"
+
+def test023_generate_cmake_reuse_objects():
+    """!
+    @brief Test generate_cmake with the object library reuse option
+    """
+    gen = ProjectFileGenerator(MockProjectDescription())
+    gen.emitter_buffer_size = None
+    gen.add_include_dir('inc')
+    gen._add_file('source', 'src/some.cpp')
+    gen._add_file('source', 'src/some_english.cpp', 'english')
+    gen._add_file('unittest', 'test/some_test.cpp')
+    gen._add_file('unittest', 'test/some_english_test.cpp', 'english')
+    gen._add_select_file('LocalSelelect_linux_test.cpp', 'LocalSelelect_linux_test')
+    mockfile = MockFile()
+    proj_gen = GenerateCmakeFile(gen)
+
+    with patch('builtins.open', mock_open()) as openmock:
+        openmock.return_value = mockfile
+
+        assert proj_gen.generate_cmake("baseDir", True, reuse_objects=True)
+        assert len(mockfile.mock_calls) == 16
+
+        exe_lines = [line for line in mockfile.writedata if line.startswith("add_executable(")]
+        assert exe_lines == ["add_executable(ParserStringListInterfaceEnglish_test "
+                             "$<TARGET_OBJECTS:${PROJECT_NAME}> test/some_english_test.cpp)\n",
+                             "add_executable(LocalSelelect_linux_test "
+                             "$<TARGET_OBJECTS:${PROJECT_NAME}> LocalSelelect_linux_test.cpp)\n",
+                             "add_executable(ParserStringListInterface_test "
+                             "$<TARGET_OBJECTS:${PROJECT_NAME}> test/some_test.cpp)\n"]
+        assert "add_library(${PROJECT_NAME} OBJECT ${ProjectSources})\n" in mockfile.writedata
+        assert "gtest_add_tests (TARGET ParserStringListInterface_test SOURCES test/some_test.cpp " \
+               "TEST_LIST ParserStringListInterface_testAllTests)\n\n" in mockfile.writedata
+        assert "target_include_directories(${PROJECT_NAME} PUBLIC ${ProjectInclude})\n" in mockfile.writedata
+        assert "    target_compile_options(${PROJECT_NAME} PRIVATE --coverage)\n" in mockfile.writedata
+
+def test024_gen_combined_unittest_target():
+    """!
+    @brief Test gen_combined_unittest_target
+    """
+    proj_gen = GenerateCmakeFile(ProjectFileGenerator(MockProjectDescription()))
+    code_txt = proj_gen.gen_combined_unittest_target('TestAll_test',
+                                                     ['src/english.cpp', 'src/french.cpp', 'test/main.cpp'],
+                                                     [('test/english_test.cpp', 'English_test'),
+                                                      ('test/french_test.cpp', 'French_test')],
+                                                     'inclist', True)
+    assert len(code_txt) == 20
+    assert code_txt[1] == "# TestAll_test unit test build\n"
+    assert code_txt[3] == "add_executable(TestAll_test src/english.cpp src/french.cpp test/main.cpp " \
+                          "test/english_test.cpp test/french_test.cpp)\n"
+    assert code_txt[11] == "gtest_add_tests (TARGET TestAll_test SOURCES test/english_test.cpp " \
+                           "TEST_LIST English_testAllTests)\n"
+    assert code_txt[13] == "    set_tests_properties(English_testAllTests " \
+                           "PROPERTIES ENVIRONMENT \"PATH=$<SHELL_PATH:$<TARGET_FILE_DIR" \
+                           ":gtest>>$<SEMICOLON>$ENV{PATH}\")\n"
+    assert code_txt[15] == "gtest_add_tests (TARGET TestAll_test SOURCES test/french_test.cpp " \
+                           "TEST_LIST French_testAllTests)\n"
+    assert code_txt[19] == "\n"
+
+def test025_generate_cmake_combined_unittest():
+    """!
+    @brief Test generate_cmake with the combined language unittest
+    """
+    gen = ProjectFileGenerator(MockProjectDescription(), combined_unittest=True)
+    gen.emitter_buffer_size = None
+    gen.add_include_dir('inc')
+    gen._add_file('source', 'src/some.cpp')
+    gen._add_file('source', 'src/some_english.cpp', 'english')
+    gen._add_file('unittest', 'test/some_test.cpp')
+    gen._add_file('unittestMain', 'test/some_test_main.cpp')
+    gen._add_file('unittest', 'test/some_english_test.cpp', 'english')
+    mockfile = MockFile()
+    proj_gen = GenerateCmakeFile(gen)
+
+    with patch('builtins.open', mock_open()) as openmock:
+        openmock.return_value = mockfile
+
+        assert proj_gen.generate_cmake("baseDir", True, reuse_objects=True)
+        exe_lines = [line for line in mockfile.writedata if line.startswith("add_executable(")]
+        assert exe_lines == ["add_executable(ParserStringListInterfaceLanguages_test "
+                             "$<TARGET_OBJECTS:${PROJECT_NAME}> test/some_test_main.cpp "
+                             "test/some_english_test.cpp)\n",
+                             "add_executable(ParserStringListInterface_test "
+                             "$<TARGET_OBJECTS:${PROJECT_NAME}> test/some_test.cpp)\n"]
+        assert "gtest_add_tests (TARGET ParserStringListInterfaceLanguages_test " \
+               "SOURCES test/some_english_test.cpp " \
+               "TEST_LIST ParserStringListInterfaceEnglish_testAllTests)\n" in mockfile.writedata
+
+def test026_gen_lib_build_options():
+    """!
+    @brief Test gen_lib_build_options
+    """
+    gen = ProjectFileGenerator(MockProjectDescription())
+    proj_gen = GenerateCmakeFile(gen)
+    assert not proj_gen.gen_lib_build_options()
+
+    # No base include, no precompiled header
+    assert not proj_gen.gen_lib_build_options(precompile_headers=True)
+
+    gen._add_file('include', 'inc/some.h')
+    code_txt = proj_gen.gen_lib_build_options(precompile_headers=True)
+    assert code_txt == ["target_precompile_headers(${PROJECT_NAME} PRIVATE "
+                        "${CMAKE_CURRENT_LIST_DIR}/inc/some.h <sstream>)\n"]
+
+    code_txt = proj_gen.gen_lib_build_options(unity_batch_size=8)
+    assert code_txt == ["set_target_properties(${PROJECT_NAME} PROPERTIES "
+                        "UNITY_BUILD ON UNITY_BUILD_BATCH_SIZE 8)\n"]
+
+    code_txt = proj_gen.gen_lib_build_options(True, 0)
+    assert len(code_txt) == 2
+    assert code_txt[1] == "set_target_properties(${PROJECT_NAME} PROPERTIES " \
+                          "UNITY_BUILD ON UNITY_BUILD_BATCH_SIZE 0)\n"
+
+def test027_generate_cmake_build_options():
+    """!
+    @brief Test generate_cmake with the precompiled header and unity build options
+    """
+    gen = ProjectFileGenerator(MockProjectDescription())
+    gen.emitter_buffer_size = None
+    gen.add_include_dir('inc')
+    gen._add_file('include', 'inc/some.h')
+    gen._add_file('source', 'src/some.cpp')
+    gen._add_file('source', 'src/some_english.cpp', 'english')
+    gen._add_file('unittest', 'test/some_test.cpp')
+    gen._add_file('unittest', 'test/some_english_test.cpp', 'english')
+    mockfile = MockFile()
+    proj_gen = GenerateCmakeFile(gen)
+
+    with patch('builtins.open', mock_open()) as openmock:
+        openmock.return_value = mockfile
+
+        assert proj_gen.generate_cmake("baseDir", True, precompile_headers=True, unity_batch_size=4)
+        assert mockfile.writedata[0] == "cmake_minimum_required(VERSION 3.16)\n"
+        lib_index = mockfile.writedata.index("add_library(${PROJECT_NAME} OBJECT ${ProjectSources})\n")
+        assert mockfile.writedata[lib_index+3] == "target_precompile_headers(${PROJECT_NAME} PRIVATE " \
+                                                  "${CMAKE_CURRENT_LIST_DIR}/inc/some.h <sstream>)\n"
+        assert mockfile.writedata[lib_index+4] == "set_target_properties(${PROJECT_NAME} PROPERTIES " \
+                                                  "UNITY_BUILD ON UNITY_BUILD_BATCH_SIZE 4)\n"
+
+def test028_generate_cmake_typed_unittest():
+    """!
+    @brief Test generate_cmake with the typed language unittest
+    """
+    gen = ProjectFileGenerator(MockProjectDescription(), typed_unittest=True)
+    gen.emitter_buffer_size = None
+    gen.add_include_dir('inc')
+    gen._add_file('source', 'src/some.cpp')
+    gen._add_file('source', 'src/some_english.cpp', 'english')
+    gen._add_file('unittest', 'test/some_test.cpp')
+    gen._add_file('typedUnittest', 'test/some_typed_test.cpp')
+    mockfile = MockFile()
+    proj_gen = GenerateCmakeFile(gen)
+
+    with patch('builtins.open', mock_open()) as openmock:
+        openmock.return_value = mockfile
+
+        assert proj_gen.generate_cmake("baseDir", True)
+        exe_lines = [line for line in mockfile.writedata if line.startswith("add_executable(")]
+        assert exe_lines == ["add_executable(ParserStringListInterfaceLanguages_typed_test "
+                             "${ProjectSources} test/some_typed_test.cpp)\n",
+                             "add_executable(ParserStringListInterface_test "
+                             "${ProjectSources} test/some_test.cpp)\n"]
+        assert "gtest_add_tests (TARGET ParserStringListInterfaceLanguages_typed_test " \
+               "SOURCES test/some_typed_test.cpp " \
+               "TEST_LIST ParserStringListInterfaceLanguages_typed_testAllTests)\n\n" in mockfile.writedata
+
+def test029_generate_cmake_source_shards():
+    """!
+    @brief Test generate_cmake with sharded language source files
+    """
+    gen = ProjectFileGenerator(MockProjectDescription())
+    gen.emitter_buffer_size = None
+    gen.add_include_dir('inc')
+    gen._add_file('source', 'src/some.cpp')
+    gen._add_file('source', 'src/some_english.cpp', 'english')
+    gen._add_file('sourceShards', 'src/some_english_1.cpp', 'english')
+    gen._add_file('unittest', 'test/some_english_test.cpp', 'english')
+    gen._add_file('unittest', 'test/some_test.cpp')
+    mockfile = MockFile()
+    proj_gen = GenerateCmakeFile(gen)
+
+    with patch('builtins.open', mock_open()) as openmock:
+        openmock.return_value = mockfile
+
+        assert proj_gen.generate_cmake("baseDir", True)
+        assert "     ${CMAKE_CURRENT_LIST_DIR}/src/some_english_1.cpp\n" in mockfile.writedata
+        exe_lines = [line for line in mockfile.writedata if line.startswith("add_executable(")]
+        assert exe_lines[0] == "add_executable(ParserStringListInterfaceEnglish_test src/some_english.cpp " \
+                               "src/some_english_1.cpp test/some_english_test.cpp)\n"
+
+def test030_gen_lib_target_reuse_objects():
+    """!
+    Test gen_lib_target, object library reused by the unit tests
+    """
+    proj_gen = GenerateCmakeFile(ProjectFileGenerator(MockProjectDescription()))
+
+    code_txt = proj_gen.gen_lib_target("TestProj", 'sources', 'inclist', True, True)
+    assert len(code_txt) == 10
+    assert code_txt[3] == "add_library(${PROJECT_NAME} OBJECT ${sources})\n"
+    assert code_txt[4] == "target_include_directories(${PROJECT_NAME} PUBLIC ${inclist})\n"
+    assert code_txt[6] == "target_compile_options(${PROJECT_NAME} PUBLIC -DGTEST_LINKED_AS_SHARED_LIBRARY=1)\n"
+    assert code_txt[7] == "if((${CMAKE_SYSTEM_NAME} MATCHES \"Linux\") AND " \
+                          "(CMAKE_BUILD_TYPE MATCHES \"^[Dd]ebug\"))\n"
+    assert code_txt[8] == "    target_compile_options(${PROJECT_NAME} PRIVATE --coverage)\n"
+    assert code_txt[9] == "endif()\n\n"
+
+    code_txt = proj_gen.gen_lib_target("TestProj", 'sources', 'inclist', True)
+    assert len(code_txt) == 9
+    assert not any("GTEST_LINKED_AS_SHARED_LIBRARY" in line for line in code_txt)
+
 # pylint: enable=protected-access
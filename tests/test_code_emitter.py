@@ -0,0 +1,129 @@
+"""@package test_programmer_tools
+Unittest for the streaming code emitter
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+import hashlib
+import io
+from unittest.mock import MagicMock
+
+from code_tools_grocsoftware.base.code_emitter import CodeEmitter, HashSink, LineSink
+
+def test001_hash_sink():
+    """!
+    @brief Test HashSink write and writelines
+    """
+    sink = HashSink()
+    assert sink.write("abc\n") == 4
+    sink.writelines(["déf\n", "ghi\n"])
+
+    expected = "abc\ndéf\nghi\n".encode("utf-8")
+    assert sink.size == len(expected)
+    assert sink.hexdigest() == hashlib.sha256(expected).hexdigest()
+
+def test002_emitter_writelines():
+    """!
+    @brief Test CodeEmitter writelines buffering until flush
+    """
+    sink = MagicMock()
+    emitter = CodeEmitter(sink)
+    emitter.writelines(["line1\n", "line2\n"])
+    assert emitter.write("line3\n") == 6
+    sink.write.assert_not_called()
+
+    emitter.flush()
+    sink.write.assert_called_once_with("line1\nline2\nline3\n")
+    assert emitter.buffer_count == 0
+
+    emitter.flush()
+    sink.write.assert_called_once()
+
+def test003_emitter_buffer_limit():
+    """!
+    @brief Test CodeEmitter streams to the sink when the buffer limit is reached
+    """
+    sink = MagicMock()
+    emitter = CodeEmitter(sink, 10)
+    emitter.writelines(["12345\n"])
+    sink.write.assert_not_called()
+    emitter.writelines(["67890\n"])
+    sink.write.assert_called_once_with("12345\n67890\n")
+
+    emitter.write("abcdefghijk")
+    assert sink.write.call_count == 2
+
+def test005_emitter_close():
+    """!
+    @brief Test CodeEmitter close flushes and leaves the sink open
+    """
+    sink = io.StringIO()
+    emitter = CodeEmitter(sink)
+    emitter.writelines(["text\n"])
+    emitter.close()
+    assert sink.getvalue() == "text\n"
+    assert not sink.closed
+
+def test006_emitter_string_writelines():
+    """!
+    @brief Test CodeEmitter writelines with a string input, as written by
+           gen_doxy_group_end()
+    """
+    sink = io.StringIO()
+    with CodeEmitter(sink) as emitter:
+        emitter.writelines("/** @} */\n")
+    assert sink.getvalue() == "/** @} */\n"
+
+def test007_emitter_owns_sink():
+    """!
+    @brief Test CodeEmitter close closes an owned sink
+    """
+    sink = io.StringIO()
+    sink.close = MagicMock()
+    emitter = CodeEmitter(sink, owns_sink=True)
+    emitter.writelines(["text\n"])
+    emitter.close()
+    assert sink.getvalue() == "text\n"
+    sink.close.assert_called_once_with()
+
+def test008_line_sink():
+    """!
+    @brief Test LineSink keeps each write as a list entry
+    """
+    sink = LineSink()
+    assert sink.write("a\n") == 2
+    sink.writelines(["b\n", "c\n"])
+    assert sink.lines == ["a\n", "b\n", "c\n"]
+
+def test009_emitter_iterator_writelines():
+    """!
+    @brief Test CodeEmitter writelines counts generator input toward the buffer limit
+    """
+    sink = MagicMock()
+    emitter = CodeEmitter(sink, 10)
+    emitter.writelines(line for line in ["12345\n"])
+    sink.write.assert_not_called()
+    assert emitter.buffer_count == 6
+    emitter.writelines(iter(["67890\n"]))
+    sink.write.assert_called_once_with("12345\n67890\n")
+    assert emitter.buffer_count == 0
@@ -24,7 +24,11 @@ Unittest for programmer base tools utility
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #==========================================================================
 
+import io
 from datetime import datetime
+from unittest.mock import patch
+from code_tools_grocsoftware.base.code_emitter import CodeEmitter
+from code_tools_grocsoftware.base.eula import EulaText
 from code_tools_grocsoftware.base.param_return_tools import ParamRetDict
 from code_tools_grocsoftware.cpp_gen.file_gen_base import GenerateCppFileHelper
 from tests.mock_eula import MockEulaText
@@ -1175,3 +1179,131 @@ class Test01CppFilehelper:
 
         test_text = helper.gen_using_statement("parserstr", "std::string", "desc")
         assert test_text == "using parserstr = std::string;          //!< desc\n"
+
+    def test57_update_xlate_name(self):
+        """!
+        @brief Test the update_xlate_name method
+        """
+        helper = GenerateCppFileHelper()
+
+        helper.update_xlate_name("std::string", "parserstr")
+        assert helper.type_xlation_dict['string'] == "parserstr"
+        assert helper.type_xlation_dict['text'] == "parserstr"
+        assert helper.type_xlation_dict['char'] == "char"
+        assert "std::string" not in helper.xlate_reverse_index
+        assert helper.xlate_reverse_index["parserstr"] == ['string', 'text']
+
+        # Chained update follows the new name
+        helper.update_xlate_name("parserstr", "mystr")
+        assert helper.type_xlation_dict['string'] == "mystr"
+        assert helper.type_xlation_dict['text'] == "mystr"
+
+        # Unknown name is ignored
+        helper.update_xlate_name("std::wstring", "wparserstr")
+        assert "wparserstr" not in helper.xlate_reverse_index
+        assert helper.declare_type('text') == "mystr"
+
+    def test58_update_xlate_names(self):
+        """!
+        @brief Test the update_xlate_names method
+        """
+        helper = GenerateCppFileHelper()
+
+        helper.update_xlate_names([("std::string", "parserstr"),
+                                   ("char", "parserchar"),
+                                   ("int", "int")])
+        assert helper.type_xlation_dict['string'] == "parserstr"
+        assert helper.type_xlation_dict['text'] == "parserstr"
+        assert helper.type_xlation_dict['char'] == "parserchar"
+        assert helper.type_xlation_dict['integer'] == "int"
+        assert helper.xlate_reverse_index["int"] == ['integer']
+
+    def test59_add_xlate_type(self):
+        """!
+        @brief Test the add_xlate_type method
+        """
+        helper = GenerateCppFileHelper()
+
+        helper.add_xlate_type('strstream', "std::stringstream")
+        assert helper.type_xlation_dict['strstream'] == "std::stringstream"
+        assert helper.xlate_reverse_index["std::stringstream"] == ['strstream']
+
+        # Replace existing entry
+        helper.add_xlate_type('char', "wchar_t")
+        assert helper.type_xlation_dict['char'] == "wchar_t"
+        assert "char" not in helper.xlate_reverse_index
+        assert helper.xlate_reverse_index["wchar_t"] == ['char']
+
+        helper.add_xlate_type('text', "std::wstring")
+        assert helper.xlate_reverse_index["std::string"] == ['string']
+
+        helper.update_xlate_name("std::stringstream", "parser_str_stream")
+        assert helper.type_xlation_dict['strstream'] == "parser_str_stream"
+
+    def test61_emit_function(self):
+        """!
+        @brief Test emit_function_declaration and emit_function_definition stream the
+               same text as the list returning methods
+        """
+        helper = GenerateCppFileHelper()
+        gen_ret_dict = ParamRetDict.build_return_dict_with_mod("integer", "return int", 0)
+        gen_param_list = [ParamRetDict.build_param_dict_with_mod("foo", "integer", "myint", 0)]
+
+        sink = io.StringIO()
+        with CodeEmitter(sink) as emitter:
+            helper.emit_function_declaration(emitter, "my_test", "My test function",
+                                             gen_param_list, gen_ret_dict, 4,
+                                             inlinecode=["int a = foo;", "return a;"])
+            helper.emit_function_definition(emitter, "my_test", "My test function",
+                                            gen_param_list, gen_ret_dict)
+
+        expected = helper.declare_function_with_decorations("my_test", "My test function",
+                                                            gen_param_list, gen_ret_dict, 4,
+                                                            inlinecode=["int a = foo;", "return a;"])
+        assert expected[-5:] == ['    int my_test(int foo)\n', '    {\n',
+                                 '        int a = foo;\n', '        return a;\n', '    }\n']
+        expected += helper.define_function_with_decorations("my_test", "My test function",
+                                                            gen_param_list, gen_ret_dict)
+        assert sink.getvalue() == "".join(expected)
+
+    def test60_gen_file_header_cache(self):
+        """!
+        @brief Test generate_generic_file_header shares the rendered EulaText headers
+        """
+        current_year = datetime.now().year
+        header_cache = {}
+
+        # No cache renders every header
+        helper = GenerateCppFileHelper()
+        assert helper.header_cache is None
+        helper.generate_generic_file_header(EulaText("MIT_open"), "Me", current_year, "unittest")
+        with patch.object(EulaText, 'format_eula_text') as format_text:
+            format_text.return_value = []
+            helper.generate_generic_file_header(EulaText("MIT_open"), "Me", current_year, "unittest")
+            format_text.assert_called_once()
+
+        helper.header_cache = header_cache
+        header_text = helper.generate_generic_file_header(EulaText("MIT_open"), "Me",
+                                                          current_year, "unittest")
+        assert len(header_cache) == 1
+
+        # A new helper and EULA object with the same text and cache use the cached header
+        helper = GenerateCppFileHelper()
+        helper.header_cache = header_cache
+        with patch.object(EulaText, 'format_eula_text') as format_text:
+            cached_text = helper.generate_generic_file_header(EulaText("MIT_open"), "Me",
+                                                              current_year, "unittest")
+            format_text.assert_not_called()
+        assert cached_text == header_text
+        assert cached_text is not header_text
+
+        # Any key change renders a new header
+        other_text = helper.generate_generic_file_header(EulaText("MIT_open"), "You",
+                                                         current_year, "unittest")
+        assert other_text[1] == "* Copyright (c) "+str(current_year)+" You\n"
+        helper.generate_generic_file_header(EulaText("BSD_3clause"), "Me", current_year, "unittest")
+        assert len(header_cache) == 3
+
+        # Other EULA objects are not cached
+        helper.generate_generic_file_header(MockEulaText(), "Me", current_year, "unittest")
+        assert len(header_cache) == 3
@@ -411,4 +411,88 @@ class TestClass01LinuxLangSelect:
         assert cpp_name == "LocalLanguageSelect_Linux_test.cpp"
         assert target_name == "LocalLanguageSelect_Linux"
 
+    def test015_constructor_use_regex(self, mocker):
+        """!
+        @brief Test the use_regex constructor option
+        """
+        test_obj = LinuxLangSelectFunctionGenerator(self.default_setup(mocker))
+        assert test_obj.use_regex
+        test_obj = LinuxLangSelectFunctionGenerator(self.default_setup(mocker), False)
+        assert not test_obj.use_regex
+
+    def test016_gen_packed_code(self, mocker):
+        """!
+        @brief Test _gen_packed_code
+        """
+        test_obj = LinuxLangSelectFunctionGenerator(self.default_setup(mocker), False)
+        assert test_obj._gen_packed_code("en") == "0x656e"
+        assert test_obj._gen_packed_code("zh") == "0x7a68"
+
+    def test017_gen_function_no_regex(self, mocker):
+        """!
+        @brief Test gen_function without std::regex
+        """
+        cpp_gen = BaseCppStringClassGenerator()
+        lang_list = LanguageDescriptionList(test_json_list)
+        test_obj = LinuxLangSelectFunctionGenerator(self.langfile_setup(mocker, lang_list), False)
+
+        capture_list = test_obj.gen_function()
+
+        assert len(capture_list) == 53
+        assert capture_list[1] == cpp_gen.gen_include("<cstdlib>")
+        assert capture_list[2] == cpp_gen.gen_include("<cstdint>")
+        assert not [line for line in capture_list if "regex" in line]
+
+        assert capture_list[17] == "        // Check the ll_CC.UTF-x form without a regular expression\n"
+        assert capture_list[18] == "        bool matched = (langId[0] >= 'a') && (langId[0] <= 'z') &&\n"
+        assert capture_list[27] == "                        ((langId[11] >= '0') && (langId[11] <= '9') && " \
+                                   "('\\0' == langId[12])));\n"
+        assert capture_list[32] == "            switch ((static_cast<uint16_t>(langId[0]) << 8) | " \
+                                   "static_cast<uint16_t>(langId[1]))\n"
+        assert capture_list[34] == "                case 0x656e: // en\n"
+        assert capture_list[35] == "                    " \
+                                   +cpp_gen._gen_make_ptr_return_statement("english")
+        assert capture_list[36] == "                case 0x6573: // es\n"
+        assert capture_list[38] == "                default: // unknown language code, use default language\n"
+
+        default_lang, _ = lang_list.get_default_data()
+        assert capture_list[44] == "        "+cpp_gen._gen_make_ptr_return_statement(default_lang)
+        assert capture_list[45] == "    }\n"
+        assert capture_list[52] == "#endif // "+test_obj.def_os_str+"\n"
+
+    def test018_gen_function_no_regex_duplicate_code(self, mocker):
+        """!
+        @brief Test gen_function without std::regex, duplicate and invalid language codes
+        """
+        lang_list = LanguageDescriptionList(test_json_list)
+        lang_data = {'english': ('en', ['US']), 'british': ('en', ['GB']), 'klingon': ('TLH', ['XX'])}
+        mocker.patch.object(lang_list, 'get_language_list', return_value=['english', 'british', 'klingon'])
+        mocker.patch.object(lang_list, 'get_language_data', side_effect=lambda name: lang_data[name])
+        test_obj = LinuxLangSelectFunctionGenerator(self.langfile_setup(mocker, lang_list), False)
+
+        capture_list = test_obj.gen_function()
+        case_lines = [line for line in capture_list if line.strip().startswith("case ")]
+        assert case_lines == ["                case 0x656e: // en\n"]
+
+    def test019_gen_unit_test_no_regex(self, mocker):
+        """!
+        @brief Test gen_unit_test without std::regex adds the malformed LANG value tests
+        """
+        lang_list = LanguageDescriptionList(test_json_list)
+        regex_obj = LinuxLangSelectFunctionGenerator(self.langfile_setup(mocker, lang_list))
+        test_obj = LinuxLangSelectFunctionGenerator(self.langfile_setup(mocker, lang_list), False)
+        regex_list = regex_obj.gen_unit_test("get_iso_code")
+        text_list = test_obj.gen_unit_test("get_iso_code")
+
+        # The regex tests are all kept
+        assert text_list[:424] == regex_list[:424]
+        assert text_list[-1] == regex_list[-1]
+
+        _, default_iso_code = lang_list.get_default_data()
+        expected = test_obj._gen_unittest_test("NoCodesetDefaultSelection", "xx_XX",
+                                               default_iso_code, "get_iso_code")
+        assert text_list[424] == "\n"
+        assert text_list[425:425+len(expected)] == expected
+        assert len(text_list) == 425 + (3 * (len(expected)+1))
+
 # pylint: enable=protected-access
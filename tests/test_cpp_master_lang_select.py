@@ -277,3 +277,29 @@ class TestClass01MasterLangSelect:
         assert text_list[index+6] == "    EXPECT_STREQ(localStringParser->get_iso_code()." \
                                      "c_str(), test_var->get_iso_code().c_str());\n"
         assert text_list[index+7] == "} // end of "+test_obj.select_function_name+"()\n"
+
+    def test010_gen_unit_test_cached(self, mocker):
+        """!
+        @brief Test gen_unit_test with cached instances
+        """
+        os_lang_selectors = [LinuxLangSelectFunctionGenerator(self.default_setup(mocker)),
+                           WindowsLangSelectFunctionGenerator(self.default_setup(mocker))]
+        test_obj = MasterSelectFunctionGenerator(self.default_setup(mocker))
+        base_list = test_obj.gen_unit_test("get_iso_code", os_lang_selectors)
+        test_obj.cached_instances = True
+        text_list = test_obj.gen_unit_test("get_iso_code", os_lang_selectors)
+
+        expected = test_obj.gen_cached_unit_test()
+        assert text_list[:len(base_list)] == base_list
+        assert text_list[len(base_list)] == "\n"
+        assert text_list[len(base_list)+1:] == expected
+
+        assert len(expected) == 11
+        assert expected[4] == "TEST(SelectFunction, TestLocalSelectCachedInstance)\n"
+        assert expected[5] == "{\n"
+        assert expected[7] == "    "+test_obj.base_intf_ret_ptr_type+" first_var = " \
+                              +test_obj.select_function_name+"();\n"
+        assert expected[8] == "    "+test_obj.base_intf_ret_ptr_type+" second_var = " \
+                              +test_obj.select_function_name+"();\n"
+        assert expected[9] == "    EXPECT_EQ(first_var.get(), second_var.get());\n"
+        assert expected[10] == "} // end of "+test_obj.select_function_name+"()\n"
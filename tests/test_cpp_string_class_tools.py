@@ -105,6 +105,17 @@ class TestClass01StringClass:
         assert test_obj._gen_make_ptr_return_statement() == exp_ret1
         assert test_obj._gen_make_ptr_return_statement("oompa") == exp_ret2
 
+    def test005_gen_make_ptr_return_statement_cached(self):
+        """!
+        @brief Test _gen_make_ptr_return_statement with cached instances
+        """
+        test_obj = BaseCppStringClassGenerator()
+        test_obj.cached_instances = True
+        exp_ret1 = "return getCachedBaseClassInstance<BaseClass>();\n"
+        exp_ret2 = "return getCachedBaseClassInstance<BaseClassOompa>();\n"
+        assert test_obj._gen_make_ptr_return_statement() == exp_ret1
+        assert test_obj._gen_make_ptr_return_statement("oompa") == exp_ret2
+
     def test006_generate_file_header(self):
         """!
         @brief Test _generate_file_header
@@ -165,6 +176,14 @@ class TestClass01StringClass:
         expected = test_obj.base_class_name+"telerite".capitalize()+"_test"
         assert test_obj.gen_unittest_target_name("telerite") == expected
 
+    def test010a_generate_combined_unittest_names(self):
+        """!
+        @brief Test gen_unittest_main_fname and gen_combined_unittest_target_name
+        """
+        test_obj = BaseCppStringClassGenerator()
+        assert test_obj.gen_unittest_main_fname() == test_obj.base_class_name+"Languages_test_main.cpp"
+        assert test_obj.gen_combined_unittest_target_name() == test_obj.base_class_name+"Languages_test"
+
     def test011_generate_mock_h_file_name(self):
         """!
         @brief Test gen_mock_h_fname
@@ -398,4 +417,155 @@ class TestClass01StringClass:
         assert len(str_list) == 1
         assert str_list[0] == expected_mock
 
+    def test022_generate_typed_property_unittest(self):
+        """!
+        @brief Test generate_typed_property_unittest, text and number values
+        """
+        test_obj = BaseCppStringClassGenerator()
+        return_dict = ParamRetDict.build_return_dict_with_mod("string", "Return", 0)
+        code_txt = test_obj.generate_typed_property_unittest("getCode", "Suite", "Table",
+                                                             return_dict, [], True)
+        assert code_txt == ["TYPED_TEST(Suite, fetchgetCode)\n",
+                            "{\n",
+                            "    TypeParam testvar;\n",
+                            "    std::string output = testvar.getCode();\n",
+                            "    EXPECT_STREQ(Table<TypeParam>::getCode, output.c_str());\n",
+                            "}\n"]
+
+        return_dict = ParamRetDict.build_return_dict_with_mod("integer", "Return", 0)
+        code_txt = test_obj.generate_typed_property_unittest("getId", "Suite", "Table",
+                                                             return_dict, ["3"])
+        assert code_txt[3] == "    int output = testvar.getId(3);\n"
+        assert code_txt[4] == "    EXPECT_EQ(Table<TypeParam>::getId, output);\n"
+
+    def test023_generate_typed_property_unittest_list(self):
+        """!
+        @brief Test generate_typed_property_unittest, list values
+        """
+        test_obj = BaseCppStringClassGenerator()
+        return_dict = ParamRetDict.build_return_dict_with_mod("string", "Return",
+                                                              ParamRetDict.type_mod_list)
+        code_txt = test_obj.generate_typed_property_unittest("getList", "Suite", "Table",
+                                                             return_dict, [], True)
+        assert len(code_txt) == 13
+        assert code_txt[3] == "    std::list<std::string> output = testvar.getList();\n"
+        assert code_txt[4] == "    const auto& expected = Table<TypeParam>::getList;\n"
+        assert code_txt[5] == "    ASSERT_EQ(expected.size(), output.size());\n"
+        assert code_txt[9] == "        EXPECT_STREQ(*expected_item, item.c_str());\n"
+
+        return_dict = ParamRetDict.build_return_dict_with_mod("integer", "Return",
+                                                              ParamRetDict.type_mod_list)
+        code_txt = test_obj.generate_typed_property_unittest("getList", "Suite", "Table",
+                                                             return_dict, [])
+        assert code_txt[9] == "        EXPECT_EQ(*expected_item, item);\n"
+
+    def test024_generate_typed_translate_unittest(self):
+        """!
+        @brief Test generate_typed_translate_unittest
+        """
+        test_obj = BaseCppStringClassGenerator()
+        return_dict = ParamRetDict.build_return_dict_with_mod("string", "Return", 0)
+        code_txt = test_obj.generate_typed_translate_unittest("getMsg", "Suite", "Table",
+                                                              return_dict, ['"key"', "3"])
+        assert code_txt == ["TYPED_TEST(Suite, printgetMsg)\n",
+                            "{\n",
+                            "    TypeParam testvar;\n",
+                            '    std::string output = testvar.getMsg("key", 3);\n',
+                            "    EXPECT_STREQ(Table<TypeParam>::getMsg, output.c_str());\n",
+                            "}\n"]
+
+    def test025_generate_typed_unittest_names(self):
+        """!
+        @brief Test gen_typed_unittest_fname and gen_typed_unittest_target_name
+        """
+        test_obj = BaseCppStringClassGenerator()
+        assert test_obj.gen_typed_unittest_fname() == test_obj.base_class_name+"Languages_typed_test.cpp"
+        assert test_obj.gen_typed_unittest_target_name() == test_obj.base_class_name+"Languages_typed_test"
+
+    def test026_gen_cached_instance_function(self):
+        """!
+        @brief Test gen_cached_instance_function
+        """
+        test_obj = BaseCppStringClassGenerator()
+        code_list = test_obj.gen_cached_instance_function()
+        assert code_list[-6:] == ["template <class LangClass>\n",
+                                  "static std::shared_ptr<BaseClass> getCachedBaseClassInstance()\n",
+                                  "{\n",
+                                  "    static const std::shared_ptr<BaseClass> instance = "
+                                  "std::make_shared<LangClass>();\n",
+                                  "    return instance;\n",
+                                  "}\n"]
+        assert code_list[0] == "/**\n"
+        assert " */\n" in code_list
+
+    def test027_generate_string_view_unittests(self):
+        """!
+        @brief Test generate_translate_unittest and generate_typed_translate_unittest
+               with a std::string_view return
+        """
+        test_obj = BaseCppStringClassGenerator()
+        return_dict = ParamRetDict.build_return_dict_with_mod("stringview", "Return", 0)
+        code_txt = test_obj.generate_translate_unittest("getMsg", "Suite", return_dict,
+                                                        "Message text", [])
+        assert code_txt == ["TEST(Suite, printgetMsg)\n",
+                            "{\n",
+                            "    Suite testvar;\n",
+                            "    std::string_view output = testvar.getMsg();\n",
+                            '    EXPECT_EQ(std::string_view("Message text"), output);\n',
+                            "}\n"]
+
+        code_txt = test_obj.generate_typed_translate_unittest("getMsg", "Suite", "Table",
+                                                              return_dict, [])
+        assert code_txt == ["TYPED_TEST(Suite, printgetMsg)\n",
+                            "{\n",
+                            "    TypeParam testvar;\n",
+                            "    std::string_view output = testvar.getMsg();\n",
+                            "    EXPECT_EQ(std::string_view(Table<TypeParam>::getMsg), output);\n",
+                            "}\n"]
+
+    def test028_gen_span_ret_dict(self):
+        """!
+        @brief Test gen_span_ret_dict and is_span_return
+        """
+        test_obj = BaseCppStringClassGenerator()
+        list_mod = ParamRetDict.type_mod_list
+        return_dict = ParamRetDict.build_return_dict_with_mod("string", "Return", list_mod)
+        span_dict = test_obj.gen_span_ret_dict(return_dict, True)
+        assert span_dict == ParamRetDict.build_return_dict_with_mod("std::span<const std::string_view>",
+                                                                    "Return", 0)
+        assert test_obj.is_span_return(span_dict)
+        assert not test_obj.is_span_return(return_dict)
+
+        return_dict = ParamRetDict.build_return_dict_with_mod("LANGID", "Return", list_mod)
+        span_dict = test_obj.gen_span_ret_dict(return_dict, False)
+        assert ParamRetDict.get_return_type(span_dict) == "std::span<const LANGID>"
+
+    def test029_generate_span_property_unittests(self):
+        """!
+        @brief Test generate_property_unittest and generate_typed_property_unittest
+               with a std::span return
+        """
+        test_obj = BaseCppStringClassGenerator()
+        return_dict = ParamRetDict.build_return_dict_with_mod("std::span<const std::string_view>", "Return")
+        code_txt = test_obj.generate_property_unittest("getList", "Suite", return_dict,
+                                                       ["US", "GB"], [], True)
+        assert code_txt == ["TEST(Suite, fetchgetList)\n",
+                            "{\n",
+                            "    Suite testvar;\n",
+                            "    std::span<const std::string_view> output = testvar.getList();\n",
+                            "    ASSERT_EQ(2u, output.size());\n",
+                            '    EXPECT_EQ(std::string_view("US"), output[0]);\n',
+                            '    EXPECT_EQ(std::string_view("GB"), output[1]);\n',
+                            "}\n"]
+
+        code_txt = test_obj.generate_typed_property_unittest("getList", "Suite", "Table",
+                                                             return_dict, [], True)
+        assert len(code_txt) == 13
+        assert code_txt[5] == "    ASSERT_EQ(expected.size(), output.size());\n"
+        assert code_txt[9] == "        EXPECT_EQ(std::string_view(*expected_item), item);\n"
+
+        return_dict = ParamRetDict.build_return_dict_with_mod("std::span<const LANGID>", "Return")
+        code_txt = test_obj.generate_property_unittest("getList", "Suite", return_dict, [1033], [])
+        assert code_txt[5] == "    EXPECT_EQ(1033, output[0]);\n"
+
 # pylint: enable=protected-access
@@ -404,4 +404,87 @@ class TestClass01WindowsLangSelect:
         assert cpp_name == "LocalLanguageSelect_Windows_test.cpp"
         assert target_name == "LocalLanguageSelect_Windows"
 
+    def shared_primary_setup(self, mocker, tmp_path):
+        """!
+        @brief Setup for the tests with two languages sharing a primary LANGID
+        """
+        lang_list = LanguageDescriptionList(str(tmp_path / "sharedlang.json"))
+        lang_list.clear()
+        lang_list.add_language("english", "en", ["US"], [0x09], [0x0409], "en", "ENGLISH_ERRORS")
+        lang_list.add_language("chinese", "zh", ["CN"], [0x04], [0x0804], "zh", "CHINESE_ERRORS")
+        lang_list.add_language("taiwanese", "zh", ["TW"], [0x04], [0x0404], "tw", "TAIWANESE_ERRORS")
+        lang_list.set_default("english")
+        return self.langfile_setup(mocker, lang_list)
+
+    def test015_gen_function_langid_table(self, mocker):
+        """!
+        @brief Test gen_function, full LANGID table lookup
+        """
+        cpp_gen = BaseCppStringClassGenerator()
+        lang_list = LanguageDescriptionList(test_json_list)
+        test_obj = WindowsLangSelectFunctionGenerator(self.langfile_setup(mocker, lang_list), True)
+        assert test_obj.langid_table
+
+        capture_list = test_obj.gen_function()
+        assert capture_list[1] == cpp_gen.gen_include("<windows.h>")
+        assert capture_list[2] == cpp_gen.gen_include("<algorithm>")
+        assert capture_list[3] == cpp_gen.gen_include("<cstdint>")
+        assert capture_list[4] == cpp_gen.gen_include("<iterator>")
+
+        region_list = []
+        for lang_name in lang_list.get_language_list():
+            _, lang_regions = lang_list.get_langid_data(lang_name)
+            region_list.extend(lang_regions)
+        table_line = "    static constexpr LANGID langIdTable[] = {"
+        table_line += ", ".join(hex(lang_id) for lang_id in sorted(region_list))+"};\n"
+        assert table_line in capture_list
+        assert "    const LANGID* found = std::lower_bound(std::begin(langIdTable), std::end(langIdTable), " \
+               "lang_id);\n" in capture_list
+        assert "            case 0: // english\n" in capture_list
+
+        # The primary language switch is the fallback
+        switch_index = capture_list.index("    switch(lang_id & 0x0FF)\n")
+        assert capture_list.index("    if ((found != std::end(langIdTable)) && (*found == lang_id))\n") \
+               < switch_index
+
+    def test016_gen_function_langid_table_shared_primary(self, mocker, tmp_path):
+        """!
+        @brief Test gen_function, full LANGID table with a shared primary LANGID
+        """
+        cpp_gen = BaseCppStringClassGenerator()
+        test_obj = WindowsLangSelectFunctionGenerator(self.shared_primary_setup(mocker, tmp_path), True)
+        capture_list = test_obj.gen_function()
+
+        assert "    static constexpr LANGID langIdTable[] = {0x404, 0x409, 0x804};\n" in capture_list
+        assert "    static constexpr uint16_t langIndexTable[] = {2, 0, 1};\n" in capture_list
+        assert "            case 2: // taiwanese\n" in capture_list
+        assert capture_list.count("        case 0x4:\n") == 1
+        case_index = capture_list.index("        case 0x4:\n")
+        assert capture_list[case_index+1] == "            "+cpp_gen._gen_make_ptr_return_statement("chinese")
+
+    def test017_gen_unit_test_langid_table(self, mocker, tmp_path):
+        """!
+        @brief Test gen_unit_test, full LANGID table region expectations
+        """
+        test_obj = WindowsLangSelectFunctionGenerator(self.shared_primary_setup(mocker, tmp_path), True)
+        text_list = test_obj.gen_unit_test("get_iso_code")
+
+        expected = test_obj._gen_unittest_test("Taiwanese_1028_Selection", 0x0404, "tw", "get_iso_code")
+        index = text_list.index(expected[4])-4
+        assert text_list[index:index+len(expected)] == expected
+
+        # Unknown regions fall back to the primary LANGID owner
+        expected = test_obj._gen_unittest_test("Taiwanese_unknown_region_004_Selection", 0x04, "zh",
+                                               "get_iso_code")
+        index = text_list.index(expected[4])-4
+        assert text_list[index:index+len(expected)] == expected
+
+        # Without the table the listed language is expected
+        test_obj = WindowsLangSelectFunctionGenerator(self.shared_primary_setup(mocker, tmp_path))
+        text_list = test_obj.gen_unit_test("get_iso_code")
+        expected = test_obj._gen_unittest_test("Taiwanese_unknown_region_004_Selection", 0x04, "tw",
+                                               "get_iso_code")
+        index = text_list.index(expected[4])-4
+        assert text_list[index:index+len(expected)] == expected
+
 # pylint: enable=protected-access
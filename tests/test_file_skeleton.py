@@ -0,0 +1,162 @@
+"""@package test_programmer_tools
+Unittest for the file skeleton stamping utility
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+from code_tools_grocsoftware.cpp_gen.file_skeleton import FileSkeleton
+
+# pylint: disable=too-few-public-methods
+
+class MockFile:
+    """!
+    @brief Mock file object for testing
+    """
+    def __init__(self):
+        self.mock_calls = []
+        self.writedata = []
+
+    def writelines(self, lines):
+        """!
+        @brief Mock writelines method
+        """
+        self.mock_calls.append(('writelines', ""))
+        self.writedata.extend(lines)
+
+# pylint: enable=too-few-public-methods
+
+def test001_slot_marker():
+    """!
+    @brief Test slot_marker
+    """
+    assert FileSkeleton.slot_marker("class_name") == "@class_name@"
+
+def test002_static_text():
+    """!
+    @brief Test stamp with only static text segments
+    """
+    skeleton = FileSkeleton()
+    skeleton.writelines(["line1\n", "line2\n"])
+    skeleton.writelines(["\n"])
+
+    mock_file = MockFile()
+    skeleton.stamp(mock_file, {})
+    assert len(mock_file.mock_calls) == 2
+    assert mock_file.writedata == ["line1\n", "line2\n", "\n"]
+
+def test003_block_slot():
+    """!
+    @brief Test stamp with a block slot, one write per slot entry
+    """
+    skeleton = FileSkeleton()
+    skeleton.writelines(["start\n"])
+    skeleton.add_slot("body")
+    skeleton.writelines(["end\n"])
+
+    mock_file = MockFile()
+    skeleton.stamp(mock_file, {"body": [["{\n"], ["    a;\n", "    b;\n"], ["}\n"]]})
+    assert len(mock_file.mock_calls) == 5
+    assert mock_file.writedata == ["start\n", "{\n", "    a;\n", "    b;\n", "}\n", "end\n"]
+
+    mock_file = MockFile()
+    skeleton.stamp(mock_file, {"body": []})
+    assert len(mock_file.mock_calls) == 2
+    assert mock_file.writedata == ["start\n", "end\n"]
+
+def test004_stamped_text():
+    """!
+    @brief Test stamp with inline slot markers
+    """
+    marker = FileSkeleton.slot_marker("class_name")
+    skeleton = FileSkeleton()
+    skeleton.add_stamped_text(["/** @brief test */\n",
+                               "int "+marker+"::get() const\n",
+                               marker+" "+marker+"\n"], "class_name")
+
+    mock_file = MockFile()
+    skeleton.stamp(mock_file, {"class_name": "Foo"})
+    assert len(mock_file.mock_calls) == 1
+    assert mock_file.writedata == ["/** @brief test */\n", "int Foo::get() const\n", "Foo Foo\n"]
+
+    mock_file = MockFile()
+    skeleton.stamp(mock_file, {"class_name": "Bar"})
+    assert mock_file.writedata == ["/** @brief test */\n", "int Bar::get() const\n", "Bar Bar\n"]
+
+def test005_source_list_copied():
+    """!
+    @brief Test writelines keeps a copy of the rendered text
+    """
+    text = ["line1\n"]
+    skeleton = FileSkeleton()
+    skeleton.writelines(text)
+    text.append("line2\n")
+
+    mock_file = MockFile()
+    skeleton.stamp(mock_file, {})
+    assert mock_file.writedata == ["line1\n"]
+
+def test006_skip_groups():
+    """!
+    @brief Test stamp leaving out named segment groups
+    """
+    skeleton = FileSkeleton()
+    skeleton.writelines(["start\n"])
+    skeleton.begin_group("first")
+    skeleton.writelines(["first\n"])
+    skeleton.add_slot("body")
+    skeleton.end_group("first")
+    skeleton.begin_group("second")
+    skeleton.writelines(["second\n"])
+    skeleton.end_group("second")
+    skeleton.writelines(["end\n"])
+    assert skeleton.groups == {"first": (1, 3), "second": (3, 4)}
+
+    mock_file = MockFile()
+    skeleton.stamp(mock_file, {"body": [["body\n"]]})
+    assert mock_file.writedata == ["start\n", "first\n", "body\n", "second\n", "end\n"]
+
+    mock_file = MockFile()
+    skeleton.stamp(mock_file, {}, ["first"])
+    assert mock_file.writedata == ["start\n", "second\n", "end\n"]
+
+    mock_file = MockFile()
+    skeleton.stamp(mock_file, {}, ["first", "second"])
+    assert mock_file.writedata == ["start\n", "end\n"]
+
+def test007_stamp_group():
+    """!
+    @brief Test stamp_group writes only the group segments
+    """
+    marker = FileSkeleton.slot_marker("class_name")
+    skeleton = FileSkeleton()
+    skeleton.writelines(["start\n"])
+    skeleton.begin_group("method")
+    skeleton.add_stamped_text(["int "+marker+"::get() const\n"], "class_name")
+    skeleton.add_slot("body")
+    skeleton.end_group("method")
+    skeleton.writelines(["end\n"])
+
+    mock_file = MockFile()
+    skeleton.stamp_group(mock_file, "method", {"class_name": "Foo", "body": [["{\n", "}\n"]]})
+    assert len(mock_file.mock_calls) == 2
+    assert mock_file.writedata == ["int Foo::get() const\n", "{\n", "}\n"]
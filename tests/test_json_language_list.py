@@ -1282,4 +1282,41 @@ class Test02JsonLanguageListInput:
             expected = "Enter Windows LANGID values. A value of 0 will exit.\n"
             assert output.getvalue() == expected
 
+    def test20_select_languages(self):
+        """!
+        @brief Test select_languages() method, select by language name
+        """
+        testobj = LanguageDescriptionList(os.path.join(TESTFILEPATH, "teststringlanglist.json"))
+        assert testobj.select_languages(["Spanish"])
+        assert testobj.get_language_list() == ['spanish']
+        assert testobj.get_default_data() == ('spanish', 'es')
+
+    def test21_select_languages_compile_switch(self):
+        """!
+        @brief Test select_languages() method, select by compile switch, default not selected
+        """
+        testobj = LanguageDescriptionList(os.path.join(TESTFILEPATH, "teststringlanglist.json"))
+        assert testobj.get_default_data() == ('spanish', 'es')
+        assert testobj.select_languages(["ENGLISH_ERRORS", "english"])
+        assert testobj.get_language_list() == ['english']
+        assert testobj.get_default_data() == ('english', 'en')
+
+    def test22_select_languages_invalid(self):
+        """!
+        @brief Test select_languages() method, unknown entry and empty selection
+        """
+        testobj = LanguageDescriptionList(os.path.join(TESTFILEPATH, "teststringlanglist.json"))
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            assert not testobj.select_languages(["klingon"])
+        assert output.getvalue() == "Error: Unknown language subset entry: klingon\n"
+        assert testobj.get_language_list() == ['english', 'spanish']
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            assert not testobj.select_languages([])
+        assert output.getvalue() == "Error: The language subset must select at least one language.\n"
+        assert testobj.get_language_list() == ['english', 'spanish']
+
 # pylint: enable=protected-access
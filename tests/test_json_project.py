@@ -623,3 +623,101 @@ def test040_get_description():
 
     test_obj.set_description("This is another test project.")
     assert test_obj.get_description() == "This is another test project."
+
+def test041_language_subset():
+    """!
+    @brief Test get_language_subset, set_language_subset and the get_lang_data subset
+    """
+    test_obj = ProjectDescription()
+    test_obj.set_lang_data_name(test_json_lang)
+    assert test_obj.get_language_subset() is None
+    assert test_obj.get_lang_data().get_language_list() == ['english', 'spanish']
+
+    test_obj.set_language_subset(['ENGLISH_ERRORS'])
+    assert test_obj.get_language_subset() == ['ENGLISH_ERRORS']
+    lang_data = test_obj.get_lang_data()
+    assert lang_data.get_language_list() == ['english']
+    assert lang_data.get_default_data() == ('english', 'en')
+
+    lang_data = test_obj.get_lang_data(apply_subset=False)
+    assert lang_data.get_language_list() == ['english', 'spanish']
+
+    test_obj.set_language_subset()
+    assert test_obj.get_language_subset() is None
+
+def test042_language_subset_invalid():
+    """!
+    @brief Test get_lang_data with an unknown language subset entry
+    """
+    test_obj = ProjectDescription()
+    test_obj.set_lang_data_name(test_json_lang)
+    test_obj.set_language_subset(['klingon'])
+    with pytest.raises(ValueError):
+        test_obj.get_lang_data()
+
+def test043_data_cache():
+    """!
+    @brief Test enable_data_cache shares the loaded language and string data
+    """
+    test_obj = ProjectDescription()
+    test_obj.set_lang_data_name(test_json_lang)
+    test_obj.set_string_data_name(test_json_string)
+    assert test_obj.data_cache is None
+    assert test_obj.get_lang_data() is not test_obj.get_lang_data()
+    assert test_obj.get_string_data() is not test_obj.get_string_data()
+
+    test_obj.enable_data_cache()
+    lang_data = test_obj.get_lang_data()
+    string_data = test_obj.get_string_data()
+    assert test_obj.get_lang_data() is lang_data
+    assert test_obj.get_lang_data(apply_subset=False) is lang_data
+    assert test_obj.get_string_data() is string_data
+
+    # The language subset is part of the cache key
+    test_obj.set_language_subset(['ENGLISH_ERRORS'])
+    subset_data = test_obj.get_lang_data()
+    assert subset_data.get_language_list() == ['english']
+    assert test_obj.get_lang_data() is subset_data
+    assert test_obj.get_lang_data(apply_subset=False) is lang_data
+    assert lang_data.get_language_list() == ['english', 'spanish']
+
+    header_cache = test_obj.get_header_cache()
+    assert header_cache == {}
+    assert test_obj.get_header_cache() is header_cache
+
+    test_obj.enable_data_cache(False)
+    assert test_obj.data_cache is None
+    assert test_obj.get_string_data() is not test_obj.get_string_data()
+    assert test_obj.get_header_cache() is None
+
+def test044_shared_data_cache():
+    """!
+    @brief Test project descriptions sharing one data cache and the string model cache
+    """
+    shared_cache = {}
+    project_list = []
+    for _ in range(2):
+        test_obj = ProjectDescription()
+        test_obj.set_lang_data_name(test_json_lang)
+        test_obj.set_string_data_name(test_json_string)
+        test_obj.enable_data_cache(shared_cache=shared_cache)
+        project_list.append(test_obj)
+
+    first, second = project_list
+    assert first.data_cache is second.data_cache
+    lang_data = first.get_lang_data()
+    string_data = first.get_string_data()
+    assert second.get_lang_data() is lang_data
+    assert second.get_string_data() is string_data
+
+    string_model = first.get_string_model(lang_data, string_data)
+    assert second.get_string_model(lang_data, string_data) is string_model
+    other_model = second.get_string_model(LanguageDescriptionList(test_json_lang), string_data)
+    assert other_model is not string_model
+    assert second.get_header_cache() is first.get_header_cache()
+
+    second.set_string_data_name(test_json_property)
+    assert second.get_string_data() is not string_data
+
+    test_obj = ProjectDescription()
+    assert test_obj.get_string_model(lang_data, string_data) is not string_model
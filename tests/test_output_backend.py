@@ -0,0 +1,407 @@
+"""@package test_programmer_tools
+Unittest for the generated file output backends
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+import hashlib
+import os
+from unittest.mock import patch, mock_open
+
+import pytest
+
+from code_tools_grocsoftware.base.code_emitter import HashSink
+from code_tools_grocsoftware.base.output_backend import DiskOutputBackend, MemoryFile
+from code_tools_grocsoftware.base.output_backend import MemoryOutputBackend, HashOutputBackend
+from code_tools_grocsoftware.base.output_backend import StagedOutputBackend, VirtualOutputBackend
+
+def test001_disk_backend():
+    """!
+    @brief Test the DiskOutputBackend file system calls
+    """
+    backend = DiskOutputBackend()
+    with patch('os.path.exists') as path_exists:
+        path_exists.return_value = True
+        assert backend.exists("testdir")
+        path_exists.assert_called_once_with("testdir")
+
+    with patch('os.mkdir') as os_mkdir:
+        backend.make_dir("testdir")
+        os_mkdir.assert_called_once_with("testdir")
+
+    with patch('builtins.open', mock_open()) as mocked_file:
+        backend.open_file("testdir/test.cpp")
+        mocked_file.assert_called_once_with("testdir/test.cpp", mode='wt', encoding="utf-8")
+
+def test002_memory_file():
+    """!
+    @brief Test MemoryFile keeps the text after close
+    """
+    outfile = MemoryFile()
+    outfile.writelines(["line1\n", "line2\n"])
+    assert outfile.get_text() == "line1\nline2\n"
+    outfile.close()
+    assert outfile.get_text() == "line1\nline2\n"
+    outfile.close()
+    assert outfile.get_text() == "line1\nline2\n"
+    assert outfile.hexdigest() == hashlib.sha256("line1\nline2\n".encode("utf-8")).hexdigest()
+
+def test003_memory_backend():
+    """!
+    @brief Test the MemoryOutputBackend
+    """
+    backend = MemoryOutputBackend()
+    assert not backend.exists("virtual_dir_name")
+    backend.make_dir("virtual_dir_name")
+    assert backend.exists("virtual_dir_name")
+    assert backend.exists(".")
+    assert not os.path.exists("virtual_dir_name")
+
+    outfile = backend.open_file("virtual_dir_name/b.txt")
+    outfile.writelines(["text b\n"])
+    backend.open_file("virtual_dir_name/a.txt").write("text a\n")
+
+    assert backend.exists("virtual_dir_name/a.txt")
+    assert backend.get_file_names() == ["virtual_dir_name/a.txt", "virtual_dir_name/b.txt"]
+    assert backend.get_text("virtual_dir_name/b.txt") == "text b\n"
+    assert backend.get_digest("virtual_dir_name/a.txt") == \
+           hashlib.sha256("text a\n".encode("utf-8")).hexdigest()
+
+def test004_hash_backend():
+    """!
+    @brief Test the HashOutputBackend
+    """
+    backend = HashOutputBackend()
+    outfile = backend.open_file("virtual_dir_name/a.txt")
+    assert isinstance(outfile, HashSink)
+    outfile.writelines(["text a\n"])
+    outfile.close()
+
+    assert backend.get_file_names() == ["virtual_dir_name/a.txt"]
+    assert backend.get_digest("virtual_dir_name/a.txt") == \
+           hashlib.sha256("text a\n".encode("utf-8")).hexdigest()
+    assert not hasattr(backend, "get_text")
+    assert isinstance(backend, VirtualOutputBackend)
+    assert not isinstance(backend, MemoryOutputBackend)
+
+@pytest.mark.parametrize("backend_class", [MemoryOutputBackend, HashOutputBackend])
+def test005_changed_files(tmp_path, backend_class):
+    """!
+    @brief Test get_changed_files against the files on disk
+    """
+    same_name = str(tmp_path / "same.txt")
+    changed_name = str(tmp_path / "changed.txt")
+    new_name = str(tmp_path / "new.txt")
+    with open(same_name, 'wt', encoding="utf-8") as disk_file:
+        disk_file.write("same text\n")
+    with open(changed_name, 'wt', encoding="utf-8") as disk_file:
+        disk_file.write("old text\n")
+
+    backend = backend_class()
+    backend.open_file(same_name).writelines(["same text\n"])
+    backend.open_file(changed_name).writelines(["new text\n"])
+    backend.open_file(new_name).writelines(["new file\n"])
+
+    assert backend.get_changed_files() == [(changed_name, "changed"), (new_name, "new")]
+    assert not os.path.exists(new_name)
+    with open(changed_name, 'rt', encoding="utf-8") as disk_file:
+        assert disk_file.read() == "old text\n"
+
+def test006_staged_backend_commit(tmp_path):
+    """!
+    @brief Test StagedOutputBackend only publishes the files on commit
+    """
+    target_a = str(tmp_path / "a.txt")
+    target_b = str(tmp_path / "sub" / "b.txt")
+    with open(target_a, 'wt', encoding="utf-8") as disk_file:
+        disk_file.write("old a\n")
+
+    backend = StagedOutputBackend(str(tmp_path))
+    assert backend.exists(str(tmp_path))
+    backend.make_dir(str(tmp_path / "sub"))
+    assert backend.exists(str(tmp_path / "sub"))
+    assert not os.path.exists(str(tmp_path / "sub"))
+
+    backend.open_file(target_a).writelines(["new a\n"])
+    outfile = backend.open_file(target_b)
+    outfile.writelines(["new b\n"])
+    outfile.close()
+
+    assert os.path.isdir(backend.stage_dir)
+    assert backend.get_file_names() == [target_a, target_b]
+    with open(target_a, 'rt', encoding="utf-8") as disk_file:
+        assert disk_file.read() == "old a\n"
+    assert not os.path.exists(target_b)
+
+    assert backend.commit()
+    with open(target_a, 'rt', encoding="utf-8") as disk_file:
+        assert disk_file.read() == "new a\n"
+    with open(target_b, 'rt', encoding="utf-8") as disk_file:
+        assert disk_file.read() == "new b\n"
+    assert sorted(os.listdir(str(tmp_path))) == ["a.txt", "sub"]
+    assert backend.stage_dir is None
+    assert not backend.staged
+    assert not backend.staged_dirs
+
+def test007_staged_backend_abort(tmp_path):
+    """!
+    @brief Test StagedOutputBackend abort discards the staged files
+    """
+    target_a = str(tmp_path / "a.txt")
+    backend = StagedOutputBackend(str(tmp_path))
+    backend.abort()
+
+    backend.open_file(target_a).writelines(["first\n"])
+    backend.open_file(target_a).writelines(["second\n"])
+    assert backend.get_file_names() == [target_a]
+    backend.abort()
+
+    assert not os.listdir(str(tmp_path))
+    assert backend.stage_dir is None
+
+def test008_staged_backend_commit_fail(tmp_path, capsys):
+    """!
+    @brief Test StagedOutputBackend commit rename failure
+    """
+    target_a = str(tmp_path / "a.txt")
+    backend = StagedOutputBackend(str(tmp_path))
+    backend.open_file(target_a).writelines(["new a\n"])
+
+    with patch('os.replace') as os_replace:
+        os_replace.side_effect = OSError("mock error")
+        assert not backend.commit()
+
+    output = capsys.readouterr()
+    assert output.out == "Failed to commit the staged output files: mock error\n"
+    assert not os.listdir(str(tmp_path))
+
+def test009_staged_backend_fsync(tmp_path):
+    """!
+    @brief Test StagedOutputBackend syncs the staged files and the updated directories
+    """
+    target_a = str(tmp_path / "a.txt")
+    target_b = str(tmp_path / "sub" / "b.txt")
+    backend = StagedOutputBackend(str(tmp_path))
+    backend.make_dir(str(tmp_path / "sub"))
+    backend.open_file(target_a).writelines(["new a\n"])
+    backend.open_file(target_b).writelines(["new b\n"])
+
+    with patch('os.sync') as os_sync, patch('os.fsync') as os_fsync:
+        assert backend.commit()
+        os_sync.assert_not_called()
+        # Two staged files, the new tree and sub directories and the base parent directory
+        assert os_fsync.call_count == 5
+    with open(target_a, 'rt', encoding="utf-8") as disk_file:
+        assert disk_file.read() == "new a\n"
+
+def test010_staged_backend_incremental(tmp_path):
+    """!
+    @brief Test StagedOutputBackend incremental commit keeps the unchanged files
+    """
+    target_a = str(tmp_path / "a.txt")
+    target_b = str(tmp_path / "b.txt")
+    target_c = str(tmp_path / "c.txt")
+    for target, text in [(target_a, "same a\n"), (target_b, "old b\n")]:
+        with open(target, 'wt', encoding="utf-8") as disk_file:
+            disk_file.write(text)
+        os.utime(target, (1000000, 1000000))
+
+    backend = StagedOutputBackend(str(tmp_path), True)
+    backend.open_file(target_a).writelines(["same a\n"])
+    backend.open_file(target_b).writelines(["new b\n"])
+    backend.open_file(target_c).writelines(["new c\n"])
+    assert backend.commit()
+
+    assert backend.unchanged == [target_a]
+    assert os.stat(target_a).st_mtime == 1000000
+    assert os.stat(target_b).st_mtime != 1000000
+    with open(target_b, 'rt', encoding="utf-8") as disk_file:
+        assert disk_file.read() == "new b\n"
+    with open(target_c, 'rt', encoding="utf-8") as disk_file:
+        assert disk_file.read() == "new c\n"
+    assert sorted(os.listdir(str(tmp_path))) == ["a.txt", "b.txt", "c.txt"]
+
+@pytest.mark.parametrize("backend_class", [MemoryOutputBackend, HashOutputBackend])
+def test011_changed_files_raw_bytes(tmp_path, backend_class):
+    """!
+    @brief Test get_changed_files compares the raw file bytes
+    """
+    crlf_name = str(tmp_path / "crlf.txt")
+    latin_name = str(tmp_path / "latin.txt")
+    utf8_name = str(tmp_path / "utf8.txt")
+    with open(crlf_name, 'wb') as disk_file:
+        disk_file.write(b"line 1\r\nline 2\r\n")
+    with open(latin_name, 'wb') as disk_file:
+        disk_file.write("caf\u00e9\n".encode("latin-1"))
+    with open(utf8_name, 'wb') as disk_file:
+        disk_file.write("caf\u00e9\n".encode("utf-8"))
+
+    backend = backend_class()
+    backend.open_file(crlf_name).writelines(["line 1\n", "line 2\n"])
+    backend.open_file(latin_name).writelines(["caf\u00e9\n"])
+    backend.open_file(utf8_name).writelines(["caf\u00e9\n"])
+
+    assert backend.get_changed_files() == [(crlf_name, "changed"), (latin_name, "changed")]
+
+def test012_staged_backend_make_dir(tmp_path):
+    """!
+    @brief Test StagedOutputBackend make_dir errors
+    """
+    backend = StagedOutputBackend(str(tmp_path))
+    with pytest.raises(FileExistsError):
+        backend.make_dir(str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        backend.make_dir(str(tmp_path / "missing" / "sub"))
+
+    backend.make_dir(str(tmp_path / "sub"))
+    backend.make_dir(str(tmp_path / "sub" / "deeper"))
+    with pytest.raises(FileExistsError):
+        backend.make_dir(str(tmp_path / "sub"))
+    backend.abort()
+    assert not backend.exists(str(tmp_path / "sub"))
+    assert not os.listdir(str(tmp_path))
+
+def test013_staged_backend_commit_rollback(tmp_path, capsys):
+    """!
+    @brief Test StagedOutputBackend leaves the output tree unchanged when building the new tree fails
+    """
+    base_dir = tmp_path / "out"
+    base_dir.mkdir()
+    target_a = str(base_dir / "a.txt")
+    target_b = str(base_dir / "sub" / "b.txt")
+    target_c = str(base_dir / "c.txt")
+    for target, text in [(target_a, "old a\n"), (target_c, "old c\n")]:
+        with open(target, 'wt', encoding="utf-8") as disk_file:
+            disk_file.write(text)
+
+    backend = StagedOutputBackend(str(base_dir))
+    backend.make_dir(str(base_dir / "sub"))
+    backend.open_file(target_a).writelines(["new a\n"])
+    backend.open_file(target_b).writelines(["new b\n"])
+    backend.open_file(target_c).writelines(["new c\n"])
+
+    real_replace = os.replace
+    def fail_on_c(src, dst):
+        if os.path.basename(dst) == "c.txt":
+            raise OSError("mock error")
+        real_replace(src, dst)
+
+    with patch('os.replace', side_effect=fail_on_c):
+        assert not backend.commit()
+
+    assert capsys.readouterr().out == "Failed to commit the staged output files: mock error\n"
+    assert sorted(os.listdir(str(base_dir))) == ["a.txt", "c.txt"]
+    for target, text in [(target_a, "old a\n"), (target_c, "old c\n")]:
+        with open(target, 'rt', encoding="utf-8") as disk_file:
+            assert disk_file.read() == text
+    assert backend.stage_dir is None
+    assert os.listdir(str(tmp_path)) == ["out"]
+
+def test014_staged_backend_swap_rollback(tmp_path, capsys):
+    """!
+    @brief Test StagedOutputBackend puts the old tree back when the new tree rename fails
+    """
+    base_dir = tmp_path / "out"
+    base_dir.mkdir()
+    target_a = str(base_dir / "a.txt")
+    with open(target_a, 'wt', encoding="utf-8") as disk_file:
+        disk_file.write("old a\n")
+
+    backend = StagedOutputBackend(str(base_dir))
+    backend.open_file(target_a).writelines(["new a\n"])
+
+    real_rename = os.rename
+    def fail_on_base(src, dst):
+        if (dst == str(base_dir)) and src.endswith("tree"):
+            raise OSError("mock error")
+        real_rename(src, dst)
+
+    with patch('os.rename', side_effect=fail_on_base):
+        assert not backend.commit()
+
+    assert capsys.readouterr().out == "Failed to commit the staged output files: mock error\n"
+    with open(target_a, 'rt', encoding="utf-8") as disk_file:
+        assert disk_file.read() == "old a\n"
+    assert os.listdir(str(tmp_path)) == ["out"]
+
+def test015_staged_backend_tree_swap(tmp_path):
+    """!
+    @brief Test StagedOutputBackend publishes the whole new tree with the directory renames
+    """
+    base_dir = tmp_path / "out"
+    (base_dir / "build").mkdir(parents=True)
+    target_a = str(base_dir / "a.txt")
+    target_b = str(base_dir / "sub" / "b.txt")
+    other_file = str(base_dir / "build" / "a.o")
+    for target, text in [(target_a, "old a\n"), (other_file, "object\n")]:
+        with open(target, 'wt', encoding="utf-8") as disk_file:
+            disk_file.write(text)
+    other_inode = os.stat(other_file).st_ino
+
+    backend = StagedOutputBackend(str(base_dir))
+    backend.make_dir(str(base_dir / "sub"))
+    backend.open_file(target_a).writelines(["new a\n"])
+    backend.open_file(target_b).writelines(["new b\n"])
+    assert os.path.dirname(backend.stage_dir) == str(tmp_path)
+
+    # At the swap the base directory still holds the complete old tree and
+    # the staged tree the complete new tree
+    tree_text = []
+    real_rename = os.rename
+    def check_trees(src, dst):
+        if src == str(base_dir):
+            with open(target_a, 'rt', encoding="utf-8") as disk_file:
+                tree_text.append(disk_file.read())
+            assert not os.path.exists(target_b)
+            new_tree = os.path.join(backend.stage_dir, "tree")
+            for name in ["a.txt", os.path.join("sub", "b.txt"), os.path.join("build", "a.o")]:
+                with open(os.path.join(new_tree, name), 'rt', encoding="utf-8") as disk_file:
+                    tree_text.append(disk_file.read())
+        real_rename(src, dst)
+
+    with patch('os.rename', side_effect=check_trees):
+        assert backend.commit()
+    assert tree_text == ["old a\n", "new a\n", "new b\n", "object\n"]
+
+    with open(target_b, 'rt', encoding="utf-8") as disk_file:
+        assert disk_file.read() == "new b\n"
+    # Files the generator did not write are linked into the new tree
+    assert os.stat(other_file).st_ino == other_inode
+    assert os.listdir(str(tmp_path)) == ["out"]
+
+def test016_staged_backend_outside_base(tmp_path):
+    """!
+    @brief Test StagedOutputBackend rejects paths outside the output base directory
+    """
+    base_dir = tmp_path / "out"
+    base_dir.mkdir()
+    backend = StagedOutputBackend(str(base_dir))
+    with pytest.raises(OSError):
+        backend.open_file(str(tmp_path / "a.txt"))
+    with pytest.raises(OSError):
+        backend.make_dir(str(tmp_path / "sub"))
+    assert backend.stage_dir is None
+
+    # Nothing staged, nothing to swap
+    assert backend.commit()
+    assert os.listdir(str(tmp_path)) == ["out"]
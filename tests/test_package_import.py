@@ -0,0 +1,112 @@
+"""@package test_programmer_tools
+Unittest for the lazy package submodule imports
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import code_tools_grocsoftware.base as base_pkg
+import code_tools_grocsoftware.cpp_gen as cpp_gen_pkg
+
+## Source directory added to the import time subprocess path
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+## Package import time bound in microseconds, the eager imports took about 25000
+PACKAGE_IMPORT_BOUND = 10000
+
+## Wall clock timing tests depend on the machine load and coverage, they only run when
+#  the CODE_TOOLS_TIMING_TESTS environment variable is set
+RUN_TIMING_TESTS = bool(os.environ.get("CODE_TOOLS_TIMING_TESTS"))
+
+def get_import_times(module_name:str)->dict:
+    """!
+    @brief Import a module in a fresh interpreter with python -X importtime
+    @param module_name {string} Module to import
+    @return dictionary - {imported module name: cumulative import microseconds}
+    """
+    environ = dict(os.environ)
+    environ['PYTHONPATH'] = os.path.abspath(SRC_DIR)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import "+module_name],
+                            capture_output=True, text=True, env=environ, check=True)
+    import_times = {}
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if line.startswith("import time:") and fields[1].strip().isdigit():
+            import_times[fields[2].strip()] = int(fields[1])
+    return import_times
+
+@pytest.mark.parametrize("package", ["code_tools_grocsoftware.base", "code_tools_grocsoftware.cpp_gen"])
+def test001_package_import_is_lazy(package):
+    """!
+    @brief Test importing the package does not import the submodules
+    """
+    import_times = get_import_times(package)
+    assert package in import_times
+    assert not [name for name in import_times if name.startswith(package+".")]
+
+def test002_submodule_import():
+    """!
+    @brief Test importing one helper only imports its own dependencies
+    """
+    import_times = get_import_times("code_tools_grocsoftware.base.text_format")
+    assert "code_tools_grocsoftware.base.text_format" in import_times
+    assert "code_tools_grocsoftware.base.eula" not in import_times
+    assert "code_tools_grocsoftware.base.json_string_class_description" not in import_times
+    assert "code_tools_grocsoftware.base.project_json" not in import_times
+    assert "code_tools_grocsoftware.cpp_gen" not in import_times
+
+def test003_lazy_attribute():
+    """!
+    @brief Test the submodule attribute access and the package __all__
+    """
+    for package in [base_pkg, cpp_gen_pkg]:
+        for name in package.__all__:
+            assert getattr(package, name).__name__ == package.__name__+"."+name
+            assert name in dir(package)
+
+    with pytest.raises(AttributeError):
+        _ = base_pkg.not_a_module
+    with pytest.raises(AttributeError):
+        _ = cpp_gen_pkg.not_a_module
+
+def test004_import_all():
+    """!
+    @brief Test from package import * imports the __all__ submodules
+    """
+    namespace = {}
+    exec("from code_tools_grocsoftware.cpp_gen import *", namespace) # pylint: disable=exec-used
+    assert sorted(name for name in namespace if name != '__builtins__') == sorted(cpp_gen_pkg.__all__)
+
+@pytest.mark.skipif(not RUN_TIMING_TESTS, reason="set CODE_TOOLS_TIMING_TESTS=1 to run the timing tests")
+@pytest.mark.parametrize("package", ["code_tools_grocsoftware.base", "code_tools_grocsoftware.cpp_gen"])
+def test005_package_import_time(package):
+    """!
+    @brief Test the package import time stays below the eager import time
+    """
+    import_times = get_import_times(package)
+    assert import_times[package] < PACKAGE_IMPORT_BOUND
@@ -0,0 +1,341 @@
+"""@package test_programmer_tools
+Unittest for the generation pipeline profiler
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+import json
+import os
+import sys
+import tracemalloc
+from unittest.mock import patch
+
+from code_tools_grocsoftware.base.profiler import PhaseProfiler, profile_span, profiler
+from code_tools_grocsoftware.base.profiler import configure_from_env
+from code_tools_grocsoftware.base.output_backend import HashOutputBackend
+from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+from synthetic_project import build_project # pylint: disable=wrong-import-position
+
+## Generation peak memory bound for the synthetic project in test012, about twice the measured peak
+GENERATE_PEAK_BOUND = 512*1024
+
+class FakeClock:
+    """!
+    @brief Clock that advances one second per reading
+    """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self)->float:
+        self.now += 1.0
+        return self.now
+
+def test001_disabled_span():
+    """!
+    @brief Test a disabled profiler records nothing
+    """
+    test_obj = PhaseProfiler()
+    assert not test_obj.enabled
+    with test_obj.span("phase") as span:
+        test_obj.count("counter")
+    assert span is test_obj.span("other")
+    assert not test_obj.events
+    assert not test_obj.stats
+    assert not test_obj.counters
+
+def test002_nested_spans():
+    """!
+    @brief Test nested span inclusive and self times
+    """
+    test_obj = PhaseProfiler(True, FakeClock())
+    with test_obj.span("outer"):            # start 2
+        with test_obj.span("inner"):        # start 3, end 4
+            pass
+        with test_obj.span("inner"):        # start 5, end 6
+            pass
+    # outer end 7
+
+    assert test_obj.stats['inner'] == [2, 2.0, 2.0, 1.0]
+    assert test_obj.stats['outer'] == [1, 5.0, 3.0, 5.0]
+    assert test_obj.events == [("inner", 2.0, 1.0, 1), ("inner", 4.0, 1.0, 1), ("outer", 1.0, 5.0, 0)]
+    assert not test_obj.stack
+
+def test003_count_and_reset():
+    """!
+    @brief Test counters and reset
+    """
+    test_obj = PhaseProfiler(True)
+    test_obj.count("files")
+    test_obj.count("files", 3)
+    assert test_obj.counters == {'files': 4}
+
+    with test_obj.span("phase"):
+        pass
+    test_obj.reset()
+    assert not test_obj.events
+    assert not test_obj.stats
+    assert not test_obj.counters
+
+def test004_get_table():
+    """!
+    @brief Test the flat timing table, sorted by self time
+    """
+    test_obj = PhaseProfiler(True, FakeClock())
+    with test_obj.span("outer"):
+        with test_obj.span("inner"):
+            pass
+    test_obj.count("files", 2)
+
+    table = test_obj.get_table()
+    assert table[0].split() == ['Span', 'Calls', 'Total', 'ms', 'Self', 'ms', 'Mean', 'ms', 'Max', 'ms']
+    assert table[1].split() == ['outer', '1', '3000.000', '2000.000', '3000.000', '3000.000']
+    assert table[2].split() == ['inner', '1', '1000.000', '1000.000', '1000.000', '1000.000']
+    assert table[3] == "\n"
+    assert table[4].split() == ['Counter', 'Value']
+    assert table[5].split() == ['files', '2']
+
+def test005_get_chrome_trace():
+    """!
+    @brief Test the Chrome trace event data
+    """
+    test_obj = PhaseProfiler(True, FakeClock())
+    with test_obj.span("GenerateLangFiles.write_inc_file"):
+        pass
+    test_obj.count("files")
+
+    trace = test_obj.get_chrome_trace()
+    assert trace['displayTimeUnit'] == 'ms'
+    span_event, counter_event = trace['traceEvents']
+    assert span_event['name'] == "GenerateLangFiles.write_inc_file"
+    assert span_event['cat'] == "GenerateLangFiles"
+    assert span_event['ph'] == 'X'
+    assert span_event['ts'] == 1000000.0
+    assert span_event['dur'] == 1000000.0
+    assert span_event['pid'] == os.getpid()
+    assert counter_event['name'] == "files"
+    assert counter_event['ph'] == 'C'
+    assert counter_event['args'] == {'value': 1}
+
+def test006_write_report(tmp_path, capsys):
+    """!
+    @brief Test write_report table and trace output
+    """
+    test_obj = PhaseProfiler(True, FakeClock())
+    with test_obj.span("phase"):
+        pass
+
+    test_obj.write_report("table")
+    assert capsys.readouterr().err == "".join(test_obj.get_table())
+
+    table_name = os.path.join(tmp_path, "table.txt")
+    test_obj.write_report("table", table_name)
+    with open(table_name, 'r', encoding='utf-8') as table_file:
+        assert table_file.read() == "".join(test_obj.get_table())
+
+    trace_name = os.path.join(tmp_path, "trace.json")
+    test_obj.write_report("trace", trace_name)
+    with open(trace_name, 'r', encoding='utf-8') as trace_file:
+        assert json.load(trace_file)['traceEvents'][0]['name'] == "phase"
+
+def test007_profile_span_decorator():
+    """!
+    @brief Test the profile_span decorator on the shared profiler
+    """
+    @profile_span()
+    def default_name(value):
+        return value+1
+
+    @profile_span("named.span")
+    def named(value):
+        return value*2
+
+    profiler.reset()
+    assert default_name(1) == 2
+    assert not profiler.stats
+
+    profiler.enable()
+    try:
+        assert default_name(1) == 2
+        assert named(2) == 4
+    finally:
+        profiler.enable(False)
+
+    assert profiler.stats[default_name.__wrapped__.__qualname__][0] == 1
+    assert profiler.stats["named.span"][0] == 1
+    profiler.reset()
+
+def test008_configure_from_env():
+    """!
+    @brief Test configure_from_env
+    """
+    with patch('atexit.register') as register:
+        assert not configure_from_env({})
+        assert not configure_from_env({'CODE_TOOLS_PROFILE': "unknown"})
+        assert not profiler.enabled
+        register.assert_not_called()
+
+        try:
+            assert configure_from_env({'CODE_TOOLS_PROFILE': "trace",
+                                       'CODE_TOOLS_PROFILE_FILE': "trace.json"})
+            assert profiler.enabled
+        finally:
+            profiler.enable(False)
+        register.assert_called_once_with(profiler.write_report, "trace", "trace.json")
+
+        try:
+            assert configure_from_env({'CODE_TOOLS_PROFILE': "table",
+                                       'CODE_TOOLS_PROFILE_MEMORY': "1"})
+            assert profiler.memory
+            assert tracemalloc.is_tracing()
+        finally:
+            profiler.enable(False)
+        assert not profiler.memory
+        assert not tracemalloc.is_tracing()
+
+def test009_memory_mode_enable():
+    """!
+    @brief Test memory mode starts and stops tracemalloc
+    """
+    test_obj = PhaseProfiler()
+    test_obj.enable(memory=True)
+    try:
+        assert test_obj.memory
+        assert test_obj.started_tracemalloc
+        assert tracemalloc.is_tracing()
+    finally:
+        test_obj.enable(False)
+    assert not test_obj.memory
+    assert not test_obj.started_tracemalloc
+    assert not tracemalloc.is_tracing()
+
+    # A running tracemalloc is left running
+    tracemalloc.start()
+    try:
+        test_obj.enable(memory=True)
+        assert not test_obj.started_tracemalloc
+        test_obj.enable(False)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+def test010_memory_span_peak():
+    """!
+    @brief Test the nested span peak memory and allocation sites
+    """
+    test_obj = PhaseProfiler(clock=FakeClock())
+    test_obj.enable(memory=True)
+    try:
+        with test_obj.span("outer"):
+            with test_obj.span("inner"):
+                data = bytearray(1024*1024)
+                del data
+            kept = [bytearray(1024) for _ in range(64)]
+    finally:
+        test_obj.enable(False)
+
+    inner_peak, inner_growth = test_obj.memory_stats["inner"]
+    outer_peak, outer_growth = test_obj.memory_stats["outer"]
+    assert inner_growth >= 1024*1024
+    assert outer_peak >= inner_peak
+    assert outer_growth >= inner_growth
+    assert len(kept) == 64
+    assert list(test_obj.memory_sites.keys()) == ["outer"]
+    assert any(site.startswith(__file__) for site, _, _ in test_obj.memory_sites["outer"])
+    assert len(test_obj.memory_events) == 2
+
+    test_obj.reset()
+    assert not test_obj.memory_stats
+    assert not test_obj.memory_sites
+    assert not test_obj.memory_events
+
+def test011_memory_reports():
+    """!
+    @brief Test the memory table and trace report entries
+    """
+    test_obj = PhaseProfiler(True, FakeClock())
+    with test_obj.span("phase"):
+        pass
+    test_obj.memory_stats = {"phase": [4096, 2048]}
+    test_obj.memory_sites = {"phase": [("gen.py:10", 3072, 3)]}
+    test_obj.memory_events = [(1.0, 1024, 4096)]
+
+    table = test_obj.get_table()
+    assert table[2] == "\n"
+    assert table[3].split() == ['Span', 'Peak', 'KiB', 'Growth', 'KiB']
+    assert table[4].split() == ['phase', '4.0', '2.0']
+    assert table[6] == "Top allocation sites after phase\n"
+    assert table[7].split() == ['3.0', 'KiB', '3', 'blocks', 'gen.py:10']
+
+    memory_event = test_obj.get_chrome_trace()['traceEvents'][1]
+    assert memory_event['name'] == "traced memory"
+    assert memory_event['ph'] == 'C'
+    assert memory_event['ts'] == 1000000.0
+    assert memory_event['args'] == {'current': 1024, 'peak': 4096}
+
+def test012_generate_peak_memory(tmp_path):
+    """!
+    @brief Test the synthetic project generation stays below the peak memory bound
+    """
+    project_file = build_project(str(tmp_path), 4, 40)
+    out_dir = os.path.join(tmp_path, "out")
+    profiler.enable(memory=True)
+    try:
+        output_backend = HashOutputBackend()
+        proj_gen = ProjectFileGenerator(ProjectDescription(project_file), output_backend)
+        output_backend.make_dir(out_dir)
+        proj_gen.make_dirs(out_dir)
+        assert proj_gen.generate_files(out_dir)
+        _, growth = profiler.memory_stats["ProjectFileGenerator.generate_files"]
+        assert "ProjectFileGenerator.generate_files" in profiler.memory_sites
+    finally:
+        profiler.enable(False)
+        profiler.reset()
+    assert 0 < growth < GENERATE_PEAK_BOUND
+
+def test013_memory_span_peak_no_reset_peak(monkeypatch):
+    """!
+    @brief Test the memory mode spans without tracemalloc.reset_peak(), Python 3.8
+    """
+    monkeypatch.delattr(tracemalloc, "reset_peak")
+    test_obj = PhaseProfiler(clock=FakeClock())
+    test_obj.enable(memory=True)
+    try:
+        with test_obj.span("outer"):
+            with test_obj.span("inner"):
+                kept = [bytearray(1024) for _ in range(256)]
+            with test_obj.span("inner"):
+                pass
+    finally:
+        test_obj.enable(False)
+
+    inner_peak, inner_growth = test_obj.memory_stats["inner"]
+    outer_peak, outer_growth = test_obj.memory_stats["outer"]
+    assert inner_growth >= 256*1024
+    assert outer_peak >= inner_peak
+    assert outer_growth >= inner_growth
+    assert len(kept) == 256
+    assert list(test_obj.memory_sites.keys()) == ["outer"]
+    assert len(test_obj.memory_events) == 3
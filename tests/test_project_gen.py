@@ -32,6 +32,10 @@ from code_tools_grocsoftware.base.json_language_list import LanguageDescriptionL
 from code_tools_grocsoftware.base.json_string_class_description import StringClassDescription
 
 from code_tools_grocsoftware.base.project_json import ProjectDescription
+from code_tools_grocsoftware.base.output_backend import DiskOutputBackend, MemoryOutputBackend
+from code_tools_grocsoftware.base.output_backend import StagedOutputBackend
+from code_tools_grocsoftware.base.profiler import profiler
+from code_tools_grocsoftware.base.code_emitter import CodeEmitter
 from code_tools_grocsoftware.cpp_gen.project_file_gen import ProjectFileGenerator
 
 from tests.dir_init import TESTFILEPATH
@@ -94,6 +98,7 @@ class MockFile:
     def __init__(self):
         self.mock_calls = []
         self.writedata = []
+        self.closed = False
 
     def writelines(self, lines):
         """!
@@ -102,6 +107,12 @@ class MockFile:
         self.mock_calls.append(('writelines', ""))
         self.writedata.extend(lines)
 
+    def close(self):
+        """!
+        @brief Mock close method
+        """
+        self.closed = True
+
 # pylint: enable=too-few-public-methods
 # pylint: disable=protected-access
 
@@ -512,6 +523,26 @@ def test020_open_file_fail(capsys):
                                             encoding="utf-8")
         assert capsys.readouterr().out == "Failed to open 'baseDirName/foo/fname.x' for writing\n"
 
+def test021_open_file_emitter():
+    """!
+    @brief Test open_file wraps the backend file in a CodeEmitter
+    """
+    backend = MemoryOutputBackend()
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), output_backend=backend)
+
+    outfile = proj_gen.open_file("baseDirName", "foo/fname.x")
+    assert isinstance(outfile, CodeEmitter)
+    outfile.writelines(["line 1\n", "line 2\n"])
+    outfile.write("line 3\n")
+    assert backend.get_text("baseDirName/foo/fname.x") == ""
+    outfile.close()
+    assert backend.files["baseDirName/foo/fname.x"].closed
+    assert backend.get_text("baseDirName/foo/fname.x") == "line 1\nline 2\nline 3\n"
+
+    proj_gen.emitter_buffer_size = None
+    outfile = proj_gen.open_file("baseDirName", "foo/raw.x")
+    assert outfile is backend.files["baseDirName/foo/raw.x"]
+
 def test030_generate_base_files():
     """!
     @brief Test generate_base_files, exists = false
@@ -883,4 +914,337 @@ def test044_generate_select_files_fail_linux(capsys):
             captured = capsys.readouterr()
             assert captured.out == "Failed to open 'baseDirName/"+linuxname+"' for writing\n"
 
+def test045_memory_output_backend():
+    """!
+    @brief Test make_dirs and file generation with the in-memory output backend
+    """
+    backend = MemoryOutputBackend()
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), backend)
+    assert proj_gen.output_backend is backend
+
+    with patch('os.mkdir') as os_mkdir:
+        with pytest.raises(NameError):
+            proj_gen.make_dirs("virtual_base_dir_name")
+        backend.make_dir("virtual_base_dir_name")
+        assert proj_gen.make_dirs("virtual_base_dir_name")
+        assert proj_gen.generate_mock_files("virtual_base_dir_name")
+        assert proj_gen.generate_select_files("virtual_base_dir_name")
+        os_mkdir.assert_not_called()
+
+    assert os.path.join("virtual_base_dir_name", "inc") in backend.dirs
+    expected_inc = os.path.join("virtual_base_dir_name", "mock",
+                                proj_gen.class_gen.gen_mock_h_fname())
+    assert expected_inc in backend.get_file_names()
+    assert len(backend.get_file_names()) == 4
+    assert "class mock_ParserStringListInterface" in backend.get_text(expected_inc)
+    assert not os.path.exists("virtual_base_dir_name")
+
+def test046_default_output_backend():
+    """!
+    @brief Test the default output backend is the disk backend
+    """
+    proj_gen = ProjectFileGenerator(MockProjectDescription())
+    assert isinstance(proj_gen.output_backend, DiskOutputBackend)
+
+def test047_staged_output_backend(tmp_path):
+    """!
+    @brief Test file generation with the staged output backend
+    """
+    base_dir = str(tmp_path)
+    backend = StagedOutputBackend(base_dir)
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), backend)
+
+    assert proj_gen.make_dirs(base_dir)
+    assert proj_gen.generate_mock_files(base_dir)
+    mock_inc = os.path.join(base_dir, "mock", proj_gen.class_gen.gen_mock_h_fname())
+    assert not os.path.exists(mock_inc)
+
+    assert backend.commit()
+    assert os.path.isfile(mock_inc)
+    assert sorted(os.listdir(base_dir)) == ["inc", "mock", "src", "test"]
+
+def test048_combined_unittest():
+    """!
+    @brief Test the combined language unittest main file generation
+    """
+    backend = MemoryOutputBackend()
+    backend.make_dir("virtual_base_dir_name")
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), backend, combined_unittest=True)
+    assert not proj_gen.class_gen.lang_unittest_main
+
+    assert proj_gen.generate_unittest_main_file("virtual_base_dir_name")
+    main_name = os.path.join("test", proj_gen.class_gen.gen_unittest_main_fname())
+    expected_target = proj_gen.class_gen.gen_combined_unittest_target_name()
+    assert proj_gen.get_combined_unittest_set_names() == (main_name, expected_target)
+    main_text = backend.get_text(os.path.join("virtual_base_dir_name", main_name))
+    assert "int main(int argc, char **argv)\n" in main_text
+
+def test049_combined_unittest_default():
+    """!
+    @brief Test the language unittests are built individually by default
+    """
+    proj_gen = ProjectFileGenerator(MockProjectDescription())
+    assert proj_gen.class_gen.lang_unittest_main
+    assert proj_gen.get_combined_unittest_set_names() is None
+
+def test050_get_base_include_fname():
+    """!
+    @brief Test get_base_include_fname
+    """
+    proj_gen = ProjectFileGenerator(MockProjectDescription())
+    assert proj_gen.get_base_include_fname() is None
+    proj_gen._add_file('include', 'inc/english.h', 'english')
+    assert proj_gen.get_base_include_fname() is None
+    proj_gen._add_file('include', 'inc/base.h')
+    assert proj_gen.get_base_include_fname() == 'inc/base.h'
+
+def test051_typed_unittest():
+    """!
+    @brief Test the typed language unittest file generation
+    """
+    backend = MemoryOutputBackend()
+    backend.make_dir("virtual_base_dir_name")
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), backend, typed_unittest=True)
+
+    with patch('code_tools_grocsoftware.cpp_gen.class_file_gen.GenerateLangFiles.write_typed_unittest_file') \
+            as write_typed:
+        assert proj_gen.generate_typed_unittest_file("virtual_base_dir_name")
+        write_typed.assert_called_once()
+
+    typed_name = os.path.join("test", proj_gen.class_gen.gen_typed_unittest_fname())
+    expected_target = proj_gen.class_gen.gen_typed_unittest_target_name()
+    assert proj_gen.get_typed_unittest_set_names() == (typed_name, expected_target)
+
+    # The language unittest files are not generated
+    with patch('code_tools_grocsoftware.cpp_gen.class_file_gen.GenerateLangFiles.write_lang_unittest_file') \
+            as write_lang_ut:
+        with patch('code_tools_grocsoftware.cpp_gen.class_file_gen.GenerateLangFiles.write_lang_src_file'):
+            with patch('code_tools_grocsoftware.cpp_gen.class_file_gen.GenerateLangFiles.write_inc_file'):
+                assert proj_gen.generate_lang_files("virtual_base_dir_name", "english")
+        write_lang_ut.assert_not_called()
+    assert 'unittest' not in proj_gen.fnames['english']
+
+def test052_typed_unittest_default():
+    """!
+    @brief Test the typed language unittest is off by default
+    """
+    proj_gen = ProjectFileGenerator(MockProjectDescription())
+    assert proj_gen.get_typed_unittest_set_names() is None
+
+def test053_cached_instances():
+    """!
+    @brief Test the cached_instances option is passed to the selection function generators
+    """
+    proj_gen = ProjectFileGenerator(MockProjectDescription())
+    assert not proj_gen.class_gen.cached_instances
+    assert not proj_gen.class_gen.master_func_gen.cached_instances
+
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), cached_instances=True)
+    assert proj_gen.class_gen.cached_instances
+    assert proj_gen.class_gen.master_func_gen.cached_instances
+    for os_sel_gen in proj_gen.class_gen.get_os_lang_sel_list():
+        assert os_sel_gen.cached_instances
+
+def test054_string_table():
+    """!
+    @brief Test the string table file generation
+    """
+    backend = MemoryOutputBackend()
+    backend.make_dir("virtual_base_dir_name")
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), backend, string_table=True)
+    assert proj_gen.class_gen.string_table
+    assert proj_gen.class_gen.master_func_gen.string_table
+    assert proj_gen.typed_unittest
+
+    with patch('code_tools_grocsoftware.cpp_gen.class_file_gen.GenerateLangFiles.write_table_inc_file') \
+            as write_inc:
+        with patch('code_tools_grocsoftware.cpp_gen.class_file_gen.GenerateLangFiles.write_table_src_file') \
+                as write_src:
+            assert proj_gen.generate_table_files("virtual_base_dir_name")
+            write_inc.assert_called_once()
+            write_src.assert_called_once()
+
+    inc_name = os.path.join("inc", proj_gen.class_gen.gen_table_h_fname())
+    src_name = os.path.join("src", proj_gen.class_gen.gen_table_cpp_fname())
+    assert proj_gen.fnames['stringTable'] == {'include': inc_name, 'source': src_name}
+    assert proj_gen.get_source_fnames() == [src_name]
+
+def test055_string_table_generate_files():
+    """!
+    @brief Test generate_files with the string table skips the language class files
+    """
+    backend = MemoryOutputBackend()
+    backend.make_dir("virtual_base_dir_name")
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), backend, string_table=True)
+
+    with patch.object(LanguageDescriptionList, 'get_iso_code_data') as lang_iso:
+        lang_iso.return_value = "en"
+        proj_gen.class_gen.test_param_values['nargs'] = ("3", False)
+        assert proj_gen.generate_files("virtual_base_dir_name")
+
+    assert 'english' not in proj_gen.fnames
+    assert 'stringTable' in proj_gen.fnames
+    assert proj_gen.get_typed_unittest_set_names() is not None
+
+def test056_windows_langid_table():
+    """!
+    @brief Test the windows_langid_table option is passed to the windows selection function generator
+    """
+    proj_gen = ProjectFileGenerator(MockProjectDescription())
+    assert not proj_gen.class_gen.get_os_lang_sel_list()[1].langid_table
+
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), windows_langid_table=True)
+    assert proj_gen.class_gen.get_os_lang_sel_list()[1].langid_table
+
+def test057_constexpr_properties():
+    """!
+    @brief Test the constexpr_properties option raises the C++ standard
+    """
+    proj_gen = ProjectFileGenerator(MockProjectDescription())
+    assert not proj_gen.class_gen.constexpr_properties
+    assert proj_gen.get_cxx_standard() == 17
+
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), constexpr_properties=True)
+    assert proj_gen.class_gen.constexpr_properties
+    assert proj_gen.get_cxx_standard() == 20
+
+def test058_language_subset_generate_files():
+    """!
+    @brief Test generate_files only generates the project language subset
+    """
+    project_data = ProjectDescription()
+    project_data.set_lang_data_name(langfilename)
+    project_data.set_string_data_name(strclass_filename)
+    project_data.set_test_subdir("test")
+    project_data.set_mock_subdir("mock")
+    project_data.set_language_subset(['SPANISH_ERRORS'])
+
+    backend = MemoryOutputBackend()
+    backend.make_dir("virtual_base_dir_name")
+    proj_gen = ProjectFileGenerator(project_data, backend)
+    assert proj_gen.json_lang_data.get_language_list() == ['spanish']
+
+    with patch.object(LanguageDescriptionList, 'get_iso_code_data') as lang_iso:
+        lang_iso.return_value = "en"
+        proj_gen.class_gen.test_param_values['nargs'] = ("3", False)
+        assert proj_gen.generate_files("virtual_base_dir_name")
+
+    assert 'english' not in proj_gen.fnames
+    assert 'spanish' in proj_gen.fnames
+    unittest_sets = proj_gen.get_lang_unittest_set_names()
+    assert len(unittest_sets) == 1
+    assert unittest_sets[0][2] == proj_gen.class_gen.gen_unittest_target_name('spanish')
+
+def test059_add_source_shards():
+    """!
+    @brief Test _add_file, get_source_fnames and get_source_shard_fnames with source shards
+    """
+    proj_gen = ProjectFileGenerator(MockProjectDescription())
+    proj_gen._add_file('source', 'src/base.cpp')
+    proj_gen._add_file('source', 'src/english.cpp', 'english')
+    proj_gen._add_file('sourceShards', 'src/english_1.cpp', 'english')
+    proj_gen._add_file('sourceShards', 'src/english_2.cpp', 'english')
+
+    assert proj_gen.fnames['english']['sourceShards'] == ['src/english_1.cpp', 'src/english_2.cpp']
+    assert proj_gen.get_source_fnames() == ['src/base.cpp', 'src/english.cpp',
+                                            'src/english_1.cpp', 'src/english_2.cpp']
+    assert proj_gen.get_source_shard_fnames('src/english.cpp') == ['src/english.cpp',
+                                                                  'src/english_1.cpp',
+                                                                  'src/english_2.cpp']
+    assert proj_gen.get_source_shard_fnames('src/base.cpp') == ['src/base.cpp']
+    assert proj_gen.get_source_shard_fnames('src/unknown.cpp') == ['src/unknown.cpp']
+
+def test060_generate_lang_src_shard_files():
+    """!
+    @brief Test generate_lang_files with sharded language source files
+    """
+    backend = MemoryOutputBackend()
+    backend.make_dir("virtual_base_dir_name")
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), backend, shard_method_count=1)
+    method = proj_gen.class_gen.get_string_model().get_translate_method("getNotListTypeMessage")
+
+    with patch.object(proj_gen.class_gen.get_string_model(), 'get_translate_methods') as methods:
+        methods.return_value = [method]*3
+        proj_gen.class_gen.test_param_values['nargs'] = ("3", False)
+        assert proj_gen.generate_lang_files("virtual_base_dir_name", "english")
+
+    src_name = os.path.join("src", proj_gen.class_gen.gen_cpp_fname("english"))
+    shard_names = [os.path.join("src", proj_gen.class_gen.gen_shard_cpp_fname("english", index))
+                   for index in [1, 2]]
+    assert proj_gen.fnames['english']['source'] == src_name
+    assert proj_gen.fnames['english']['sourceShards'] == shard_names
+    assert proj_gen.get_source_fnames() == [src_name] + shard_names
+    for fname in [src_name] + shard_names:
+        assert os.path.join("virtual_base_dir_name", fname) in backend.get_file_names()
+
+def test061_generate_files_profile():
+    """!
+    @brief Test generate_files records the profiler phase spans
+    """
+    backend = MemoryOutputBackend()
+    backend.make_dir("virtual_base_dir_name")
+
+    profiler.reset()
+    profiler.enable()
+    try:
+        proj_gen = ProjectFileGenerator(MockProjectDescription(), backend)
+        with patch.object(LanguageDescriptionList, 'get_iso_code_data') as lang_iso:
+            lang_iso.return_value = "en"
+            proj_gen.class_gen.test_param_values['nargs'] = ("3", False)
+            assert proj_gen.generate_files("virtual_base_dir_name")
+    finally:
+        profiler.enable(False)
+
+    assert profiler.stats['ProjectFileGenerator.__init__'][0] == 1
+    assert profiler.stats['ProjectFileGenerator.generate_files'][0] == 1
+    assert profiler.stats['GenerateLangFiles.write_lang_src_file'][0] == 2
+    assert profiler.stats['GenerateLangFiles.translate_body'][0] == 2
+    assert profiler.counters['ProjectFileGenerator.files'] == len(backend.get_file_names())
+    profiler.reset()
+
+def generate_memory_files(jobs:int, start_methods:list = None)->tuple:
+    """!
+    @brief Generate the mock project files in memory
+    @param jobs {int} generate_files() worker process count
+    @param start_methods {list} Available multiprocessing start methods or None for the system list
+    @return tuple - (ProjectFileGenerator, MemoryOutputBackend)
+    """
+    backend = MemoryOutputBackend()
+    backend.make_dir("virtual_base_dir_name")
+    proj_gen = ProjectFileGenerator(MockProjectDescription(), backend)
+    with patch.object(LanguageDescriptionList, 'get_iso_code_data') as lang_iso:
+        lang_iso.return_value = "en"
+        proj_gen.class_gen.test_param_values['nargs'] = ("3", False)
+        if start_methods is None:
+            assert proj_gen.generate_files("virtual_base_dir_name", jobs)
+        else:
+            with patch('multiprocessing.get_all_start_methods') as get_methods:
+                get_methods.return_value = start_methods
+                assert proj_gen.generate_files("virtual_base_dir_name", jobs)
+    return proj_gen, backend
+
+@pytest.mark.skipif(os.name != 'posix', reason="parallel generation needs the fork start method")
+def test062_generate_files_jobs():
+    """!
+    @brief Test generate_files with worker processes matches the serial output
+    """
+    serial_gen, serial_backend = generate_memory_files(1)
+    parallel_gen, parallel_backend = generate_memory_files(2)
+
+    assert parallel_gen.fnames == serial_gen.fnames
+    assert list(parallel_gen.fnames.keys()) == list(serial_gen.fnames.keys())
+    assert list(parallel_backend.files.keys()) == list(serial_backend.files.keys())
+    for fname in serial_backend.get_file_names():
+        assert parallel_backend.get_text(fname) == serial_backend.get_text(fname)
+
+def test063_generate_files_jobs_no_fork():
+    """!
+    @brief Test generate_files generates serially without the fork start method
+    """
+    with patch.object(ProjectFileGenerator, 'generate_lang_files_parallel') as parallel:
+        proj_gen, _ = generate_memory_files(2, ['spawn'])
+        parallel.assert_not_called()
+    assert 'english' in proj_gen.fnames
+    assert 'spanish' in proj_gen.fnames
+
 # pylint: enable=protected-access
@@ -0,0 +1,183 @@
+"""@package test_programmer_tools
+Unittest for the language neutral string class model
+"""
+
+#==========================================================================
+# Copyright (c) 2025 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+import os
+from unittest.mock import patch
+
+from code_tools_grocsoftware.base.json_language_list import LanguageDescriptionList
+from code_tools_grocsoftware.base.json_string_class_description import StringClassDescription
+from code_tools_grocsoftware.base.string_class_model import StringClassModel
+from code_tools_grocsoftware.cpp_gen.file_gen_base import GenerateCppFileHelper
+from code_tools_grocsoftware.python_gen.file_gen_base import GeneratePythonFileHelper
+from code_tools_grocsoftware.typescript_gen.file_gen_base import GenerateTypeScriptFileHelper
+
+from tests.dir_init import TESTFILEPATH
+
+langfilename = os.path.join(TESTFILEPATH, "teststringlanglist.json")
+strclass_filename = os.path.join(TESTFILEPATH, "teststrdesc.json")
+
+def test001_model_constructor():
+    """!
+    @brief Test the StringClassModel constructor
+    """
+    model = StringClassModel(LanguageDescriptionList(langfilename),
+                             StringClassDescription(strclass_filename))
+    assert model.base_class_name == "ParserStringListInterface"
+    assert model.namespace_name == "argparser"
+    assert model.property_method_names == ['getLangIsoCode']
+    assert model.translate_method_names == ['getNotListTypeMessage']
+    assert not model.property_methods
+    assert not model.translate_methods
+    assert not model.languages
+
+def test002_model_methods():
+    """!
+    @brief Test the StringClassModel method resolution
+    """
+    str_data = StringClassDescription(strclass_filename)
+    model = StringClassModel(LanguageDescriptionList(langfilename), str_data)
+
+    prop_list = model.get_property_methods()
+    assert len(prop_list) == 1
+    assert prop_list[0].name == 'getLangIsoCode'
+    assert prop_list[0].property_name == 'isoCode'
+    assert prop_list[0].is_property()
+    _, desc, params, ret = str_data.get_property_method_data('getLangIsoCode')
+    assert prop_list[0].desc == desc
+    assert prop_list[0].params == params
+    assert prop_list[0].ret == ret
+
+    trans_list = model.get_translate_methods()
+    assert len(trans_list) == 1
+    assert trans_list[0].name == 'getNotListTypeMessage'
+    assert not trans_list[0].is_property()
+    desc, params, ret = str_data.get_tranlate_method_function_data('getNotListTypeMessage')
+    assert trans_list[0].desc == desc
+    assert trans_list[0].params == params
+    assert trans_list[0].ret == ret
+
+def test003_model_resolve_once():
+    """!
+    @brief Test the StringClassModel resolves each method and language once
+    """
+    model = StringClassModel(LanguageDescriptionList(langfilename),
+                             StringClassDescription(strclass_filename))
+
+    with patch.object(StringClassDescription, 'get_property_method_data',
+                      wraps=model.str_data.get_property_method_data) as get_prop, \
+         patch.object(StringClassDescription, 'get_tranlate_method_text_data',
+                      wraps=model.str_data.get_tranlate_method_text_data) as get_text, \
+         patch.object(LanguageDescriptionList, 'get_iso_code_data',
+                      wraps=model.lang_data.get_iso_code_data) as get_iso:
+        method = model.get_property_method('getLangIsoCode')
+        assert model.get_property_methods()[0] is method
+        assert model.get_property_method('getLangIsoCode') is method
+        get_prop.assert_called_once_with('getLangIsoCode')
+
+        lang = model.get_language("english")
+        text = lang.get_translate_text('getNotListTypeMessage')
+        assert model.get_language("english") is lang
+        assert lang.get_translate_text('getNotListTypeMessage') is text
+        get_iso.assert_called_once_with("english")
+        get_text.assert_called_once_with('getNotListTypeMessage', 'en')
+
+def test004_language_model():
+    """!
+    @brief Test the LanguageClassModel data
+    """
+    lang_data = LanguageDescriptionList(langfilename)
+    model = StringClassModel(lang_data, StringClassDescription(strclass_filename))
+
+    lang = model.get_language("english")
+    assert lang.lang_name == "english"
+    assert lang.class_name == "ParserStringListInterfaceEnglish"
+    assert lang.iso_code == "en"
+    assert lang.get_property_value('isoCode') == "en"
+    assert lang.get_property_value('LANG') == lang_data.get_property_data("english", 'LANG')
+    assert lang.property_values['isoCode'] == "en"
+
+    assert model.get_class_name() == "ParserStringListInterface"
+    assert model.get_class_name("spanish") == "ParserStringListInterfaceSpanish"
+
+def test005_model_shared_by_backends():
+    """!
+    @brief Test the C++, python and typescript helpers render from the same model
+    """
+    model = StringClassModel(LanguageDescriptionList(langfilename),
+                             StringClassDescription(strclass_filename))
+    method = model.get_translate_method('getNotListTypeMessage')
+
+    for helper in [GenerateCppFileHelper(), GeneratePythonFileHelper(),
+                   GenerateTypeScriptFileHelper()]:
+        decl = helper.declare_function_with_decorations(method.name, method.desc,
+                                                        method.params, method.ret)
+        assert any('getNotListTypeMessage' in line for line in decl)
+        assert any(method.desc in line for line in decl)
+
+def test006_method_body_data():
+    """!
+    @brief Test the StringMethodModel and LanguageClassModel body data
+    """
+    model = StringClassModel(LanguageDescriptionList(langfilename),
+                             StringClassDescription(strclass_filename))
+    prop = model.get_property_method('getLangIsoCode')
+    xlate = model.get_translate_method('getNotListTypeMessage')
+    assert prop.param_names == []
+    assert not prop.is_list
+    assert prop.is_text
+    assert xlate.param_names == ['nargs']
+    assert not xlate.is_list
+    assert not xlate.is_text
+
+    lang = model.get_language("english")
+    assert lang.get_property_items(prop) == ["en"]
+
+    lang.property_values['isoCode'] = ["en", "us"]
+    prop.is_list = True
+    items = lang.get_property_items(prop)
+    assert items == ["en", "us"]
+    assert items is not lang.property_values['isoCode']
+
+def test007_method_test_data():
+    """!
+    @brief Test the StringClassModel and LanguageClassModel unittest data
+    """
+    model = StringClassModel(LanguageDescriptionList(langfilename),
+                             StringClassDescription(strclass_filename))
+    prop = model.get_property_method('getLangIsoCode')
+    xlate = model.get_translate_method('getNotListTypeMessage')
+    lang = model.get_language("english")
+
+    assert StringClassModel.get_test_args(prop, {}) == []
+    assert StringClassModel.get_test_args(xlate, {}) == [("42", False)]
+    assert StringClassModel.get_test_args(xlate, {'nargs': ("3", False)}) == [("3", False)]
+
+    assert lang.get_test_expected(prop, {}) == ["en"]
+    expected = lang.get_test_expected(xlate, {'nargs': ("3", False)})
+    assert expected == "Only list type arguments can have an argument count of 3"
+    assert lang.get_test_expected(xlate, {'nargs': ["3", False]}) is expected
+    assert lang.get_test_expected(xlate, {'nargs': ("5", False)}).endswith("of 5")
+    assert len(lang.test_strings) == 2